@@ -0,0 +1,44 @@
+"""add request dedup fields to planning drafts
+
+Revision ID: a9c4e1f7b3d2
+Revises: f7b2d4e9a1c3
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e1f7b3d2'
+down_revision: Union[str, Sequence[str], None] = 'f7b2d4e9a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INFLIGHT_PRIMARY = "parent_draft_id IS NULL AND status IN ('queued', 'running')"
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('planning_drafts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('request_fingerprint', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('idempotency_key', sa.String(length=128), nullable=True))
+        batch_op.add_column(sa.Column('dedup_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.create_index(
+            'uq_planning_drafts_inflight_fingerprint',
+            ['request_fingerprint'],
+            unique=True,
+            postgresql_where=sa.text(INFLIGHT_PRIMARY),
+            sqlite_where=sa.text(INFLIGHT_PRIMARY),
+        )
+        batch_op.create_unique_constraint('uq_planning_drafts_idempotency_key', ['idempotency_key'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('planning_drafts', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_planning_drafts_idempotency_key', type_='unique')
+        batch_op.drop_index('uq_planning_drafts_inflight_fingerprint')
+        batch_op.drop_column('dedup_count')
+        batch_op.drop_column('idempotency_key')
+        batch_op.drop_column('request_fingerprint')
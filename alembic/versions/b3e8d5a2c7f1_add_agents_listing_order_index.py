@@ -0,0 +1,31 @@
+"""add agents listing order index
+
+Revision ID: b3e8d5a2c7f1
+Revises: a9c4e1f7b3d2
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8d5a2c7f1'
+down_revision: Union[str, Sequence[str], None] = 'a9c4e1f7b3d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Pagination keyset des agents (nom, prenom, id) : parcours d'index au lieu d'un tri complet
+    op.create_index(
+        'ix_agents_nom_prenom_id',
+        'agents',
+        ['nom', 'prenom', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_agents_nom_prenom_id', table_name='agents')
@@ -0,0 +1,34 @@
+"""add partial revoked_at index on refresh_tokens
+
+Revision ID: d2b7f9c3a5e1
+Revises: c4e8a1f2d7b9
+Create Date: 2026-10-19 14:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b7f9c3a5e1'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a1f2d7b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # token_hash est déjà couvert par l'index unique de uq_refresh_tokens_token_hash
+    op.create_index(
+        'ix_refresh_tokens_revoked_at',
+        'refresh_tokens',
+        ['revoked_at'],
+        unique=False,
+        postgresql_where=sa.text('revoked_at IS NOT NULL'),
+        sqlite_where=sa.text('revoked_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_refresh_tokens_revoked_at', table_name='refresh_tokens')
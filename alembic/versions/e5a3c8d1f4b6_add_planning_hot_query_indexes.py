@@ -0,0 +1,54 @@
+"""add covering indexes for planning hot queries
+
+Revision ID: e5a3c8d1f4b6
+Revises: d2b7f9c3a5e1
+Create Date: 2026-10-19 16:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a3c8d1f4b6'
+down_revision: Union[str, Sequence[str], None] = 'd2b7f9c3a5e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # agent_days lus par période tous agents confondus (planning poste, couverture)
+    op.create_index(
+        'ix_agent_days_day_date_agent',
+        'agent_days',
+        ['day_date', 'agent_id'],
+        unique=False,
+        postgresql_include=['id'],
+    )
+    # affectations lues par tranche -> poste, jointure vers agent_days sans visite de table
+    op.create_index(
+        'ix_agent_day_assignments_tranche_day',
+        'agent_day_assignments',
+        ['tranche_id', 'agent_day_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_planning_draft_assignments_tranche_id',
+        'planning_draft_assignments',
+        ['tranche_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_qualifications_poste_agent',
+        'qualifications',
+        ['poste_id', 'agent_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_qualifications_poste_agent', table_name='qualifications')
+    op.drop_index('ix_planning_draft_assignments_tranche_id', table_name='planning_draft_assignments')
+    op.drop_index('ix_agent_day_assignments_tranche_day', table_name='agent_day_assignments')
+    op.drop_index('ix_agent_days_day_date_agent', table_name='agent_days')
@@ -0,0 +1,40 @@
+"""add alternative fields to planning drafts
+
+Revision ID: f7b2d4e9a1c3
+Revises: e5a3c8d1f4b6
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b2d4e9a1c3'
+down_revision: Union[str, Sequence[str], None] = 'e5a3c8d1f4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('planning_drafts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('parent_draft_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('alternative_rank', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_planning_drafts_parent_draft_id',
+            'planning_drafts',
+            ['parent_draft_id'],
+            ['id'],
+            ondelete='CASCADE',
+        )
+        batch_op.create_index('ix_planning_drafts_parent_draft_id', ['parent_draft_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('planning_drafts', schema=None) as batch_op:
+        batch_op.drop_index('ix_planning_drafts_parent_draft_id')
+        batch_op.drop_constraint('fk_planning_drafts_parent_draft_id', type_='foreignkey')
+        batch_op.drop_column('alternative_rank')
+        batch_op.drop_column('parent_draft_id')
@@ -14,7 +14,9 @@ from backend.app.bootstrap.container import (
     agent_service,
     agent_planning_factory,
     agent_team_service,
+    eligibility_cache,
     planning_day_assembler,
+    planning_read_cache,
     poste_coverage_requirement_service,
     poste_planning_factory,
     poste_planning_day_assembler,
@@ -44,6 +46,10 @@ from core.application.services import (
     TeamService,
     TrancheService,
 )
+from core.application.services.eligibility_cache import EligibilityCache
+from core.application.services.planning.planning_cache import PlanningReadCache
+from core.application.services.planning.tranche_catalog import TrancheCatalog
+from db.repositories import tranche_repo
 
 def get_db() -> Generator[Session, None, None]:
     # Une session par requête HTTP, commit/rollback gérés automatiquement
@@ -80,9 +86,15 @@ def get_agent_planning_validator_service(
 ) -> AgentPlanningValidatorService:
     return AgentPlanningValidatorService(rh_rules_engine=engine)
 
+def get_eligibility_cache() -> EligibilityCache:
+    return eligibility_cache
+
 def get_planning_day_assembler() -> PlanningDayAssembler:
     return planning_day_assembler
 
+def get_planning_read_cache() -> PlanningReadCache:
+    return planning_read_cache
+
 def get_poste_planning_factory() -> PostePlanningFactory:
     return poste_planning_factory
 
@@ -111,4 +123,8 @@ def get_team_planning_factory() -> TeamPlanningFactory:
     return team_planning_factory
 
 def get_tranche_service() -> TrancheService:
-    return tranche_service
\ No newline at end of file
+    return tranche_service
+
+def get_tranche_catalog() -> TrancheCatalog:
+    # Une instance par requête (FastAPI met en cache la dépendance le temps de la requête)
+    return TrancheCatalog.from_repo(tranche_repo)
\ No newline at end of file
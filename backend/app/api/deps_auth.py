@@ -2,6 +2,7 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from backend.app.api.deps import get_db
+from backend.app.bootstrap.container import login_throttle, user_auth_cache
 from core.application.services.auth_service import AuthService
 from core.application.services.user_auth_service import UserAuthService
 from db.repositories.user_repo import SqlAlchemyUserRepo
@@ -12,8 +13,10 @@ def get_auth_service(session: Session = Depends(get_db)) -> AuthService:
     return AuthService(
         users=SqlAlchemyUserRepo(session),
         refresh_tokens=SqlAlchemyRefreshTokenRepo(session),
+        user_cache=user_auth_cache,
+        throttle=login_throttle,
     )
 
 
 def get_user_auth_service(session: Session = Depends(get_db)) -> UserAuthService:
-    return UserAuthService(users=SqlAlchemyUserRepo(session))
+    return UserAuthService(users=SqlAlchemyUserRepo(session), cache=user_auth_cache)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Hashable, Optional
+
+from fastapi import Request, Response, status
+
+from core.application.services.planning.planning_cache import PlanningReadCache
+
+CACHE_CONTROL_REVALIDATE = "private, no-cache"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    if "*" in candidates:
+        return True
+    weak = etag[2:] if etag.startswith("W/") else etag
+    return etag in candidates or weak in candidates or f"W/{weak}" in candidates
+
+
+def not_modified_response(request: Request, read_cache: PlanningReadCache, key: Hashable) -> Optional[Response]:
+    """
+    Return a 304 when the client's If-None-Match still matches a valid cache entry.
+    Served from memory only: no database access on this path.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    cached = read_cache.get(key)
+    if cached is None or not _etag_matches(if_none_match, cached.etag):
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": cached.etag, "Cache-Control": CACHE_CONTROL_REVALIDATE},
+    )
+
+
+def set_etag_headers(response: Response, read_cache: PlanningReadCache, key: Hashable) -> None:
+    """Attach the ETag of the entry just built (if it was cached)."""
+    cached = read_cache.get(key)
+    if cached is None:
+        return
+    response.headers["ETag"] = cached.etag
+    response.headers["Cache-Control"] = CACHE_CONTROL_REVALIDATE
@@ -24,5 +24,13 @@ def conflict(detail: Any = "Conflict") -> NoReturn:
     raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
 
 
+def service_unavailable(detail: Any = "Service unavailable", retry_after: int = 1) -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=detail,
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
 def unprocessable_entity(detail: Any = "Unprocessable entity") -> NoReturn:
     raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail)
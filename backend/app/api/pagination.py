@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from backend.app.api.http_exceptions import bad_request
+from backend.app.dto.common.pagination import (
+    Page,
+    PaginationParams,
+    build_keyset_page,
+    build_page,
+    decode_cursor,
+)
+
+
+def paginate(service: Any, p: PaginationParams) -> Page:
+    """
+    Page d'un service exposant list/count (mode offset) et list_keyset/count_estimate (mode keyset).
+    """
+    if not p.is_keyset:
+        items = service.list(limit=p.limit, offset=p.offset)
+        total = service.count()
+        return build_page(items=items, total=total, p=p)
+
+    try:
+        after = decode_cursor(p.cursor)
+        page = service.list_keyset(limit=p.page_size, after=after)
+    except ValueError:
+        bad_request("Invalid cursor")
+
+    total, estimated = service.count_estimate() if p.with_total else (None, False)
+    return build_keyset_page(
+        items=page.items,
+        next_key=page.next_key,
+        p=p,
+        total=total,
+        total_is_estimate=estimated,
+    )
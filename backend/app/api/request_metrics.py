@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.utils.metrics import metrics
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware recording per-route latency.
+
+    Routes are labelled by their template (``/api/v1/teams/{team_id}``) so the
+    series cardinality stays bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = int(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            metrics.observe(
+                "http_request_duration_seconds",
+                time.perf_counter() - started_at,
+                method=scope.get("method", ""),
+                route=getattr(route, "path", None) or "<unmatched>",
+                status=str(status_code),
+            )
@@ -1,8 +1,13 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
 
 from backend.app.api.deps_authorization import require_role
+from core.utils.metrics import metrics, render_profiler_stats
+from core.utils.profiler import profiler
 from db.models import User
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 router = APIRouter(
     prefix="/admin",
     tags=["admin"],
@@ -16,3 +21,13 @@ def admin_ping(_: User = Depends(require_role("admin"))):
     Accessible uniquement aux utilisateurs avec le rôle 'admin'.
     """
     return {"status": "ok", "role_required": "admin"}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def admin_metrics(_: User = Depends(require_role("admin"))):
+    """
+    Expose les métriques runtime (SQL, routes, solveur, drafts) au format texte Prometheus.
+    Accessible uniquement aux utilisateurs avec le rôle 'admin'.
+    """
+    body = metrics.render() + render_profiler_stats(dict(profiler.stats), namespace=metrics.namespace)
+    return PlainTextResponse(content=body, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,12 +1,14 @@
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
 from backend.app.api.deps import (
     get_agent_day_service,
     get_agent_planning_factory,
     get_planning_day_assembler,
+    get_planning_read_cache,
 )
+from backend.app.api.http_cache import not_modified_response, set_etag_headers
 from backend.app.api.http_exceptions import bad_request
 from backend.app.dto.planning import AgentPlanningResponseDTO
 from backend.app.dto.planning_day import (
@@ -21,6 +23,8 @@ from backend.app.dto.planning_day import (
 from backend.app.mappers.planning import to_agent_planning_response
 from backend.app.mappers.planning_day import to_agent_planning_day_dto, to_planning_day_dto
 from core.application.services import AgentDayService, AgentPlanningFactory, PlanningDayAssembler
+from core.application.services.agent_day_service import AgentDayChange
+from core.application.services.planning.planning_cache import PlanningReadCache, agent_planning_key
 
 router = APIRouter(prefix="/agents", tags=["Agent planning"])
 
@@ -48,12 +52,21 @@ def get_planning_days_for_agents(
 @router.get("/{agent_id}/planning", response_model=AgentPlanningResponseDTO)
 def get_agent_planning(
     agent_id: int,
+    request: Request,
+    response: Response,
     start_date: date = Query(..., description="YYYY-MM-DD"),
     end_date: date = Query(..., description="YYYY-MM-DD"),
     agent_planning_factory: AgentPlanningFactory = Depends(get_agent_planning_factory),
+    read_cache: PlanningReadCache = Depends(get_planning_read_cache),
 ):
+    cache_key = agent_planning_key(agent_id, start_date, end_date)
+    cached_response = not_modified_response(request, read_cache, cache_key)
+    if cached_response is not None:
+        return cached_response
+
     try:
         planning = agent_planning_factory.build(agent_id=agent_id, start_date=start_date, end_date=end_date)
+        set_etag_headers(response, read_cache, cache_key)
         return to_agent_planning_response(planning)
     except ValueError as e:
         bad_request(str(e))
@@ -102,25 +115,31 @@ def bulk_upsert_agent_planning_days(
     agent_day_service: AgentDayService = Depends(get_agent_day_service),
     planning_day_assembler: PlanningDayAssembler = Depends(get_planning_day_assembler),
 ):
-    updated = []
-    failed = []
-
-    for day_date in payload.day_dates:
-        try:
-            agent_day_service.upsert_day(
-                agent_id=agent_id,
-                day_date=day_date,
-                day_type=payload.day_type,
-                tranche_id=payload.tranche_id,
-                description=payload.description,
-            )
-
-            planning_day = planning_day_assembler.build_one_for_agent(agent_id=agent_id, day_date=day_date)
-            updated.append(to_planning_day_dto(planning_day))
-
-        except ValueError as e:
-            failed.append(BulkFailedItem(day_date=day_date, code="VALIDATION_ERROR", message=str(e)))
-        except Exception as e:
-            failed.append(BulkFailedItem(day_date=day_date, code="UNEXPECTED_ERROR", message=str(e)))
+    changes = [
+        AgentDayChange(
+            agent_id=agent_id,
+            day_date=day_date,
+            day_type=payload.day_type,
+            tranche_id=payload.tranche_id,
+            description=payload.description,
+        )
+        for day_date in payload.day_dates
+    ]
+
+    try:
+        result = agent_day_service.bulk_upsert_days(changes)
+    except Exception as e:
+        # Transaction unique : rien n'a été appliqué
+        failed = [BulkFailedItem(day_date=c.day_date, code="UNEXPECTED_ERROR", message=str(e)) for c in changes]
+        return AgentPlanningDayBulkPutResponseDTO(updated=[], failed=failed)
+
+    failed = [
+        BulkFailedItem(day_date=f.day_date, code="VALIDATION_ERROR", message=f.message)
+        for f in result.failed
+    ]
+
+    keys = [(c.agent_id, c.day_date) for c in result.applied]
+    planning_days = planning_day_assembler.build_for_agent_days(keys)
+    updated = [to_planning_day_dto(planning_days[key]) for key in keys if key in planning_days]
 
     return AgentPlanningDayBulkPutResponseDTO(updated=updated, failed=failed)
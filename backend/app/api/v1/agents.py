@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends, status
 
 from backend.app.api.deps import get_agent_service
 from backend.app.api.http_exceptions import bad_request, conflict, not_found
+from backend.app.api.pagination import paginate
 from backend.app.dto.agents import AgentCreateDTO, AgentDTO, AgentDetailDTO, AgentUpdateDTO
-from backend.app.dto.common.pagination import Page, PaginationParams, build_page, pagination_params
+from backend.app.dto.common.pagination import Page, PaginationParams, pagination_params
 from backend.app.mappers.agents import to_agent_detail_dto
 from backend.app.mappers.agents_light import to_agent_dto
 from core.application.services import AgentService
@@ -22,9 +23,7 @@ def list_agents(
     agent_service: AgentService = Depends(get_agent_service),
     p: PaginationParams = Depends(pagination_params),
 ):
-    items = agent_service.list(limit=p.limit, offset=p.offset)
-    total = agent_service.count()
-    return build_page(items=items, total=total, p=p)
+    return paginate(agent_service, p)
 
 
 @router.get("/{agent_id}", response_model=AgentDetailDTO)
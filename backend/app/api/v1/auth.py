@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from backend.app.dto.auth import LoginRequest, MeResponse
@@ -9,25 +11,38 @@ from backend.app.settings import settings
 
 from backend.app.api.deps_auth import get_auth_service
 from backend.app.api.deps_current_user import current_user
-from core.application.services.auth_service import AuthService, AuthError
+from core.application.services.auth_service import AuthService, AuthError, LoginBusyError, LoginThrottledError
 from db.models import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/login", response_model=ActionResponse)
-def login(
+async def login(
     payload: LoginRequest,
     request: Request,
     response: Response,
     auth: AuthService = Depends(get_auth_service),
 ):
     try:
-        pair = auth.login(
+        # Route async : le hachage argon2 n'occupe pas de thread du threadpool des requêtes
+        pair = await auth.alogin(
             payload.username,
             payload.password,
             user_agent=request.headers.get("user-agent"),
             ip=(request.client.host if request.client else None),
         )
+    except LoginThrottledError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after))},
+        )
+    except LoginBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     except AuthError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
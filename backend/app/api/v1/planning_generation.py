@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Header
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from backend.app.api.deps import get_db
 from backend.app.api.deps_current_user import current_user
-from backend.app.api.http_exceptions import bad_request, forbidden, not_found, unprocessable_entity
+from backend.app.api.http_exceptions import bad_request, conflict, forbidden, not_found, unprocessable_entity
 from backend.app.dto.team_planning import TeamPlanningResponseDTO
 from backend.app.services.planning_draft_read_service import get_draft_team_planning as get_draft_team_planning_service
 from backend.app.dto.planning_generate import (
@@ -17,7 +18,7 @@ from backend.app.dto.planning_generate import (
     PlanningGenerateResponse,
     PlanningGenerateStatusResponse,
 )
-from backend.app.services.planning.generation import planning_generation_service
+from backend.app.services.planning.generation import IdempotencyKeyConflictError, planning_generation_service
 from backend.app.services.planning_draft_decision_service import accept_draft as accept_draft_service, reject_draft as reject_draft_service
 from backend.app.services.solver.stats_normalizer import normalize_result_stats_for_api
 from core.domain.enums.planning_draft_status import PlanningDraftStatus
@@ -46,43 +47,62 @@ def generate_planning(
     payload: PlanningGenerateRequest,
     background_tasks: BackgroundTasks,
     session: Session = Depends(get_db),
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key", max_length=128),
 ) -> PlanningGenerateResponse:
+    create_kwargs = dict(
+        team_id=payload.team_id,
+        start_date=payload.start_date,
+        end_date=payload.end_date,
+        seed=payload.seed,
+        time_limit_seconds=payload.time_limit_seconds,
+        quality_profile=payload.quality_profile,
+        v3_strategy=payload.v3_strategy,
+        phase1_fraction=payload.phase1_fraction,
+        phase1_seconds=payload.phase1_seconds,
+        lns_iter_seconds=payload.lns_iter_seconds,
+        lns_min_remaining_seconds=payload.lns_min_remaining_seconds,
+        lns_strict_improve=payload.lns_strict_improve,
+        lns_max_days_to_relax=payload.lns_max_days_to_relax,
+        lns_neighborhood_mode=payload.lns_neighborhood_mode,
+        min_lns_seconds=payload.min_lns_seconds,
+        phase2_max_fraction_of_remaining=payload.phase2_max_fraction_of_remaining,
+        phase2_no_improve_seconds=payload.phase2_no_improve_seconds,
+        enable_decision_strategy=payload.enable_decision_strategy,
+        enable_symmetry_breaking=payload.enable_symmetry_breaking,
+        enable_warm_start=payload.enable_warm_start,
+        enable_decomposition=payload.enable_decomposition,
+        alternatives_count=payload.alternatives_count,
+        alternatives_min_changed_days=payload.alternatives_min_changed_days,
+        budget_mode=payload.budget_mode,
+        enable_memory_profiling=payload.enable_memory_profiling,
+        memory_limit_mb=payload.memory_limit_mb,
+        idempotency_key=idempotency_key,
+    )
     try:
-        draft = planning_generation_service.create_draft(
-            session=session,
-            team_id=payload.team_id,
-            start_date=payload.start_date,
-            end_date=payload.end_date,
-            seed=payload.seed,
-            time_limit_seconds=payload.time_limit_seconds,
-            quality_profile=payload.quality_profile,
-            v3_strategy=payload.v3_strategy,
-            phase1_fraction=payload.phase1_fraction,
-            phase1_seconds=payload.phase1_seconds,
-            lns_iter_seconds=payload.lns_iter_seconds,
-            lns_min_remaining_seconds=payload.lns_min_remaining_seconds,
-            lns_strict_improve=payload.lns_strict_improve,
-            lns_max_days_to_relax=payload.lns_max_days_to_relax,
-            lns_neighborhood_mode=payload.lns_neighborhood_mode,
-            min_lns_seconds=payload.min_lns_seconds,
-            phase2_max_fraction_of_remaining=payload.phase2_max_fraction_of_remaining,
-            phase2_no_improve_seconds=payload.phase2_no_improve_seconds,
-            enable_decision_strategy=payload.enable_decision_strategy,
-            enable_symmetry_breaking=payload.enable_symmetry_breaking,
-        )
-
-        session.commit()
+        try:
+            draft, deduplicated = planning_generation_service.create_draft(session=session, **create_kwargs)
+            session.commit()
+        except IntegrityError:
+            # Même empreinte (job en cours) ou même clé d'idempotence insérée en parallèle :
+            # l'autre requête a créé le draft, on s'y rattache
+            session.rollback()
+            draft, deduplicated = planning_generation_service.create_draft(session=session, **create_kwargs)
+            session.commit()
 
         session.refresh(draft)
+    except IdempotencyKeyConflictError as exc:
+        conflict(str(exc))
     except ValueError as exc:
         bad_request(str(exc))
 
-    job_id_str = str(draft.job_id)
-    background_tasks.add_task(planning_generation_service.run_job, job_id_str)
+    if not deduplicated:
+        background_tasks.add_task(planning_generation_service.run_job, str(draft.job_id))
     return PlanningGenerateResponse(
         job_id=UUID(draft.job_id),
         draft_id=draft.id,
-        status=PlanningDraftStatus.QUEUED,
+        status=PlanningDraftStatus(draft.status),
+        deduplicated=deduplicated,
+        dedup_count=draft.dedup_count,
     )
 
 
@@ -102,6 +122,14 @@ def get_generation_status(job_id: str, session: Session = Depends(get_db)) -> Pl
     if draft_status in (PlanningDraftStatus.SUCCESS, PlanningDraftStatus.FAILED):
         normalized_result_stats = normalize_result_stats_for_api(draft.result_stats)
 
+    alternative_draft_ids = [
+        draft_id
+        for (draft_id,) in session.query(PlanningDraft.id)
+        .filter(PlanningDraft.parent_draft_id == draft.id)
+        .order_by(PlanningDraft.alternative_rank)
+        .all()
+    ]
+
     return PlanningGenerateStatusResponse(
         job_id=UUID(draft.job_id),
         draft_id=draft.id,
@@ -109,6 +137,9 @@ def get_generation_status(job_id: str, session: Session = Depends(get_db)) -> Pl
         progress=_progress_from_status(draft_status),
         result_stats=normalized_result_stats,
         error=draft.error if draft_status == PlanningDraftStatus.FAILED else None,
+        parent_draft_id=draft.parent_draft_id,
+        alternative_draft_ids=alternative_draft_ids,
+        dedup_count=draft.dedup_count,
     )
 
 
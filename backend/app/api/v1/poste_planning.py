@@ -1,26 +1,32 @@
 from datetime import date
+from typing import List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from backend.app.api.deps import (
     get_poste_planning_day_assembler,
     get_poste_planning_day_service,
     get_poste_planning_factory,
     get_poste_service,
+    get_planning_read_cache,
+    get_tranche_catalog,
 )
+from backend.app.api.http_cache import not_modified_response, set_etag_headers
 from backend.app.api.http_exceptions import bad_request, not_found
-from backend.app.dto.poste_coverage_day import PosteCoverageDayDTO
+from backend.app.dto.poste_coverage_day import PosteCoverageDayDTO, PosteCoverageRangeDTO
 from backend.app.dto.poste_planning import PostePlanningDayDTO, PostePlanningDayEditRequest, PostePlanningResponseDTO
-from backend.app.mappers.poste_coverage_day import to_poste_coverage_day_dto
+from backend.app.mappers.poste_coverage_day import to_poste_coverage_day_dto, to_poste_coverage_range_dto
 from backend.app.mappers.poste_planning import to_poste_planning_day_dto, to_poste_planning_response
 from core.application.services import PosteService
 from core.application.services.exceptions import NotFoundError
+from core.application.services.planning.planning_cache import PlanningReadCache, poste_planning_key
 from core.application.services.planning.poste_planning_day_assembler import PostePlanningDayAssembler
 from core.application.services.planning.poste_planning_day_service import (
     PostePlanningDayService,
     PostePlanningTrancheAgents,
 )
 from core.application.services.planning.poste_planning_factory import PostePlanningFactory
+from core.application.services.planning.tranche_catalog import TrancheCatalog
 
 router = APIRouter(prefix="/postes", tags=["Postes - Planning"])
 
@@ -28,16 +34,27 @@ router = APIRouter(prefix="/postes", tags=["Postes - Planning"])
 @router.get("/{poste_id}/planning", response_model=PostePlanningResponseDTO)
 def get_poste_planning(
     poste_id: int,
+    request: Request,
+    response: Response,
     start_date: date = Query(..., description="YYYY-MM-DD"),
     end_date: date = Query(..., description="YYYY-MM-DD"),
     poste_planning_factory: PostePlanningFactory = Depends(get_poste_planning_factory),
+    read_cache: PlanningReadCache = Depends(get_planning_read_cache),
+    catalog: TrancheCatalog = Depends(get_tranche_catalog),
 ):
+    cache_key = poste_planning_key(poste_id, start_date, end_date)
+    cached_response = not_modified_response(request, read_cache, cache_key)
+    if cached_response is not None:
+        return cached_response
+
     try:
         planning = poste_planning_factory.build(
             poste_id=poste_id,
             start_date=start_date,
             end_date=end_date,
+            catalog=catalog,
         )
+        set_etag_headers(response, read_cache, cache_key)
         return to_poste_planning_response(planning)
     except ValueError as e:
         msg = str(e)
@@ -47,6 +64,22 @@ def get_poste_planning(
         bad_request(msg)
 
 
+@router.get("/planning/coverage/range", response_model=PosteCoverageRangeDTO)
+def get_postes_planning_coverage_range(
+    poste_ids: List[int] = Query(..., description="Répétable : ?poste_ids=1&poste_ids=2"),
+    start_date: date = Query(..., description="YYYY-MM-DD"),
+    end_date: date = Query(..., description="YYYY-MM-DD"),
+    service: PosteService = Depends(get_poste_service),
+) -> PosteCoverageRangeDTO:
+    try:
+        rm = service.get_poste_coverage_for_range(poste_ids=poste_ids, start_date=start_date, end_date=end_date)
+        return to_poste_coverage_range_dto(rm)
+    except NotFoundError as e:
+        not_found({"code": e.code, "details": e.details})
+    except ValueError as e:
+        bad_request(str(e))
+
+
 @router.get("/{poste_id}/planning/coverage", response_model=PosteCoverageDayDTO)
 def get_poste_planning_coverage(
     poste_id: int,
@@ -68,6 +101,7 @@ def rewrite_poste_day(
     payload: PostePlanningDayEditRequest,
     svc: PostePlanningDayService = Depends(get_poste_planning_day_service),
     assembler: PostePlanningDayAssembler = Depends(get_poste_planning_day_assembler),
+    catalog: TrancheCatalog = Depends(get_tranche_catalog),
 ):
     try:
         svc.rewrite_poste_day(
@@ -78,9 +112,11 @@ def rewrite_poste_day(
                 for t in payload.tranches
             ],
             cleanup_empty_agent_days=payload.cleanup_empty_agent_days,
+            catalog=catalog,
         )
 
-        poste_planning_day = assembler.build_one_for_poste(poste_id=poste_id, day_date=day_date)
+        # même catalogue : les tranches validées ci-dessus ne sont pas relues
+        poste_planning_day = assembler.build_one_for_poste(poste_id=poste_id, day_date=day_date, catalog=catalog)
         return to_poste_planning_day_dto(poste_planning_day)
 
     except ValueError as e:
@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, status
 
 from backend.app.api.deps import get_poste_service
 from backend.app.api.http_exceptions import bad_request, conflict, not_found
-from backend.app.dto.common.pagination import Page, PaginationParams, build_page, pagination_params
+from backend.app.api.pagination import paginate
+from backend.app.dto.common.pagination import Page, PaginationParams, pagination_params
 from backend.app.dto.postes import PosteCreateDTO, PosteDTO, PosteDetailDTO, PosteUpdateDTO
 from backend.app.mappers.postes import to_poste_detail_dto, to_poste_dto
 from core.application.services import PosteService
@@ -21,9 +22,7 @@ def list_postes(
     poste_service: PosteService = Depends(get_poste_service),
     p: PaginationParams = Depends(pagination_params),
 ):
-    items = poste_service.list(limit=p.limit, offset=p.offset)
-    total = poste_service.count()
-    return build_page(items=items, total=total, p=p)
+    return paginate(poste_service, p)
 
 
 @router.get("/{poste_id}", response_model=PosteDetailDTO)
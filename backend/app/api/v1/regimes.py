@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, status
 
 from backend.app.api.deps import get_regime_service
 from backend.app.api.http_exceptions import bad_request, conflict, not_found
-from backend.app.dto.common.pagination import Page, PaginationParams, build_page, pagination_params
+from backend.app.api.pagination import paginate
+from backend.app.dto.common.pagination import Page, PaginationParams, pagination_params
 from backend.app.dto.regimes import RegimeCreateDTO, RegimeDTO, RegimeDetailDTO, RegimeUpdateDTO
 from backend.app.mappers.regimes import to_regime_detail_dto
 from backend.app.mappers.regimes_light import to_regime_dto
@@ -53,9 +54,7 @@ def list_regimes(
     regime_service: RegimeService = Depends(get_regime_service),
     p: PaginationParams = Depends(pagination_params),
 ):
-    items = regime_service.list(limit=p.limit, offset=p.offset)
-    total = regime_service.count()
-    return build_page(items=items, total=total, p=p)
+    return paginate(regime_service, p)
 
 
 @router.patch("/{regime_id}", response_model=RegimeDTO)
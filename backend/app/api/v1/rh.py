@@ -2,19 +2,19 @@ from datetime import date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Annotated, List, Tuple
 
-from backend.app.api.deps import get_agent_planning_factory, get_agent_planning_validator_service, get_qualification_service, get_team_service
+from backend.app.api.deps import get_agent_planning_factory, get_agent_planning_validator_service, get_eligibility_cache, get_team_service
 from backend.app.dto.rh.rh_request import RHValidateAgentRequestDTO, RHValidatePosteDayRequestDTO, RHValidatePosteRequestDTO, RHValidateTeamRequestDTO
 from backend.app.dto.rh.rh_validation_day_details import RhValidationPosteDayDetailsDTO
 from backend.app.dto.rh.rh_validation_result import RhValidationAgentResultDTO, RhValidationTeamAgentResultDTO, RhValidationTeamResultDTO, RhValidationTeamSkippedDTO
-from backend.app.dto.rh.rh_validation_summary import RhValidationPosteSummaryDTO
+from backend.app.dto.rh.rh_validation_summary import RhValidationPosteSummaryDTO, RhValidationTeamSummaryDTO
 from backend.app.mappers.rh.rh_validation_day_details import to_poste_day_details_dto
-from backend.app.mappers.rh.rh_validation_summary import to_poste_summary_dto
+from backend.app.mappers.rh.rh_validation_summary import to_poste_summary_dto, to_team_summary_dto
 from backend.app.mappers.rh.rh_validation_result import rh_validation_result_to_dto
 
 from core.application.config.rh_rules_config import RhEngineProfile
 from core.application.services.planning.agent_planning_factory import AgentPlanningFactory
 from core.application.services.agent_planning_validator_service import AgentPlanningValidatorService
-from core.application.services.qualification_service import QualificationService
+from core.application.services.eligibility_cache import EligibilityCache
 from core.application.services.teams.team_service import TeamService
 from core.application.services.exceptions import NotFoundError
 from core.rh_rules.models.rule_result import RuleResult
@@ -53,7 +53,7 @@ def validate_poste_day(
     include_info: Annotated[bool, Query()] = False,
     agent_planning_factory: AgentPlanningFactory = Depends(get_agent_planning_factory),
     validator: AgentPlanningValidatorService = Depends(get_agent_planning_validator_service),
-    qualification_service: QualificationService = Depends(get_qualification_service),
+    eligibility: EligibilityCache = Depends(get_eligibility_cache),
 ) -> RhValidationPosteDayDetailsDTO:
     if payload.date_debut > payload.date_fin:
         raise HTTPException(status_code=422, detail="date_debut must be <= date_fin")
@@ -61,8 +61,7 @@ def validate_poste_day(
     if not (payload.date_debut <= payload.day <= payload.date_fin):
         raise HTTPException(status_code=422, detail="day must be within [date_debut, date_fin]")
 
-    qualifications = qualification_service.search(poste_id=payload.poste_id)
-    qualified_agent_ids = [q.agent_id for q in qualifications]
+    qualified_agent_ids = eligibility.get().qualified_agent_ids(payload.poste_id)
 
     # padding backend-only
     pad = timedelta(days=31)
@@ -96,13 +95,12 @@ def validate_poste_summary(
     profile: Annotated[RhEngineProfile, Query()] = RhEngineProfile.FULL,
     agent_planning_factory: AgentPlanningFactory = Depends(get_agent_planning_factory),
     validator: AgentPlanningValidatorService = Depends(get_agent_planning_validator_service),
-    qualification_service: QualificationService = Depends(get_qualification_service),
+    eligibility: EligibilityCache = Depends(get_eligibility_cache),
 ) -> RhValidationPosteSummaryDTO:
     if payload.date_debut > payload.date_fin:
         raise HTTPException(status_code=422, detail="date_debut must be <= date_fin")
 
-    qualifications = qualification_service.search(poste_id=payload.poste_id)
-    qualified_agent_ids = [q.agent_id for q in qualifications]
+    qualified_agent_ids = eligibility.get().qualified_agent_ids(payload.poste_id)
 
     if not qualified_agent_ids:
         return to_poste_summary_dto(
@@ -139,19 +137,17 @@ def validate_poste_summary(
         per_agent_results=per_agent_results,
     )
 
-@router.post("/validate/team", response_model=RhValidationTeamResultDTO)
-def validate_team(
-    payload: RHValidateTeamRequestDTO,
-    profile: Annotated[RhEngineProfile, Query()] = RhEngineProfile.FULL,
-    agent_planning_factory: AgentPlanningFactory = Depends(get_agent_planning_factory),
-    validator: AgentPlanningValidatorService = Depends(get_agent_planning_validator_service),
-    team_service: TeamService = Depends(get_team_service),
-) -> RhValidationTeamResultDTO:
-    if payload.date_debut > payload.date_fin:
-        raise HTTPException(status_code=422, detail="date_debut must be <= date_fin")
-
+def _validate_team_agents(
+    *,
+    team_id: int,
+    date_debut: date,
+    date_fin: date,
+    agent_planning_factory: AgentPlanningFactory,
+    validator: AgentPlanningValidatorService,
+    team_service: TeamService,
+) -> Tuple[List[int], List[Tuple[int, RuleResult]], List[RhValidationTeamSkippedDTO]]:
     try:
-        agent_ids = team_service.list_agent_ids(team_id=payload.team_id)
+        agent_ids = team_service.list_agent_ids(team_id=team_id)
     except NotFoundError as e:
         raise HTTPException(
             status_code=404,
@@ -159,18 +155,18 @@ def validate_team(
         ) from e
 
     pad = timedelta(days=31)
-    window_start = payload.date_debut - pad
-    window_end = payload.date_fin + pad
+    window_start = date_debut - pad
+    window_end = date_fin + pad
 
-    results: List[RhValidationTeamAgentResultDTO] = []
+    per_agent_results: List[Tuple[int, RuleResult]] = []
     skipped: List[RhValidationTeamSkippedDTO] = []
 
     for agent_id in sorted(agent_ids):
         try:
             planning = agent_planning_factory.build(
                 agent_id=agent_id,
-                start_date=payload.date_debut,
-                end_date=payload.date_fin,
+                start_date=date_debut,
+                end_date=date_fin,
             )
         except NotFoundError as e:
             skipped.append(
@@ -199,11 +195,68 @@ def validate_team(
             )
             continue
 
-        results.append(
-            RhValidationTeamAgentResultDTO(
-                agent_id=agent_id,
-                result=rh_validation_result_to_dto(result)
-            )
+        per_agent_results.append((agent_id, result))
+
+    return list(agent_ids), per_agent_results, skipped
+
+
+@router.post("/validate/team", response_model=RhValidationTeamResultDTO)
+def validate_team(
+    payload: RHValidateTeamRequestDTO,
+    profile: Annotated[RhEngineProfile, Query()] = RhEngineProfile.FULL,
+    agent_planning_factory: AgentPlanningFactory = Depends(get_agent_planning_factory),
+    validator: AgentPlanningValidatorService = Depends(get_agent_planning_validator_service),
+    team_service: TeamService = Depends(get_team_service),
+) -> RhValidationTeamResultDTO:
+    if payload.date_debut > payload.date_fin:
+        raise HTTPException(status_code=422, detail="date_debut must be <= date_fin")
+
+    _, per_agent_results, skipped = _validate_team_agents(
+        team_id=payload.team_id,
+        date_debut=payload.date_debut,
+        date_fin=payload.date_fin,
+        agent_planning_factory=agent_planning_factory,
+        validator=validator,
+        team_service=team_service,
+    )
+
+    results = [
+        RhValidationTeamAgentResultDTO(
+            agent_id=agent_id,
+            result=rh_validation_result_to_dto(result)
         )
+        for agent_id, result in per_agent_results
+    ]
+
+    return RhValidationTeamResultDTO(results=results, skipped=skipped)
+
 
-    return RhValidationTeamResultDTO(results=results, skipped=skipped)
\ No newline at end of file
+@router.post("/validate/team/summary", response_model=RhValidationTeamSummaryDTO)
+def validate_team_summary(
+    payload: RHValidateTeamRequestDTO,
+    profile: Annotated[RhEngineProfile, Query()] = RhEngineProfile.FULL,
+    agent_planning_factory: AgentPlanningFactory = Depends(get_agent_planning_factory),
+    validator: AgentPlanningValidatorService = Depends(get_agent_planning_validator_service),
+    team_service: TeamService = Depends(get_team_service),
+) -> RhValidationTeamSummaryDTO:
+    if payload.date_debut > payload.date_fin:
+        raise HTTPException(status_code=422, detail="date_debut must be <= date_fin")
+
+    agent_ids, per_agent_results, skipped = _validate_team_agents(
+        team_id=payload.team_id,
+        date_debut=payload.date_debut,
+        date_fin=payload.date_fin,
+        agent_planning_factory=agent_planning_factory,
+        validator=validator,
+        team_service=team_service,
+    )
+
+    return to_team_summary_dto(
+        team_id=payload.team_id,
+        start=payload.date_debut,
+        end=payload.date_fin,
+        profile=profile,
+        agent_ids=agent_ids,
+        per_agent_results=per_agent_results,
+        skipped=skipped,
+    )
@@ -1,15 +1,24 @@
 from datetime import date
 from typing import List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from backend.app.api.deps import get_agent_day_service, get_planning_day_assembler, get_team_planning_factory, get_team_service
+from backend.app.api.deps import (
+    get_agent_day_service,
+    get_planning_day_assembler,
+    get_planning_read_cache,
+    get_team_planning_factory,
+    get_team_service,
+)
+from backend.app.api.http_cache import not_modified_response, set_etag_headers
 from backend.app.api.http_exceptions import bad_request, not_found
 from backend.app.dto.planning_day import AgentPlanningDayDTO
 from backend.app.dto.team_planning import TeamPlanningDayBulkPutDTO, TeamPlanningDayBulkPutResponseDTO, TeamPlanningResponseDTO, TeamBulkFailedItem
 from backend.app.mappers.planning_day import to_planning_day_dto
 from backend.app.mappers.team_planning import to_team_planning_response
+from core.application.services.agent_day_service import AgentDayChange
 from core.application.services.exceptions import NotFoundError
+from core.application.services.planning.planning_cache import PlanningReadCache, team_planning_key
 from core.application.services.planning.team_planning_factory import TeamPlanningFactory
 
 router = APIRouter(prefix="/teams", tags=["Teams - Planning"])
@@ -18,12 +27,21 @@ router = APIRouter(prefix="/teams", tags=["Teams - Planning"])
 @router.get("/{team_id}/planning", response_model=TeamPlanningResponseDTO)
 def get_team_planning(
     team_id: int,
+    request: Request,
+    response: Response,
     start_date: date = Query(..., description="YYYY-MM-DD"),
     end_date: date = Query(..., description="YYYY-MM-DD"),
     team_planning_factory: TeamPlanningFactory = Depends(get_team_planning_factory),
+    read_cache: PlanningReadCache = Depends(get_planning_read_cache),
 ):
+    cache_key = team_planning_key(team_id, start_date, end_date)
+    cached_response = not_modified_response(request, read_cache, cache_key)
+    if cached_response is not None:
+        return cached_response
+
     try:
         planning = team_planning_factory.build(team_id=team_id, start_date=start_date, end_date=end_date)
+        set_etag_headers(response, read_cache, cache_key)
         return to_team_planning_response(planning)
     except NotFoundError as e:
         # tu avais un detail structuré, on conserve
@@ -41,6 +59,7 @@ def bulk_upsert_team_planning_days(
 ):
     updated: List[AgentPlanningDayDTO] = []
     failed: List[TeamBulkFailedItem] = []
+    changes: List[AgentDayChange] = []
 
     try:
         team_agent_ids = set(team_service.list_agent_ids(team_id=team_id))
@@ -62,41 +81,41 @@ def bulk_upsert_team_planning_days(
                 )
             continue
 
-        for day_date in item.day_dates:
-            try:
-                agent_day_service.upsert_day(
-                    agent_id=agent_id,
-                    day_date=day_date,
-                    day_type=payload.day_type,
-                    tranche_id=payload.tranche_id,
-                    description=payload.description,
-                )
+        changes.extend(
+            AgentDayChange(
+                agent_id=agent_id,
+                day_date=day_date,
+                day_type=payload.day_type,
+                tranche_id=payload.tranche_id,
+                description=payload.description,
+            )
+            for day_date in item.day_dates
+        )
 
-                planning_day = planning_day_assembler.build_one_for_agent(agent_id=agent_id, day_date=day_date)
-                updated.append(
-                    AgentPlanningDayDTO(
-                        agent_id=agent_id,
-                        planning_day=to_planning_day_dto(planning_day),
-                    )
-                )
+    if not changes:
+        return TeamPlanningDayBulkPutResponseDTO(updated=updated, failed=failed)
 
-            except ValueError as e:
-                failed.append(
-                    TeamBulkFailedItem(
-                        agent_id=agent_id,
-                        day_date=day_date,
-                        code="VALIDATION_ERROR",
-                        message=str(e),
-                    )
-                )
-            except Exception as e:
-                failed.append(
-                    TeamBulkFailedItem(
-                        agent_id=agent_id,
-                        day_date=day_date,
-                        code="UNEXPECTED_ERROR",
-                        message=str(e),
-                    )
-                )
+    try:
+        result = agent_day_service.bulk_upsert_days(changes)
+    except Exception as e:
+        # Transaction unique : rien n'a été appliqué
+        failed.extend(
+            TeamBulkFailedItem(agent_id=c.agent_id, day_date=c.day_date, code="UNEXPECTED_ERROR", message=str(e))
+            for c in changes
+        )
+        return TeamPlanningDayBulkPutResponseDTO(updated=updated, failed=failed)
+
+    failed.extend(
+        TeamBulkFailedItem(agent_id=f.agent_id, day_date=f.day_date, code="VALIDATION_ERROR", message=f.message)
+        for f in result.failed
+    )
+
+    keys = [(c.agent_id, c.day_date) for c in result.applied]
+    planning_days = planning_day_assembler.build_for_agent_days(keys)
+    updated.extend(
+        AgentPlanningDayDTO(agent_id=agent_id, planning_day=to_planning_day_dto(planning_days[(agent_id, day_date)]))
+        for agent_id, day_date in keys
+        if (agent_id, day_date) in planning_days
+    )
 
     return TeamPlanningDayBulkPutResponseDTO(updated=updated, failed=failed)
@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, status
 
 from backend.app.api.deps import get_team_service
 from backend.app.api.http_exceptions import bad_request, conflict, not_found
-from backend.app.dto.common.pagination import Page, PaginationParams, build_page, pagination_params
+from backend.app.api.pagination import paginate
+from backend.app.dto.common.pagination import Page, PaginationParams, pagination_params
 from backend.app.dto.team import TeamCreateDTO, TeamDTO, TeamUpdateDTO
 from backend.app.mappers.teams import to_team_dto
 from core.application.services.exceptions import ConflictError, NotFoundError
@@ -16,9 +17,7 @@ def list_teams(
     service: TeamService = Depends(get_team_service),
     p: PaginationParams = Depends(pagination_params),
 ):
-    items = service.list(limit=p.limit, offset=p.offset)
-    total = service.count()
-    return build_page(items, total, p)
+    return paginate(service, p)
 
 
 @router.post("", response_model=TeamDTO, status_code=status.HTTP_201_CREATED)
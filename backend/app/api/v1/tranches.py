@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, status
 
 from backend.app.api.deps import get_tranche_service
 from backend.app.api.http_exceptions import bad_request, conflict, not_found
-from backend.app.dto.common.pagination import Page, PaginationParams, build_page, pagination_params
+from backend.app.api.pagination import paginate
+from backend.app.dto.common.pagination import Page, PaginationParams, pagination_params
 from backend.app.dto.tranches import TrancheCreateDTO, TrancheDTO, TrancheUpdateDTO
 from backend.app.mappers.tranches import to_tranche_dto
 from core.application.services import TrancheService
@@ -23,9 +24,7 @@ def list_tranches(
     tranche_service: TrancheService = Depends(get_tranche_service),
     p: PaginationParams = Depends(pagination_params),
 ):
-    items = tranche_service.list(limit=p.limit, offset=p.offset)
-    total = tranche_service.count()
-    return build_page(items=items, total=total, p=p)
+    return paginate(tranche_service, p)
 
 
 @router.post("/", response_model=TrancheDTO, status_code=status.HTTP_201_CREATED)
@@ -1,13 +1,17 @@
+from typing import Any, Optional
+
 from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from backend.app.api.deps import get_db
 from backend.app.api.deps_authorization import require_admin
-from backend.app.api.http_exceptions import bad_request, conflict, forbidden, not_found
+from backend.app.api.http_exceptions import bad_request, conflict, forbidden, not_found, service_unavailable
+from backend.app.bootstrap.container import user_auth_cache
 from backend.app.dto.users import UserCreate, UserOut, UserUpdate
-from backend.app.security.password import hash_password
+from backend.app.security.password import PasswordHasherBusy, ahash_password
 from db.models import User
 
 router = APIRouter(prefix="/users", tags=["users"], dependencies=[Depends(require_admin)])
@@ -27,6 +31,15 @@ def _normalize_password(password: str) -> str:
     return normalized
 
 
+async def _hash_password(password: str) -> str:
+    # Attendu depuis la boucle d'événements : aucun thread de requête bloqué pendant argon2.
+    # Pool argon2 saturé (rafale de logins) : 503 + Retry-After, comme le login
+    try:
+        return await ahash_password(_normalize_password(password))
+    except PasswordHasherBusy:
+        service_unavailable("Password hashing temporarily unavailable")
+
+
 def _active_admin_count(db: Session) -> int:
     return (
         db.query(func.count(User.id))
@@ -37,13 +50,17 @@ def _active_admin_count(db: Session) -> int:
 
 
 @router.post("", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def create_user(payload: UserCreate, db: Session = Depends(get_db)) -> User:
+async def create_user(payload: UserCreate, db: Session = Depends(get_db)) -> User:
     user = User(
         username=_normalize_username(payload.username),
-        password_hash=hash_password(_normalize_password(payload.password)),
+        password_hash=await _hash_password(payload.password),
         role=payload.role,
         is_active=payload.is_active,
     )
+    return await run_in_threadpool(_insert_user, db, user)
+
+
+def _insert_user(db: Session, user: User) -> User:
     db.add(user)
     try:
         db.commit()
@@ -74,20 +91,31 @@ def get_user(user_id: int, db: Session = Depends(get_db)) -> User:
 
 
 @router.patch("/{user_id}", response_model=UserOut)
-def update_user(
+async def update_user(
     user_id: int,
     payload: UserUpdate,
     db: Session = Depends(get_db),
     actor: User = Depends(require_admin),
 ) -> User:
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        not_found("Not found")
-
     changes = payload.model_dump(exclude_unset=True)
     if not changes:
         bad_request("Invalid payload")
 
+    password_hash = await _hash_password(changes["password"]) if "password" in changes else None
+    return await run_in_threadpool(_apply_user_update, db, user_id, changes, actor, password_hash)
+
+
+def _apply_user_update(
+    db: Session,
+    user_id: int,
+    changes: dict[str, Any],
+    actor: User,
+    password_hash: Optional[str],
+) -> User:
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        not_found("Not found")
+
     if user.id == actor.id and (
         changes.get("role") == "manager" or changes.get("is_active") is False
     ):
@@ -107,14 +135,20 @@ def update_user(
         user.role = changes["role"]
     if "is_active" in changes:
         user.is_active = changes["is_active"]
-    if "password" in changes:
-        user.password_hash = hash_password(_normalize_password(changes["password"]))
+    if password_hash is not None:
+        user.password_hash = password_hash
+
+    # Désactivation / changement de mot de passe : les access tokens en cours sont révoqués
+    if changes.get("is_active") is False or "password" in changes:
+        user.token_version = (user.token_version or 0) + 1
 
     try:
         db.commit()
     except IntegrityError:
         db.rollback()
         conflict("Conflict")
+    finally:
+        user_auth_cache.invalidate(user_id)
 
     db.refresh(user)
     return user
@@ -137,10 +171,13 @@ def delete_user(
         forbidden("Forbidden")
 
     user.is_active = False
+    user.token_version = (user.token_version or 0) + 1
     try:
         db.commit()
     except IntegrityError:
         db.rollback()
         conflict("Conflict")
+    finally:
+        user_auth_cache.invalidate(user_id)
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,5 +1,6 @@
 # backend/app/bootstrap/container.py
 
+from backend.app.settings import settings
 from core.application.services import (
     AgentDayService,
     AgentService,
@@ -17,6 +18,10 @@ from core.application.services import (
     TeamService,
     TrancheService,
 )
+from core.application.services.eligibility_cache import EligibilityCache
+from core.application.services.planning.planning_cache import PlanningReadCache, PlanningVersions
+from core.application.services.user_auth_cache import UserAuthCache
+from backend.app.security.login_throttle import LoginThrottle
 
 from db.repositories import (
     agent_repo,
@@ -28,10 +33,51 @@ from db.repositories import (
     regime_repo,
     tranche_repo,
     agent_team_repo,
+    eligibility_repo,
     team_repo,
 )
 
 
+# ---------------------------------------------------------
+# Planning read cache
+# ---------------------------------------------------------
+
+planning_versions = PlanningVersions()
+
+planning_read_cache = PlanningReadCache(
+    versions=planning_versions,
+    max_entries=settings.planning_cache_max_entries,
+    enabled=settings.planning_cache_enabled,
+    ttl_seconds=settings.planning_cache_ttl_seconds,
+)
+
+# ---------------------------------------------------------
+# Eligibility (qualifications + équipes)
+# ---------------------------------------------------------
+
+eligibility_cache = EligibilityCache(
+    repo=eligibility_repo,
+    ttl_seconds=settings.eligibility_cache_ttl_seconds,
+    enabled=settings.eligibility_cache_enabled,
+)
+
+# ---------------------------------------------------------
+# Auth user cache
+# ---------------------------------------------------------
+
+user_auth_cache = UserAuthCache(
+    ttl_seconds=settings.user_cache_ttl_seconds,
+    enabled=settings.user_cache_enabled,
+)
+
+login_throttle = LoginThrottle(
+    max_failures_per_user=settings.login_max_failures_per_user,
+    max_failures_per_ip=settings.login_max_failures_per_ip,
+    window_seconds=settings.login_failure_window_seconds,
+    lockout_seconds=settings.login_lockout_seconds,
+    enabled=settings.login_throttle_enabled,
+)
+
 # ---------------------------------------------------------
 # Repositories -> Services
 # ---------------------------------------------------------
@@ -39,6 +85,7 @@ from db.repositories import (
 agent_day_service = AgentDayService(
     agent_day_repo=agent_day_repo,
     assignment_repo=agent_day_assignment_repo,
+    planning_versions=planning_versions,
 )
 
 agent_service = AgentService(
@@ -46,12 +93,16 @@ agent_service = AgentService(
     agent_day_repo=agent_day_repo,
     qualification_repo=qualification_repo,
     regime_repo=regime_repo,
+    planning_versions=planning_versions,
+    eligibility=eligibility_cache,
 )
 
 poste_service = PosteService(
     poste_repo=poste_repo,
     qualification_repo=qualification_repo,
     tranche_repo=tranche_repo,
+    eligibility=eligibility_cache,
+    planning_versions=planning_versions,
 )
 
 poste_coverage_requirement_service = PosteCoverageRequirementService(
@@ -62,25 +113,31 @@ qualification_service = QualificationService(
     agent_repo=agent_repo,
     poste_repo=poste_repo,
     qualification_repo=qualification_repo,
+    eligibility=eligibility_cache,
+    planning_versions=planning_versions,
 )
 
 regime_service = RegimeService(
     agent_repo=agent_repo,
     regime_repo=regime_repo,
+    planning_versions=planning_versions,
 )
 
 tranche_service = TrancheService(
     poste_repo=poste_repo,
     tranche_repo=tranche_repo,
-    agent_day_assignment_repo=agent_day_assignment_repo
+    agent_day_assignment_repo=agent_day_assignment_repo,
+    planning_versions=planning_versions,
 )
 
-team_service = TeamService(repo=team_repo)
+team_service = TeamService(repo=team_repo, eligibility=eligibility_cache, planning_versions=planning_versions)
 
 agent_team_service = AgentTeamService(
     agent_repo=agent_repo,
     team_repo=team_repo,
-    agent_team_repo=agent_team_repo
+    agent_team_repo=agent_team_repo,
+    planning_versions=planning_versions,
+    eligibility=eligibility_cache,
 )
 
 # ---------------------------------------------------------
@@ -100,34 +157,41 @@ poste_planning_day_assembler = PostePlanningDayAssembler(
 poste_planning_day_service = PostePlanningDayService(
     tranche_repo=tranche_repo,
     agent_day_repo=agent_day_repo,
-    agent_day_assignment_repo=agent_day_assignment_repo
+    agent_day_assignment_repo=agent_day_assignment_repo,
+    planning_versions=planning_versions,
 )
 
 agent_planning_factory = AgentPlanningFactory(
     agent_service=agent_service,
     planning_day_assembler=planning_day_assembler,
+    read_cache=planning_read_cache,
 )
 
 poste_planning_factory = PostePlanningFactory(
     poste_repo=poste_repo,
-    planning_day_assembler=poste_planning_day_assembler
+    planning_day_assembler=poste_planning_day_assembler,
+    read_cache=planning_read_cache,
 )
 
 team_planning_factory = TeamPlanningFactory(
     team_service=team_service,
     agent_service=agent_service,
     planning_day_assembler=planning_day_assembler,
+    read_cache=planning_read_cache,
 )
 
 __all__ = [
     "agent_day_service",
     "agent_service",
+    "eligibility_cache",
     "poste_service",
     "poste_coverage_requirement_service",
     "qualification_service",
     "regime_service",
     "tranche_service",
     "planning_day_assembler",
+    "planning_read_cache",
+    "planning_versions",
     "agent_planning_factory",
     "poste_planning_factory",
     "poste_planning_day_assembler",
@@ -135,4 +199,6 @@ __all__ = [
     "team_planning_factory",
     "agent_team_service",
     "team_service",
+    "user_auth_cache",
+    "login_throttle",
 ]
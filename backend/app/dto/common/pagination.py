@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import base64
+import json
 import math
-from typing import Generic, List, TypeVar
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
 
 from fastapi import Query
 from pydantic import BaseModel, Field
@@ -12,9 +14,19 @@ T = TypeVar("T")
 class PaginationParams(BaseModel):
     """
     Params de pagination réutilisables via Depends().
+
+    - mode offset (historique) : page / page_size, total exact
+    - mode keyset : dès que `cursor` est fourni (`cursor=` vide pour la première page),
+      total calculé seulement si `with_total` (estimé sur Postgres)
     """
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
+    cursor: Optional[str] = None
+    with_total: bool = False
+
+    @property
+    def is_keyset(self) -> bool:
+        return self.cursor is not None
 
     @property
     def offset(self) -> int:
@@ -28,18 +40,22 @@ class PaginationParams(BaseModel):
 def pagination_params(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (meta.next_cursor); empty for the first page."),
+    with_total: bool = Query(False, description="Keyset mode only: also return a (possibly estimated) total."),
 ) -> PaginationParams:
     """
     Dependency FastAPI (plus flexible que Depends(PaginationParams) avec Query).
     """
-    return PaginationParams(page=page, page_size=page_size)
+    return PaginationParams(page=page, page_size=page_size, cursor=cursor, with_total=with_total)
 
 
 class PageMeta(BaseModel):
-    page: int
+    page: Optional[int] = None
     page_size: int
-    total: int
-    pages: int
+    total: Optional[int] = None
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class Page(BaseModel, Generic[T]):
@@ -58,3 +74,40 @@ def build_page(items: List[T], total: int, p: PaginationParams) -> Page[T]:
             pages=pages,
         ),
     )
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    raw = json.dumps(list(key), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[Any, ...]]:
+    """Décode un curseur opaque ; "" => première page. Lève ValueError si invalide."""
+    if cursor == "":
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(key, list) or not key:
+        raise ValueError("Invalid cursor")
+    return tuple(key)
+
+
+def build_keyset_page(
+    items: List[T],
+    next_key: Optional[Sequence[Any]],
+    p: PaginationParams,
+    total: Optional[int] = None,
+    total_is_estimate: bool = False,
+) -> Page[T]:
+    return Page[T](
+        items=items,
+        meta=PageMeta(
+            page_size=p.page_size,
+            total=total,
+            next_cursor=encode_cursor(next_key) if next_key is not None else None,
+            total_is_estimate=total_is_estimate,
+        ),
+    )
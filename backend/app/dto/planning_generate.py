@@ -28,6 +28,13 @@ class PlanningGenerateRequest(BaseModel):
     phase2_no_improve_seconds: float | None = Field(default=None, ge=0)
     enable_decision_strategy: bool | None = Field(default=None)
     enable_symmetry_breaking: bool | None = Field(default=None)
+    enable_warm_start: bool | None = Field(default=None)
+    enable_decomposition: bool = Field(default=False)
+    alternatives_count: int = Field(default=0, ge=0, le=5)
+    alternatives_min_changed_days: int | None = Field(default=None, ge=1)
+    budget_mode: str | None = Field(default=None)
+    enable_memory_profiling: bool | None = Field(default=None)
+    memory_limit_mb: int | None = Field(default=None, ge=64)
 
     @field_validator("end_date")
     @classmethod
@@ -56,11 +63,19 @@ class PlanningGenerateRequest(BaseModel):
     @field_validator("v3_strategy")
     @classmethod
     def validate_v3_strategy(cls, value: str) -> str:
-        allowed = {"two_phase", "two_phase_lns", "lns_only"}
+        allowed = {"two_phase", "two_phase_lns", "lns_only", "lexicographic"}
         if value not in allowed:
             raise ValueError(f"v3_strategy must be one of {sorted(allowed)}")
         return value
 
+    @field_validator("budget_mode")
+    @classmethod
+    def validate_budget_mode(cls, value: str | None) -> str | None:
+        allowed = {"wall", "deterministic"}
+        if value is not None and value not in allowed:
+            raise ValueError(f"budget_mode must be one of {sorted(allowed)}")
+        return value
+
 
 class GroupedStatsPayload(BaseModel):
     meta: dict
@@ -84,6 +99,9 @@ class PlanningGenerateResponse(BaseModel):
     job_id: UUID
     draft_id: int
     status: PlanningDraftStatus
+    # True quand la demande a rejoint un job identique déjà en file ou en cours
+    deduplicated: bool = False
+    dedup_count: int = 0
 
 
 class PlanningGenerateStatusResponse(BaseModel):
@@ -93,6 +111,9 @@ class PlanningGenerateStatusResponse(BaseModel):
     progress: float = Field(ge=0, le=1)
     result_stats: ResultStatsPayload | None = None
     error: str | None = None
+    parent_draft_id: int | None = None
+    alternative_draft_ids: list[int] = Field(default_factory=list)
+    dedup_count: int = 0
 
 
 class PlanningDraftAcceptResponse(BaseModel):
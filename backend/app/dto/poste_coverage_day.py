@@ -16,3 +16,21 @@ class PosteCoverageDayDTO(BaseModel):
     day_date: date
     weekday: int  # 0=lundi..6=dimanche
     tranches: list[TrancheCoverageDTO]
+
+
+class TrancheCoverageSeriesDTO(BaseModel):
+    tranche_id: int
+    poste_id: int
+    tranche_nom: str
+    heure_debut: time
+    heure_fin: time
+    # colonnes alignées sur PosteCoverageRangeDTO.days
+    required: list[int]
+    assigned: list[int]
+
+class PosteCoverageRangeDTO(BaseModel):
+    poste_ids: list[int]
+    start_date: date
+    end_date: date
+    days: list[date]
+    tranches: list[TrancheCoverageSeriesDTO]
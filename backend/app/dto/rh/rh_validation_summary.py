@@ -6,6 +6,7 @@ from typing import List, Literal
 from pydantic import BaseModel
 
 from backend.app.dto.rh.rh_risk_level import RiskLevel
+from backend.app.dto.rh.rh_validation_result import RhValidationTeamSkippedDTO
 
 Severity = Literal["info", "warning", "error"]
 
@@ -33,3 +34,13 @@ class RhValidationPosteSummaryDTO(BaseModel):
     profile: str
     eligible_agents_count: int
     days: List[RhPosteDaySummaryDTO]
+
+
+class RhValidationTeamSummaryDTO(BaseModel):
+    team_id: int
+    date_debut: date
+    date_fin: date
+    profile: str
+    agents_count: int
+    days: List[RhPosteDaySummaryDTO]
+    skipped: List[RhValidationTeamSkippedDTO] = []
@@ -1,15 +1,37 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.app.settings import settings
 from backend.app.dto._rebuild import rebuild_dtos
 from backend.app.api.router import api_router
+from backend.app.api.request_metrics import RequestMetricsMiddleware
+from backend.app.services.refresh_token_purge import RefreshTokenPurgeWorker
+from core.utils.metrics import metrics
+from db import db
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    worker = None
+    if settings.refresh_token_purge_interval_minutes > 0:
+        worker = RefreshTokenPurgeWorker(db, interval_seconds=settings.refresh_token_purge_interval_minutes * 60)
+        worker.start()
+    try:
+        yield
+    finally:
+        if worker is not None:
+            worker.stop()
 
 
 def create_app() -> FastAPI:
     rebuild_dtos()
 
-    app = FastAPI(title=settings.app_name, debug=settings.debug)
+    app = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
+
+    metrics.enabled = settings.metrics_enabled
+    app.add_middleware(RequestMetricsMiddleware)
 
     origins = settings.cors_origins
 
@@ -3,12 +3,18 @@ from __future__ import annotations
 
 from backend.app.dto.poste_coverage_day import (
     PosteCoverageDayDTO,
+    PosteCoverageRangeDTO,
     TrancheCoverageDTO,
+    TrancheCoverageSeriesDTO,
 )
 from core.application.read_models.poste_coverage_day_rm import (
     PosteCoverageDayRM,
     TrancheCoverageRM,
 )
+from core.application.read_models.poste_coverage_range_rm import (
+    PosteCoverageRangeRM,
+    TrancheCoverageSeriesRM,
+)
 
 def to_tranche_coverage_dto(rm: TrancheCoverageRM) -> TrancheCoverageDTO:
     return TrancheCoverageDTO(
@@ -27,3 +33,23 @@ def to_poste_coverage_day_dto(rm: PosteCoverageDayRM) -> PosteCoverageDayDTO:
         weekday=rm.weekday,
         tranches=[to_tranche_coverage_dto(t) for t in rm.tranches],
     )
+
+def to_tranche_coverage_series_dto(rm: TrancheCoverageSeriesRM) -> TrancheCoverageSeriesDTO:
+    return TrancheCoverageSeriesDTO(
+        tranche_id=rm.tranche_id,
+        poste_id=rm.poste_id,
+        tranche_nom=rm.tranche_nom,
+        heure_debut=rm.heure_debut,
+        heure_fin=rm.heure_fin,
+        required=rm.required_counts,
+        assigned=rm.assigned_counts,
+    )
+
+def to_poste_coverage_range_dto(rm: PosteCoverageRangeRM) -> PosteCoverageRangeDTO:
+    return PosteCoverageRangeDTO(
+        poste_ids=rm.poste_ids,
+        start_date=rm.start_date,
+        end_date=rm.end_date,
+        days=rm.days,
+        tranches=[to_tranche_coverage_series_dto(t) for t in rm.tranches],
+    )
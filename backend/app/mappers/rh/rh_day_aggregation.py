@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.rh_rules.models.rh_violation import RhViolation
+from core.rh_rules.models.rule_result import RuleResult
+from core.utils.severity import Severity
+
+TriggerKey = Tuple[str, str]  # (rule_name, "warning" | "error")
+
+
+def severity_to_str(sev: Severity) -> str:
+    if sev == Severity.ERROR:
+        return "error"
+    if sev == Severity.WARNING:
+        return "warning"
+    return "info"
+
+
+@dataclass
+class RhDayAggregate:
+    day: date
+    agents_with_issues_count: int = 0
+    agents_with_blockers_count: int = 0
+    triggers: Counter = field(default_factory=Counter)
+
+    def top_triggers(self, n: int = 3) -> List[Tuple[TriggerKey, int]]:
+        return self.triggers.most_common(n)
+
+
+def _merge_spans(spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Fusionne des intervalles [lo, hi] (inclusifs) qui se chevauchent ou se touchent."""
+    if not spans:
+        return []
+    spans.sort()
+    merged = [spans[0]]
+    for lo, hi in spans[1:]:
+        last_lo, last_hi = merged[-1]
+        if lo <= last_hi + 1:
+            merged[-1] = (last_lo, max(last_hi, hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+class RhDayAggregator:
+    """
+    Agrégation par jour des violations RH via des tableaux de différences.
+
+    Chaque violation est posée une seule fois sur son intervalle [start_date, end_date]
+    (écrêté à la période), puis un balayage unique par compteur donne les valeurs par jour :
+    O(violations · log + jours · déclencheurs distincts) au lieu de O(agents · jours · violations).
+
+    - agents_with_issues_count : agents ayant au moins une violation WARNING/ERROR ce jour
+    - agents_with_blockers_count : agents ayant au moins une violation ERROR ce jour
+    - triggers : (rule_name, severity) -> nombre de violations couvrant le jour
+    """
+
+    def __init__(self, start: date, end: date, *, rule_names: Optional[Iterable[str]] = None) -> None:
+        if start > end:
+            raise ValueError("start must be <= end")
+        self.start = start
+        self.end = end
+        self.rule_names = frozenset(rule_names) if rule_names is not None else None
+
+        self._days_count = (end - start).days + 1
+        self._issues_diff = [0] * (self._days_count + 1)
+        self._blockers_diff = [0] * (self._days_count + 1)
+        # dict ordonné : l'ordre de première apparition départage les égalités du top
+        self._triggers_diff: Dict[TriggerKey, List[int]] = {}
+
+    # --------------------------------------------------
+    def add_result(self, result: RuleResult) -> None:
+        """Ajoute les violations d'un agent (un RuleResult = un agent)."""
+        issue_spans: List[Tuple[int, int]] = []
+        blocker_spans: List[Tuple[int, int]] = []
+
+        for v in result.violations:
+            span = self._span(v)
+            if span is None:
+                continue
+            lo, hi = span
+
+            key = (v.rule_name, severity_to_str(v.severity))
+            diff = self._triggers_diff.get(key)
+            if diff is None:
+                diff = self._triggers_diff[key] = [0] * (self._days_count + 1)
+            diff[lo] += 1
+            diff[hi + 1] -= 1
+
+            issue_spans.append(span)
+            if v.severity == Severity.ERROR:
+                blocker_spans.append(span)
+
+        # Un agent ne compte qu'une fois par jour : fusion de ses intervalles avant pose
+        for lo, hi in _merge_spans(issue_spans):
+            self._issues_diff[lo] += 1
+            self._issues_diff[hi + 1] -= 1
+        for lo, hi in _merge_spans(blocker_spans):
+            self._blockers_diff[lo] += 1
+            self._blockers_diff[hi + 1] -= 1
+
+    def add_results(self, per_agent_results: Iterable[Tuple[int, RuleResult]]) -> "RhDayAggregator":
+        for _, result in per_agent_results:
+            self.add_result(result)
+        return self
+
+    # --------------------------------------------------
+    def days(self) -> List[RhDayAggregate]:
+        out: List[RhDayAggregate] = []
+        issues = 0
+        blockers = 0
+        running = {key: 0 for key in self._triggers_diff}
+
+        for i in range(self._days_count):
+            issues += self._issues_diff[i]
+            blockers += self._blockers_diff[i]
+            triggers: Counter = Counter()
+            for key, diff in self._triggers_diff.items():
+                running[key] += diff[i]
+                if running[key]:
+                    triggers[key] = running[key]
+
+            out.append(
+                RhDayAggregate(
+                    day=self.start + timedelta(days=i),
+                    agents_with_issues_count=issues,
+                    agents_with_blockers_count=blockers,
+                    triggers=triggers,
+                )
+            )
+        return out
+
+    # --------------------------------------------------
+    def _span(self, v: RhViolation) -> Optional[Tuple[int, int]]:
+        if v.severity == Severity.INFO:
+            return None
+        if self.rule_names is not None and v.rule_name not in self.rule_names:
+            return None
+        if v.start_date is None or v.end_date is None:
+            return None
+        if v.end_date < self.start or v.start_date > self.end:
+            return None
+
+        lo = (max(v.start_date, self.start) - self.start).days
+        hi = (min(v.end_date, self.end) - self.start).days
+        if lo > hi:
+            return None
+        return lo, hi
@@ -4,13 +4,14 @@ from jose import jwt, JWTError
 
 from backend.app.settings import settings
 
-def create_access_token(*, user_id: int, role: str) -> str:
+def create_access_token(*, user_id: int, role: str, token_version: int = 0) -> str:
     now = datetime.now(timezone.utc)
     exp = now + timedelta(minutes=settings.access_token_minutes)
 
     payload = {
         "sub": str(user_id),
         "role": role,
+        "tv": token_version,
         "iss": settings.jwt_issuer,
         "aud": settings.jwt_audience,
         "iat": int(now.timestamp()),
@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+ThrottleKey = Tuple[str, str]  # ("user" | "ip", valeur)
+
+
+@dataclass
+class _Attempts:
+    failures: Deque[float] = field(default_factory=deque)
+    locked_until: float = 0.0
+
+    def last_seen(self) -> float:
+        return max(self.failures[-1] if self.failures else 0.0, self.locked_until)
+
+
+class LoginThrottle:
+    """
+    Limitation en mémoire des échecs de login, par nom d'utilisateur et par IP.
+
+    Au-delà de `max_failures` échecs dans `window_seconds`, la clé est bloquée pendant
+    `lockout_seconds` : les tentatives suivantes sont refusées avant toute vérification
+    argon2, donc sans coût CPU. Le seuil IP est plus large (NAT, postes partagés).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_failures_per_user: int = 5,
+        max_failures_per_ip: int = 50,
+        window_seconds: float = 300.0,
+        lockout_seconds: float = 300.0,
+        max_keys: int = 10_000,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_failures_per_user = max_failures_per_user
+        self.max_failures_per_ip = max_failures_per_ip
+        self.window_seconds = window_seconds
+        self.lockout_seconds = lockout_seconds
+        self.max_keys = max_keys
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._attempts: Dict[ThrottleKey, _Attempts] = {}
+
+    @staticmethod
+    def keys(username: str, ip: Optional[str]) -> Tuple[ThrottleKey, ...]:
+        keys: Tuple[ThrottleKey, ...] = (("user", username.strip().lower()),)
+        if ip:
+            keys += (("ip", ip),)
+        return keys
+
+    def retry_after(self, keys: Iterable[ThrottleKey]) -> float:
+        """Secondes restantes avant de pouvoir retenter (0 si autorisé)."""
+        if not self.enabled:
+            return 0.0
+        now = self._clock()
+        with self._lock:
+            waits = [a.locked_until - now for a in (self._attempts.get(k) for k in keys) if a is not None]
+        return max([0.0, *waits])
+
+    def record_failure(self, keys: Iterable[ThrottleKey]) -> None:
+        if not self.enabled:
+            return
+        now = self._clock()
+        with self._lock:
+            if len(self._attempts) >= self.max_keys:
+                self._purge(now)
+            for key in keys:
+                attempts = self._attempts.setdefault(key, _Attempts())
+                attempts.failures.append(now)
+                while attempts.failures and attempts.failures[0] <= now - self.window_seconds:
+                    attempts.failures.popleft()
+                if len(attempts.failures) >= self._limit(key):
+                    attempts.locked_until = now + self.lockout_seconds
+                    attempts.failures.clear()
+
+    def record_success(self, keys: Iterable[ThrottleKey]) -> None:
+        """Un succès efface l'historique de l'utilisateur (pas celui de l'IP)."""
+        with self._lock:
+            for key in keys:
+                if key[0] == "user":
+                    self._attempts.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._attempts.clear()
+
+    def _limit(self, key: ThrottleKey) -> int:
+        return self.max_failures_per_user if key[0] == "user" else self.max_failures_per_ip
+
+    def _purge(self, now: float) -> None:
+        stale = [
+            key
+            for key, a in self._attempts.items()
+            if a.locked_until <= now and (not a.failures or a.failures[-1] <= now - self.window_seconds)
+        ]
+        for key in stale:
+            del self._attempts[key]
+        if len(self._attempts) >= self.max_keys:
+            # Dernier recours : mémoire bornée, on oublie les clés les plus anciennes
+            oldest = sorted(self._attempts, key=lambda k: self._attempts[k].last_seen())
+            for key in oldest[: len(self._attempts) - self.max_keys + 1]:
+                del self._attempts[key]
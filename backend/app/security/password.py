@@ -1,9 +1,116 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+from backend.app.settings import settings
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Trop de hachages/vérifications en attente : la demande est refusée plutôt que mise en file."""
+
+
+class PasswordHasher:
+    """
+    Hachage argon2 exécuté sur un pool de threads dédié et borné.
+
+    - `max_workers` threads au plus calculent de l'argon2 en même temps (CPU/mémoire bornés)
+    - au-delà de `max_workers + max_pending` demandes en cours, on lève PasswordHasherBusy :
+      une rafale de logins ne peut pas immobiliser les threads qui servent le reste de l'API
+    - les variantes async (`ahash`, `averify_and_update`) attendent le pool dédié depuis la boucle
+      d'événements : aucun thread de requête n'est bloqué pendant le calcul argon2
+    """
+
+    def __init__(
+        self,
+        *,
+        time_cost: int,
+        memory_cost: int,
+        parallelism: int,
+        max_workers: int = 2,
+        max_pending: int = 16,
+    ) -> None:
+        self.context = CryptContext(
+            schemes=["argon2"],
+            deprecated="auto",
+            argon2__rounds=time_cost,
+            argon2__memory_cost=memory_cost,
+            argon2__parallelism=parallelism,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+
+    def hash(self, password: str) -> str:
+        return self._run(self.context.hash, password)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        return self._run(self.context.verify, password, password_hash)
+
+    def verify_and_update(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """Retourne (valide, nouveau_hash) ; nouveau_hash est non nul si les paramètres argon2 ont changé."""
+        return self._run(self.context.verify_and_update, password, password_hash)
+
+    async def ahash(self, password: str) -> str:
+        return await self._arun(self.context.hash, password)
+
+    async def averify_and_update(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        return await self._arun(self.context.verify_and_update, password, password_hash)
+
+    def needs_update(self, password_hash: str) -> bool:
+        return self.context.needs_update(password_hash)
+
+    def _run(self, fn: Callable[..., T], *args) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("Password hashing capacity exceeded")
+        try:
+            return self._executor.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    async def _arun(self, fn: Callable[..., T], *args) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("Password hashing capacity exceeded")
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Le slot est rendu quand le calcul se termine réellement, même si la requête est annulée
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+
+password_hasher = PasswordHasher(
+    time_cost=settings.password_hash_time_cost,
+    memory_cost=settings.password_hash_memory_cost,
+    parallelism=settings.password_hash_parallelism,
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
+
+# Compat : contexte passlib partagé
+pwd_context = password_hasher.context
+
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
+
 
 def verify_password(password: str, password_hash: str) -> bool:
-    return pwd_context.verify(password, password_hash)
+    return password_hasher.verify(password, password_hash)
+
+
+def verify_and_update_password(password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+    return password_hasher.verify_and_update(password, password_hash)
+
+
+async def ahash_password(password: str) -> str:
+    return await password_hasher.ahash(password)
+
+
+async def averify_and_update_password(password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+    return await password_hasher.averify_and_update(password, password_hash)
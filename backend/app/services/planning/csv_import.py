@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import csv
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, Optional, TextIO
+
+from sqlalchemy import Date, bindparam, select, text
+from sqlalchemy.orm import Session
+
+from core.domain.enums.day_type import DayType
+from db.database import Database
+from db.models import Agent, Poste, Tranche
+
+logger = logging.getLogger(__name__)
+
+# Abréviations françaises des mois (en-têtes "30-janv")
+FRENCH_MONTHS = {
+    "janv": 1,
+    "févr": 2,
+    "mars": 3,
+    "avr": 4,
+    "mai": 5,
+    "juin": 6,
+    "juil": 7,
+    "août": 8,
+    "sept": 9,
+    "oct": 10,
+    "nov": 11,
+    "déc": 12,
+}
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class PlanningCsvCodes:
+    """Correspondance codes du fichier -> type de journée (+ alias de tranches)."""
+
+    rest_codes: frozenset[str] = frozenset()
+    working_codes: frozenset[str] = frozenset()
+    zcot_codes: frozenset[str] = frozenset()
+    leave_codes: frozenset[str] = frozenset()
+    absence_codes: frozenset[str] = frozenset()
+    tranche_aliases: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        rest_codes: Iterable[str] = (),
+        working_codes: Iterable[str] = (),
+        zcot_codes: Iterable[str] = (),
+        leave_codes: Iterable[str] = (),
+        absence_codes: Iterable[str] = (),
+        tranche_aliases: Optional[dict[str, str]] = None,
+    ) -> "PlanningCsvCodes":
+        def norm(codes: Iterable[str]) -> frozenset[str]:
+            return frozenset(normalize_code(c) for c in codes)
+
+        return cls(
+            rest_codes=norm(rest_codes),
+            working_codes=norm(working_codes),
+            zcot_codes=norm(zcot_codes),
+            leave_codes=norm(leave_codes),
+            absence_codes=norm(absence_codes),
+            tranche_aliases={normalize_code(k): normalize_code(v) for k, v in (tranche_aliases or {}).items()},
+        )
+
+    def day_type_for(self, code: str) -> Optional[DayType]:
+        # Même ordre de priorité que l'ancien script
+        if code in self.rest_codes:
+            return DayType.REST
+        if code in self.working_codes or code in self.tranche_aliases:
+            return DayType.WORKING
+        if code in self.zcot_codes:
+            return DayType.ZCOT
+        if code in self.leave_codes:
+            return DayType.LEAVE
+        if code in self.absence_codes:
+            return DayType.ABSENT
+        return None
+
+
+@dataclass
+class PlanningCsvImportReport:
+    dry_run: bool
+    agent_rows: int = 0
+    cells_read: int = 0
+    empty_cells: int = 0
+    days_written: int = 0
+    assignments_written: int = 0
+    agents_created: int = 0
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+    unknown_codes: Counter = field(default_factory=Counter)
+    unknown_agents: list[str] = field(default_factory=list)
+    unresolved_tranches: Counter = field(default_factory=Counter)
+    ambiguous_tranches: Counter = field(default_factory=Counter)
+
+    @property
+    def cells_per_second(self) -> float:
+        return self.cells_read / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def is_clean(self) -> bool:
+        return not (self.unknown_codes or self.unknown_agents or self.unresolved_tranches or self.ambiguous_tranches)
+
+    def format(self, top: int = 10) -> str:
+        mode = "dry-run (aucune écriture)" if self.dry_run else "import"
+        lines = [
+            f"Mode               : {mode}",
+            f"Lignes agents      : {self.agent_rows}",
+            f"Cellules lues      : {self.cells_read} ({self.empty_cells} vides)",
+            f"Journées écrites   : {self.days_written}",
+            f"Affectations       : {self.assignments_written}",
+            f"Agents créés       : {self.agents_created}",
+            f"Chunks             : {self.chunks}",
+            f"Durée              : {self.elapsed_seconds:.2f}s ({self.cells_per_second:,.0f} cellules/s)",
+        ]
+        if self.unknown_agents:
+            lines.append(f"Agents inconnus    : {', '.join(self.unknown_agents[:top])}")
+        for label, counter in (
+            ("Codes inconnus", self.unknown_codes),
+            ("Tranches absentes", self.unresolved_tranches),
+            ("Tranches ambiguës", self.ambiguous_tranches),
+        ):
+            if counter:
+                items = ", ".join(f"{code!r}×{n}" for code, n in counter.most_common(top))
+                lines.append(f"{label:<19}: {items}")
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class _DayRow:
+    agent_id: int
+    day_date: date
+    day_type: str
+    description: Optional[str]
+    is_off_shift: bool
+    tranche_id: Optional[int]
+
+
+def normalize_code(code: str) -> str:
+    return code.strip().upper()
+
+
+def parse_header_date(raw: str, year: int) -> date:
+    """Accepte '30-janv' (année fournie), '2025-01-30' ou '30/01/2025'."""
+    value = raw.strip()
+    for fmt in ("%Y-%m-%d", "%d/%m/%Y"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            pass
+
+    compact = value.lower().replace(".", "").replace(" ", "")
+    try:
+        day_part, month_part = compact.split("-")
+        return date(year, FRENCH_MONTHS[month_part], int(day_part))
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Format de date invalide: '{raw}' ({e})")
+
+
+def split_full_name(full_name: str) -> tuple[str, str]:
+    """'Julie MARTIN' -> (prenom='Julie', nom='MARTIN')."""
+    parts = full_name.strip().split(" ", 1)
+    if len(parts) != 2 or not parts[1].strip():
+        raise ValueError(f"Nom complet invalide: '{full_name}'")
+    return parts[0].capitalize(), parts[1].strip().upper()
+
+
+class PlanningCsvImporter:
+    """
+    Import en flux d'un planning CSV (1 ligne par agent, 1 colonne par jour) vers
+    agent_days / agent_day_assignments.
+
+    - le fichier est lu ligne à ligne, les cellules sont bufferisées par chunks
+    - agents, postes et tranches sont résolus via des dictionnaires chargés une fois
+    - chaque chunk est chargé en bloc dans sa propre transaction :
+      COPY vers une table de staging sur PostgreSQL, executemany sur SQLite,
+      puis upsert ensembliste (ON CONFLICT (agent_id, day_date))
+    - dry_run : même parsing / résolution, aucune écriture
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        codes: PlanningCsvCodes,
+        *,
+        year: int,
+        poste_names: Optional[Iterable[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        create_missing_agents: bool = False,
+        dry_run: bool = False,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be > 0")
+        self.database = database
+        self.codes = codes
+        self.year = year
+        self.poste_names = {normalize_code(p) for p in poste_names} if poste_names else None
+        self.chunk_size = chunk_size
+        self.create_missing_agents = create_missing_agents
+        self.dry_run = dry_run
+
+        self._agent_ids: dict[tuple[str, str], int] = {}
+        self._tranche_ids: dict[str, list[int]] = {}
+        self._next_dry_run_agent_id = -1
+
+    # --------------------------------------------------
+    def import_file(self, path: str, *, encoding: str = "utf-8", delimiter: str = ";") -> PlanningCsvImportReport:
+        with open(path, newline="", encoding=encoding) as f:
+            return self.import_stream(f, delimiter=delimiter)
+
+    def import_stream(self, stream: TextIO, *, delimiter: str = ";") -> PlanningCsvImportReport:
+        report = PlanningCsvImportReport(dry_run=self.dry_run)
+        started = time.perf_counter()
+
+        reader = csv.reader(stream, delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
+            raise ValueError("Fichier vide.")
+        dates = self._parse_header(header[1:])
+
+        with self.database.session_scope() as session:
+            self._load_lookups(session)
+
+        buffer: dict[tuple[int, date], _DayRow] = {}
+        for row in reader:
+            for day_row in self._iter_row_days(row, dates, report):
+                # Dernière occurrence gagne (ON CONFLICT ne tolère pas 2 lignes identiques par statement)
+                buffer[(day_row.agent_id, day_row.day_date)] = day_row
+            if len(buffer) >= self.chunk_size:
+                self._flush(list(buffer.values()), report)
+                buffer.clear()
+
+        if buffer:
+            self._flush(list(buffer.values()), report)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        logger.info("planning csv import done: %s cells in %.2fs", report.cells_read, report.elapsed_seconds)
+        return report
+
+    # --------------------------------------------------
+    def _parse_header(self, raw_dates: list[str]) -> list[date]:
+        dates = [parse_header_date(d, self.year) for d in raw_dates]
+        for previous, current in zip(dates, dates[1:]):
+            if current != previous + timedelta(days=1):
+                raise ValueError(
+                    f"Discontinuité détectée entre {previous} et {current} (attendu : {previous + timedelta(days=1)})."
+                )
+        return dates
+
+    def _load_lookups(self, session: Session) -> None:
+        self._agent_ids = {
+            (nom.strip().upper(), prenom.strip().casefold()): agent_id
+            for agent_id, nom, prenom in session.execute(select(Agent.id, Agent.nom, Agent.prenom))
+        }
+
+        query = select(Tranche.id, Tranche.nom, Poste.nom).join(Poste, Poste.id == Tranche.poste_id)
+        self._tranche_ids = {}
+        for tranche_id, tranche_nom, poste_nom in session.execute(query):
+            if self.poste_names is not None and normalize_code(poste_nom) not in self.poste_names:
+                continue
+            self._tranche_ids.setdefault(normalize_code(tranche_nom), []).append(tranche_id)
+
+    def _resolve_agent(self, full_name: str, report: PlanningCsvImportReport) -> Optional[int]:
+        try:
+            prenom, nom = split_full_name(full_name)
+        except ValueError:
+            report.unknown_agents.append(full_name)
+            return None
+
+        key = (nom, prenom.casefold())
+        agent_id = self._agent_ids.get(key)
+        if agent_id is not None:
+            return agent_id
+
+        if not self.create_missing_agents:
+            report.unknown_agents.append(full_name)
+            return None
+
+        if self.dry_run:
+            agent_id = self._next_dry_run_agent_id
+            self._next_dry_run_agent_id -= 1
+        else:
+            with self.database.session_scope() as session:
+                agent = Agent(nom=nom, prenom=prenom, actif=True)
+                session.add(agent)
+                session.flush()
+                agent_id = agent.id
+        self._agent_ids[key] = agent_id
+        report.agents_created += 1
+        return agent_id
+
+    def _resolve_tranche(self, code: str, report: PlanningCsvImportReport) -> Optional[int]:
+        name = self.codes.tranche_aliases.get(code, code)
+        candidates = self._tranche_ids.get(name, [])
+        if len(candidates) == 1:
+            return candidates[0]
+        if candidates:
+            report.ambiguous_tranches[name] += 1
+        else:
+            report.unresolved_tranches[name] += 1
+        return None
+
+    def _iter_row_days(
+        self, row: list[str], dates: list[date], report: PlanningCsvImportReport
+    ) -> Iterator[_DayRow]:
+        if not row or not row[0].strip():
+            return
+        report.agent_rows += 1
+
+        agent_id = self._resolve_agent(row[0], report)
+        cells = row[1 : len(dates) + 1]
+        report.cells_read += len(cells)
+        if agent_id is None:
+            return
+
+        for day_date, raw in zip(dates, cells):
+            code = normalize_code(raw)
+            if not code:
+                report.empty_cells += 1
+                continue
+
+            day_type = self.codes.day_type_for(code)
+            if day_type is None:
+                report.unknown_codes[code] += 1
+                continue
+
+            tranche_id = self._resolve_tranche(code, report) if day_type == DayType.WORKING else None
+            yield _DayRow(
+                agent_id=agent_id,
+                day_date=day_date,
+                day_type=day_type.value,
+                description=raw.strip(),
+                is_off_shift=(day_type == DayType.OFF_SHIFT),
+                tranche_id=tranche_id,
+            )
+
+    # --------------------------------------------------
+    def _flush(self, rows: list[_DayRow], report: PlanningCsvImportReport) -> None:
+        report.chunks += 1
+        if self.dry_run:
+            return
+
+        with self.database.session_scope() as session:
+            dialect = session.get_bind().dialect.name
+            if dialect == "postgresql":
+                _load_chunk_postgres(session, rows)
+            elif dialect == "sqlite":
+                _load_chunk_sqlite(session, rows)
+            else:
+                raise NotImplementedError(f"bulk import not supported for dialect {dialect!r}")
+
+        report.days_written += len(rows)
+        report.assignments_written += sum(1 for r in rows if r.tranche_id is not None)
+
+
+# ======================================================
+# Chargement SQLite : executemany + upsert par clé métier
+# ======================================================
+_SQLITE_UPSERT_DAYS = text(
+    """
+    INSERT INTO agent_days (agent_id, day_date, day_type, description, is_off_shift, created_at, updated_at)
+    VALUES (:agent_id, :day_date, :day_type, :description, :is_off_shift, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    ON CONFLICT (agent_id, day_date) DO UPDATE SET
+        day_type = excluded.day_type,
+        description = excluded.description,
+        is_off_shift = excluded.is_off_shift,
+        updated_at = CURRENT_TIMESTAMP
+    """
+).bindparams(bindparam("day_date", type_=Date))
+
+_SQLITE_DELETE_ASSIGNMENTS = text(
+    """
+    DELETE FROM agent_day_assignments
+    WHERE agent_day_id = (SELECT id FROM agent_days WHERE agent_id = :agent_id AND day_date = :day_date)
+    """
+).bindparams(bindparam("day_date", type_=Date))
+
+_SQLITE_INSERT_ASSIGNMENTS = text(
+    """
+    INSERT INTO agent_day_assignments (agent_day_id, tranche_id)
+    SELECT id, :tranche_id FROM agent_days WHERE agent_id = :agent_id AND day_date = :day_date
+    """
+).bindparams(bindparam("day_date", type_=Date))
+
+
+def _load_chunk_sqlite(session: Session, rows: list[_DayRow]) -> None:
+    params = [
+        {
+            "agent_id": r.agent_id,
+            "day_date": r.day_date,
+            "day_type": r.day_type,
+            "description": r.description,
+            "is_off_shift": r.is_off_shift,
+            "tranche_id": r.tranche_id,
+        }
+        for r in rows
+    ]
+    session.execute(_SQLITE_UPSERT_DAYS, [{k: v for k, v in p.items() if k != "tranche_id"} for p in params])
+    session.execute(_SQLITE_DELETE_ASSIGNMENTS, [{"agent_id": p["agent_id"], "day_date": p["day_date"]} for p in params])
+    with_tranche = [p for p in params if p["tranche_id"] is not None]
+    if with_tranche:
+        session.execute(
+            _SQLITE_INSERT_ASSIGNMENTS,
+            [{"agent_id": p["agent_id"], "day_date": p["day_date"], "tranche_id": p["tranche_id"]} for p in with_tranche],
+        )
+
+
+# ======================================================
+# Chargement PostgreSQL : COPY vers staging + SQL ensembliste
+# ======================================================
+_PG_STAGING_TABLE = "_planning_csv_import_staging"
+
+
+def _load_chunk_postgres(session: Session, rows: list[_DayRow]) -> None:
+    session.execute(
+        text(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS {_PG_STAGING_TABLE} (
+                agent_id integer NOT NULL,
+                day_date date NOT NULL,
+                day_type varchar(32) NOT NULL,
+                description text,
+                is_off_shift boolean NOT NULL,
+                tranche_id integer
+            ) ON COMMIT DELETE ROWS
+            """
+        )
+    )
+
+    # psycopg 3 : COPY ... FROM STDIN sur la connexion DBAPI de la session
+    cursor = session.connection().connection.cursor()
+    try:
+        with cursor.copy(
+            f"COPY {_PG_STAGING_TABLE} (agent_id, day_date, day_type, description, is_off_shift, tranche_id) FROM STDIN"
+        ) as copy:
+            for r in rows:
+                copy.write_row((r.agent_id, r.day_date, r.day_type, r.description, r.is_off_shift, r.tranche_id))
+    finally:
+        cursor.close()
+
+    session.execute(
+        text(
+            f"""
+            INSERT INTO agent_days (agent_id, day_date, day_type, description, is_off_shift, created_at, updated_at)
+            SELECT agent_id, day_date, day_type, description, is_off_shift, now(), now() FROM {_PG_STAGING_TABLE}
+            ON CONFLICT (agent_id, day_date) DO UPDATE SET
+                day_type = EXCLUDED.day_type,
+                description = EXCLUDED.description,
+                is_off_shift = EXCLUDED.is_off_shift,
+                updated_at = now()
+            """
+        )
+    )
+    session.execute(
+        text(
+            f"""
+            DELETE FROM agent_day_assignments a
+            USING agent_days d, {_PG_STAGING_TABLE} s
+            WHERE a.agent_day_id = d.id AND d.agent_id = s.agent_id AND d.day_date = s.day_date
+            """
+        )
+    )
+    session.execute(
+        text(
+            f"""
+            INSERT INTO agent_day_assignments (agent_day_id, tranche_id)
+            SELECT d.id, s.tranche_id
+            FROM {_PG_STAGING_TABLE} s
+            JOIN agent_days d ON d.agent_id = s.agent_id AND d.day_date = s.day_date
+            WHERE s.tranche_id IS NOT NULL
+            """
+        )
+    )
@@ -1,27 +1,41 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+from copy import deepcopy
 from datetime import date
 from numbers import Real
 from uuid import uuid4
 
 from sqlalchemy.orm import Session
 
+from backend.app.services.solver.calibration import resolve_units_per_second
+from backend.app.services.solver.coverage_flow import compute_coverage_flow_bound
 from backend.app.services.solver.interface import SolverService
 from backend.app.services.solver.mapper import SolverInputMapper
+from backend.app.services.solver.memory_profile import MemoryProfiler
+from backend.app.services.solver.model_cache import CompiledModelCache
 from backend.app.services.solver.models import (
     CoverageDemand,
     InfeasibleError,
+    MemoryLimitExceededError,
+    SolverAlternative,
     SolverInput,
     SolverOutput,
     TimeoutError,
     TrancheInfo,
 )
 from backend.app.services.solver.ortools_solver import OrtoolsSolver
+from core.application.services.eligibility_cache import EligibilityCache
+from core.application.services.planning.planning_cache import PlanningVersions
 from core.domain.enums.planning_draft_status import PlanningDraftStatus
+from core.utils.metrics import metrics
 from db.models import PlanningDraft, PlanningDraftAgentDay, PlanningDraftAssignment, Team
 
 from db import db
+from backend.app.bootstrap.container import eligibility_cache, planning_versions
+from backend.app.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -50,10 +64,158 @@ def merge_stats(*dicts: dict | None) -> dict[str, object]:
     return merged
 
 
+def record_solver_metrics(stats: dict | None) -> None:
+    """Feed solver stage durations from grouped result stats into the metrics registry."""
+    grouped = (stats or {}).get("stats")
+    if not metrics.enabled or not isinstance(grouped, dict):
+        return
+
+    timing = (grouped.get("timing") or {}).get("global") or {}
+    phases = (grouped.get("cp_sat") or {}).get("phases") or {}
+    lns = grouped.get("lns") or {}
+    durations = {
+        "model_build": timing.get("model_build_wall_time_seconds"),
+        "phase1": (phases.get("phase1") or {}).get("phase1_wall_time_seconds"),
+        "phase2": timing.get("phase2_solve_wall_time_seconds"),
+        "lns": lns.get("lns_total_wall_time_seconds"),
+        "total": timing.get("solve_wall_time_seconds"),
+    }
+    for phase, seconds in durations.items():
+        if isinstance(seconds, Real) and seconds > 0:
+            metrics.observe("solver_phase_duration_seconds", float(seconds), phase=phase)
+
+    lns_iterations = lns.get("lns_iterations")
+    lns_seconds = lns.get("lns_total_wall_time_seconds")
+    if isinstance(lns_iterations, Real) and isinstance(lns_seconds, Real) and lns_iterations > 0 and lns_seconds > 0:
+        metrics.observe("solver_lns_iterations_per_second", float(lns_iterations) / float(lns_seconds))
+
+
+def alternative_result_stats(
+    primary_stats: dict, alternative: SolverAlternative, *, primary_draft_id: int
+) -> dict[str, object]:
+    """Primary grouped stats with the coverage/objective breakdown of ``alternative``."""
+    stats = deepcopy(primary_stats)
+    grouped = stats.get("stats") or {}
+    coverage = grouped.setdefault("coverage", {})
+    coverage.update(
+        {
+            "understaff_total": alternative.understaff_total,
+            "understaff_total_weighted": alternative.understaff_total_weighted,
+            "coverage_ratio": alternative.coverage_ratio,
+        }
+    )
+    objective = grouped.setdefault("objective", {})
+    objective.update(
+        {
+            "objective_value": alternative.objective_value,
+            "score": alternative.objective_value,
+            "objective_terms": alternative.objective_terms,
+            "alternative": {
+                "rank": alternative.rank,
+                "primary_draft_id": primary_draft_id,
+                "changed_days_to_primary": alternative.changed_days_to_primary,
+            },
+        }
+    )
+    solution_quality = grouped.setdefault("solution_quality", {})
+    solution_quality["num_assignments"] = len(alternative.assignments)
+    return stats
+
+
+def with_persistence_memory(stats: dict, memory: MemoryProfiler) -> dict:
+    """Append the persistence sample to ``stats.timing.memory`` (the solver stops at extraction)."""
+    if not memory.active:
+        return stats
+    result = deepcopy(stats)
+    grouped = result.setdefault("stats", {})
+    memory_stats = grouped.setdefault("timing", {}).setdefault("memory", {})
+    persistence = {key.removeprefix("memory_"): value for key, value in memory.to_stats().items()}
+    memory_stats["stages"] = list(memory_stats.get("stages") or []) + persistence["stages"]
+    for key in ("peak_rss_mb", "process_peak_rss_mb", "traced_peak_mb"):
+        values = [value for value in (memory_stats.get(key), persistence[key]) if value is not None]
+        memory_stats[key] = max(values) if values else None
+    return result
+
+
+class IdempotencyKeyConflictError(ValueError):
+    """The idempotency key was already used for another team or period."""
+
+
+def generation_request_fingerprint(
+    *,
+    team_id: int,
+    start_date: date,
+    end_date: date,
+    seed: int | None,
+    time_limit_seconds: int,
+    solver_options: dict,
+    input_data_version: str | None,
+) -> str:
+    """sha256 of what decides the outcome of a generation: same fingerprint, same job."""
+    payload = {
+        "team_id": team_id,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "seed": seed,
+        "time_limit_seconds": time_limit_seconds,
+        "solver_options": _json_safe(solver_options),
+        "input_data_version": input_data_version,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
 class PlanningGenerationService:
-    def __init__(self, solver: SolverService, database):
+    def __init__(
+        self,
+        solver: SolverService,
+        database,
+        eligibility: EligibilityCache | None = None,
+        versions: PlanningVersions | None = None,
+    ):
         self.solver = solver
         self.db = database
+        # Doit lire la même base que `database` ; sans cache, le mapper interroge la session du job
+        self.eligibility = eligibility
+        # Version des données d'entrée dans l'empreinte : une écriture entre deux demandes relance un job
+        self.versions = versions
+
+    def _input_data_version(self, team_id: int) -> str | None:
+        if self.versions is None:
+            return None
+        token = self.versions.token(team_ids=[team_id], include_assignments=True)
+        return f"{self.versions.epoch}:{token!r}"
+
+    def _find_duplicate(
+        self,
+        session: Session,
+        *,
+        team_id: int,
+        start_date: date,
+        end_date: date,
+        fingerprint: str,
+        idempotency_key: str | None,
+    ) -> PlanningDraft | None:
+        """Draft already created for this idempotency key, else identical job still queued or running."""
+        if idempotency_key is not None:
+            keyed = session.query(PlanningDraft).filter(PlanningDraft.idempotency_key == idempotency_key).first()
+            if keyed is not None:
+                if (keyed.team_id, keyed.start_date, keyed.end_date) != (team_id, start_date, end_date):
+                    raise IdempotencyKeyConflictError(
+                        f"Idempotency key already used for another generation (job {keyed.job_id})"
+                    )
+                return keyed
+
+        return (
+            session.query(PlanningDraft)
+            .filter(
+                PlanningDraft.request_fingerprint == fingerprint,
+                PlanningDraft.parent_draft_id.is_(None),
+                PlanningDraft.status.in_([PlanningDraftStatus.QUEUED.value, PlanningDraftStatus.RUNNING.value]),
+            )
+            .order_by(PlanningDraft.id)
+            .first()
+        )
 
     def create_draft(
         self,
@@ -77,11 +239,90 @@ class PlanningGenerationService:
         phase2_no_improve_seconds: float | None = None,
         enable_decision_strategy: bool | None = None,
         enable_symmetry_breaking: bool | None = None,
-    ) -> PlanningDraft:
+        enable_warm_start: bool | None = None,
+        enable_decomposition: bool = False,
+        alternatives_count: int = 0,
+        alternatives_min_changed_days: int | None = None,
+        budget_mode: str | None = None,
+        enable_memory_profiling: bool | None = None,
+        memory_limit_mb: int | None = None,
+        idempotency_key: str | None = None,
+    ) -> tuple[PlanningDraft, bool]:
+        """Queue a generation job, or return the identical job already queued/running.
+
+        Returns ``(draft, deduplicated)``. A duplicate has its ``dedup_count`` incremented;
+        the caller must not schedule it again.
+        """
         team = session.get(Team, team_id)
         if team is None:
             raise ValueError(f"Team {team_id} not found")
 
+        budget_mode = budget_mode or settings.solver_budget_mode
+        # Figé sur le draft : un rejeu réutilise le même budget déterministe, quel que soit l'hôte
+        deterministic_units_per_second = (
+            resolve_units_per_second(
+                explicit=settings.solver_deterministic_units_per_second,
+                calibration_path=settings.solver_calibration_path,
+            )
+            if budget_mode == "deterministic"
+            else None
+        )
+
+        solver_options = {
+            "quality_profile": quality_profile,
+            "v3_strategy": v3_strategy,
+            "phase1_fraction": phase1_fraction,
+            "phase1_seconds": phase1_seconds,
+            "lns_iter_seconds": lns_iter_seconds,
+            "lns_min_remaining_seconds": lns_min_remaining_seconds,
+            "lns_strict_improve": lns_strict_improve,
+            "lns_max_days_to_relax": lns_max_days_to_relax,
+            "lns_neighborhood_mode": lns_neighborhood_mode,
+            "min_lns_seconds": min_lns_seconds,
+            "phase2_max_fraction_of_remaining": phase2_max_fraction_of_remaining,
+            "phase2_no_improve_seconds": phase2_no_improve_seconds,
+            "enable_decision_strategy": enable_decision_strategy,
+            "enable_symmetry_breaking": enable_symmetry_breaking,
+            "enable_warm_start": enable_warm_start,
+            "enable_decomposition": bool(enable_decomposition),
+            "alternatives_count": int(alternatives_count or 0),
+            "alternatives_min_changed_days": alternatives_min_changed_days,
+            "budget_mode": budget_mode,
+            "deterministic_units_per_second": deterministic_units_per_second,
+            "enable_memory_profiling": bool(
+                settings.solver_memory_profiling_enabled if enable_memory_profiling is None else enable_memory_profiling
+            ),
+            "memory_limit_mb": memory_limit_mb if memory_limit_mb is not None else settings.solver_memory_limit_mb,
+        }
+        fingerprint = generation_request_fingerprint(
+            team_id=team_id,
+            start_date=start_date,
+            end_date=end_date,
+            seed=seed,
+            time_limit_seconds=time_limit_seconds,
+            solver_options=solver_options,
+            input_data_version=self._input_data_version(team_id),
+        )
+
+        duplicate = self._find_duplicate(
+            session,
+            team_id=team_id,
+            start_date=start_date,
+            end_date=end_date,
+            fingerprint=fingerprint,
+            idempotency_key=idempotency_key,
+        )
+        if duplicate is not None:
+            # Incrément côté SQL : deux doubles-clics concurrents comptent tous les deux
+            duplicate.dedup_count = PlanningDraft.dedup_count + 1
+            session.flush()
+            metrics.inc("planning_generate_deduplicated_total")
+            logger.info(
+                "planning_generation.create_draft.deduplicated",
+                extra={"draft_id": duplicate.id, "job_id": duplicate.job_id},
+            )
+            return duplicate, True
+
         draft = PlanningDraft(
             job_id=str(uuid4()),
             team_id=team_id,
@@ -90,27 +331,14 @@ class PlanningGenerationService:
             status=PlanningDraftStatus.QUEUED.value,
             seed=seed,
             time_limit_seconds=time_limit_seconds,
-            solver_options={
-                "quality_profile": quality_profile,
-                "v3_strategy": v3_strategy,
-                "phase1_fraction": phase1_fraction,
-                "phase1_seconds": phase1_seconds,
-                "lns_iter_seconds": lns_iter_seconds,
-                "lns_min_remaining_seconds": lns_min_remaining_seconds,
-                "lns_strict_improve": lns_strict_improve,
-                "lns_max_days_to_relax": lns_max_days_to_relax,
-                "lns_neighborhood_mode": lns_neighborhood_mode,
-                "min_lns_seconds": min_lns_seconds,
-                "phase2_max_fraction_of_remaining": phase2_max_fraction_of_remaining,
-                "phase2_no_improve_seconds": phase2_no_improve_seconds,
-                "enable_decision_strategy": enable_decision_strategy,
-                "enable_symmetry_breaking": enable_symmetry_breaking,
-            },
+            solver_options=solver_options,
+            request_fingerprint=fingerprint,
+            idempotency_key=idempotency_key,
         )
         session.add(draft)
         session.flush()
         logger.error("planning_generation.create_draft", extra={"draft_id": draft.id, "job_id": draft.job_id})
-        return draft
+        return draft, False
 
     def _compute_hard_infeasible_stats(
         self,
@@ -186,7 +414,10 @@ class PlanningGenerationService:
                 draft.status = PlanningDraftStatus.RUNNING.value
                 session.commit()
 
-                mapper = SolverInputMapper(session=session)
+                mapper = SolverInputMapper(
+                    session=session,
+                    eligibility=self.eligibility.get() if self.eligibility is not None else None,
+                )
                 team_agent_ids = mapper.list_team_agent_ids(team_id=draft.team_id)
                 raw_qualified_postes_by_agent = mapper.list_qualified_postes_by_agent(agent_ids=team_agent_ids)
                 sorted_qualified_postes_by_agent = mapper.normalize_qualified_postes_by_agent(
@@ -248,6 +479,16 @@ class PlanningGenerationService:
                     qualified_postes_by_agent=sorted_qualified_postes_by_agent,
                     absences=absences,
                 )
+                with metrics.time("solver_phase_duration_seconds", phase="coverage_flow_precheck"):
+                    coverage_flow = compute_coverage_flow_bound(
+                        demands=coverage_demands,
+                        tranches=tranches,
+                        agent_ids=team_agent_ids,
+                        qualified_postes_by_agent=sorted_qualified_postes_by_agent,
+                        qualification_date_by_agent_poste=qualification_date_by_agent_poste,
+                        absences=absences,
+                    )
+                coverage_flow_stats = coverage_flow.to_stats()
                 mapper_debug_stats = {
                     "absence_count": len(absences),
                     "demand_count": len(coverage_demands),
@@ -259,6 +500,8 @@ class PlanningGenerationService:
                     "ignored_poste_ids_sample": ignored_poste_ids_sample,
                     "hard_infeasible_demands_count": hard_infeasible_count,
                     "hard_infeasible_demands_sample": hard_infeasible_sample,
+                    "coverage_flow_understaff_lower_bound": coverage_flow.understaff_lower_bound,
+                    "coverage_flow_bottleneck_days_count": coverage_flow_stats["coverage_flow_bottleneck_days_count"],
                 }
 
                 solver_opts = draft.solver_options or {}
@@ -298,12 +541,40 @@ class PlanningGenerationService:
                         phase2_no_improve_seconds=solver_opts.get("phase2_no_improve_seconds"),
                         enable_decision_strategy=solver_opts.get("enable_decision_strategy"),
                         enable_symmetry_breaking=solver_opts.get("enable_symmetry_breaking"),
+                        enable_warm_start=solver_opts.get("enable_warm_start"),
+                        enable_decomposition=bool(solver_opts.get("enable_decomposition", False)),
+                        alternatives_count=int(solver_opts.get("alternatives_count") or 0),
+                        alternatives_min_changed_days=solver_opts.get("alternatives_min_changed_days"),
+                        budget_mode=str(solver_opts.get("budget_mode") or "wall"),
+                        deterministic_units_per_second=solver_opts.get("deterministic_units_per_second"),
+                        enable_memory_profiling=bool(solver_opts.get("enable_memory_profiling", False)),
+                        memory_limit_mb=solver_opts.get("memory_limit_mb"),
+                        understaff_lower_bound=coverage_flow.understaff_lower_bound,
+                        coverage_flow_bottleneck_days=coverage_flow_stats["coverage_flow_bottleneck_days"],
                     )
                 )
 
-                self._persist_output(session=session, draft=draft, solver_output=solver_output)
-
-                stats = merge_stats(mapper_debug_stats, solver_output.stats)
+                record_solver_metrics(solver_output.stats)
+                memory = MemoryProfiler(
+                    enabled=bool(solver_opts.get("enable_memory_profiling", False)),
+                    limit_mb=solver_opts.get("memory_limit_mb"),
+                ).start()
+                try:
+                    with metrics.time("planning_draft_persist_duration_seconds"):
+                        self._persist_output(session=session, draft=draft, solver_output=solver_output)
+                        alternative_draft_ids = self._persist_alternatives(
+                            session=session,
+                            draft=draft,
+                            solver_output=solver_output,
+                            mapper_debug_stats=mapper_debug_stats,
+                        )
+                    memory.checkpoint("persistence")
+                finally:
+                    memory.stop()
+
+                stats = merge_stats(mapper_debug_stats, with_persistence_memory(solver_output.stats, memory))
+                if solver_output.alternatives:
+                    stats["alternative_draft_ids"] = alternative_draft_ids
 
                 draft.result_stats = stats
                 draft.status = PlanningDraftStatus.SUCCESS.value
@@ -317,6 +588,7 @@ class PlanningGenerationService:
                 return
             except TimeoutError as exc:
                 session.rollback()
+                record_solver_metrics(getattr(exc, "stats", {}))
 
                 failed_draft = session.query(PlanningDraft).filter(PlanningDraft.job_id == normalized_job_id).first()
                 if failed_draft is not None:
@@ -339,8 +611,30 @@ class PlanningGenerationService:
                     extra={"draft_id": failed_draft.id if failed_draft else None, "job_id": normalized_job_id},
                 )
                 return
+            except MemoryLimitExceededError as exc:
+                session.rollback()
+                record_solver_metrics(getattr(exc, "stats", {}))
+
+                failed_draft = session.query(PlanningDraft).filter(PlanningDraft.job_id == normalized_job_id).first()
+                if failed_draft is None:
+                    return
+                failed_draft.status = PlanningDraftStatus.FAILED.value
+                failed_draft.error = str(exc)
+                failed_draft.result_stats = merge_stats(
+                    mapper_debug_stats,
+                    getattr(exc, "stats", {}),
+                    {"solver_status": "MEMORY_LIMIT", "coverage_ratio": 0, "normalized_solver_status": "MEMORY_LIMIT"},
+                )
+                session.commit()
+
+                logger.warning(
+                    "planning_generation.run_job.memory_limit_exceeded",
+                    extra={"draft_id": failed_draft.id, "job_id": normalized_job_id, "reason": str(exc)},
+                )
+                return
             except InfeasibleError as exc:
                 session.rollback()
+                record_solver_metrics(getattr(exc, "stats", {}))
 
                 failed_draft = session.query(PlanningDraft).filter(PlanningDraft.job_id == normalized_job_id).first()
                 if failed_draft is None:
@@ -373,7 +667,44 @@ class PlanningGenerationService:
                 failed_draft.error = str(exc)
                 session.commit()
 
-    def _persist_output(self, session: Session, draft: PlanningDraft, solver_output: SolverOutput) -> None:
+    def _persist_alternatives(
+        self,
+        session: Session,
+        draft: PlanningDraft,
+        solver_output: SolverOutput,
+        mapper_debug_stats: dict[str, object],
+    ) -> list[int]:
+        """Persist pool alternatives as sibling drafts of ``draft`` (same job, own job_id)."""
+        draft_ids: list[int] = []
+        for alternative in solver_output.alternatives:
+            sibling = PlanningDraft(
+                job_id=str(uuid4()),
+                team_id=draft.team_id,
+                start_date=draft.start_date,
+                end_date=draft.end_date,
+                status=PlanningDraftStatus.SUCCESS.value,
+                seed=draft.seed,
+                time_limit_seconds=draft.time_limit_seconds,
+                solver_options=draft.solver_options,
+                parent_draft_id=draft.id,
+                alternative_rank=alternative.rank,
+                result_stats=merge_stats(
+                    mapper_debug_stats,
+                    alternative_result_stats(solver_output.stats, alternative, primary_draft_id=draft.id),
+                ),
+            )
+            session.add(sibling)
+            session.flush()
+            self._persist_output(session=session, draft=sibling, solver_output=alternative)
+            draft_ids.append(sibling.id)
+        return draft_ids
+
+    def _persist_output(
+        self,
+        session: Session,
+        draft: PlanningDraft,
+        solver_output: SolverOutput | SolverAlternative,
+    ) -> None:
         by_key: dict[tuple[int, date], PlanningDraftAgentDay] = {}
 
         for item in solver_output.agent_days:
@@ -404,4 +735,16 @@ class PlanningGenerationService:
             )
 
 
-planning_generation_service = PlanningGenerationService(solver=OrtoolsSolver(), database=db)
+planning_generation_service = PlanningGenerationService(
+    solver=OrtoolsSolver(
+        model_cache=CompiledModelCache(
+            settings.solver_model_cache_dir,
+            max_bytes=settings.solver_model_cache_max_mb * 1024 * 1024,
+        )
+        if settings.solver_model_cache_enabled
+        else None
+    ),
+    database=db,
+    eligibility=eligibility_cache,
+    versions=planning_versions,
+)
@@ -8,7 +8,9 @@ from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from backend.app.api.http_exceptions import conflict, not_found
+from backend.app.bootstrap.container import planning_versions
 from core.domain.enums.planning_draft_status import PlanningDraftStatus
+from core.utils.metrics import metrics
 from db.models import AgentDay, AgentDayAssignment, AgentTeam, PlanningDraft, PlanningDraftAgentDay, PlanningDraftAssignment
 
 logger = logging.getLogger(__name__)
@@ -85,6 +87,11 @@ def _build_accept_response(draft: PlanningDraft) -> DraftAcceptResult:
 
 
 def accept_draft(session: Session, draft_id: int, actor_user_id: int | None = None) -> DraftAcceptResult:
+    with metrics.time("planning_draft_accept_duration_seconds"):
+        return _accept_draft(session, draft_id, actor_user_id)
+
+
+def _accept_draft(session: Session, draft_id: int, actor_user_id: int | None) -> DraftAcceptResult:
     with session.begin_nested():
         draft = _get_draft_for_update_or_404(session, draft_id)
         draft_status = PlanningDraftStatus(draft.status)
@@ -181,6 +188,8 @@ def accept_draft(session: Session, draft_id: int, actor_user_id: int | None = No
         )
 
     session.commit()
+    planning_versions.bump_team(draft.team_id)
+    planning_versions.bump_agents(team_agent_ids)
     session.refresh(draft)
     return _build_accept_response(draft)
 
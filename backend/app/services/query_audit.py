@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event, insert, text
+
+from backend.app.services.planning_draft_read_service import get_draft_team_planning
+from db.models import (
+    Agent,
+    AgentDay,
+    AgentDayAssignment,
+    AgentTeam,
+    PlanningDraft,
+    PlanningDraftAgentDay,
+    PlanningDraftAssignment,
+    Poste,
+    PosteCoverageRequirement,
+    Qualification,
+    Team,
+    Tranche,
+    User,
+)
+from db.models.refresh_token import RefreshToken
+from db.repositories.agent_day_repo import AgentDayRepository
+from db.repositories.poste_repo import PosteRepository
+from db.repositories.qualification_repo import QualificationRepository
+from db.repositories.refresh_token_repo import SqlAlchemyRefreshTokenRepo
+
+# Tables volumineuses : un parcours séquentiel y est une régression
+HOT_TABLES = frozenset(
+    {
+        "agent_days",
+        "agent_day_assignments",
+        "planning_draft_agent_days",
+        "planning_draft_assignments",
+        "qualifications",
+        "refresh_tokens",
+    }
+)
+
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+# "SCAN t USING [COVERING] INDEX ..." : parcours d'index (ORDER BY servi par l'index), pas de la table
+_SQLITE_INDEX_SCAN = re.compile(r"\bUSING (?:COVERING )?INDEX\b")
+
+Statement = Tuple[str, Any]
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    name: str
+    run: Callable[[], Any]
+
+
+@dataclass
+class QueryPlanFinding:
+    query: str
+    statement: str
+    plan: List[str]
+    seq_scans: List[str] = field(default_factory=list)
+
+
+@dataclass
+class QueryAuditReport:
+    findings: List[QueryPlanFinding]
+
+    @property
+    def failures(self) -> List[QueryPlanFinding]:
+        return [f for f in self.findings if f.seq_scans]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def format(self) -> str:
+        lines = []
+        for f in self.findings:
+            status = "SEQ SCAN " + ", ".join(sorted(set(f.seq_scans))) if f.seq_scans else "ok"
+            lines.append(f"[{status}] {f.query}: {_one_line(f.statement)[:120]}")
+            if f.seq_scans:
+                lines += [f"      {row}" for row in f.plan]
+        queries = {f.query for f in self.findings}
+        failed = {f.query for f in self.failures}
+        lines.append(f"{len(queries) - len(failed)}/{len(queries)} hot queries use indexes only")
+        return "\n".join(lines)
+
+
+class QueryPlanAuditor:
+    """
+    Audit EXPLAIN des requêtes chaudes.
+
+    Chaque requête est exécutée réellement (via les repositories) pendant qu'un listener
+    capture les SELECT émis ; chaque SELECT capturé est ensuite rejoué en EXPLAIN.
+    - SQLite : EXPLAIN QUERY PLAN, une ligne "SCAN <table>" sans "USING ... INDEX" = parcours complet
+    - Postgres : EXPLAIN (FORMAT JSON) avec enable_seqscan=off ; un "Seq Scan" restant
+      signifie qu'aucun index n'est utilisable (indépendamment de la volumétrie)
+    """
+
+    def __init__(self, database, hot_tables: Iterable[str] = HOT_TABLES):
+        self.database = database
+        self.hot_tables = frozenset(hot_tables)
+
+    def audit(self, queries: Sequence[HotQuery]) -> QueryAuditReport:
+        findings: List[QueryPlanFinding] = []
+        for query in queries:
+            for statement, params in self._capture(query.run):
+                plan, scans = self._explain(statement, params)
+                findings.append(QueryPlanFinding(query=query.name, statement=statement, plan=plan, seq_scans=scans))
+        return QueryAuditReport(findings=findings)
+
+    def _capture(self, run: Callable[[], Any]) -> List[Statement]:
+        captured: List[Statement] = []
+
+        def _listener(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                captured.append((statement, parameters))
+
+        event.listen(self.database.engine, "before_cursor_execute", _listener)
+        try:
+            run()
+        finally:
+            event.remove(self.database.engine, "before_cursor_execute", _listener)
+        return captured
+
+    def _explain(self, statement: str, params: Any) -> Tuple[List[str], List[str]]:
+        dialect = self.database.engine.dialect.name
+        with self.database.engine.connect() as conn:
+            if dialect == "postgresql":
+                with conn.begin():
+                    conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+                    raw = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, params).scalar()
+                plan_doc = raw if isinstance(raw, list) else json.loads(raw)
+                nodes = list(_walk_pg_plan(plan_doc[0]["Plan"]))
+                plan = [f"{n.get('Node Type')} {n.get('Relation Name', '')}".strip() for n in nodes]
+                scans = [n["Relation Name"] for n in nodes if n.get("Node Type") == "Seq Scan" and n.get("Relation Name") in self.hot_tables]
+                return plan, scans
+
+            rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, params).all()
+            plan = [str(row[-1]) for row in rows]
+            scans = [
+                m.group(1)
+                for detail in plan
+                if (m := _SQLITE_SCAN.match(detail))
+                and m.group(1) in self.hot_tables
+                and not _SQLITE_INDEX_SCAN.search(detail)
+            ]
+            return plan, scans
+
+
+def _walk_pg_plan(node: dict):
+    yield node
+    for child in node.get("Plans", []) or []:
+        yield from _walk_pg_plan(child)
+
+
+def _one_line(statement: str) -> str:
+    return " ".join(statement.split())
+
+
+# ---------------------------------------------------------
+# Jeu de données et catalogue des requêtes chaudes
+# ---------------------------------------------------------
+
+@dataclass(frozen=True)
+class AuditDataset:
+    poste_id: int
+    agent_id: int
+    draft_id: int
+    start_date: date
+    end_date: date
+    token_hash: str
+
+
+def seed_audit_dataset(
+    database,
+    *,
+    agents: int = 60,
+    postes: int = 4,
+    days: int = 120,
+    drafts_count: int = 5,
+    start_date: date = date(2026, 1, 5),
+) -> AuditDataset:
+    """
+    Peuple une base vide avec une volumétrie réaliste (agents x jours) puis lance ANALYZE,
+    pour que les plans ressemblent à ceux de production.
+    """
+    with database.session_scope() as session:
+        poste_rows = [Poste(nom=f"AUDIT-P{i}") for i in range(postes)]
+        team = Team(name="AUDIT-TEAM")
+        session.add_all([*poste_rows, team])
+        session.flush()
+
+        tranches = []
+        for p in poste_rows:
+            for nom, start_h in (("M", 6), ("S", 14), ("N", 22)):
+                tranches.append(Tranche(nom=nom, heure_debut=time(start_h), heure_fin=time((start_h + 8) % 24), poste_id=p.id))
+        agent_rows = [Agent(nom=f"AUDIT{i:04d}", prenom="x", actif=True) for i in range(agents)]
+        session.add_all([*tranches, *agent_rows])
+        session.flush()
+
+        session.execute(insert(AgentTeam), [{"agent_id": a.id, "team_id": team.id} for a in agent_rows])
+        session.execute(
+            insert(Qualification),
+            [{"agent_id": a.id, "poste_id": poste_rows[i % postes].id} for i, a in enumerate(agent_rows)],
+        )
+        session.execute(
+            insert(PosteCoverageRequirement),
+            [
+                {"poste_id": t.poste_id, "tranche_id": t.id, "weekday": wd, "required_count": 1}
+                for t in tranches
+                for wd in range(7)
+            ],
+        )
+
+        day_dates = [start_date + timedelta(days=i) for i in range(days)]
+        session.execute(
+            insert(AgentDay),
+            [{"agent_id": a.id, "day_date": d, "day_type": "working"} for a in agent_rows for d in day_dates],
+        )
+        day_ids = session.execute(text("SELECT id, agent_id FROM agent_days")).all()
+        session.execute(
+            insert(AgentDayAssignment),
+            [{"agent_day_id": day_id, "tranche_id": tranches[(agent_id + day_id) % len(tranches)].id} for day_id, agent_id in day_ids],
+        )
+
+        # Plusieurs brouillons : la lecture d'un brouillon ne doit toucher que ses lignes
+        drafts = [
+            PlanningDraft(job_id=f"audit-job-{i}", team_id=team.id, start_date=day_dates[0], end_date=day_dates[-1], status="success")
+            for i in range(drafts_count)
+        ]
+        session.add_all(drafts)
+        session.flush()
+        draft = drafts[-1]
+        session.execute(
+            insert(PlanningDraftAgentDay),
+            [
+                {"draft_id": dr.id, "agent_id": a.id, "day_date": d, "day_type": "working"}
+                for dr in drafts
+                for a in agent_rows
+                for d in day_dates[:28]
+            ],
+        )
+        draft_day_ids = session.execute(text("SELECT id FROM planning_draft_agent_days")).scalars().all()
+        session.execute(
+            insert(PlanningDraftAssignment),
+            [{"draft_agent_day_id": i, "tranche_id": tranches[i % len(tranches)].id} for i in draft_day_ids],
+        )
+
+        user = User(username="audit", password_hash="x", role="manager", is_active=True)
+        session.add(user)
+        session.flush()
+        now = datetime.now(timezone.utc)
+        session.execute(
+            insert(RefreshToken),
+            [{"user_id": user.id, "token_hash": f"{i:064x}", "expires_at": now + timedelta(days=i % 30)} for i in range(2000)],
+        )
+
+        dataset = AuditDataset(
+            poste_id=poste_rows[0].id,
+            agent_id=agent_rows[0].id,
+            draft_id=draft.id,
+            start_date=day_dates[0],
+            end_date=day_dates[27],
+            token_hash=f"{1234:064x}",
+        )
+
+    with database.engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    return dataset
+
+
+def default_hot_queries(database, dataset: AuditDataset) -> List[HotQuery]:
+    """Requêtes des écrans planning / couverture / brouillons et de l'authentification."""
+    agent_days = AgentDayRepository()
+    agent_days.db = database
+    postes = PosteRepository()
+    postes.db = database
+    qualifications = QualificationRepository()
+    qualifications.db = database
+
+    def _draft_read():
+        with database.session_scope() as session:
+            get_draft_team_planning(session, dataset.draft_id)
+
+    def _refresh_lookup():
+        with database.session_scope() as session:
+            SqlAlchemyRefreshTokenRepo(session).get_by_hash(dataset.token_hash)
+
+    ds = dataset
+    return [
+        HotQuery("agent_days.list_by_poste_and_range", lambda: agent_days.list_by_poste_and_range(ds.poste_id, ds.start_date, ds.end_date)),
+        HotQuery("agent_days.list_by_poste_and_day", lambda: agent_days.list_by_poste_and_day(ds.poste_id, ds.start_date)),
+        HotQuery("agent_days.list_by_agent_and_range", lambda: agent_days.list_by_agent_and_range(ds.agent_id, ds.start_date, ds.end_date)),
+        HotQuery("postes.get_coverage_for_day", lambda: postes.get_coverage_for_day(poste_id=ds.poste_id, day_date=ds.start_date)),
+        HotQuery(
+            "postes.get_coverage_for_range",
+            lambda: postes.get_coverage_for_range(poste_ids=[ds.poste_id], start_date=ds.start_date, end_date=ds.end_date),
+        ),
+        HotQuery("qualifications.list_for_poste", lambda: qualifications.list_for_poste(ds.poste_id)),
+        HotQuery("planning_drafts.get_draft_team_planning", _draft_read),
+        HotQuery("refresh_tokens.get_by_hash", _refresh_lookup),
+    ]
+
+
+def run_audit(database, dataset: Optional[AuditDataset] = None) -> QueryAuditReport:
+    dataset = dataset or seed_audit_dataset(database)
+    return QueryPlanAuditor(database).audit(default_hot_queries(database, dataset))
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import timedelta
+from typing import Optional
+
+from backend.app.settings import settings
+from core.application.services.refresh_token_retention_service import (
+    RefreshTokenPurgeReport,
+    RefreshTokenRetentionService,
+)
+from db.repositories.refresh_token_repo import SqlAlchemyRefreshTokenRepo
+
+logger = logging.getLogger(__name__)
+
+
+def purge_refresh_tokens(database, *, batch_size: Optional[int] = None) -> RefreshTokenPurgeReport:
+    """Exécute une passe de purge avec la politique de rétention des settings."""
+    with database.session_scope() as session:
+        service = RefreshTokenRetentionService(
+            SqlAlchemyRefreshTokenRepo(session),
+            revoked_retention=timedelta(days=settings.refresh_token_revoked_retention_days),
+            refresh_token_lifetime=timedelta(days=settings.refresh_token_days),
+            expired_grace=timedelta(hours=settings.refresh_token_expired_grace_hours),
+            batch_size=batch_size or settings.refresh_token_purge_batch_size,
+        )
+        return service.purge()
+
+
+class RefreshTokenPurgeWorker:
+    """Thread démon qui lance `purge_refresh_tokens` à intervalle régulier."""
+
+    def __init__(self, database, interval_seconds: float):
+        self.database = database
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="refresh-token-purge", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                report = purge_refresh_tokens(self.database)
+                logger.info(report.format())
+            except Exception:
+                logger.exception("refresh_tokens purge failed")
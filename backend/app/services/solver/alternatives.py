@@ -0,0 +1,135 @@
+"""Top-k diverse solution pool on the already-built model.
+
+Once the main pipeline has its incumbent (the primary solution), each alternative is
+one extra LNS-style solve of a clone of the model: same objective, coverage locked to
+the primary (``understaff_weighted_sum <= primary``), the primary fixed outside a
+neighbourhood of agents, and a Hamming-distance constraint on the daily combo choice
+against the primary and every alternative found so far. With one-hot ``y`` per
+(agent, day), "at least ``d`` (agent, day) choices differ from reference ``s``" is
+linear: ``sum(y[k] for k chosen in s) <= n_days - d``.
+
+A full re-solve with only the distance constraint rarely finds anything within a
+short budget (the primary hint is infeasible by construction); swapping schedules
+inside a group of agents is cheap and keeps the coverage of the primary.
+Alternatives only pay a short solve each, not a full generation.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from ortools.sat.python import cp_model
+
+
+@dataclass(frozen=True)
+class PoolSolution:
+    rank: int
+    solver: cp_model.CpSolver
+    solution: dict[str, Any]
+    changed_days_to_primary: int
+
+
+@dataclass
+class DiversePoolResult:
+    solutions: list[PoolSolution] = field(default_factory=list)
+    attempts: list[dict[str, Any]] = field(default_factory=list)
+    min_changed_days: int = 0
+    wall_time_seconds: float = 0.0
+
+
+def default_min_changed_days(*, agent_day_count: int, fraction: float) -> int:
+    return max(1, int(math.ceil(agent_day_count * fraction)))
+
+
+def chosen_keys(assignment_map: dict[tuple[int, int, int], int]) -> list[tuple[int, int, int]]:
+    return [key for key, value in assignment_map.items() if int(value) == 1]
+
+
+def changed_days(left: dict[tuple[int, int, int], int], right: dict[tuple[int, int, int], int]) -> int:
+    """Number of (agent, day) whose combo differs between two assignment maps."""
+    return len(set(chosen_keys(left)) - set(chosen_keys(right)))
+
+
+def run_diverse_pool(
+    *,
+    model: cp_model.CpModel,
+    objective: cp_model.LinearExprT,
+    y: dict[tuple[int, int, int], cp_model.IntVar],
+    y_keys: list[tuple[int, int, int]],
+    understaff_weighted_sum: cp_model.IntVar,
+    primary_solution: dict[str, Any],
+    count: int,
+    min_changed_days: int,
+    time_limit_seconds_each: float,
+    neighborhood_agent_count: int,
+    max_attempts: int,
+    seed: int,
+    _new_solver: Callable[[float], cp_model.CpSolver],
+    _normalize_status: Callable[[int, float, float], tuple[str, str, bool]],
+    _extract_solution: Callable[[cp_model.CpSolver], dict[str, Any]],
+) -> DiversePoolResult:
+    """Find up to ``count`` solutions, each ``min_changed_days`` away from all previous ones.
+
+    ``model`` is not mutated. Each attempt relaxes ``neighborhood_agent_count`` agents
+    drawn with a ``seed``-derived RNG (deterministic for a given input); at most
+    ``max_attempts`` solves are run in total.
+    """
+    result = DiversePoolResult(min_changed_days=min_changed_days)
+    references = [primary_solution["assignment_map"]]
+    primary_map = primary_solution["assignment_map"]
+    agent_ids = sorted({key[0] for key in y_keys})
+    rng = random.Random(seed)
+
+    for attempt_index in range(max_attempts):
+        if len(result.solutions) >= count:
+            break
+        rank = len(result.solutions) + 1
+        relaxed_agents = set(rng.sample(agent_ids, min(len(agent_ids), neighborhood_agent_count)))
+        pool_model = model.Clone()
+        pool_model.ClearHints()
+        for key in y_keys:
+            if key[0] in relaxed_agents:
+                pool_model.AddHint(y[key], int(primary_map[key]))
+            else:
+                pool_model.Add(y[key] == int(primary_map[key]))
+        pool_model.Minimize(objective)
+        # Jamais moins bien couvert que la solution principale
+        pool_model.Add(understaff_weighted_sum <= int(primary_solution["understaff_total_weighted"]))
+        for reference in references:
+            keys = chosen_keys(reference)
+            pool_model.Add(sum(y[key] for key in keys) <= len(keys) - min_changed_days)
+
+        solver = _new_solver(time_limit_seconds_each)
+        status = solver.Solve(pool_model)
+        wall = float(solver.WallTime())
+        result.wall_time_seconds += wall
+        raw, normalized, _timeout = _normalize_status(status, wall, time_limit_seconds_each)
+        attempt: dict[str, Any] = {
+            "attempt": attempt_index,
+            "rank": rank,
+            "relaxed_agent_ids": sorted(relaxed_agents),
+            "status_raw": raw,
+            "normalized_status": normalized,
+            "wall_time_seconds": wall,
+            "objective_value": None,
+            "understaff_total_unweighted": None,
+            "changed_days_to_primary": None,
+        }
+        result.attempts.append(attempt)
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            continue
+
+        solution = _extract_solution(solver)
+        changed = changed_days(solution["assignment_map"], primary_map)
+        attempt.update(
+            objective_value=solution["objective_value"],
+            understaff_total_unweighted=solution["understaff_total_unweighted"],
+            changed_days_to_primary=changed,
+        )
+        result.solutions.append(PoolSolution(rank=rank, solver=solver, solution=solution, changed_days_to_primary=changed))
+        references.append(solution["assignment_map"])
+
+    return result
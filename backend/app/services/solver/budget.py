@@ -0,0 +1,108 @@
+"""Budget clock shared by phase1/phase2/LNS/eval.
+
+- ``wall``: historical behavior, budgets are wall-clock seconds.
+- ``deterministic``: budgets are CP-SAT deterministic time (``max_deterministic_time``),
+  expressed in "calibrated seconds" (units / ``units_per_second``). Every budget
+  decision (remaining time, LNS start, timeout detection) reads the accumulated
+  deterministic time, so the same input replays bit-for-bit on any host with the
+  same OR-Tools build, whatever the load. Each solve is charged at least
+  ``min_seconds_per_solve`` (work outside CP-SAT is not deterministic time), and a
+  wall cap (``wall_safety_factor`` x budget) still bounds pathological hosts; hitting
+  it is reported and breaks the replay guarantee for that run only.
+"""
+
+from __future__ import annotations
+
+import time
+
+from ortools.sat.python import cp_model
+
+from backend.app.services.solver.constants import (
+    DETERMINISTIC_MIN_SECONDS_PER_SOLVE,
+    DETERMINISTIC_WALL_SAFETY_FACTOR,
+)
+
+BUDGET_MODES = ("wall", "deterministic")
+
+
+def solver_deterministic_time(solver: cp_model.CpSolver) -> float:
+    """Deterministic time of the last ``Solve`` of ``solver`` (0.0 before any solve)."""
+    return float(solver.ResponseProto().deterministic_time)
+
+
+class SolveClock:
+    def __init__(
+        self,
+        *,
+        mode: str = "wall",
+        units_per_second: float = 1.0,
+        started_at: float | None = None,
+        time_limit_seconds: float = 0.0,
+        wall_safety_factor: float = DETERMINISTIC_WALL_SAFETY_FACTOR,
+        min_seconds_per_solve: float = DETERMINISTIC_MIN_SECONDS_PER_SOLVE,
+    ):
+        if mode not in BUDGET_MODES:
+            raise ValueError(f"budget_mode must be one of {list(BUDGET_MODES)}")
+        if units_per_second <= 0:
+            raise ValueError("deterministic_units_per_second must be > 0")
+        self.mode = mode
+        self.units_per_second = float(units_per_second)
+        self.started_at = time.monotonic() if started_at is None else started_at
+        self.time_limit_seconds = float(time_limit_seconds)
+        self.wall_safety_factor = float(wall_safety_factor)
+        self.min_seconds_per_solve = float(min_seconds_per_solve)
+        self._solvers: list[cp_model.CpSolver] = []
+        # Cumul des solveurs terminés (tous sauf le dernier créé)
+        self._settled_units = 0.0
+        self._settled_seconds = 0.0
+
+    @property
+    def deterministic(self) -> bool:
+        return self.mode == "deterministic"
+
+    def _charged_seconds(self, units: float) -> float:
+        return max(units / self.units_per_second, self.min_seconds_per_solve)
+
+    def track(self, solver: cp_model.CpSolver) -> cp_model.CpSolver:
+        # Un nouveau solveur n'est créé qu'une fois le précédent résolu : on fige sa valeur
+        if self._solvers:
+            units = solver_deterministic_time(self._solvers[-1])
+            self._settled_units += units
+            self._settled_seconds += self._charged_seconds(units)
+        self._solvers.append(solver)
+        return solver
+
+    def deterministic_units_total(self) -> float:
+        last = solver_deterministic_time(self._solvers[-1]) if self._solvers else 0.0
+        return self._settled_units + last
+
+    def deterministic_seconds(self) -> float:
+        """Budget seconds consumed in deterministic mode (per-solve minimum included)."""
+        if not self._solvers:
+            return 0.0
+        last = solver_deterministic_time(self._solvers[-1])
+        return self._settled_seconds + self._charged_seconds(last)
+
+    def wall_elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def wall_cap_hit(self) -> bool:
+        if not self.deterministic or self.time_limit_seconds <= 0:
+            return False
+        return self.wall_elapsed() >= self.time_limit_seconds * self.wall_safety_factor
+
+    def elapsed(self) -> float:
+        """Seconds consumed against the budget (wall or calibrated deterministic)."""
+        if not self.deterministic:
+            return self.wall_elapsed()
+        if self.wall_cap_hit:
+            # Filet de sécurité : budget considéré épuisé, quel que soit le temps déterministe
+            return max(self.time_limit_seconds, self.deterministic_seconds())
+        return self.deterministic_seconds()
+
+    def last_solve_seconds(self, wall_time: float) -> float:
+        """Duration of the last solve in budget seconds (``wall_time`` in wall mode)."""
+        if self.deterministic and self._solvers:
+            return solver_deterministic_time(self._solvers[-1]) / self.units_per_second
+        return wall_time
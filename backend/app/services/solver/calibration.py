@@ -0,0 +1,124 @@
+"""Host calibration for deterministic-time budgets.
+
+CP-SAT deterministic time is host-independent but has no unit: the calibration runs
+a fixed synthetic instance in wall mode and records how many deterministic units the
+host burns per wall second. ``units_per_second`` then converts a budget expressed in
+seconds into ``max_deterministic_time``, so a draft generated with a deterministic
+budget takes roughly its nominal duration on the calibrated host, and replays
+identically everywhere else (only slower or faster).
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+
+import ortools
+
+from backend.app.services.solver.constants import DETERMINISTIC_DEFAULT_UNITS_PER_SECOND
+from backend.app.services.solver.models import CoverageDemand, SolverInput, TrancheInfo
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+
+
+@dataclass(frozen=True)
+class DeterministicCalibration:
+    units_per_second: float
+    host: str
+    ortools_version: str
+    samples: list[float] = field(default_factory=list)
+    measured_at: str | None = None
+
+    def expected_seconds(self, deterministic_units: float) -> float:
+        return float(deterministic_units) / self.units_per_second
+
+    def save(self, path: str | Path) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(asdict(self), indent=2, sort_keys=True), encoding="utf-8")
+        return target
+
+    @classmethod
+    def load(cls, path: str | Path) -> "DeterministicCalibration | None":
+        source = Path(path)
+        if not source.exists():
+            return None
+        data = json.loads(source.read_text(encoding="utf-8"))
+        if float(data.get("units_per_second") or 0.0) <= 0:
+            return None
+        return cls(
+            units_per_second=float(data["units_per_second"]),
+            host=str(data.get("host", "")),
+            ortools_version=str(data.get("ortools_version", "")),
+            samples=[float(s) for s in data.get("samples", [])],
+            measured_at=data.get("measured_at"),
+        )
+
+
+def resolve_units_per_second(*, explicit: float | None, calibration_path: str | Path | None) -> float:
+    """Explicit setting > host calibration file > default."""
+    if explicit:
+        return float(explicit)
+    if calibration_path:
+        calibration = DeterministicCalibration.load(calibration_path)
+        if calibration is not None:
+            return calibration.units_per_second
+    return DETERMINISTIC_DEFAULT_UNITS_PER_SECOND
+
+
+def calibration_input(*, seed: int, time_limit_seconds: int) -> SolverInput:
+    """Fixed synthetic instance: 12 agents, 2 postes x 3 tranches, 3 weeks, tight coverage."""
+    start = date(2026, 1, 5)
+    days = [start + timedelta(days=i) for i in range(21)]
+    agent_ids = list(range(1, 13))
+    tranches = [
+        TrancheInfo(id=poste_id * 10 + k, poste_id=poste_id, heure_debut=time(h_start, 0), heure_fin=time(h_end, 0))
+        for poste_id in (1, 2)
+        for k, (h_start, h_end) in enumerate(((6, 14), (14, 22), (22, 6)))
+    ]
+    qualified = {a: ((1, 2) if a % 3 == 0 else ((1,) if a % 3 == 1 else (2,))) for a in agent_ids}
+    return SolverInput(
+        team_id=0,
+        start_date=days[0],
+        end_date=days[-1],
+        seed=seed,
+        time_limit_seconds=time_limit_seconds,
+        agent_ids=agent_ids,
+        absences={(a, days[(a * 5) % len(days)]) for a in agent_ids},
+        qualified_postes_by_agent=qualified,
+        qualification_date_by_agent_poste={(a, p): None for a, postes in qualified.items() for p in postes},
+        existing_day_type_by_agent_day={},
+        poste_ids=[1, 2],
+        tranches=tranches,
+        coverage_demands=[
+            CoverageDemand(day_date=d, tranche_id=t.id, required_count=1, poste_id=t.poste_id)
+            for d in days
+            for t in tranches
+        ],
+        v3_strategy="two_phase_lns",
+        budget_mode="wall",
+    )
+
+
+def calibrate(*, runs: int = 3, time_limit_seconds: int = 5) -> DeterministicCalibration:
+    """Measure deterministic units per wall second on this host (median over ``runs`` seeds)."""
+    samples: list[float] = []
+    for run in range(max(1, runs)):
+        output = OrtoolsSolver().generate(calibration_input(seed=run + 1, time_limit_seconds=time_limit_seconds))
+        timing = output.stats["stats"]["timing"]["global"]
+        wall = float(timing["solve_wall_time_seconds"] or 0.0)
+        units = float(timing["deterministic_time_total"] or 0.0)
+        if wall > 0 and units > 0:
+            samples.append(units / wall)
+    if not samples:
+        raise RuntimeError("calibration produced no usable sample")
+    return DeterministicCalibration(
+        units_per_second=statistics.median(samples),
+        host=platform.node() or "unknown",
+        ortools_version=ortools.__version__,
+        samples=samples,
+        measured_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    )
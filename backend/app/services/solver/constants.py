@@ -14,6 +14,7 @@ STATS_PAYLOAD_CAPS = {
         "lns_iteration_history": 100,
         "cp_sat_best_objective_points": 200,
         "understaff_by_day_weighted": 366,
+        "coverage_flow_bottleneck_days": 366,
     },
     "compact": {
         "combo_rejected_samples": 10,
@@ -23,6 +24,7 @@ STATS_PAYLOAD_CAPS = {
         "lns_iteration_history": 20,
         "cp_sat_best_objective_points": 50,
         "understaff_by_day_weighted": 31,
+        "coverage_flow_bottleneck_days": 31,
     },
 }
 
@@ -30,6 +32,36 @@ STATS_PAYLOAD_CAPS = {
 CP_SAT_DEFAULT_NUM_SEARCH_WORKERS = 1
 CP_SAT_DEFAULT_RANDOM_SEED = 0
 
+# Deterministic-time budgets: CP-SAT deterministic units per calibrated second when no
+# host calibration is available (single-worker rate of a typical x86 VM), and wall-clock
+# cap (x budget) kept as a safety net.
+DETERMINISTIC_DEFAULT_UNITS_PER_SECOND = 0.2
+DETERMINISTIC_WALL_SAFETY_FACTOR = 5.0
+# Minimum budget charged per solve (model rebuild/extraction is not deterministic time);
+# keeps tiny LNS neighborhoods from looping until the wall cap.
+DETERMINISTIC_MIN_SECONDS_PER_SOLVE = 0.05
+
+# Independent-component decomposition: upper bound on components solved in parallel
+# (each CP-SAT solve stays single-worker, so this is also the number of busy cores).
+DECOMPOSITION_MAX_WORKERS = 4
+
+# Diverse solution pool: each attempt gets this share of the time limit (on top of the
+# main budget, floored) and relaxes this fraction of the agents; an alternative must
+# change at least this fraction of (agent, day) choices versus the primary and every
+# previous alternative. Attempts are capped at ALTERNATIVES_MAX_ATTEMPTS_FACTOR x k.
+ALTERNATIVES_TIME_SHARE_EACH = 0.1
+ALTERNATIVES_MIN_SECONDS_EACH = 1.0
+ALTERNATIVES_MIN_CHANGED_DAYS_FRACTION = 0.05
+ALTERNATIVES_NEIGHBORHOOD_AGENT_FRACTION = 0.25
+ALTERNATIVES_MAX_ATTEMPTS_FACTOR = 2
+
+# Lexicographic strategy: share of the remaining budget per tier (unused time rolls forward).
+LEXICOGRAPHIC_TIER_BUDGET_SHARES = {
+    "coverage": 0.5,
+    "fairness": 0.3,
+    "comfort": 0.2,
+}
+
 # LNS guardrails and history sizing.
 MIN_LNS_REMAINING_SECONDS_TO_RUN_ITER = 0.2
 LNS_ITER_OVERHEAD_SECONDS = 0.05
@@ -4,7 +4,11 @@ from typing import Any
 
 from ortools.sat.python import cp_model
 
-from backend.app.services.solver.constants import CP_SAT_DEFAULT_NUM_SEARCH_WORKERS, CP_SAT_DEFAULT_RANDOM_SEED
+from backend.app.services.solver.constants import (
+    CP_SAT_DEFAULT_NUM_SEARCH_WORKERS,
+    CP_SAT_DEFAULT_RANDOM_SEED,
+    DETERMINISTIC_WALL_SAFETY_FACTOR,
+)
 
 
 def normalize_status(raw_status: int, wall_time: float, budget_seconds: float) -> tuple[str, str, bool]:
@@ -34,14 +38,26 @@ def normalize_status(raw_status: int, wall_time: float, budget_seconds: float) -
     return raw, normalized, bool(time_limit_reached)
 
 
-def configure_solver(*, budget_seconds: float, time_limit_seconds: float, seed: int) -> cp_model.CpSolver:
+def configure_solver(
+    *,
+    budget_seconds: float,
+    time_limit_seconds: float,
+    seed: int,
+    deterministic_units_per_second: float | None = None,
+) -> cp_model.CpSolver:
     """Build a configured single-thread deterministic CP-SAT solver.
 
+    With ``deterministic_units_per_second`` the budget becomes ``max_deterministic_time``
+    (budget x units) and the wall limit is only a safety cap.
     CP-SAT config only; this helper does not write result stats.
     """
     solver = cp_model.CpSolver()
     if budget_seconds > 0:
-        solver.parameters.max_time_in_seconds = budget_seconds
+        if deterministic_units_per_second:
+            solver.parameters.max_deterministic_time = budget_seconds * deterministic_units_per_second
+            solver.parameters.max_time_in_seconds = budget_seconds * DETERMINISTIC_WALL_SAFETY_FACTOR
+        else:
+            solver.parameters.max_time_in_seconds = budget_seconds
     solver.parameters.num_search_workers = CP_SAT_DEFAULT_NUM_SEARCH_WORKERS
     solver.parameters.random_seed = int(seed or CP_SAT_DEFAULT_RANDOM_SEED)
     return solver
@@ -65,6 +81,8 @@ def effective_cp_sat_params(
         "num_search_workers": int(getattr(solver.parameters, "num_search_workers", 0) or 0),
         "random_seed": int(getattr(solver.parameters, "random_seed", 0) or 0),
     }
+    if solver.parameters.HasField("max_deterministic_time"):
+        params["max_deterministic_time"] = float(solver.parameters.max_deterministic_time)
     optional_numeric = {
         "max_number_of_conflicts": int(getattr(solver.parameters, "max_number_of_conflicts", 0) or 0),
         "cp_model_probing_level": int(getattr(solver.parameters, "cp_model_probing_level", 0) or 0),
@@ -0,0 +1,449 @@
+"""Independent-component decomposition of the generation model.
+
+Agents only interact through the postes they can hold: two groups of agents qualified
+for disjoint sets of postes share no coverage constraint, no combo and no rest rule.
+Only the fairness spreads (work days/minutes, nights) and the global amplitude cap
+couple them in the monolithic model. In decomposition mode, the agent–poste
+qualification graph is split into connected components, each component is solved as
+its own model (in parallel threads, CP-SAT releases the GIL while solving) and the
+outputs are merged into a single ``SolverOutput``.
+
+Fairness is computed per component: spreads are minimized inside each component,
+not across the team (the merged ``solution_quality`` still reports the team-wide
+min/max). The amplitude cap applies per component.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Iterable
+
+from backend.app.services.solver.constants import DECOMPOSITION_MAX_WORKERS
+from backend.app.services.solver.coverage_flow import compute_coverage_flow_bound
+from backend.app.services.solver.memory_profile import tracemalloc_session
+from backend.app.services.solver.models import (
+    CoverageDemand,
+    SolverAgentDay,
+    SolverAlternative,
+    SolverAssignment,
+    SolverFailureError,
+    SolverInput,
+    SolverOutput,
+)
+from backend.app.services.solver.stats import StatsCollector
+
+# Groupes dont les compteurs s'additionnent entre composantes
+_ADDITIVE_GROUPS = ("model", "coverage", "objective", "solution_quality")
+_LNS_ADDITIVE_KEYS = (
+    "lns_iterations",
+    "lns_iterations_actual",
+    "lns_accept_count",
+    "lns_accept_count_total",
+    "lns_no_solution_count_total",
+    "lns_unknown_count_total",
+    "lns_total_wall_time_seconds",
+    "lns_solve_wall_time_seconds_total",
+    "lns_model_rebuild_wall_time_seconds_total",
+)
+_SUMMARY_COVERAGE_KEYS = ("understaff_total", "understaff_total_weighted", "total_required_count", "coverage_ratio")
+
+
+@dataclass(frozen=True)
+class QualificationComponent:
+    index: int
+    agent_ids: list[int]
+    poste_ids: list[int]
+
+
+def detect_qualification_components(solver_input: SolverInput) -> list[QualificationComponent]:
+    """Connected components of the agent–poste qualification graph.
+
+    Agents without any poste form one extra component (they can only rest);
+    postes nobody is qualified for are attached to the first component (their
+    demands stay uncovered whatever the split).
+    """
+    poste_ids = list(solver_input.poste_ids)
+    known_postes = set(poste_ids)
+    parent: dict[int, int] = {poste_id: poste_id for poste_id in poste_ids}
+
+    def _find(poste_id: int) -> int:
+        while parent[poste_id] != poste_id:
+            parent[poste_id] = parent[parent[poste_id]]
+            poste_id = parent[poste_id]
+        return poste_id
+
+    postes_by_agent: dict[int, list[int]] = {}
+    for agent_id in solver_input.agent_ids:
+        postes = sorted(p for p in solver_input.qualified_postes_by_agent.get(agent_id, ()) if p in known_postes)
+        postes_by_agent[agent_id] = postes
+        for other in postes[1:]:
+            root_a, root_b = _find(postes[0]), _find(other)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    agents_by_root: dict[int, list[int]] = {}
+    idle_agents: list[int] = []
+    for agent_id in solver_input.agent_ids:
+        postes = postes_by_agent[agent_id]
+        if postes:
+            agents_by_root.setdefault(_find(postes[0]), []).append(agent_id)
+        else:
+            idle_agents.append(agent_id)
+
+    postes_by_root: dict[int, list[int]] = {}
+    orphan_postes: list[int] = []
+    for poste_id in poste_ids:
+        root = _find(poste_id)
+        if root in agents_by_root:
+            postes_by_root.setdefault(root, []).append(poste_id)
+        else:
+            orphan_postes.append(poste_id)
+
+    groups = sorted(
+        ((agents, postes_by_root[root]) for root, agents in agents_by_root.items()),
+        key=lambda group: min(group[0]),
+    )
+    if idle_agents:
+        groups.append((idle_agents, []))
+    if not groups:
+        return [QualificationComponent(index=0, agent_ids=list(solver_input.agent_ids), poste_ids=poste_ids)]
+    if orphan_postes:
+        first_agents, first_postes = groups[0]
+        groups[0] = (first_agents, sorted(first_postes + orphan_postes))
+
+    return [
+        QualificationComponent(index=index, agent_ids=agents, poste_ids=postes)
+        for index, (agents, postes) in enumerate(groups)
+    ]
+
+
+def _demand_poste_id(demand: CoverageDemand, poste_by_tranche: dict[int, int]) -> int | None:
+    return demand.poste_id if demand.poste_id is not None else poste_by_tranche.get(demand.tranche_id)
+
+
+def build_component_input(
+    solver_input: SolverInput,
+    component: QualificationComponent,
+    *,
+    time_limit_seconds: int,
+) -> SolverInput:
+    agents = set(component.agent_ids)
+    postes = set(component.poste_ids)
+    poste_by_tranche = {tranche.id: tranche.poste_id for tranche in solver_input.tranches}
+
+    def _agent_map(mapping: dict) -> dict:
+        return {key: value for key, value in mapping.items() if key[0] in agents}
+
+    tranches = [tranche for tranche in solver_input.tranches if tranche.poste_id in postes]
+    demands = [
+        demand for demand in solver_input.coverage_demands if _demand_poste_id(demand, poste_by_tranche) in postes
+    ]
+    qualified = {agent_id: postes_ for agent_id, postes_ in solver_input.qualified_postes_by_agent.items() if agent_id in agents}
+    qualification_dates = _agent_map(solver_input.qualification_date_by_agent_poste)
+    absences = {key for key in solver_input.absences if key[0] in agents}
+
+    understaff_lower_bound = None
+    bottleneck_days: list[dict[str, Any]] = []
+    if solver_input.understaff_lower_bound is not None:
+        # La borne globale ne se répartit pas : on la recalcule sur la composante (même relaxation)
+        flow = compute_coverage_flow_bound(
+            demands=demands,
+            tranches=tranches,
+            agent_ids=list(component.agent_ids),
+            qualified_postes_by_agent=qualified,
+            qualification_date_by_agent_poste=qualification_dates,
+            absences=absences,
+        )
+        understaff_lower_bound = flow.understaff_lower_bound
+        bottleneck_days = flow.to_stats()["coverage_flow_bottleneck_days"]
+
+    return replace(
+        solver_input,
+        time_limit_seconds=time_limit_seconds,
+        agent_ids=list(component.agent_ids),
+        absences=absences,
+        qualified_postes_by_agent=qualified,
+        qualification_date_by_agent_poste=qualification_dates,
+        existing_day_type_by_agent_day=_agent_map(solver_input.existing_day_type_by_agent_day),
+        poste_ids=list(component.poste_ids),
+        tranches=tranches,
+        coverage_demands=demands,
+        existing_day_type_by_agent_day_ctx=_agent_map(solver_input.existing_day_type_by_agent_day_ctx),
+        existing_daytype_by_agent_day_ctx=_agent_map(solver_input.existing_daytype_by_agent_day_ctx),
+        existing_assignment_by_agent_day_ctx=_agent_map(solver_input.existing_assignment_by_agent_day_ctx),
+        existing_work_minutes_by_agent_day_ctx=_agent_map(solver_input.existing_work_minutes_by_agent_day_ctx),
+        existing_shift_start_end_by_agent_day_ctx=_agent_map(solver_input.existing_shift_start_end_by_agent_day_ctx),
+        enable_decomposition=False,
+        understaff_lower_bound=understaff_lower_bound,
+        coverage_flow_bottleneck_days=bottleneck_days,
+    )
+
+
+def _merge_values(values: list[Any]) -> Any:
+    present = [value for value in values if value is not None]
+    if not present:
+        return None
+    first = present[0]
+    if isinstance(first, bool):
+        return any(bool(value) for value in present)
+    if isinstance(first, (int, float)):
+        return sum(present)
+    if isinstance(first, list):
+        return [item for value in present for item in value]
+    if isinstance(first, dict):
+        return _merge_dicts(present)
+    # Valeurs descriptives : conservées seulement si toutes les composantes s'accordent
+    return first if all(value == first for value in present) else None
+
+
+def _merge_dicts(dicts: list[dict[str, Any]]) -> dict[str, Any]:
+    keys: list[str] = []
+    for item in dicts:
+        keys.extend(key for key in item if key not in keys)
+    return {key: _merge_values([item.get(key) for item in dicts]) for key in keys}
+
+
+def _merge_top_understaff_days(groups: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    by_day: dict[str, dict[str, int]] = {}
+    for coverage in groups:
+        for item in coverage.get("top_understaff_days") or []:
+            day = by_day.setdefault(item["day_date"], {"understaff_unweighted": 0, "understaff_weighted": 0})
+            day["understaff_unweighted"] += int(item.get("understaff_unweighted") or 0)
+            day["understaff_weighted"] += int(item.get("understaff_weighted") or 0)
+    ordered = sorted(by_day, key=lambda d: (-by_day[d]["understaff_unweighted"], -by_day[d]["understaff_weighted"], d))
+    return [{"day_date": day_key, **by_day[day_key]} for day_key in ordered]
+
+
+def merge_component_stats(
+    components: list[QualificationComponent],
+    component_stats: list[dict[str, Any]],
+    *,
+    total_required_weighted: int,
+    wall_time_seconds: float,
+    time_limit_seconds: float,
+    component_time_limit_seconds: int,
+    max_workers: int,
+    collector: StatsCollector,
+) -> dict[str, Any]:
+    grouped = [stats.get("stats") or {} for stats in component_stats]
+    merged: dict[str, Any] = {"meta": deepcopy(grouped[0].get("meta") or {})}
+
+    # Composantes résolues en parallèle : chaque durée d'étape est celle de la plus lente
+    timing_globals = [(group.get("timing") or {}).get("global") or {} for group in grouped]
+    timing = {}
+    for key in timing_globals[0]:
+        values = [item.get(key) for item in timing_globals]
+        numeric = [v for v in values if isinstance(v, (int, float)) and not isinstance(v, bool)]
+        timing[key] = max(numeric) if numeric and len(numeric) == len(values) else _merge_values(values)
+    timing.update(
+        {
+            "time_limit_seconds": float(time_limit_seconds),
+            "solve_wall_time_seconds": float(wall_time_seconds),
+            "solve_time_seconds": float(wall_time_seconds),
+        }
+    )
+    # RSS est celui du process partagé : on garde l'échantillonnage de la composante au pic le plus haut
+    memories = [(group.get("timing") or {}).get("memory") or {} for group in grouped]
+    merged["timing"] = {
+        "global": timing,
+        "memory": deepcopy(max(memories, key=lambda memory: float(memory.get("peak_rss_mb") or 0.0))),
+    }
+
+    for group_name in _ADDITIVE_GROUPS:
+        merged[group_name] = _merge_dicts([group.get(group_name) or {} for group in grouped])
+
+    coverage = merged["coverage"]
+    coverages = [group.get("coverage") or {} for group in grouped]
+    required = int(coverage.get("total_required_count") or 0)
+    understaff = int(coverage.get("understaff_total") or 0)
+    understaff_weighted = int(coverage.get("understaff_total_weighted") or 0)
+    coverage["coverage_ratio"] = max(0.0, 1.0 - understaff / required) if required > 0 else 1.0
+    coverage["coverage_ratio_weighted"] = (
+        max(0.0, 1.0 - understaff_weighted / total_required_weighted) if total_required_weighted > 0 else 1.0
+    )
+    coverage["top_understaff_days"] = _merge_top_understaff_days(coverages)
+    bounds = [item.get("coverage_flow_understaff_lower_bound") for item in coverages]
+    coverage["coverage_flow_understaff_lower_bound"] = None if any(b is None for b in bounds) else sum(bounds)
+
+    quality = merged["solution_quality"]
+    qualities = [group.get("solution_quality") or {} for group in grouped]
+    for key in ("workload_min", "min_work_days", "nights_min"):
+        quality[key] = min((q[key] for q in qualities if q.get(key) is not None), default=None)
+    for key in ("workload_max", "max_work_days", "nights_max"):
+        quality[key] = max((q[key] for q in qualities if q.get(key) is not None), default=None)
+    agent_counts = [len(component.agent_ids) for component in components]
+    total_agents = sum(agent_counts)
+    quality["workload_avg"] = (
+        sum(float(q.get("workload_avg") or 0.0) * n for q, n in zip(qualities, agent_counts)) / total_agents
+        if total_agents
+        else 0.0
+    )
+
+    merged["objective"]["dominance_ratios"] = deepcopy((grouped[0].get("objective") or {}).get("dominance_ratios"))
+
+    lns = deepcopy(grouped[0].get("lns") or {})
+    for key in _LNS_ADDITIVE_KEYS:
+        lns[key] = _merge_values([(group.get("lns") or {}).get(key) for group in grouped])
+    lns["iteration_history"] = [
+        {**item, "component_index": component.index}
+        for component, group in zip(components, grouped)
+        for item in (group.get("lns") or {}).get("iteration_history") or []
+    ]
+    merged["lns"] = lns
+
+    cp_sat = deepcopy(grouped[0].get("cp_sat") or {})
+    cp_sats = [group.get("cp_sat") or {} for group in grouped]
+    for key in ("symmetry_constraints_count", "symmetry_classes_count", "symmetry_agents_in_classes", "symmetry_group_size_log10", "decision_strategy_prioritized_vars_count"):
+        cp_sat[key] = _merge_values([item.get(key) for item in cp_sats])
+    cp_sat["symmetry_class_sizes"] = sorted(_merge_values([item.get("symmetry_class_sizes") for item in cp_sats]) or [], reverse=True)
+    first_feasible = [item.get("time_to_first_feasible_seconds") for item in cp_sats]
+    cp_sat["time_to_first_feasible_seconds"] = None if any(v is None for v in first_feasible) else max(first_feasible)
+    cp_sat["decomposition"] = {
+        "applied": True,
+        "components_count": len(components),
+        "max_workers": max_workers,
+        "component_time_limit_seconds": component_time_limit_seconds,
+        "components": [
+            {
+                "index": component.index,
+                "agent_ids": component.agent_ids,
+                "poste_ids": component.poste_ids,
+                "solve_wall_time_seconds": ((group.get("timing") or {}).get("global") or {}).get("solve_wall_time_seconds"),
+                **{key: (group.get("coverage") or {}).get(key) for key in _SUMMARY_COVERAGE_KEYS},
+                "objective_value": (group.get("objective") or {}).get("objective_value"),
+                # Détail complet (phases, LNS, CP-SAT) uniquement en verbosité debug
+                **({"stats": group} if collector.verbosity == "debug" else {}),
+            }
+            for component, group in zip(components, grouped)
+        ],
+    }
+    merged["cp_sat"] = cp_sat
+
+    return {
+        "result_stats_schema_version": StatsCollector.SCHEMA_VERSION,
+        "stats": collector.apply_verbosity(merged, collector.verbosity),
+    }
+
+
+def solve_decomposed(
+    solve: Callable[[SolverInput], SolverOutput],
+    solver_input: SolverInput,
+    components: list[QualificationComponent],
+    *,
+    weight_for_demand: Callable[[CoverageDemand], int],
+    max_workers: int | None = None,
+) -> SolverOutput:
+    """Solve each component with ``solve`` in parallel and merge the outputs.
+
+    When there are more components than workers, components run in waves and the
+    per-component budget is the total budget divided by the number of waves.
+    A failing component fails the whole generation (as it would in the monolithic
+    model), with its own stats plus the decomposition summary.
+    """
+    started_at = time.monotonic()
+    workers = max(1, min(len(components), max_workers or DECOMPOSITION_MAX_WORKERS, os.cpu_count() or 1))
+    waves = math.ceil(len(components) / workers)
+    component_time_limit = max(1, int(solver_input.time_limit_seconds or 0) // waves)
+    inputs = [
+        build_component_input(solver_input, component, time_limit_seconds=component_time_limit)
+        for component in components
+    ]
+
+    # tracemalloc est global au process : une seule session pour toutes les composantes
+    with tracemalloc_session(solver_input.enable_memory_profiling), ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="solver-component"
+    ) as executor:
+        futures = [executor.submit(solve, component_input) for component_input in inputs]
+        outcomes: list[SolverOutput | SolverFailureError] = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except SolverFailureError as exc:
+                outcomes.append(exc)
+
+    for component, outcome in zip(components, outcomes):
+        if isinstance(outcome, SolverFailureError):
+            stats = deepcopy(outcome.stats)
+            stats.setdefault("stats", {}).setdefault("cp_sat", {})["decomposition"] = {
+                "applied": True,
+                "components_count": len(components),
+                "failed_component_index": component.index,
+                "failed_component_agent_ids": component.agent_ids,
+                "failed_component_poste_ids": component.poste_ids,
+            }
+            outcome.stats = stats
+            raise outcome
+
+    outputs = [outcome for outcome in outcomes if isinstance(outcome, SolverOutput)]
+    stats = merge_component_stats(
+        components,
+        [output.stats for output in outputs],
+        total_required_weighted=sum(
+            weight_for_demand(demand) * max(0, demand.required_count) for demand in solver_input.coverage_demands
+        ),
+        wall_time_seconds=time.monotonic() - started_at,
+        time_limit_seconds=float(solver_input.time_limit_seconds or 0),
+        component_time_limit_seconds=component_time_limit,
+        max_workers=workers,
+        collector=StatsCollector.from_env(),
+    )
+    return SolverOutput(
+        agent_days=_sorted_agent_days(day for output in outputs for day in output.agent_days),
+        assignments=_sorted_assignments(assignment for output in outputs for assignment in output.assignments),
+        stats=stats,
+        alternatives=merge_component_alternatives(outputs, total_required_count=int(stats["stats"]["coverage"]["total_required_count"] or 0)),
+    )
+
+
+def _sorted_agent_days(items: Iterable[SolverAgentDay]) -> list[SolverAgentDay]:
+    return sorted(items, key=lambda item: (item.day_date, item.agent_id))
+
+
+def _sorted_assignments(items: Iterable[SolverAssignment]) -> list[SolverAssignment]:
+    return sorted(items, key=lambda item: (item.day_date, item.agent_id, item.tranche_id))
+
+
+def merge_component_alternatives(outputs: list[SolverOutput], *, total_required_count: int) -> list[SolverAlternative]:
+    """Alternative of rank r = rank-r alternative of each component, or its primary when it has none."""
+    max_rank = max((alternative.rank for output in outputs for alternative in output.alternatives), default=0)
+    merged: list[SolverAlternative] = []
+    for rank in range(1, max_rank + 1):
+        parts = []
+        for output in outputs:
+            alternative = next((item for item in output.alternatives if item.rank == rank), None)
+            coverage = output.stats["stats"]["coverage"]
+            parts.append(
+                alternative
+                if alternative is not None
+                else SolverAlternative(
+                    rank=rank,
+                    agent_days=output.agent_days,
+                    assignments=output.assignments,
+                    objective_value=int(output.stats["stats"]["objective"]["objective_value"] or 0),
+                    understaff_total=int(coverage["understaff_total"] or 0),
+                    understaff_total_weighted=int(coverage["understaff_total_weighted"] or 0),
+                    coverage_ratio=float(coverage["coverage_ratio"]),
+                    changed_days_to_primary=0,
+                    objective_terms=dict(output.stats["stats"]["objective"]["objective_terms"] or {}),
+                )
+            )
+        understaff = sum(part.understaff_total for part in parts)
+        merged.append(
+            SolverAlternative(
+                rank=rank,
+                agent_days=_sorted_agent_days(day for part in parts for day in part.agent_days),
+                assignments=_sorted_assignments(assignment for part in parts for assignment in part.assignments),
+                objective_value=sum(part.objective_value for part in parts),
+                understaff_total=understaff,
+                understaff_total_weighted=sum(part.understaff_total_weighted for part in parts),
+                coverage_ratio=max(0.0, 1.0 - understaff / total_required_count) if total_required_count > 0 else 1.0,
+                changed_days_to_primary=sum(part.changed_days_to_primary for part in parts),
+                objective_terms=_merge_dicts([part.objective_terms for part in parts]),
+            )
+        )
+    return merged
@@ -0,0 +1,164 @@
+"""Lexicographic multi-objective solve (coverage -> fairness -> comfort).
+
+Each tier is minimized on its own (small coefficient range, tighter LP relaxation),
+then its best value is locked as a hard constraint ``tier_expr <= best`` before the
+next tier runs. The incumbent of a tier is hinted into the next one, so a tier that
+runs out of budget still returns at least the previous solution.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from ortools.sat.python import cp_model
+
+from backend.app.services.solver.phases import TraceCallback, solve_with_trace
+
+
+@dataclass(frozen=True)
+class ObjectiveTier:
+    name: str
+    expr: cp_model.LinearExprT
+    budget_share: float
+
+
+@dataclass
+class LexicographicResult:
+    best_solution: dict[str, Any] | None
+    tiers: list[dict[str, Any]] = field(default_factory=list)
+    trace_points: list[tuple[float, float, int]] = field(default_factory=list)
+    time_to_first_feasible_seconds: float | None = None
+    last_raw_status: str | None = None
+    last_normalized_status: str | None = None
+    last_status_int: int | None = None
+    last_wall_time: float = 0.0
+
+
+def relative_gap(objective_value: float | None, best_bound: float | None) -> float | None:
+    """Relative optimality gap of a minimization; 0.0 when proven optimal."""
+    if objective_value is None or best_bound is None:
+        return None
+    return abs(objective_value - best_bound) / max(1.0, abs(objective_value))
+
+
+def _empty_tier_stats(tier: ObjectiveTier, budget: float) -> dict[str, Any]:
+    return {
+        "name": tier.name,
+        "budget_share": tier.budget_share,
+        "time_limit_seconds": budget,
+        "wall_time_seconds": 0.0,
+        "status_raw": "SKIPPED",
+        "normalized_status": "SKIPPED",
+        "objective_value": None,
+        "best_bound": None,
+        "gap": None,
+        "locked_bound": None,
+        "stopped_at_lower_bound": False,
+        "understaff_total_unweighted": None,
+        "understaff_total_weighted": None,
+    }
+
+
+def tier_budget_seconds(*, remaining_seconds: float, shares_left: list[float]) -> float:
+    """Budget of the head tier: its share of what is left (unused time rolls forward)."""
+    total = sum(shares_left)
+    if remaining_seconds <= 0 or total <= 0:
+        return 0.0
+    return remaining_seconds * (shares_left[0] / total)
+
+
+def run_lexicographic(
+    *,
+    model: cp_model.CpModel,
+    tiers: list[ObjectiveTier],
+    y: dict[tuple[int, int, int], cp_model.IntVar],
+    y_keys: list[tuple[int, int, int]],
+    understaff_var: cp_model.IntVar,
+    understaff_lower_bound: int | None,
+    time_limit_seconds: float,
+    elapsed: Callable[[], float],
+    stats: dict[str, Any],
+    _new_solver: Callable[[float], cp_model.CpSolver],
+    _effective_cp_sat_params: Callable[[cp_model.CpSolver, float], dict[str, Any]],
+    _normalize_status: Callable[[int, float, float], tuple[str, str, bool]],
+    _extract_solution: Callable[[cp_model.CpSolver], dict[str, Any]],
+    deterministic_units_per_second: float | None = None,
+) -> LexicographicResult:
+    """Solve ``tiers`` in order on ``model`` (mutated: objectives, locks, hints).
+
+    ``elapsed`` is the shared budget clock (wall or deterministic seconds since the
+    solve started); tier budgets and trace offsets are expressed on that clock.
+    """
+    result = LexicographicResult(best_solution=None)
+    elapsed_before = 0.0
+
+    for index, tier in enumerate(tiers):
+        if time_limit_seconds > 0:
+            remaining = max(0.0, time_limit_seconds - elapsed())
+            budget = tier_budget_seconds(remaining_seconds=remaining, shares_left=[t.budget_share for t in tiers[index:]])
+            if budget <= 0:
+                result.tiers.append(_empty_tier_stats(tier, 0.0))
+                continue
+        else:
+            budget = 0.0
+
+        model.Minimize(tier.expr)
+        if result.best_solution is not None:
+            model.ClearHints()
+            for key in y_keys:
+                model.AddHint(y[key], int(result.best_solution["assignment_map"][key]))
+
+        solver = _new_solver(budget)
+        stats.setdefault("cp_sat_params_effective", {})[f"lexicographic_{tier.name}"] = _effective_cp_sat_params(solver, budget)
+        # Seule une borne nulle est exacte pour la somme pondérée (la borne max-flow est non pondérée)
+        stop_at = 0 if (index == 0 and understaff_lower_bound == 0) else None
+        cb = TraceCallback(
+            understaff_var,
+            stop_at_understaff_lower_bound=stop_at,
+            deterministic_units_per_second=deterministic_units_per_second,
+        )
+        solve_started = elapsed()
+        status = solve_with_trace(solver, model, cb)
+        spent = max(0.0, elapsed() - solve_started)
+        wall = float(solver.WallTime())
+        raw, normalized, _timeout = _normalize_status(status, wall, budget)
+        if cb.lower_bound_reached and status == cp_model.FEASIBLE:
+            normalized = "OPTIMAL"
+
+        result.last_raw_status = raw
+        result.last_normalized_status = normalized
+        result.last_status_int = int(status)
+        result.last_wall_time = wall
+        if cb.first_feasible_time is not None and result.time_to_first_feasible_seconds is None:
+            result.time_to_first_feasible_seconds = elapsed_before + cb.first_feasible_time
+        result.trace_points.extend((elapsed_before + t, obj, us) for (t, obj, us) in cb.points)
+        elapsed_before += spent
+
+        tier_stats = _empty_tier_stats(tier, budget)
+        tier_stats.update(
+            wall_time_seconds=wall,
+            status_raw=raw,
+            normalized_status=normalized,
+            stopped_at_lower_bound=bool(cb.lower_bound_reached),
+        )
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            value = int(round(solver.ObjectiveValue()))
+            bound = value if (status == cp_model.OPTIMAL or cb.lower_bound_reached) else float(solver.BestObjectiveBound())
+            tier_stats["objective_value"] = value
+            tier_stats["best_bound"] = bound
+            tier_stats["gap"] = relative_gap(value, bound)
+            result.best_solution = _extract_solution(solver)
+            tier_stats["understaff_total_unweighted"] = result.best_solution["understaff_total_unweighted"]
+            tier_stats["understaff_total_weighted"] = result.best_solution["understaff_total_weighted"]
+            if index < len(tiers) - 1:
+                # Verrou : les tiers suivants ne peuvent pas dégrader celui-ci
+                model.Add(tier.expr <= value)
+                tier_stats["locked_bound"] = value
+        result.tiers.append(tier_stats)
+
+        if result.best_solution is None:
+            # Pas de solution au premier tier : inutile d'optimiser les suivants
+            break
+
+    return result
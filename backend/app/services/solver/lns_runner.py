@@ -53,6 +53,7 @@ class LnsRunner:
         _effective_cp_sat_params: Callable[[cp_model.CpSolver, float], dict[str, Any]],
         _normalize_status: Callable[[Any, float, float], tuple[str, str, bool]],
         _extract_solution: Callable[[cp_model.CpSolver], dict[str, Any]],
+        elapsed: Callable[[], float] | None = None,
     ) -> LnsRunResult:
         """Execute the deterministic LNS phase for an existing incumbent solution.
 
@@ -72,6 +73,9 @@ class LnsRunner:
                 mappings needed to rebuild per-iteration relaxed models.
             _new_solver/_effective_cp_sat_params/_normalize_status/_extract_solution:
                 Existing solver helpers injected by ``OrtoolsSolver`` to preserve behavior.
+            elapsed: Budget clock (seconds consumed since ``started_at``). Defaults to
+                wall time; ``OrtoolsSolver`` injects its ``SolveClock`` so deterministic
+                budgets drive the same guards.
 
         Returns:
             ``LnsRunResult`` containing the possibly updated best solution and aggregate
@@ -137,7 +141,8 @@ class LnsRunner:
             # No trimming here; payload caps are handled in StatsCollector.
             lns_iteration_history.append(entry)
 
-        lns_start_remaining = max(0.0, (time_limit_seconds - (time.monotonic() - started_at))) if lns_enabled and time_limit_seconds > 0 else 0.0
+        budget_elapsed: Callable[[], float] = elapsed or (lambda: time.monotonic() - started_at)
+        lns_start_remaining = max(0.0, (time_limit_seconds - budget_elapsed())) if lns_enabled and time_limit_seconds > 0 else 0.0
         if lns_enabled and best_solution is not None:
             poste_ids_sorted = sorted(set(solver_input.poste_ids))
             demanded_poste_ids = sorted({int(rec["poste_id"]) for rec in demand_records})
@@ -198,8 +203,7 @@ class LnsRunner:
                 return set(selected)
 
             while True:
-                elapsed = time.monotonic() - started_at
-                remaining = (time_limit_seconds - elapsed) if time_limit_seconds > 0 else 0.0
+                remaining = (time_limit_seconds - budget_elapsed()) if time_limit_seconds > 0 else 0.0
                 if remaining <= max(lns_min_remaining_seconds, 0.0):
                     break
 
@@ -346,7 +350,7 @@ class LnsRunner:
                     stats["lns_model_invalid_iteration_index"] = lns_iterations
                     _append_lns_history(
                         {
-                            "t": round(float(time.monotonic() - started_at), 3),
+                            "t": round(float(budget_elapsed()), 3),
                             "poste_id": poste_id,
                             "selected_postes": [int(pid) for pid in selected_postes],
                             "relaxed_days_count": len(selected_days),
@@ -411,7 +415,7 @@ class LnsRunner:
                         accepted = True
                         lns_accept_count += 1
                         lns_last_accept_iteration_index = int(lns_iterations - 1)
-                        lns_last_accept_t = float(time.monotonic() - started_at)
+                        lns_last_accept_t = float(budget_elapsed())
                         lns_best_improvement_understaff = max(lns_best_improvement_understaff, prev_u - cand["understaff_total_unweighted"])
                         lns_best_improvement_objective = max(lns_best_improvement_objective, prev_o - cand["objective_value"])
 
@@ -422,7 +426,7 @@ class LnsRunner:
 
                 _append_lns_history(
                     {
-                        "t": round(float(time.monotonic() - started_at), 3),
+                        "t": round(float(budget_elapsed()), 3),
                         "poste_id": poste_id,
                         "selected_postes": [int(pid) for pid in selected_postes],
                         "relaxed_days_count": len(selected_days),
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from db.models import AgentDay, AgentDayAssignment, AgentTeam, PosteCoverageRequirement, Qualification, Tranche
 
 from backend.app.services.solver.models import CoverageDemand, TrancheInfo
+from core.application.read_models.eligibility_rm import EligibilityRM
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +26,15 @@ class CoverageRequirementPattern:
 class SolverInputMapper:
     """Prépare les données DB pour le solver à partir des entités métier persistées."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, eligibility: EligibilityRM | None = None):
         self.session = session
+        # Snapshot d'éligibilité partagé : évite les requêtes équipe / qualifications par job
+        self.eligibility = eligibility
 
     def list_team_agent_ids(self, team_id: int) -> list[int]:
+        if self.eligibility is not None:
+            return self.eligibility.team_agent_ids(team_id)
+
         rows = self.session.execute(select(AgentTeam.agent_id).where(AgentTeam.team_id == team_id)).all()
         return sorted(agent_id for (agent_id,) in rows)
 
@@ -37,6 +43,11 @@ class SolverInputMapper:
         if not agent_ids:
             return qualified_postes_by_agent
 
+        if self.eligibility is not None:
+            for agent_id in qualified_postes_by_agent:
+                qualified_postes_by_agent[agent_id].update(self.eligibility.qualified_poste_ids(agent_id))
+            return qualified_postes_by_agent
+
         rows = self.session.execute(
             select(Qualification.agent_id, Qualification.poste_id)
             .where(Qualification.agent_id.in_(agent_ids))
@@ -66,6 +77,14 @@ class SolverInputMapper:
         if not agent_ids:
             return qualification_date_by_agent_poste
 
+        if self.eligibility is not None:
+            for agent_id in sorted(agent_ids):
+                for poste_id in self.eligibility.qualified_poste_ids(agent_id):
+                    qualification_date_by_agent_poste[(agent_id, poste_id)] = self.eligibility.qualification_date(
+                        agent_id, poste_id
+                    )
+            return qualification_date_by_agent_poste
+
         rows = self.session.execute(
             select(Qualification.agent_id, Qualification.poste_id, Qualification.date_qualification)
             .where(Qualification.agent_id.in_(agent_ids))
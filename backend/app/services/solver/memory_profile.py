@@ -0,0 +1,131 @@
+"""Stage-level memory sampling and peak-RAM guardrail for the generation pipeline.
+
+Two sources, sampled at the end of each stage (combos, choice vars, coverage, rest
+constraints, GPT, fairness, objective, search, LNS, extraction, persistence):
+
+- RSS (``/proc/self/statm``): what the OOM killer sees, CP-SAT's C++ model and
+  search included. Cheap to read, so the guardrail always uses it.
+- tracemalloc: Python allocations only (var dicts, combos, stats), but attributed
+  to the stage that made them. Slows allocation-heavy code down, hence opt-in.
+
+The guardrail raises ``MemoryLimitExceededError`` at the first checkpoint where RSS
+exceeds the limit, so the job fails cleanly instead of being killed mid-build.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from backend.app.services.solver.models import MemoryLimitExceededError
+
+_MB = 1024.0 * 1024.0
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_mb() -> float | None:
+    """Resident set size of the process, or its lifetime peak where statm is unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * _PAGE_SIZE / _MB
+    except (OSError, ValueError, IndexError):
+        return process_peak_rss_mb()
+
+
+def process_peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss : KiB sous Linux, octets sous macOS
+    return max_rss / (_MB if sys.platform == "darwin" else 1024.0)
+
+
+@contextmanager
+def tracemalloc_session(enabled: bool) -> Iterator[None]:
+    """Keep tracemalloc running across nested profilers (decomposition components share it)."""
+    owns = bool(enabled) and not tracemalloc.is_tracing()
+    if owns:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if owns:
+            tracemalloc.stop()
+
+
+class MemoryProfiler:
+    """Checkpoint-based sampler; a no-op when profiling is off and no limit is set."""
+
+    def __init__(self, *, enabled: bool, limit_mb: float | None) -> None:
+        self.enabled = bool(enabled)
+        self.limit_mb = float(limit_mb) if limit_mb else None
+        self.stages: list[dict[str, Any]] = []
+        self.peak_rss_mb: float | None = None
+        self.traced_peak_mb: float | None = None
+        self.limit_exceeded_stage: str | None = None
+        self._owns_tracing = False
+        self._last_checkpoint_at = time.monotonic()
+
+    @property
+    def active(self) -> bool:
+        return self.enabled or self.limit_mb is not None
+
+    def start(self) -> "MemoryProfiler":
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        self._last_checkpoint_at = time.monotonic()
+        return self
+
+    def stop(self) -> None:
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def checkpoint(self, stage: str) -> None:
+        """Sample memory at the end of ``stage``; raise if RSS is above the limit."""
+        if not self.active:
+            return
+        now = time.monotonic()
+        rss = current_rss_mb()
+        if rss is not None:
+            self.peak_rss_mb = max(self.peak_rss_mb or 0.0, rss)
+        if self.enabled:
+            sample: dict[str, Any] = {
+                "stage": stage,
+                "rss_mb": round(rss, 1) if rss is not None else None,
+                "wall_time_seconds": round(now - self._last_checkpoint_at, 3),
+            }
+            if tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                sample["traced_current_mb"] = round(current / _MB, 1)
+                sample["traced_peak_mb"] = round(peak / _MB, 1)
+                self.traced_peak_mb = max(self.traced_peak_mb or 0.0, peak / _MB)
+            self.stages.append(sample)
+        self._last_checkpoint_at = now
+
+        if self.limit_mb is not None and rss is not None and rss > self.limit_mb:
+            self.limit_exceeded_stage = stage
+            raise MemoryLimitExceededError(
+                f"memory_limit_exceeded: rss {rss:.0f} MB > limit {self.limit_mb:.0f} MB after stage '{stage}'"
+            )
+
+    def to_stats(self) -> dict[str, Any]:
+        """Flat ``memory_*`` keys, grouped under ``stats.timing.memory``."""
+        return {
+            "memory_profiling_enabled": self.enabled,
+            "memory_limit_mb": self.limit_mb,
+            "memory_peak_rss_mb": round(self.peak_rss_mb, 1) if self.peak_rss_mb is not None else None,
+            "memory_process_peak_rss_mb": round(process_peak_rss_mb() or 0.0, 1) if self.active else None,
+            "memory_traced_peak_mb": round(self.traced_peak_mb, 1) if self.traced_peak_mb is not None else None,
+            "memory_limit_exceeded_stage": self.limit_exceeded_stage,
+            "memory_stages": list(self.stages),
+        }
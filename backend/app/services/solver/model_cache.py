@@ -0,0 +1,246 @@
+"""Content-addressed on-disk cache of built CP-SAT models.
+
+Re-running a draft with another seed or a longer budget rebuilds the exact same
+model. The build is keyed by a fingerprint of the ``SolverInput`` fields that shape
+the model (run-only options such as seed, budgets, LNS/phase tuning, alternatives
+are left out), the resolved build options, the objective weights, the solver source
+and the OR-Tools version. An entry stores the serialized ``CpModelProto`` and the
+Python-side build state (index maps, demand records, combos, build stats) with every
+CP-SAT variable replaced by its proto index, so a hit restores the model without
+re-running the builders.
+
+Entries are pickle files in a local directory owned by the worker, evicted in LRU
+order (file mtime, refreshed on hit) once the directory exceeds its size cap.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from datetime import date, time
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import ortools
+from ortools.sat.python import cp_model
+
+from backend.app.services.solver.models import SolverInput
+
+MODEL_CACHE_FORMAT_VERSION = 1
+_ENTRY_SUFFIX = ".cpmodel.pkl"
+
+# Options read only after the build (search, budgets, post-processing): not part of the key
+RUN_SCOPED_INPUT_FIELDS = frozenset(
+    {
+        "seed",
+        "time_limit_seconds",
+        "quality_profile",
+        "v3_strategy",
+        "budget_mode",
+        "deterministic_units_per_second",
+        "phase1_fraction",
+        "phase1_seconds",
+        "lns_iter_seconds",
+        "lns_min_remaining_seconds",
+        "lns_strict_improve",
+        "lns_max_days_to_relax",
+        "lns_neighborhood_mode",
+        "min_lns_seconds",
+        "phase2_max_fraction_of_remaining",
+        "phase2_no_improve_seconds",
+        "enable_decision_strategy",
+        "enable_symmetry_breaking",
+        "enable_warm_start",
+        "enable_decomposition",
+        "alternatives_count",
+        "alternatives_min_changed_days",
+        "enable_memory_profiling",
+        "memory_limit_mb",
+    }
+)
+
+
+def _canonical(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: _canonical(getattr(value, field.name)) for field in dataclasses.fields(value)}
+    if isinstance(value, dict):
+        return sorted(([_canonical(k), _canonical(v)] for k, v in value.items()), key=repr)
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(item) for item in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+@lru_cache(maxsize=1)
+def _solver_source_digest() -> str:
+    """Any change to the solver package invalidates every entry."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def solver_input_fingerprint(solver_input: SolverInput, *, build_options: dict[str, Any]) -> str:
+    """sha256 of the model-shaping part of ``solver_input`` plus resolved ``build_options``."""
+    payload = {
+        "format": MODEL_CACHE_FORMAT_VERSION,
+        "ortools": ortools.__version__,
+        "source": _solver_source_digest(),
+        "input": {
+            field.name: _canonical(getattr(solver_input, field.name))
+            for field in dataclasses.fields(solver_input)
+            if field.name not in RUN_SCOPED_INPUT_FIELDS
+        },
+        "build_options": _canonical(build_options),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class VarRef(NamedTuple):
+    index: int
+
+
+class ExprRef(NamedTuple):
+    terms: tuple[tuple[int, int], ...]
+    offset: int
+
+
+def freeze_state(value: Any) -> Any:
+    """Replace CP-SAT variables/linear expressions by proto indices (picklable)."""
+    if isinstance(value, cp_model.IntVar):
+        return VarRef(value.Index())
+    if isinstance(value, cp_model.LinearExpr):
+        coefficients, offset = value.get_integer_var_value_map()
+        return ExprRef(tuple(sorted((var.Index(), int(coeff)) for var, coeff in coefficients.items())), int(offset))
+    if isinstance(value, dict):
+        return {freeze_state(k): freeze_state(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [freeze_state(item) for item in value]
+    if isinstance(value, tuple) and not hasattr(value, "_fields"):
+        return tuple(freeze_state(item) for item in value)
+    return value
+
+
+def thaw_state(value: Any, model: cp_model.CpModel, _vars: dict[int, cp_model.IntVar] | None = None) -> Any:
+    """Inverse of ``freeze_state`` on ``model``; one Python variable object per proto index."""
+    variables = {} if _vars is None else _vars
+
+    def _var(index: int) -> cp_model.IntVar:
+        var = variables.get(index)
+        if var is None:
+            var = variables[index] = model.GetIntVarFromProtoIndex(index)
+        return var
+
+    def _thaw(item: Any) -> Any:
+        if isinstance(item, VarRef):
+            return _var(item.index)
+        if isinstance(item, ExprRef):
+            indices = [index for index, _coeff in item.terms]
+            coefficients = [coeff for _index, coeff in item.terms]
+            return cp_model.LinearExpr.WeightedSum([_var(index) for index in indices], coefficients) + item.offset
+        if isinstance(item, dict):
+            return {_thaw(k): _thaw(v) for k, v in item.items()}
+        if isinstance(item, list):
+            return [_thaw(element) for element in item]
+        if isinstance(item, tuple) and not hasattr(item, "_fields"):
+            return tuple(_thaw(element) for element in item)
+        return item
+
+    return _thaw(value)
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedModel:
+    model: cp_model.CpModel
+    state: dict[str, Any]
+    entry_bytes: int
+
+
+class CompiledModelCache:
+    """LRU, size-capped directory of built models keyed by ``solver_input_fingerprint``."""
+
+    def __init__(self, directory: str | Path, *, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+
+    def _path(self, fingerprint: str) -> Path:
+        return self.directory / f"{fingerprint}{_ENTRY_SUFFIX}"
+
+    def load(self, fingerprint: str) -> CachedModel | None:
+        path = self._path(fingerprint)
+        try:
+            raw = path.read_bytes()
+            entry = pickle.loads(raw)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            # Entrée corrompue ou d'un format obsolète : on la jette et on reconstruit
+            path.unlink(missing_ok=True)
+            return None
+        if entry.get("format") != MODEL_CACHE_FORMAT_VERSION:
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        model = cp_model.CpModel()
+        model.Proto().ParseFromString(entry["proto"])
+        return CachedModel(model=model, state=thaw_state(entry["state"], model), entry_bytes=len(raw))
+
+    def store(self, fingerprint: str, model: cp_model.CpModel, state: dict[str, Any]) -> int:
+        """Write the entry atomically, then evict; returns the entry size in bytes."""
+        raw = pickle.dumps(
+            {
+                "format": MODEL_CACHE_FORMAT_VERSION,
+                "proto": model.Proto().SerializeToString(),
+                "state": freeze_state(state),
+            },
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        if len(raw) > self.max_bytes:
+            return len(raw)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(raw)
+            os.replace(tmp_name, self._path(fingerprint))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self.evict()
+        return len(raw)
+
+    def evict(self) -> list[str]:
+        """Drop least recently used entries until the directory fits ``max_bytes``."""
+        with self._lock:
+            entries = []
+            for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort(key=lambda item: item[0])
+            total = sum(size for _mtime, size, _path in entries)
+            evicted: list[str] = []
+            for _mtime, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted.append(path.name.removesuffix(_ENTRY_SUFFIX))
+            return evicted
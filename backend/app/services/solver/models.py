@@ -30,6 +30,8 @@ class SolverInput:
     existing_shift_start_end_by_agent_day_ctx: dict[tuple[int, date], tuple[int, int] | None] = field(default_factory=dict)
     quality_profile: str = "balanced"
     v3_strategy: str = "two_phase_lns"
+    budget_mode: str = "wall"
+    deterministic_units_per_second: float | None = None
     phase1_fraction: float | None = None
     phase1_seconds: float | None = None
     lns_iter_seconds: float | None = None
@@ -42,6 +44,14 @@ class SolverInput:
     phase2_no_improve_seconds: float | None = None
     enable_decision_strategy: bool | None = None
     enable_symmetry_breaking: bool | None = None
+    enable_warm_start: bool | None = None
+    enable_decomposition: bool = False
+    alternatives_count: int = 0
+    alternatives_min_changed_days: int | None = None
+    enable_memory_profiling: bool = False
+    memory_limit_mb: float | None = None
+    understaff_lower_bound: int | None = None
+    coverage_flow_bottleneck_days: list[dict[str, Any]] = field(default_factory=list)
 
 
 class SolverFailureError(Exception):
@@ -58,6 +68,10 @@ class TimeoutError(SolverFailureError):
     pass
 
 
+class MemoryLimitExceededError(SolverFailureError):
+    pass
+
+
 @dataclass(frozen=True)
 class TrancheInfo:
     id: int
@@ -90,8 +104,22 @@ class SolverAssignment:
     tranche_id: int
 
 
+@dataclass(frozen=True)
+class SolverAlternative:
+    rank: int
+    agent_days: list[SolverAgentDay]
+    assignments: list[SolverAssignment]
+    objective_value: int
+    understaff_total: int
+    understaff_total_weighted: int
+    coverage_ratio: float
+    changed_days_to_primary: int
+    objective_terms: dict[str, int] = field(default_factory=dict)
+
+
 @dataclass(frozen=True)
 class SolverOutput:
     agent_days: list[SolverAgentDay]
     assignments: list[SolverAssignment]
     stats: dict[str, Any]
+    alternatives: list[SolverAlternative] = field(default_factory=list)
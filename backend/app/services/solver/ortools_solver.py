@@ -2,12 +2,18 @@
 
 Pipeline (deterministic, non-breaking contract):
   phase1 -> phase2 -> lns -> extraction -> stats finalization.
+  (strategy "lexicographic": coverage -> fairness -> comfort tiers -> extraction -> stats)
 
 Responsibilities by module:
 - model_builder: build immutable solve context and indices.
 - cp_sat: CP-SAT setup/status normalization/effective params snapshots.
 - phases: callback tracing and solve wrapper.
 - lns_runner: optional iterative LNS improvement on an incumbent.
+- lexicographic: tiered solve with bound locking between tiers.
+- alternatives: optional top-k diverse pool around the final incumbent.
+- decomposition: optional split into independent agent–poste components.
+- memory_profile: optional stage-level memory sampling and peak-RAM guardrail.
+- model_cache: optional on-disk cache of built models keyed by input fingerprint.
 - solution_extractor: read assignments/metrics from a solved model.
 - stats: grouped result stats assembly and verbosity shaping.
 
@@ -28,24 +34,46 @@ Dependency flow:
 
 from __future__ import annotations
 
+import math
 import time
 from datetime import date
+from typing import Any
 
 from ortools.sat.python import cp_model
 
 from core.domain.enums.day_type import DayType
 
+from backend.app.services.solver.alternatives import default_min_changed_days, run_diverse_pool
+from backend.app.services.solver.budget import SolveClock
 from backend.app.services.solver.constants import (
+    ALTERNATIVES_MAX_ATTEMPTS_FACTOR,
+    ALTERNATIVES_MIN_CHANGED_DAYS_FRACTION,
+    ALTERNATIVES_MIN_SECONDS_EACH,
+    ALTERNATIVES_NEIGHBORHOOD_AGENT_FRACTION,
+    ALTERNATIVES_TIME_SHARE_EACH,
+    DETERMINISTIC_DEFAULT_UNITS_PER_SECOND,
+    LEXICOGRAPHIC_TIER_BUDGET_SHARES,
     LNS_ITER_OVERHEAD_SECONDS,
     MAX_LNS_HISTORY_ITEMS as MAX_LNS_HISTORY_ITEMS_CONST,
     MIN_LNS_CP_SAT_TIME_LIMIT_SECONDS,
     MIN_LNS_REMAINING_SECONDS_TO_RUN_ITER,
 )
 from backend.app.services.solver.cp_sat import configure_solver, effective_cp_sat_params, normalize_status
+from backend.app.services.solver.decomposition import detect_qualification_components, solve_decomposed
 from backend.app.services.solver.existing_assignments import build_existing_context_maps, is_in_window_ctx_index
+from backend.app.services.solver.lexicographic import ObjectiveTier, run_lexicographic
 from backend.app.services.solver.lns_runner import LnsRunner
 from backend.app.services.solver.model_builder import build_solve_context
-from backend.app.services.solver.models import InfeasibleError, SolverInput, SolverOutput, TimeoutError
+from backend.app.services.solver.memory_profile import MemoryProfiler
+from backend.app.services.solver.model_cache import CompiledModelCache, solver_input_fingerprint
+from backend.app.services.solver.models import (
+    InfeasibleError,
+    MemoryLimitExceededError,
+    SolverAlternative,
+    SolverInput,
+    SolverOutput,
+    TimeoutError,
+)
 from backend.app.services.solver.ortools_solver_builders import (
     add_daily_choice_constraints,
     add_rest_compat_constraints,
@@ -54,8 +82,10 @@ from backend.app.services.solver.ortools_solver_builders import (
 )
 from backend.app.services.solver.phases import TraceCallback, solve_with_trace
 from backend.app.services.solver.rh_combos import DayCombo, DayKind, DefaultRhComboRulesEngine, build_day_combos_for_poste, build_rest_compatibility
-from backend.app.services.solver.solution_extractor import extract_solution
-from backend.app.services.solver.stats_defaults import make_base_stats
+from backend.app.services.solver.solution_extractor import extract_solution, index_getter, solution_values, sum_values
+from backend.app.services.solver.stats_defaults import make_base_stats, run_scoped_base_stats
+from backend.app.services.solver.symmetry import add_class_ordering_constraints, detect_agent_equivalence_classes
+from backend.app.services.solver.warm_start import GptFrame, WarmStartDemand, build_greedy_warm_start
 from backend.app.services.solver.stats import StatsCollector
 
 
@@ -97,6 +127,9 @@ class OrtoolsSolver:
     RPDOUBLE_OFF_DAY_TYPES = {DayType.REST.value}
     MAX_LNS_HISTORY_ITEMS = MAX_LNS_HISTORY_ITEMS_CONST
 
+    def __init__(self, model_cache: CompiledModelCache | None = None) -> None:
+        self.model_cache = model_cache
+
     @staticmethod
     def _time_to_minutes(value) -> int:
         return (value.hour * 60) + value.minute
@@ -160,9 +193,40 @@ class OrtoolsSolver:
 
         Orchestrates phase1/phase2 solves, optional LNS refinement, solution
         extraction, and final stats aggregation while preserving legacy flat keys.
+        With ``enable_decomposition``, independent agent–poste components are
+        solved separately and merged (see ``decomposition``). Memory is sampled
+        after each stage when profiling or a RAM limit is set (see ``memory_profile``).
+        """
+        if solver_input.enable_decomposition:
+            components = detect_qualification_components(solver_input)
+            if len(components) > 1:
+                tranche_by_id = {tranche.id: tranche for tranche in solver_input.tranches}
+                return solve_decomposed(
+                    self.generate,
+                    solver_input,
+                    components,
+                    weight_for_demand=lambda demand: self._understaff_priority_weight_for_demand(
+                        day_date=demand.day_date, tranche=tranche_by_id.get(demand.tranche_id)
+                    ),
+                )
+
+        memory = MemoryProfiler(
+            enabled=solver_input.enable_memory_profiling,
+            limit_mb=solver_input.memory_limit_mb,
+        ).start()
+        try:
+            return self._generate_model(solver_input, memory)
+        finally:
+            memory.stop()
+
+    def _build_model(
+        self, solver_input: SolverInput, *, memory: MemoryProfiler, stats_collector: StatsCollector
+    ) -> tuple[cp_model.CpModel, dict[str, Any]]:
+        """Build the CP-SAT model and the Python-side state the solve reads.
+
+        The state maps names to values (variables, index maps, demand records, build
+        stats); it is what ``model_cache`` stores next to the model proto.
         """
-        stats_collector = StatsCollector.from_env()
-        solve_started_at = time.monotonic()
         model = cp_model.CpModel()
         num_constraints = 0
         num_variables = 0
@@ -297,6 +361,11 @@ class OrtoolsSolver:
             lns_history_max_items=int(self.MAX_LNS_HISTORY_ITEMS),
         )
 
+        def _memory_checkpoint(stage: str) -> None:
+            self._checkpoint_memory(memory, stage, stats=stats, stats_collector=stats_collector)
+
+        _memory_checkpoint("combos")
+
         covered_tranche_ids_by_any_combo = {
             tranche_id
             for combo in combos
@@ -412,6 +481,7 @@ class OrtoolsSolver:
         stats["y_variables_count"] = choice_build.y_variables_count
         stats["num_combos_in_model"] = len(combo_ids_in_model)
         stats["num_combos_effective"] = stats["num_combos_in_model"]
+        _memory_checkpoint("choice_vars")
 
         use_existing_assignments = bool(solver_input.use_existing_assignments)
         existing_daytypes_db_ctx = solver_input.existing_daytype_by_agent_day_ctx if use_existing_assignments else {}
@@ -543,6 +613,7 @@ class OrtoolsSolver:
             for demand in solver_input.coverage_demands
             if demand.day_date in date_to_index
         )
+        _memory_checkpoint("coverage")
 
         num_constraints_delta, rest_constraints_count = add_rest_compat_constraints(
             model=model,
@@ -553,6 +624,7 @@ class OrtoolsSolver:
             compatible_pairs=compatible_pairs,
         )
         num_constraints += num_constraints_delta
+        _memory_checkpoint("rest_constraints")
 
         run_vars: dict[tuple[int, int, int], cp_model.IntVar] = {}
         runs_candidate_count_by_agent: dict[int, int] = {agent_id: 0 for agent_id in ordered_agent_ids}
@@ -706,6 +778,8 @@ class OrtoolsSolver:
 
             stats["run_feasible_candidate_count_by_agent"] = run_feasible_candidate_count_by_agent
             stats["worked_ctx_window_fixed_days_count_by_agent"] = worked_ctx_window_fixed_days_count_by_agent
+        _memory_checkpoint("gpt")
+
         is_work_by_agent_day: dict[tuple[int, int], cp_model.IntVar] = {}
         stability_change_vars_by_agent: dict[int, list[cp_model.IntVar]] = {agent_id: [] for agent_id in ordered_agent_ids}
         work_block_start_vars_by_agent: dict[int, list[cp_model.IntVar]] = {agent_id: [] for agent_id in ordered_agent_ids}
@@ -929,7 +1003,8 @@ class OrtoolsSolver:
         max_nights = model.NewIntVar(0, len(dates), "max_nights")
         min_nights = model.NewIntVar(0, len(dates), "min_nights")
         total_night_days = model.NewIntVar(0, len(dates) * max(1, len(ordered_agent_ids)), "total_night_days")
-        total_amplitude_cost = model.NewIntVar(0, 60_000, "total_amplitude_cost")
+        total_amplitude_cap = 60_000
+        total_amplitude_cost = model.NewIntVar(0, total_amplitude_cap, "total_amplitude_cost")
         useless_work_total = model.NewIntVar(0, len(useless_work_vars), "useless_work_total")
         num_variables += 7
         if work_minutes_by_agent:
@@ -952,22 +1027,25 @@ class OrtoolsSolver:
             model.Add(total_night_days == 0)
             num_constraints += 3
 
-        default_enable_symmetry_breaking = profile in {"balanced", "high"}
-        enable_symmetry_breaking = default_enable_symmetry_breaking if solver_input.enable_symmetry_breaking is None else bool(solver_input.enable_symmetry_breaking)
+        _memory_checkpoint("fairness")
+
+        enable_symmetry_breaking = self._resolve_symmetry_breaking(solver_input)
+        # Ordonnancement uniquement entre agents strictement interchangeables
+        equivalence_classes = detect_agent_equivalence_classes(solver_input, ordered_agent_ids)
         symmetry_constraints_count = 0
         if enable_symmetry_breaking:
-            for i in range(len(ordered_agent_ids) - 1):
-                a1 = ordered_agent_ids[i]
-                a2 = ordered_agent_ids[i + 1]
-                if a1 in work_days_by_agent and a2 in work_days_by_agent:
-                    model.Add(work_days_by_agent[a1] >= work_days_by_agent[a2])
-                    symmetry_constraints_count += 1
-                if a1 in night_days_by_agent and a2 in night_days_by_agent:
-                    model.Add(night_days_by_agent[a1] >= night_days_by_agent[a2])
-                    symmetry_constraints_count += 1
+            symmetry_constraints_count = add_class_ordering_constraints(
+                model=model,
+                classes=equivalence_classes,
+                key_by_agent=work_days_by_agent,
+            )
             num_constraints += symmetry_constraints_count
         stats["symmetry_breaking_enabled"] = bool(enable_symmetry_breaking)
         stats["symmetry_constraints_count"] = int(symmetry_constraints_count)
+        stats["symmetry_classes_count"] = len(equivalence_classes.classes)
+        stats["symmetry_class_sizes"] = equivalence_classes.sizes
+        stats["symmetry_agents_in_classes"] = equivalence_classes.agents_in_classes
+        stats["symmetry_group_size_log10"] = round(equivalence_classes.group_size_log10, 3)
 
         if amplitude_by_agent:
             model.Add(total_amplitude_cost == sum(amplitude_by_agent.values()))
@@ -1132,15 +1210,218 @@ class OrtoolsSolver:
             + self.W_EXISTING_CHANGE_STRONG * existing_change_strong_total
             + self.W_EXISTING_CHANGE_MEDIUM * existing_change_medium_total
         )
+        _memory_checkpoint("objective")
+        stats["smoothing_term_components_count"] = len(weighted_understaff_smooth_terms)
+
+        return model, {
+            "stats": stats,
+            "y": y,
+            "run_vars": run_vars,
+            "vars_by_demand": vars_by_demand,
+            "demand_records": demand_records,
+            "combo_by_id": combo_by_id,
+            "compatible_pairs": compatible_pairs,
+            "apply_gpt_rules": apply_gpt_rules,
+            "context_days": context_days,
+            "dates": dates,
+            "date_to_index": date_to_index,
+            "date_to_period_index": date_to_period_index,
+            "in_window_ctx_indices": in_window_ctx_indices,
+            "ordered_agent_ids": ordered_agent_ids,
+            "tranche_by_id": tranche_by_id,
+            "hard_daytype_overrides": hard_daytype_overrides,
+            "resolved_existing_daytypes_ctx": resolved_existing_daytypes_ctx,
+            "runs_candidate_count_by_agent": runs_candidate_count_by_agent,
+            "equivalence_classes": equivalence_classes,
+            "enable_symmetry_breaking": enable_symmetry_breaking,
+            "total_required_count": total_required_count,
+            "total_required_weighted": total_required_weighted,
+            "total_amplitude_cap": total_amplitude_cap,
+            "num_constraints": num_constraints,
+            "num_variables": num_variables,
+            "coverage_constraints_count": coverage_constraints_count,
+            "rest_constraints_count": rest_constraints_count,
+            "work_days_by_agent": work_days_by_agent,
+            "diversity_vars_by_agent": diversity_vars_by_agent,
+            "stability_change_vars_by_agent": stability_change_vars_by_agent,
+            "work_block_start_vars_by_agent": work_block_start_vars_by_agent,
+            "rpdouble_soft_vars_by_agent": rpdouble_soft_vars_by_agent,
+            "max_work_days": max_work_days,
+            "min_work_days": min_work_days,
+            "max_work_minutes": max_work_minutes,
+            "min_work_minutes": min_work_minutes,
+            "max_nights": max_nights,
+            "min_nights": min_nights,
+            "total_night_days": total_night_days,
+            "total_amplitude_cost": total_amplitude_cost,
+            "useless_work_total": useless_work_total,
+            "understaff_weighted_sum": understaff_weighted_sum,
+            "understaff_smooth_weighted_sum": understaff_smooth_weighted_sum,
+            "understaff_total_unweighted": understaff_total_unweighted,
+            "stability_changes_total": stability_changes_total,
+            "work_blocks_starts_total": work_blocks_starts_total,
+            "rpdouble_soft_total": rpdouble_soft_total,
+            "tranche_diversity_total": tranche_diversity_total,
+            "existing_change_strong_total": existing_change_strong_total,
+            "existing_change_medium_total": existing_change_medium_total,
+            "objective": objective,
+        }
+
+    def _build_or_load_model(
+        self, solver_input: SolverInput, *, memory: MemoryProfiler, stats_collector: StatsCollector
+    ) -> tuple[cp_model.CpModel, dict[str, Any]]:
+        """Load the built model from ``model_cache`` when the input fingerprint matches, else build (and store)."""
+        if self.model_cache is None:
+            return self._build_model(solver_input, memory=memory, stats_collector=stats_collector)
+
+        fingerprint = solver_input_fingerprint(
+            solver_input,
+            build_options={
+                "enable_symmetry_breaking": self._resolve_symmetry_breaking(solver_input),
+                "weights": {name: value for name, value in vars(OrtoolsSolver).items() if name.startswith("W_")},
+            },
+        )
+        load_started = time.monotonic()
+        cached = self.model_cache.load(fingerprint)
+        load_wall = time.monotonic() - load_started
+        if cached is not None:
+            model, state = cached.model, cached.state
+            stats = state["stats"]
+            stats.update(run_scoped_base_stats(time_limit_seconds=float(solver_input.time_limit_seconds or 0.0), solver_input=solver_input))
+            stats.update(
+                {
+                    "model_cache_enabled": True,
+                    "model_cache_hit": True,
+                    "model_cache_fingerprint": fingerprint,
+                    "model_cache_load_wall_time_seconds": load_wall,
+                    "model_cache_entry_bytes": cached.entry_bytes,
+                }
+            )
+            self._checkpoint_memory(memory, "model_cache_load", stats=stats, stats_collector=stats_collector)
+            return model, state
+
+        build_started = time.monotonic()
+        model, state = self._build_model(solver_input, memory=memory, stats_collector=stats_collector)
+        build_wall = time.monotonic() - build_started
+        store_started = time.monotonic()
+        try:
+            entry_bytes = self.model_cache.store(fingerprint, model, state)
+        except OSError:
+            # Cache disque indisponible : la génération continue sans lui
+            entry_bytes = None
+        state["stats"].update(
+            {
+                "model_cache_enabled": True,
+                "model_cache_hit": False,
+                "model_cache_fingerprint": fingerprint,
+                "model_cache_load_wall_time_seconds": load_wall,
+                "model_cache_build_wall_time_seconds": build_wall,
+                "model_cache_store_wall_time_seconds": time.monotonic() - store_started,
+                "model_cache_entry_bytes": entry_bytes,
+            }
+        )
+        return model, state
+
+    @staticmethod
+    def _checkpoint_memory(memory: MemoryProfiler, stage: str, *, stats: dict[str, Any], stats_collector: StatsCollector) -> None:
+        try:
+            memory.checkpoint(stage)
+        except MemoryLimitExceededError as exc:
+            stats.update(memory.to_stats())
+            raise MemoryLimitExceededError(str(exc), stats=stats_collector.finalize(stats)) from None
+
+    @staticmethod
+    def _resolve_symmetry_breaking(solver_input: SolverInput) -> bool:
+        if solver_input.enable_symmetry_breaking is not None:
+            return bool(solver_input.enable_symmetry_breaking)
+        return (solver_input.quality_profile or "balanced").lower() in {"balanced", "high"}
+
+    def _generate_model(self, solver_input: SolverInput, memory: MemoryProfiler) -> SolverOutput:
+        stats_collector = StatsCollector.from_env()
+        solve_started_at = time.monotonic()
+        model, state = self._build_or_load_model(solver_input, memory=memory, stats_collector=stats_collector)
+        stats = state["stats"]
+        y = state["y"]
+        run_vars = state["run_vars"]
+        vars_by_demand = state["vars_by_demand"]
+        demand_records = state["demand_records"]
+        combo_by_id = state["combo_by_id"]
+        compatible_pairs = state["compatible_pairs"]
+        apply_gpt_rules = state["apply_gpt_rules"]
+        context_days = state["context_days"]
+        dates = state["dates"]
+        date_to_index = state["date_to_index"]
+        date_to_period_index = state["date_to_period_index"]
+        in_window_ctx_indices = state["in_window_ctx_indices"]
+        ordered_agent_ids = state["ordered_agent_ids"]
+        tranche_by_id = state["tranche_by_id"]
+        hard_daytype_overrides = state["hard_daytype_overrides"]
+        resolved_existing_daytypes_ctx = state["resolved_existing_daytypes_ctx"]
+        runs_candidate_count_by_agent = state["runs_candidate_count_by_agent"]
+        equivalence_classes = state["equivalence_classes"]
+        enable_symmetry_breaking = state["enable_symmetry_breaking"]
+        total_required_count = state["total_required_count"]
+        total_required_weighted = state["total_required_weighted"]
+        total_amplitude_cap = state["total_amplitude_cap"]
+        num_constraints = state["num_constraints"]
+        num_variables = state["num_variables"]
+        coverage_constraints_count = state["coverage_constraints_count"]
+        rest_constraints_count = state["rest_constraints_count"]
+        work_days_by_agent = state["work_days_by_agent"]
+        diversity_vars_by_agent = state["diversity_vars_by_agent"]
+        stability_change_vars_by_agent = state["stability_change_vars_by_agent"]
+        work_block_start_vars_by_agent = state["work_block_start_vars_by_agent"]
+        rpdouble_soft_vars_by_agent = state["rpdouble_soft_vars_by_agent"]
+        max_work_days = state["max_work_days"]
+        min_work_days = state["min_work_days"]
+        max_work_minutes = state["max_work_minutes"]
+        min_work_minutes = state["min_work_minutes"]
+        max_nights = state["max_nights"]
+        min_nights = state["min_nights"]
+        total_night_days = state["total_night_days"]
+        total_amplitude_cost = state["total_amplitude_cost"]
+        useless_work_total = state["useless_work_total"]
+        understaff_weighted_sum = state["understaff_weighted_sum"]
+        understaff_smooth_weighted_sum = state["understaff_smooth_weighted_sum"]
+        understaff_total_unweighted = state["understaff_total_unweighted"]
+        stability_changes_total = state["stability_changes_total"]
+        work_blocks_starts_total = state["work_blocks_starts_total"]
+        rpdouble_soft_total = state["rpdouble_soft_total"]
+        tranche_diversity_total = state["tranche_diversity_total"]
+        existing_change_strong_total = state["existing_change_strong_total"]
+        existing_change_medium_total = state["existing_change_medium_total"]
+        objective = state["objective"]
+        var_to_key = {id(var): key for key, var in y.items()}
+        time_limit_seconds = float(solver_input.time_limit_seconds or 0.0)
+        profile = (solver_input.quality_profile or "balanced").lower()
+
+        def _memory_checkpoint(stage: str) -> None:
+            self._checkpoint_memory(memory, stage, stats=stats, stats_collector=stats_collector)
+
+        budget_mode = (solver_input.budget_mode or "wall").lower()
+        deterministic_units = (
+            float(solver_input.deterministic_units_per_second or DETERMINISTIC_DEFAULT_UNITS_PER_SECOND)
+            if budget_mode == "deterministic"
+            else None
+        )
+        clock = SolveClock(
+            mode=budget_mode,
+            units_per_second=deterministic_units or 1.0,
+            time_limit_seconds=time_limit_seconds,
+        )
 
         def _normalize_status(raw_status: int, wall_time: float, budget_seconds: float) -> tuple[str, str, bool]:
-            return normalize_status(raw_status=raw_status, wall_time=wall_time, budget_seconds=budget_seconds)
+            # En mode déterministe, le timeout se lit sur le temps déterministe du dernier solve
+            return normalize_status(raw_status=raw_status, wall_time=clock.last_solve_seconds(wall_time), budget_seconds=budget_seconds)
 
         def _new_solver(budget_seconds: float) -> cp_model.CpSolver:
-            solver = configure_solver(
-                budget_seconds=budget_seconds,
-                time_limit_seconds=time_limit_seconds,
-                seed=int(solver_input.seed or 0),
+            solver = clock.track(
+                configure_solver(
+                    budget_seconds=budget_seconds,
+                    time_limit_seconds=time_limit_seconds,
+                    seed=int(solver_input.seed or 0),
+                    deterministic_units_per_second=deterministic_units,
+                )
             )
             if budget_seconds > 0:
                 applied = float(time_limit_seconds if time_limit_seconds > 0 else budget_seconds)
@@ -1183,20 +1464,28 @@ class OrtoolsSolver:
             for di, score in day_scores[:5]
         ]
 
+        # Extraction vectorisée : lecture unique du vecteur de solution, indices proto précalculés
+        run_keys = sorted(run_vars.keys())
+        y_values_of = index_getter([y[key] for key in y_keys])
+        run_values_of = index_getter([run_vars[key] for key in run_keys])
+        understaff_values_of = index_getter([rec["understaff_var"] for rec in demand_records])
+        extraction_timing = {"seconds": 0.0, "count": 0}
+
         def _extract_solution(solver: cp_model.CpSolver):
-            assign = {(aid, di, cid): int(solver.Value(y[(aid, di, cid)])) for (aid, di, cid) in y_keys}
-            run_assign = {(aid, si, ei): int(solver.Value(run_vars[(aid, si, ei)])) for (aid, si, ei) in sorted(run_vars.keys())} if run_vars else {}
+            extraction_started = time.monotonic()
+            values = solution_values(solver)
+            assign = dict(zip(y_keys, y_values_of(values)))
+            run_assign = dict(zip(run_keys, run_values_of(values))) if run_vars else {}
             understaff_by_poste_unweighted: dict[int, int] = {}
             understaff_by_poste_weighted: dict[int, int] = {}
             understaff_by_poste_day: dict[tuple[int, int], int] = {}
             understaff_by_day_unweighted: dict[int, int] = {}
             understaff_by_day_weighted: dict[int, int] = {}
-            for rec in demand_records:
-                poste_id = int(rec["poste_id"])
-                di = int(rec["day_index"])
-                us = int(solver.Value(rec["understaff_var"]))
+            for rec, us in zip(demand_records, understaff_values_of(values)):
                 if us <= 0:
                     continue
+                poste_id = int(rec["poste_id"])
+                di = int(rec["day_index"])
                 understaff_by_poste_unweighted[poste_id] = understaff_by_poste_unweighted.get(poste_id, 0) + us
                 weighted_us = int(rec["weight"]) * us
                 understaff_by_poste_weighted[poste_id] = understaff_by_poste_weighted.get(poste_id, 0) + weighted_us
@@ -1204,18 +1493,21 @@ class OrtoolsSolver:
                 understaff_by_poste_day[key] = understaff_by_poste_day.get(key, 0) + us
                 understaff_by_day_unweighted[di] = understaff_by_day_unweighted.get(di, 0) + us
                 understaff_by_day_weighted[di] = understaff_by_day_weighted.get(di, 0) + weighted_us
-            return {
+            solution = {
                 "assignment_map": assign,
                 "run_assignment_map": run_assign,
-                "understaff_total_unweighted": int(solver.Value(understaff_total_unweighted)),
+                "understaff_total_unweighted": int(values[understaff_total_unweighted.Index()]),
                 "objective_value": int(solver.Value(objective)),
-                "understaff_total_weighted": int(solver.Value(understaff_weighted_sum)),
+                "understaff_total_weighted": int(values[understaff_weighted_sum.Index()]),
                 "understaff_by_poste_unweighted": understaff_by_poste_unweighted,
                 "understaff_by_poste_weighted": understaff_by_poste_weighted,
                 "understaff_by_poste_day": understaff_by_poste_day,
                 "understaff_by_day_unweighted": understaff_by_day_unweighted,
                 "understaff_by_day_weighted": understaff_by_day_weighted,
             }
+            extraction_timing["seconds"] += time.monotonic() - extraction_started
+            extraction_timing["count"] += 1
+            return solution
 
         strategy = (solver_input.v3_strategy or "two_phase_lns").lower()
         default_phase1_fraction = {"fast": 0.2, "balanced": 0.1, "high": 0.15}.get(profile, 0.1)
@@ -1245,7 +1537,10 @@ class OrtoolsSolver:
         stats["min_lns_seconds"] = min_lns_seconds
 
         started_at = time.monotonic()
+        clock.started_at = started_at
         stats["model_build_wall_time_seconds"] = max(0.0, started_at - solve_started_at)
+        stats["budget_mode"] = budget_mode
+        stats["deterministic_units_per_second"] = deterministic_units
         best_solution = None
         trace_points: list[tuple[float, float, int]] = []
         time_to_first_feasible_seconds = None
@@ -1256,14 +1551,142 @@ class OrtoolsSolver:
         last_wall_time = 0.0
         last_status_int = None
 
-        if strategy != "lns_only":
+        enable_warm_start = True if solver_input.enable_warm_start is None else bool(solver_input.enable_warm_start)
+        warm_start = None
+        if enable_warm_start and strategy != "lns_only":
+            gpt_frame = None
+            if apply_gpt_rules:
+                fixed_ctx_days: dict[tuple[int, int], tuple[bool, int]] = {}
+                for agent_id in ordered_agent_ids:
+                    for ci, day_date in enumerate(context_days):
+                        if is_in_window_ctx_index(ci, in_window_ctx_indices):
+                            continue
+                        day_type_ctx = resolved_existing_daytypes_ctx.get((agent_id, day_date), DayType.REST.value)
+                        if day_type_ctx == DayType.REST.value:
+                            fixed_ctx_days[(agent_id, ci)] = (False, 0)
+                        elif day_type_ctx in {DayType.ZCOT.value, DayType.LEAVE.value, DayType.ABSENT.value}:
+                            fixed_ctx_days[(agent_id, ci)] = (True, 0)
+                        else:
+                            fixed_ctx_days[(agent_id, ci)] = (True, int(solver_input.existing_work_minutes_by_agent_day_ctx.get((agent_id, day_date), 0)))
+                gpt_frame = GptFrame(
+                    num_ctx_days=len(context_days),
+                    ctx_index_by_day_index={date_to_period_index[d]: ci for ci, d in enumerate(context_days) if d in date_to_period_index},
+                    fixed_ctx_days=fixed_ctx_days,
+                )
+            warm_start = build_greedy_warm_start(
+                ordered_agent_ids=ordered_agent_ids,
+                num_days=len(dates),
+                y_keys=y_keys,
+                combo_by_id=combo_by_id,
+                compatible_pairs=compatible_pairs,
+                demands=[
+                    WarmStartDemand(day_index=date_to_index[d.day_date], tranche_id=d.tranche_id, required_count=d.required_count, weight=int(rec["weight"]))
+                    for d, rec in zip(solver_input.coverage_demands, demand_records)
+                ],
+                forced_rest={(agent_id, date_to_index[day_date]) for (agent_id, day_date) in hard_daytype_overrides},
+                gpt=gpt_frame,
+                run_keys=sorted(run_vars.keys()),
+                equivalence_classes=equivalence_classes.classes if enable_symmetry_breaking else None,
+                max_total_amplitude_minutes=total_amplitude_cap,
+            )
+            for key in y_keys:
+                model.AddHint(y[key], warm_start.assignment_map[key])
+            for key, value in warm_start.run_assignment_map.items():
+                model.AddHint(run_vars[key], value)
+            stats["warm_start_applied"] = True
+            stats["warm_start_wall_time_seconds"] = warm_start.wall_time_seconds
+            stats["warm_start_understaff_total_unweighted"] = warm_start.understaff_total_unweighted
+            stats["warm_start_understaff_total_weighted"] = warm_start.understaff_total_weighted
+            stats["warm_start_coverage_ratio_unweighted"] = warm_start.coverage_ratio_unweighted
+            stats["warm_start_rule_violations"] = warm_start.rule_violations
+            stats["warm_start_hinted_vars_count"] = len(y_keys) + len(warm_start.run_assignment_map)
+        stats["warm_start_enabled"] = bool(enable_warm_start)
+
+        if strategy == "lexicographic":
+            # Mêmes poids relatifs qu'en somme pondérée, mais un tier à la fois (sans W_COVER)
+            tiers = [
+                ObjectiveTier("coverage", understaff_weighted_sum, LEXICOGRAPHIC_TIER_BUDGET_SHARES["coverage"]),
+                ObjectiveTier(
+                    "fairness",
+                    self.W_EXISTING_CHANGE_STRONG * existing_change_strong_total
+                    + self.W_EXISTING_CHANGE_MEDIUM * existing_change_medium_total
+                    + self.W_NIGHTS_TOTAL * total_night_days
+                    + self.W_NIGHTS_SPREAD * (max_nights - min_nights)
+                    + self.W_FAIR_MINUTES_SPREAD * (max_work_minutes - min_work_minutes)
+                    + self.W_FAIR_DAYS_SPREAD * (max_work_days - min_work_days),
+                    LEXICOGRAPHIC_TIER_BUDGET_SHARES["fairness"],
+                ),
+                ObjectiveTier(
+                    "comfort",
+                    self.W_AMPLITUDE * total_amplitude_cost
+                    + self.W_USELESS_WORK * useless_work_total
+                    + self.W_STABILITY_CHANGE * stability_changes_total
+                    + self.W_WORK_BLOCKS * work_blocks_starts_total
+                    - self.W_RPDOUBLE_BONUS * rpdouble_soft_total
+                    - self.W_TRANCHE_DIVERSITY * tranche_diversity_total
+                    + self.W_UNDERSTAFF_SMOOTH * understaff_smooth_weighted_sum,
+                    LEXICOGRAPHIC_TIER_BUDGET_SHARES["comfort"],
+                ),
+            ]
+            lexico_result = run_lexicographic(
+                model=model,
+                tiers=tiers,
+                y=y,
+                y_keys=y_keys,
+                understaff_var=understaff_total_unweighted,
+                understaff_lower_bound=solver_input.understaff_lower_bound,
+                time_limit_seconds=time_limit_seconds,
+                elapsed=clock.elapsed,
+                stats=stats,
+                _new_solver=_new_solver,
+                _effective_cp_sat_params=_effective_cp_sat_params,
+                _normalize_status=_normalize_status,
+                _extract_solution=_extract_solution,
+                deterministic_units_per_second=deterministic_units,
+            )
+            best_solution = lexico_result.best_solution
+            trace_points.extend(lexico_result.trace_points)
+            time_to_first_feasible_seconds = lexico_result.time_to_first_feasible_seconds
+            last_raw_status = lexico_result.last_raw_status
+            last_normalized_status = lexico_result.last_normalized_status
+            last_status_int = lexico_result.last_status_int
+            last_wall_time = lexico_result.last_wall_time
+            stats["lexicographic_enabled"] = True
+            stats["lexicographic_tiers"] = lexico_result.tiers
+
+            # Le tier couverture tient lieu de phase1 pour les consommateurs existants
+            coverage_tier = lexico_result.tiers[0] if lexico_result.tiers else {}
+            coverage_understaff = coverage_tier.get("understaff_total_unweighted")
+            phase1_stats = {
+                "phase1_time_limit_seconds": coverage_tier.get("time_limit_seconds", 0.0),
+                "phase1_wall_time_seconds": coverage_tier.get("wall_time_seconds", 0.0),
+                "phase1_solve_wall_time_seconds": coverage_tier.get("wall_time_seconds", 0.0),
+                "phase1_status_raw": coverage_tier.get("status_raw"),
+                "phase1_normalized_status": coverage_tier.get("normalized_status"),
+                "phase1_best_objective_value": coverage_tier.get("objective_value"),
+                "phase1_understaff_lower_bound": solver_input.understaff_lower_bound,
+                "phase1_stopped_at_lower_bound": bool(coverage_tier.get("stopped_at_lower_bound", False)),
+                "phase1_understaff_total_unweighted": coverage_understaff,
+                "phase1_coverage_ratio_unweighted": (
+                    max(0.0, 1.0 - (coverage_understaff / total_required_count)) if total_required_count else 1.0
+                ) if coverage_understaff is not None else None,
+            }
+        elif strategy != "lns_only":
             model.Minimize(understaff_total_unweighted)
             solver1 = _new_solver(phase1_seconds)
             stats.setdefault("cp_sat_params_effective", {})["phase1"] = _effective_cp_sat_params(solver1, phase1_seconds)
-            cb1 = TraceCallback(understaff_total_unweighted)
+            cb1 = TraceCallback(
+                understaff_total_unweighted,
+                stop_at_understaff_lower_bound=solver_input.understaff_lower_bound,
+                deterministic_units_per_second=deterministic_units,
+            )
             status1 = solve_with_trace(solver1, model, cb1)
             wall1 = float(solver1.WallTime())
+            phase1_clock_seconds = clock.last_solve_seconds(wall1)
             raw1, normalized1, timeout1 = _normalize_status(status1, wall1, phase1_seconds)
+            if cb1.lower_bound_reached and status1 == cp_model.FEASIBLE:
+                # Stopped on the max-flow bound: optimal for phase1, not a timeout.
+                normalized1 = "OPTIMAL"
             last_wall_time = wall1
             last_status_int = int(status1)
             last_raw_status = raw1
@@ -1275,6 +1698,8 @@ class OrtoolsSolver:
                 "phase1_status_raw": raw1,
                 "phase1_normalized_status": normalized1,
                 "phase1_best_objective_value": float(getattr(solver1, "ObjectiveValue", lambda: 0.0)()) if status1 in (cp_model.OPTIMAL, cp_model.FEASIBLE) else None,
+                "phase1_understaff_lower_bound": solver_input.understaff_lower_bound,
+                "phase1_stopped_at_lower_bound": bool(cb1.lower_bound_reached),
             }
             if cb1.first_feasible_time is not None and time_to_first_feasible_seconds is None:
                 time_to_first_feasible_seconds = cb1.first_feasible_time
@@ -1287,7 +1712,7 @@ class OrtoolsSolver:
                 phase1_stats["phase1_understaff_total_unweighted"] = None
                 phase1_stats["phase1_coverage_ratio_unweighted"] = None
 
-            remaining_after_phase1 = max(0.0, time_limit_seconds - (time.monotonic() - started_at)) if time_limit_seconds > 0 else 0.0
+            remaining_after_phase1 = max(0.0, time_limit_seconds - clock.elapsed()) if time_limit_seconds > 0 else 0.0
             if strategy in {"two_phase", "two_phase_lns"} and remaining_after_phase1 > 0:
                 min_lns_reserve = min(min_lns_seconds, remaining_after_phase1) if lns_enabled else 0.0
                 phase2_budget_cap = max(0.0, remaining_after_phase1 - min_lns_reserve)
@@ -1298,6 +1723,7 @@ class OrtoolsSolver:
                     model.Add(understaff_total_unweighted <= int(best_solution["understaff_total_unweighted"]))
                 model.Minimize(objective)
                 if best_solution is not None:
+                    model.ClearHints()
                     for key in y_keys:
                         model.AddHint(y[key], int(best_solution["assignment_map"][key]))
                 phase2_rebuild_started = time.monotonic()
@@ -1305,7 +1731,11 @@ class OrtoolsSolver:
                 stats["phase2_reused_model"] = True
                 solver2 = _new_solver(phase2_budget_cap)
                 stats.setdefault("cp_sat_params_effective", {})["phase2"] = _effective_cp_sat_params(solver2, phase2_budget_cap)
-                cb2 = TraceCallback(understaff_total_unweighted, stop_no_improve_after_seconds=phase2_no_improve_seconds)
+                cb2 = TraceCallback(
+                    understaff_total_unweighted,
+                    stop_no_improve_after_seconds=phase2_no_improve_seconds,
+                    deterministic_units_per_second=deterministic_units,
+                )
                 status2 = solve_with_trace(solver2, model, cb2)
                 wall2 = float(solver2.WallTime())
                 stats["phase2_solve_wall_time_seconds"] = wall2
@@ -1326,8 +1756,8 @@ class OrtoolsSolver:
                     "phase2_non_regression_bound": int(best_solution["understaff_total_unweighted"]) if best_solution is not None else None,
                 }
                 if cb2.first_feasible_time is not None and time_to_first_feasible_seconds is None:
-                    time_to_first_feasible_seconds = phase1_stats.get("phase1_wall_time_seconds", 0.0) + cb2.first_feasible_time
-                trace_points.extend([(phase1_stats.get("phase1_wall_time_seconds", 0.0) + t, obj, us) for (t, obj, us) in cb2.points])
+                    time_to_first_feasible_seconds = phase1_clock_seconds + cb2.first_feasible_time
+                trace_points.extend([(phase1_clock_seconds + t, obj, us) for (t, obj, us) in cb2.points])
                 if status2 in (cp_model.OPTIMAL, cp_model.FEASIBLE):
                     cand = _extract_solution(solver2)
                     phase2_stats["phase2_understaff_total_unweighted"] = cand["understaff_total_unweighted"]
@@ -1338,6 +1768,15 @@ class OrtoolsSolver:
                     phase2_stats["phase2_understaff_total_unweighted"] = None
                     phase2_stats["phase2_coverage_ratio_unweighted"] = None
 
+        if warm_start is not None:
+            # Premier incumbent CP-SAT au moins aussi bon que l'heuristique : le hint a été repris tel quel
+            first_point = trace_points[0] if trace_points else None
+            stats["warm_start_first_feasible_seconds"] = time_to_first_feasible_seconds
+            stats["warm_start_first_solution_understaff_unweighted"] = first_point[2] if first_point else None
+            stats["warm_start_hint_accepted"] = bool(first_point and first_point[2] <= warm_start.understaff_total_unweighted)
+
+        _memory_checkpoint("search")
+
         lns_started = time.monotonic()
         lns_result = LnsRunner(max_lns_history_items=self.MAX_LNS_HISTORY_ITEMS).run(
             best_solution=best_solution,
@@ -1365,6 +1804,7 @@ class OrtoolsSolver:
             _effective_cp_sat_params=_effective_cp_sat_params,
             _normalize_status=_normalize_status,
             _extract_solution=_extract_solution,
+            elapsed=clock.elapsed,
         )
         best_solution = lns_result.best_solution
         lns_iterations = lns_result.lns_iterations
@@ -1372,6 +1812,7 @@ class OrtoolsSolver:
         lns_best_improvement_understaff = lns_result.lns_best_improvement_understaff
         lns_best_improvement_objective = lns_result.lns_best_improvement_objective
         lns_neighborhoods_tried = lns_result.lns_neighborhoods_tried
+        _memory_checkpoint("lns")
 
         if best_solution is None:
             stats["solve_wall_time_seconds"] = float(last_wall_time)
@@ -1398,7 +1839,11 @@ class OrtoolsSolver:
 
         status = eval_status
         wall_time = float(time.monotonic() - started_at)
-        time_limit_reached = bool((last_normalized_status == "TIMEOUT") or (time_limit_seconds > 0 and wall_time >= time_limit_seconds * 0.95))
+        budget_elapsed = clock.elapsed()
+        time_limit_reached = bool((last_normalized_status == "TIMEOUT") or (time_limit_seconds > 0 and budget_elapsed >= time_limit_seconds * 0.95))
+        stats["deterministic_time_total"] = clock.deterministic_units_total()
+        stats["deterministic_time_total_seconds"] = clock.deterministic_seconds() if clock.deterministic else None
+        stats["budget_wall_safety_cap_hit"] = clock.wall_cap_hit
         normalized_solver_status = "TIMEOUT" if time_limit_reached else "FEASIBLE"
 
         stats["time_limit_seconds"] = time_limit_seconds
@@ -1429,6 +1874,8 @@ class OrtoolsSolver:
         stats["lns_neighborhoods_tried_by_poste"] = lns_neighborhoods_tried
         stats["time_to_first_feasible_seconds"] = time_to_first_feasible_seconds
         stats["best_objective_over_time_points"] = [{"t": round(t, 3), "obj": obj, "understaff_unweighted": us} for (t, obj, us) in trace_points]
+        final_extraction_started = time.monotonic()
+        eval_values = solution_values(eval_solver)
         assignments, agent_days, assigned_day_by_agent = extract_solution(
             eval_solver=eval_solver,
             y=y,
@@ -1438,8 +1885,27 @@ class OrtoolsSolver:
             ordered_agent_ids=ordered_agent_ids,
             solver_input=solver_input,
             hard_daytype_overrides=hard_daytype_overrides,
+            assignment_map=best_solution["assignment_map"],
         )
 
+        def _objective_terms(solver_: cp_model.CpSolver) -> dict[str, int]:
+            return {
+                "understaff_weighted": solver_.Value(understaff_weighted_sum),
+                "understaff_smooth_weighted": solver_.Value(understaff_smooth_weighted_sum),
+                "nights_total": solver_.Value(total_night_days),
+                "nights_spread": solver_.Value(max_nights) - solver_.Value(min_nights),
+                "fair_minutes_spread": solver_.Value(max_work_minutes) - solver_.Value(min_work_minutes),
+                "fair_days_spread": solver_.Value(max_work_days) - solver_.Value(min_work_days),
+                "amplitude_cost": solver_.Value(total_amplitude_cost),
+                "useless_work": solver_.Value(useless_work_total),
+                "stability_changes": solver_.Value(stability_changes_total),
+                "work_blocks_starts": solver_.Value(work_blocks_starts_total),
+                "rpdouble_soft_bonus": solver_.Value(rpdouble_soft_total),
+                "tranche_diversity_bonus": solver_.Value(tranche_diversity_total),
+                "existing_change_strong": solver_.Value(existing_change_strong_total),
+                "existing_change_medium": solver_.Value(existing_change_medium_total),
+            }
+
         objective_value = int(best_solution["objective_value"])
         understaff_total = int(best_solution["understaff_total_unweighted"])
         understaff_total_weighted = int(best_solution["understaff_total_weighted"])
@@ -1449,40 +1915,34 @@ class OrtoolsSolver:
         coverage_ratio_weighted = 1.0
         if total_required_weighted > 0:
             coverage_ratio_weighted = max(0.0, 1.0 - (understaff_total_weighted / total_required_weighted))
-        work_values = [eval_solver.Value(work_days_by_agent[agent_id]) for agent_id in ordered_agent_ids]
+        work_values = list(index_getter([work_days_by_agent[agent_id] for agent_id in ordered_agent_ids])(eval_values))
         workload_min = min(work_values) if work_values else 0
         workload_max = max(work_values) if work_values else 0
         workload_avg = (sum(work_values) / len(work_values)) if work_values else 0.0
         stability_changes_by_agent = {
-            agent_id: sum(eval_solver.Value(var) for var in stability_change_vars_by_agent.get(agent_id, []))
+            agent_id: sum_values(eval_values, stability_change_vars_by_agent.get(agent_id, []))
             for agent_id in ordered_agent_ids
         }
         work_blocks_starts_by_agent = {
-            agent_id: sum(eval_solver.Value(var) for var in work_block_start_vars_by_agent.get(agent_id, []))
+            agent_id: sum_values(eval_values, work_block_start_vars_by_agent.get(agent_id, []))
             for agent_id in ordered_agent_ids
         }
         rpdouble_soft_by_agent = {
-            agent_id: sum(eval_solver.Value(var) for var in rpdouble_soft_vars_by_agent.get(agent_id, []))
+            agent_id: sum_values(eval_values, rpdouble_soft_vars_by_agent.get(agent_id, []))
             for agent_id in ordered_agent_ids
         }
         tranche_diversity_by_agent = {
-            agent_id: eval_solver.Value(diversity_vars_by_agent.get(agent_id, 0)) if agent_id in diversity_vars_by_agent else 0
+            agent_id: eval_values[diversity_vars_by_agent[agent_id].Index()] if agent_id in diversity_vars_by_agent else 0
             for agent_id in ordered_agent_ids
         }
 
-        combo_ids_used: set[int] = set()
-        for (_agent_id, _di, combo_id), var in y.items():
-            if eval_solver.Value(var) == 1:
-                combo_ids_used.add(combo_id)
+        combo_ids_used = {combo_id for (_agent_id, _di, combo_id), value in best_solution["assignment_map"].items() if value == 1}
 
-        runs_selected_by_agent = {
-            agent_id: sum(
-                eval_solver.Value(run)
-                for (a, _s, _e), run in run_vars.items()
-                if a == agent_id
-            )
-            for agent_id in ordered_agent_ids
-        } if apply_gpt_rules else {}
+        runs_selected_by_agent: dict[int, int] = {}
+        if apply_gpt_rules:
+            runs_selected_by_agent = {agent_id: 0 for agent_id in ordered_agent_ids}
+            for (a, _s, _e), value in zip(run_keys, run_values_of(eval_values)):
+                runs_selected_by_agent[a] = runs_selected_by_agent.get(a, 0) + value
         max_possible_runs_by_agent = {
             agent_id: len(context_days) // 3
             for agent_id in ordered_agent_ids
@@ -1492,9 +1952,8 @@ class OrtoolsSolver:
         understaff_day_weighted: dict[str, int] = {}
         understaff_day_unweighted: dict[str, int] = {}
         top_understaff_days = []
-        for rec in demand_records:
+        for rec, us in zip(demand_records, understaff_values_of(eval_values)):
             day_key = rec["day_date"].isoformat()
-            us = int(eval_solver.Value(rec["understaff_var"]))
             wt = int(rec["weight"]) * us
             understaff_day_unweighted[day_key] = understaff_day_unweighted.get(day_key, 0) + us
             understaff_day_weighted[day_key] = understaff_day_weighted.get(day_key, 0) + wt
@@ -1502,7 +1961,8 @@ class OrtoolsSolver:
         for day_key in sorted(understaff_day_unweighted, key=lambda d: (-understaff_day_unweighted[d], -understaff_day_weighted.get(d, 0), d)):
             top_understaff_days.append({"day_date": day_key, "understaff_unweighted": understaff_day_unweighted[day_key], "understaff_weighted": understaff_day_weighted.get(day_key, 0)})
         stats["understaff_by_day_weighted"] = understaff_day_weighted
-        stats["smoothing_term_components_count"] = len(weighted_understaff_smooth_terms)
+        stats["final_extraction_wall_time_seconds"] = float(time.monotonic() - final_extraction_started)
+        _memory_checkpoint("extraction")
         stats["top_understaff_days"] = top_understaff_days
         stats.update(
             {
@@ -1543,30 +2003,87 @@ class OrtoolsSolver:
                 "understaff_smooth_weighted_sum": eval_solver.Value(understaff_smooth_weighted_sum),
                 "existing_change_strong_total": eval_solver.Value(existing_change_strong_total),
                 "existing_change_medium_total": eval_solver.Value(existing_change_medium_total),
-                "objective_terms": {
-                    "understaff_weighted": understaff_total_weighted,
-                    "understaff_smooth_weighted": eval_solver.Value(understaff_smooth_weighted_sum),
-                    "nights_total": eval_solver.Value(total_night_days),
-                    "nights_spread": eval_solver.Value(max_nights) - eval_solver.Value(min_nights),
-                    "fair_minutes_spread": eval_solver.Value(max_work_minutes) - eval_solver.Value(min_work_minutes),
-                    "fair_days_spread": eval_solver.Value(max_work_days) - eval_solver.Value(min_work_days),
-                    "amplitude_cost": eval_solver.Value(total_amplitude_cost),
-                    "useless_work": eval_solver.Value(useless_work_total),
-                    "stability_changes": eval_solver.Value(stability_changes_total),
-                    "work_blocks_starts": eval_solver.Value(work_blocks_starts_total),
-                    "rpdouble_soft_bonus": eval_solver.Value(rpdouble_soft_total),
-                    "tranche_diversity_bonus": eval_solver.Value(tranche_diversity_total),
-                    "existing_change_strong": eval_solver.Value(existing_change_strong_total),
-                    "existing_change_medium": eval_solver.Value(existing_change_medium_total),
-                },
+                "objective_terms": _objective_terms(eval_solver),
                 "num_assignments": len(assignments),
             }
         )
 
+        alternatives: list[SolverAlternative] = []
+        alternatives_count = max(0, int(solver_input.alternatives_count or 0))
+        if alternatives_count > 0:
+            min_changed_days = (
+                int(solver_input.alternatives_min_changed_days)
+                if solver_input.alternatives_min_changed_days is not None
+                else default_min_changed_days(
+                    agent_day_count=len(ordered_agent_ids) * len(dates),
+                    fraction=ALTERNATIVES_MIN_CHANGED_DAYS_FRACTION,
+                )
+            )
+            alternative_seconds = max(ALTERNATIVES_MIN_SECONDS_EACH, time_limit_seconds * ALTERNATIVES_TIME_SHARE_EACH)
+            pool = run_diverse_pool(
+                model=model,
+                objective=objective,
+                y=y,
+                y_keys=y_keys,
+                understaff_weighted_sum=understaff_weighted_sum,
+                primary_solution=best_solution,
+                count=alternatives_count,
+                min_changed_days=min_changed_days,
+                time_limit_seconds_each=alternative_seconds,
+                neighborhood_agent_count=max(2, math.ceil(len(ordered_agent_ids) * ALTERNATIVES_NEIGHBORHOOD_AGENT_FRACTION)),
+                max_attempts=alternatives_count * ALTERNATIVES_MAX_ATTEMPTS_FACTOR,
+                seed=int(solver_input.seed or 0),
+                _new_solver=_new_solver,
+                _normalize_status=_normalize_status,
+                _extract_solution=_extract_solution,
+            )
+            for pooled in pool.solutions:
+                alt_assignments, alt_agent_days, _ = extract_solution(
+                    eval_solver=pooled.solver,
+                    y=y,
+                    combo_by_id=combo_by_id,
+                    dates=dates,
+                    date_to_index=date_to_index,
+                    ordered_agent_ids=ordered_agent_ids,
+                    solver_input=solver_input,
+                    hard_daytype_overrides=hard_daytype_overrides,
+                    assignment_map=pooled.solution["assignment_map"],
+                )
+                alt_understaff = int(pooled.solution["understaff_total_unweighted"])
+                alternatives.append(
+                    SolverAlternative(
+                        rank=pooled.rank,
+                        agent_days=alt_agent_days,
+                        assignments=alt_assignments,
+                        objective_value=int(pooled.solution["objective_value"]),
+                        understaff_total=alt_understaff,
+                        understaff_total_weighted=int(pooled.solution["understaff_total_weighted"]),
+                        coverage_ratio=max(0.0, 1.0 - alt_understaff / total_required_count) if total_required_count > 0 else 1.0,
+                        changed_days_to_primary=pooled.changed_days_to_primary,
+                        objective_terms=_objective_terms(pooled.solver),
+                    )
+                )
+            stats.update(
+                {
+                    "alternatives_requested": alternatives_count,
+                    "alternatives_found": len(alternatives),
+                    "alternatives_min_changed_days": min_changed_days,
+                    "alternatives_time_limit_seconds_each": alternative_seconds,
+                    "alternatives_wall_time_seconds": pool.wall_time_seconds,
+                    "alternatives_attempts": pool.attempts,
+                }
+            )
+
+        stats["extraction_wall_time_seconds_total"] = float(extraction_timing["seconds"])
+        stats["extraction_count"] = int(extraction_timing["count"])
+        if alternatives_count > 0:
+            _memory_checkpoint("alternatives")
+        stats.update(memory.to_stats())
         stats = stats_collector.finalize(stats)
 
         return SolverOutput(
             agent_days=agent_days,
             assignments=assignments,
             stats=stats,
+            alternatives=alternatives,
         )
@@ -11,7 +11,13 @@ class TraceCallback(cp_model.CpSolverSolutionCallback):
     Mutates only internal trace fields (``first_feasible_time``/``points``).
     """
 
-    def __init__(self, understaff_var: cp_model.IntVar, stop_no_improve_after_seconds: float | None = None):
+    def __init__(
+        self,
+        understaff_var: cp_model.IntVar,
+        stop_no_improve_after_seconds: float | None = None,
+        stop_at_understaff_lower_bound: int | None = None,
+        deterministic_units_per_second: float | None = None,
+    ):
         super().__init__()
         self.understaff_var = understaff_var
         self.first_feasible_time = None
@@ -19,9 +25,18 @@ class TraceCallback(cp_model.CpSolverSolutionCallback):
         self.stop_no_improve_after_seconds = stop_no_improve_after_seconds
         self.last_improve_time = 0.0
         self.best_obj = None
+        self.stop_at_understaff_lower_bound = stop_at_understaff_lower_bound
+        self.lower_bound_reached = False
+        # Budget en temps déterministe : horodatage reproductible (indépendant de la charge)
+        self.deterministic_units_per_second = deterministic_units_per_second
+
+    def _now(self) -> float:
+        if self.deterministic_units_per_second:
+            return float(self.DeterministicTime()) / self.deterministic_units_per_second
+        return float(self.WallTime())
 
     def on_solution_callback(self):
-        t = float(self.WallTime())
+        t = self._now()
         if self.first_feasible_time is None:
             self.first_feasible_time = t
             self.last_improve_time = t
@@ -33,6 +48,11 @@ class TraceCallback(cp_model.CpSolverSolutionCallback):
             self.last_improve_time = t
         if len(self.points) < 200 and (not self.points or improved or us < self.points[-1][2]):
             self.points.append((t, obj, us))
+        if self.stop_at_understaff_lower_bound is not None and us <= self.stop_at_understaff_lower_bound:
+            # Proven optimal for the understaff objective: nothing left to search.
+            self.lower_bound_reached = True
+            self.StopSearch()
+            return
         if self.stop_no_improve_after_seconds is not None and (t - self.last_improve_time) >= self.stop_no_improve_after_seconds:
             self.StopSearch()
 
@@ -1,13 +1,38 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Any
+from operator import itemgetter
+from typing import Any, Callable, Sequence
 
 from core.domain.enums.day_type import DayType
 
 from backend.app.services.solver.models import SolverAgentDay, SolverAssignment, SolverInput
 
 
+def solution_values(solver: Any) -> Sequence[int]:
+    """Solution vector of the last solve, indexed by proto variable index.
+
+    Reading it once and indexing is ~50x faster than one ``solver.Value`` per
+    variable (each call goes through the Python linear-expression evaluator).
+    """
+    return solver.ResponseProto().solution
+
+
+def index_getter(variables: Sequence[Any]) -> Callable[[Sequence[int]], tuple[int, ...]]:
+    """Precompiled gather of ``variables`` from a solution vector (always a tuple)."""
+    indices = [variable.Index() for variable in variables]
+    if not indices:
+        return lambda values: ()
+    if len(indices) == 1:
+        only = indices[0]
+        return lambda values: (values[only],)
+    return itemgetter(*indices)
+
+
+def sum_values(values: Sequence[int], variables: Sequence[Any]) -> int:
+    return sum(values[variable.Index()] for variable in variables)
+
+
 def extract_solution(
     *,
     eval_solver: Any,
@@ -18,15 +43,21 @@ def extract_solution(
     ordered_agent_ids: list[int],
     solver_input: SolverInput,
     hard_daytype_overrides: dict[tuple[int, date], str] | None = None,
+    assignment_map: dict[tuple[int, int, int], int] | None = None,
 ) -> tuple[list[SolverAssignment], list[SolverAgentDay], set[tuple[int, int]]]:
     """Extract assignments and agent-day statuses from solved CP-SAT variables.
 
+    ``assignment_map`` (y key -> 0/1, as built by the solver's extraction) skips
+    reading ``y`` from ``eval_solver`` again.
     Extraction-only utility: does not mutate flat/grouped stats.
     """
+    if assignment_map is None:
+        values = solution_values(eval_solver)
+        assignment_map = {key: values[var.Index()] for key, var in y.items()}
     assignments: list[SolverAssignment] = []
     assigned_day_by_agent: set[tuple[int, int]] = set()
-    for (agent_id, di, combo_id), var in y.items():
-        if eval_solver.Value(var) != 1:
+    for (agent_id, di, combo_id), value in assignment_map.items():
+        if value != 1:
             continue
         combo = combo_by_id[combo_id]
         if combo.tranche_ids:
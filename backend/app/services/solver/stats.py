@@ -156,6 +156,8 @@ class StatsCollector:
             "smoothing_term_components_count",
             "top_understaff_days",
             "understaff_by_day_weighted",
+            "coverage_flow_understaff_lower_bound",
+            "coverage_flow_bottleneck_days",
         }
         objective_keys = {"objective_value", "score", "objective_terms", "dominance_ratios"}
         solution_quality_keys = {
@@ -261,9 +263,23 @@ class StatsCollector:
             "decision_strategy_day_scores_top": flat.get("decision_strategy_day_scores_top", []),
             "symmetry_breaking_enabled": flat.get("symmetry_breaking_enabled"),
             "symmetry_constraints_count": flat.get("symmetry_constraints_count"),
+            "symmetry_classes_count": flat.get("symmetry_classes_count"),
+            "symmetry_class_sizes": flat.get("symmetry_class_sizes", []),
+            "symmetry_agents_in_classes": flat.get("symmetry_agents_in_classes"),
+            "symmetry_group_size_log10": flat.get("symmetry_group_size_log10"),
             "phases": {
                 "phase1": {k: v for k, v in flat.items() if k.startswith("phase1_")},
                 "phase2": {k: v for k, v in flat.items() if k.startswith("phase2_")},
+                "warm_start": {k.removeprefix("warm_start_"): v for k, v in flat.items() if k.startswith("warm_start_")},
+                "alternatives": {k.removeprefix("alternatives_"): v for k, v in flat.items() if k.startswith("alternatives_")},
+                "lexicographic": {
+                    "enabled": bool(flat.get("lexicographic_enabled", False)),
+                    "tiers": flat.get("lexicographic_tiers", []),
+                },
+            },
+            "decomposition": {
+                "applied": bool(flat.get("decomposition_applied", False)),
+                "components_count": flat.get("decomposition_components_count", 1),
             },
             "best_objective_over_time_points": flat.get("best_objective_over_time_points", []),
             "time_to_first_feasible_seconds": flat.get("time_to_first_feasible_seconds"),
@@ -281,6 +297,11 @@ class StatsCollector:
                     for key in [
                         "time_limit_seconds",
                         "solver_max_time_seconds_applied",
+                        "budget_mode",
+                        "deterministic_units_per_second",
+                        "deterministic_time_total",
+                        "deterministic_time_total_seconds",
+                        "budget_wall_safety_cap_hit",
                         "solve_wall_time_seconds",
                         "solve_time_seconds",
                         "model_build_wall_time_seconds",
@@ -288,10 +309,17 @@ class StatsCollector:
                         "phase2_solve_wall_time_seconds",
                         "lns_model_rebuild_wall_time_seconds_total",
                         "lns_solve_wall_time_seconds_total",
+                        "extraction_wall_time_seconds_total",
+                        "extraction_count",
+                        "final_extraction_wall_time_seconds",
                     ]
-                }
+                },
+                "memory": {k.removeprefix("memory_"): v for k, v in flat.items() if k.startswith("memory_")},
+            },
+            "model": {
+                **{k: flat.get(k) for k in model_keys},
+                "cache": {k.removeprefix("model_cache_"): v for k, v in flat.items() if k.startswith("model_cache_")},
             },
-            "model": {k: flat.get(k) for k in model_keys},
             "coverage": {k: flat.get(k) for k in coverage_keys},
             "objective": {k: flat.get(k) for k in objective_keys},
             "solution_quality": {k: flat.get(k) for k in solution_quality_keys},
@@ -316,6 +344,7 @@ class StatsCollector:
         self._truncate_list_keep_type(model, "missing_tranche_in_any_combo_sample", int(caps["missing_tranche_in_any_combo_sample"]))
 
         self._truncate_list_keep_type(coverage, "top_understaff_days", int(caps["top_understaff_days"]))
+        self._truncate_list_keep_type(coverage, "coverage_flow_bottleneck_days", int(caps["coverage_flow_bottleneck_days"]))
         if verbosity == "compact":
             self._filter_positive_understaff_days(coverage, int(caps["understaff_by_day_weighted"]))
         else:
@@ -15,8 +15,14 @@ def make_base_stats(*, time_limit_seconds: float, total_required_count: int, tot
             "is_timeout": False,
             "time_limit_reached": False,
             "timeout_detection_method": "status_feasible_or_walltime_95pct",
-            "time_limit_seconds": time_limit_seconds,
             "solver_max_time_seconds_applied": 0.0,
+            "deterministic_units_per_second": None,
+            "deterministic_time_total": 0.0,
+            "deterministic_time_total_seconds": None,
+            "budget_wall_safety_cap_hit": False,
+            "extraction_wall_time_seconds_total": 0.0,
+            "extraction_count": 0,
+            "final_extraction_wall_time_seconds": 0.0,
             "solve_wall_time_seconds": 0.0,
             "solver_status_int": None,
             "solve_time_seconds": 0.0,
@@ -26,6 +32,8 @@ def make_base_stats(*, time_limit_seconds: float, total_required_count: int, tot
             "understaff_total": 0,
             "understaff_total_weighted": 0,
             "coverage_ratio_weighted": 0.0,
+            "coverage_flow_understaff_lower_bound": solver_input.understaff_lower_bound,
+            "coverage_flow_bottleneck_days": list(solver_input.coverage_flow_bottleneck_days),
             "soft_violations": 0,
             "agent_count": agent_count,
             "poste_count": len(solver_input.poste_ids),
@@ -187,6 +195,43 @@ def make_base_stats(*, time_limit_seconds: float, total_required_count: int, tot
             "decision_strategy_day_scores_top": [],
             "symmetry_breaking_enabled": False,
             "symmetry_constraints_count": 0,
+            "symmetry_classes_count": 0,
+            "symmetry_class_sizes": [],
+            "symmetry_agents_in_classes": 0,
+            "symmetry_group_size_log10": 0.0,
+            "warm_start_enabled": False,
+            "warm_start_applied": False,
+            "warm_start_wall_time_seconds": 0.0,
+            "warm_start_understaff_total_unweighted": None,
+            "warm_start_understaff_total_weighted": None,
+            "warm_start_coverage_ratio_unweighted": None,
+            "warm_start_rule_violations": 0,
+            "warm_start_hinted_vars_count": 0,
+            "warm_start_first_feasible_seconds": None,
+            "warm_start_first_solution_understaff_unweighted": None,
+            "warm_start_hint_accepted": False,
+            "alternatives_requested": 0,
+            "alternatives_found": 0,
+            "alternatives_min_changed_days": None,
+            "alternatives_time_limit_seconds_each": None,
+            "alternatives_wall_time_seconds": 0.0,
+            "alternatives_attempts": [],
+            "decomposition_applied": False,
+            "decomposition_components_count": 1,
+            "model_cache_enabled": False,
+            "model_cache_hit": False,
+            "model_cache_fingerprint": None,
+            "model_cache_load_wall_time_seconds": None,
+            "model_cache_build_wall_time_seconds": None,
+            "model_cache_store_wall_time_seconds": None,
+            "model_cache_entry_bytes": None,
+            "memory_peak_rss_mb": None,
+            "memory_process_peak_rss_mb": None,
+            "memory_traced_peak_mb": None,
+            "memory_limit_exceeded_stage": None,
+            "memory_stages": [],
+            "lexicographic_enabled": False,
+            "lexicographic_tiers": [],
             "objective_terms": {
                 "understaff_weighted": 0,
                 "understaff_smooth_weighted": 0,
@@ -202,4 +247,15 @@ def make_base_stats(*, time_limit_seconds: float, total_required_count: int, tot
                 "tranche_diversity_bonus": 0,
             },
         }
+    stats.update(run_scoped_base_stats(time_limit_seconds=time_limit_seconds, solver_input=solver_input))
     return stats
+
+
+def run_scoped_base_stats(*, time_limit_seconds: float, solver_input) -> dict[str, object]:
+    """Base stats read from run-only options (refreshed when a cached model is reused)."""
+    return {
+        "time_limit_seconds": time_limit_seconds,
+        "budget_mode": solver_input.budget_mode,
+        "memory_profiling_enabled": bool(solver_input.enable_memory_profiling),
+        "memory_limit_mb": solver_input.memory_limit_mb,
+    }
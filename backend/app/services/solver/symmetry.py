@@ -0,0 +1,116 @@
+"""Agent symmetry detection and class-restricted symmetry breaking.
+
+Two agents are interchangeable for the CP-SAT model when everything the model reads
+per agent is identical: qualified postes and qualification dates, absences, and the
+existing day types/assignments/work minutes (window and GPT context). Swapping the
+whole schedules of two such agents preserves feasibility and the objective, so each
+equivalence class can be ordered on any per-agent key without losing any optimal
+solution.
+
+The key is the number of worked days: a full lex-leader on the daily combo vector is
+stronger on paper, but its reified equalities fight the coverage-first decision
+strategy and the phase hints (markedly worse incumbents within the same budget).
+
+Regime is not part of ``SolverInput`` (the model does not read it), hence not part
+of the signature either.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Hashable
+
+from ortools.sat.python import cp_model
+
+from backend.app.services.solver.models import SolverInput
+
+
+@dataclass(frozen=True)
+class AgentEquivalenceClasses:
+    # Classes de taille >= 2 uniquement, membres triés
+    classes: list[list[int]]
+
+    @property
+    def sizes(self) -> list[int]:
+        return sorted((len(members) for members in self.classes), reverse=True)
+
+    @property
+    def agents_in_classes(self) -> int:
+        return sum(len(members) for members in self.classes)
+
+    @property
+    def group_size_log10(self) -> float:
+        """log10 de la taille du groupe de symétrie (produit des k!) ciblé par l'ordonnancement."""
+        return sum(math.lgamma(len(members) + 1) for members in self.classes) / math.log(10)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _by_agent(mapping: dict[tuple[int, date], Any]) -> dict[int, list[tuple[date, Hashable]]]:
+    grouped: dict[int, list[tuple[date, Hashable]]] = {}
+    for (agent_id, day_date), value in mapping.items():
+        grouped.setdefault(agent_id, []).append((day_date, _freeze(value)))
+    return grouped
+
+
+def detect_agent_equivalence_classes(solver_input: SolverInput, agent_ids: list[int]) -> AgentEquivalenceClasses:
+    absences_by_agent: dict[int, list[date]] = {}
+    for agent_id, day_date in solver_input.absences:
+        absences_by_agent.setdefault(agent_id, []).append(day_date)
+
+    per_agent_maps = [
+        _by_agent(mapping)
+        for mapping in (
+            solver_input.existing_day_type_by_agent_day,
+            solver_input.existing_day_type_by_agent_day_ctx,
+            solver_input.existing_daytype_by_agent_day_ctx,
+            solver_input.existing_assignment_by_agent_day_ctx,
+            solver_input.existing_work_minutes_by_agent_day_ctx,
+            solver_input.existing_shift_start_end_by_agent_day_ctx,
+        )
+    ]
+
+    members_by_signature: dict[Hashable, list[int]] = {}
+    for agent_id in agent_ids:
+        postes = sorted(solver_input.qualified_postes_by_agent.get(agent_id, ()))
+        signature = (
+            tuple(postes),
+            tuple(solver_input.qualification_date_by_agent_poste.get((agent_id, poste_id)) for poste_id in postes),
+            tuple(sorted(absences_by_agent.get(agent_id, ()))),
+            tuple(tuple(sorted(grouped.get(agent_id, ()))) for grouped in per_agent_maps),
+        )
+        members_by_signature.setdefault(signature, []).append(agent_id)
+
+    classes = sorted(
+        (sorted(members) for members in members_by_signature.values() if len(members) > 1),
+        key=lambda members: members[0],
+    )
+    return AgentEquivalenceClasses(classes=classes)
+
+
+def add_class_ordering_constraints(
+    *,
+    model: cp_model.CpModel,
+    classes: AgentEquivalenceClasses,
+    key_by_agent: dict[int, cp_model.LinearExprT],
+) -> int:
+    """Order each class on a per-agent key: key(a_i) >= key(a_i+1).
+
+    Returns the number of constraints added.
+    """
+    num_constraints = 0
+    for members in classes.classes:
+        for a1, a2 in zip(members, members[1:]):
+            model.Add(key_by_agent[a1] >= key_by_agent[a2])
+            num_constraints += 1
+    return num_constraints
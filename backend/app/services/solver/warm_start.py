@@ -0,0 +1,308 @@
+"""Greedy constructive warm start, hinted into phase1.
+
+Day by day, demands are served in priority order (``weight`` from
+``_understaff_priority_weight_for_demand``): each unit goes to the eligible agent
+whose allowed combo covers the most still-open weighted demand, ties broken by
+fewest worked days (fairness) then fewest minutes. Hard rules tracked while building:
+
+- one combo per agent/day, only combos present in ``y`` (qualification, dates, absences);
+- no over-coverage: a combo never covers a demanded tranche that is already full;
+- forced rest days (existing ABSENT/LEAVE) and rest compatibility between days;
+- the domain cap of ``total_amplitude_cost`` (``max_total_amplitude_minutes``);
+- GPT (when context days are given): worked blocks of 3..6 days, <= 2880 minutes,
+  two off days after a 6-day block, fixed context days outside the window.
+
+The result is a complete assignment of the choice variables (plus GPT run variables)
+and is used as a hint only: CP-SAT repairs whatever the greedy could not honor
+(reported as ``rule_violations``).
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+from backend.app.services.solver.rh_combos import DayCombo, DayKind
+
+GPT_MAX_RUN_DAYS = 6
+GPT_MIN_RUN_DAYS = 3
+GPT_MAX_RUN_MINUTES = 2880
+
+
+@dataclass(frozen=True)
+class WarmStartDemand:
+    day_index: int
+    tranche_id: int
+    required_count: int
+    weight: int
+
+
+@dataclass(frozen=True)
+class GptFrame:
+    """Context-day frame of the GPT rules (window days + fixed days around it)."""
+
+    num_ctx_days: int
+    ctx_index_by_day_index: dict[int, int]
+    # (agent_id, ctx_index) -> (worked, minutes) for days outside the window
+    fixed_ctx_days: dict[tuple[int, int], tuple[bool, int]]
+
+
+@dataclass
+class WarmStart:
+    assignment_map: dict[tuple[int, int, int], int]
+    run_assignment_map: dict[tuple[int, int, int], int] = field(default_factory=dict)
+    understaff_total_unweighted: int = 0
+    understaff_total_weighted: int = 0
+    total_required_count: int = 0
+    rule_violations: int = 0
+    wall_time_seconds: float = 0.0
+
+    @property
+    def coverage_ratio_unweighted(self) -> float:
+        if not self.total_required_count:
+            return 1.0
+        return max(0.0, 1.0 - self.understaff_total_unweighted / self.total_required_count)
+
+
+@dataclass
+class _AgentState:
+    run_len: int = 0
+    run_minutes: int = 0
+    # Jours off encore dus après un bloc de 6
+    off_required: int = 0
+    work_days: int = 0
+    prev_combo_id: int | None = None
+
+    def work(self, minutes: int) -> None:
+        self.run_len += 1
+        self.run_minutes += minutes
+        self.off_required = 0
+
+    def rest(self) -> None:
+        if self.run_len >= GPT_MAX_RUN_DAYS:
+            self.off_required = 1
+        elif self.off_required > 0:
+            self.off_required -= 1
+        self.run_len = 0
+        self.run_minutes = 0
+
+
+def build_greedy_warm_start(
+    *,
+    ordered_agent_ids: list[int],
+    num_days: int,
+    y_keys: list[tuple[int, int, int]],
+    combo_by_id: dict[int, DayCombo],
+    compatible_pairs: set[tuple[int, int]],
+    demands: list[WarmStartDemand],
+    forced_rest: set[tuple[int, int]],
+    gpt: GptFrame | None = None,
+    run_keys: list[tuple[int, int, int]] | None = None,
+    equivalence_classes: list[list[int]] | None = None,
+    max_total_amplitude_minutes: int | None = None,
+) -> WarmStart:
+    started = time.monotonic()
+    work_combos_by_agent_day: dict[tuple[int, int], list[DayCombo]] = {}
+    for agent_id, di, combo_id in y_keys:
+        combo = combo_by_id[combo_id]
+        if combo.day_kind == DayKind.WORK and (agent_id, di) not in forced_rest:
+            work_combos_by_agent_day.setdefault((agent_id, di), []).append(combo)
+
+    demands_by_day: dict[int, list[WarmStartDemand]] = {}
+    for demand in demands:
+        if demand.required_count > 0:
+            demands_by_day.setdefault(demand.day_index, []).append(demand)
+    weight_by_day_tranche = {(d.day_index, d.tranche_id): d.weight for d in demands}
+
+    window_ctx = {ci: di for di, ci in gpt.ctx_index_by_day_index.items()} if gpt else {}
+
+    def _fixed(agent_id: int, ci: int) -> tuple[bool, int] | None:
+        return gpt.fixed_ctx_days.get((agent_id, ci), (False, 0)) if ci not in window_ctx else None
+
+    def _workable(agent_id: int, di: int) -> bool:
+        return bool(work_combos_by_agent_day.get((agent_id, di)))
+
+    def _fixed_run_after(agent_id: int, ci: int) -> tuple[int, int]:
+        """Consecutive fixed worked days (and their minutes) right after ``ci``."""
+        days = minutes = 0
+        cursor = ci + 1
+        while cursor < gpt.num_ctx_days:
+            fixed = _fixed(agent_id, cursor)
+            if fixed is None or not fixed[0]:
+                break
+            days += 1
+            minutes += fixed[1]
+            cursor += 1
+        return days, minutes
+
+    def _can_be_off(agent_id: int, ci: int) -> bool:
+        if ci >= gpt.num_ctx_days:
+            return False
+        fixed = _fixed(agent_id, ci)
+        return fixed is None or not fixed[0]
+
+    def _gpt_allows(agent_id: int, di: int, state: _AgentState, minutes: int) -> bool:
+        if gpt is None:
+            return True
+        if state.off_required > 0 or state.run_len >= GPT_MAX_RUN_DAYS:
+            return False
+        ci = gpt.ctx_index_by_day_index[di]
+        tail_days, tail_minutes = _fixed_run_after(agent_id, ci)
+        new_len = state.run_len + 1 + tail_days
+        if new_len > GPT_MAX_RUN_DAYS or state.run_minutes + minutes + tail_minutes > GPT_MAX_RUN_MINUTES:
+            return False
+        end_ci = ci + tail_days
+        if new_len == GPT_MAX_RUN_DAYS and not (_can_be_off(agent_id, end_ci + 1) and _can_be_off(agent_id, end_ci + 2)):
+            return False
+        if state.run_len == 0 and new_len < GPT_MIN_RUN_DAYS:
+            # Un bloc ne démarre que s'il peut atteindre la longueur minimale
+            for k in range(1, GPT_MIN_RUN_DAYS - tail_days):
+                next_ci = end_ci + k
+                if next_ci >= gpt.num_ctx_days:
+                    return False
+                next_di = window_ctx.get(next_ci)
+                if next_di is None:
+                    if not _fixed(agent_id, next_ci)[0]:
+                        return False
+                elif not _workable(agent_id, next_di):
+                    return False
+        return True
+
+    def _must_work(state: _AgentState) -> bool:
+        return gpt is not None and 0 < state.run_len < GPT_MIN_RUN_DAYS
+
+    states = {agent_id: _AgentState() for agent_id in ordered_agent_ids}
+    if gpt is not None:
+        first_window_ci = min(window_ctx) if window_ctx else gpt.num_ctx_days
+        for agent_id in ordered_agent_ids:
+            for ci in range(first_window_ci):
+                worked, minutes = _fixed(agent_id, ci)
+                if worked:
+                    states[agent_id].work(minutes)
+                else:
+                    states[agent_id].rest()
+
+    chosen: dict[tuple[int, int], int] = {}
+    amplitude_left = max_total_amplitude_minutes if max_total_amplitude_minutes is not None else float("inf")
+    understaff_unweighted = understaff_weighted = 0
+    rule_violations = 0
+
+    for di in range(num_days):
+        assigned_today: dict[int, DayCombo] = {}
+        remaining = {d.tranche_id: d.required_count for d in demands_by_day.get(di, [])}
+
+        def _candidates(agent_id: int) -> list[DayCombo]:
+            state = states[agent_id]
+            return [
+                combo
+                for combo in work_combos_by_agent_day.get((agent_id, di), [])
+                if (state.prev_combo_id is None or (state.prev_combo_id, combo.id) in compatible_pairs)
+                and _gpt_allows(agent_id, di, state, combo.work_minutes)
+            ]
+
+        candidates_by_agent = {agent_id: _candidates(agent_id) for agent_id in ordered_agent_ids}
+
+        def _gain(combo: DayCombo) -> int:
+            return sum(weight_by_day_tranche[(di, t)] for t in combo.tranche_ids if remaining.get(t, 0) > 0)
+
+        def _fits(combo: DayCombo) -> bool:
+            # covered <= required : aucune tranche demandée déjà pleine
+            if combo.amplitude_minutes > amplitude_left:
+                return False
+            return all(remaining[t] > 0 for t in combo.tranche_ids if t in remaining)
+
+        for demand in sorted(demands_by_day.get(di, []), key=lambda d: (-d.weight, d.tranche_id)):
+            while remaining.get(demand.tranche_id, 0) > 0:
+                best: tuple[tuple, int, DayCombo] | None = None
+                for agent_id in ordered_agent_ids:
+                    if agent_id in assigned_today:
+                        continue
+                    state = states[agent_id]
+                    for combo in candidates_by_agent[agent_id]:
+                        if demand.tranche_id not in combo.tranche_ids or not _fits(combo):
+                            continue
+                        score = (_must_work(state), _gain(combo), -state.work_days, -combo.work_minutes, -agent_id)
+                        if best is None or score > best[0]:
+                            best = (score, agent_id, combo)
+                if best is None:
+                    break
+                _score, agent_id, combo = best
+                assigned_today[agent_id] = combo
+                amplitude_left -= combo.amplitude_minutes
+                for tranche_id in combo.tranche_ids:
+                    if remaining.get(tranche_id, 0) > 0:
+                        remaining[tranche_id] -= 1
+
+        for agent_id in ordered_agent_ids:
+            state = states[agent_id]
+            combo = assigned_today.get(agent_id)
+            if combo is None and _must_work(state):
+                options = sorted((c for c in candidates_by_agent[agent_id] if _fits(c)), key=lambda c: (-_gain(c), c.work_minutes, c.id))
+                if options:
+                    combo = options[0]
+                    amplitude_left -= combo.amplitude_minutes
+                    for tranche_id in combo.tranche_ids:
+                        if remaining.get(tranche_id, 0) > 0:
+                            remaining[tranche_id] -= 1
+                else:
+                    rule_violations += 1
+            if combo is None:
+                chosen[(agent_id, di)] = 0
+                state.rest()
+                state.prev_combo_id = 0
+            else:
+                chosen[(agent_id, di)] = combo.id
+                state.work(combo.work_minutes)
+                state.work_days += 1
+                state.prev_combo_id = combo.id
+
+        for tranche_id, left in remaining.items():
+            understaff_unweighted += left
+            understaff_weighted += left * weight_by_day_tranche[(di, tranche_id)]
+
+    if gpt is not None:
+        # Blocs trop courts en fin de fenêtre (aucun jour suivant pour les compléter)
+        last_ci = max(window_ctx) if window_ctx else -1
+        for agent_id in ordered_agent_ids:
+            tail_days, _ = _fixed_run_after(agent_id, last_ci)
+            if tail_days == 0 and 0 < states[agent_id].run_len < GPT_MIN_RUN_DAYS:
+                rule_violations += 1
+
+    if equivalence_classes:
+        # Respecte l'ordonnancement de symétrie (jours travaillés décroissants dans chaque classe)
+        for members in equivalence_classes:
+            schedules = sorted(
+                ([chosen[(agent_id, di)] for di in range(num_days)] for agent_id in members),
+                key=lambda schedule: -sum(1 for combo_id in schedule if combo_id != 0),
+            )
+            for agent_id, schedule in zip(members, schedules):
+                for di, combo_id in enumerate(schedule):
+                    chosen[(agent_id, di)] = combo_id
+
+    assignment_map = {(a, di, c): int(chosen.get((a, di)) == c) for (a, di, c) in y_keys}
+    run_assignment_map: dict[tuple[int, int, int], int] = {}
+    if gpt is not None and run_keys:
+        worked_blocks: set[tuple[int, int, int]] = set()
+        for agent_id in ordered_agent_ids:
+            worked = []
+            for ci in range(gpt.num_ctx_days):
+                di = window_ctx.get(ci)
+                worked.append(chosen[(agent_id, di)] != 0 if di is not None else _fixed(agent_id, ci)[0])
+            start = None
+            for ci, is_worked in enumerate([*worked, False]):
+                if is_worked and start is None:
+                    start = ci
+                elif not is_worked and start is not None:
+                    worked_blocks.add((agent_id, start, ci - 1))
+                    start = None
+        run_assignment_map = {key: int(key in worked_blocks) for key in run_keys}
+
+    return WarmStart(
+        assignment_map=assignment_map,
+        run_assignment_map=run_assignment_map,
+        understaff_total_unweighted=understaff_unweighted,
+        understaff_total_weighted=understaff_weighted,
+        total_required_count=sum(max(0, d.required_count) for d in demands),
+        rule_violations=rule_violations,
+        wall_time_seconds=time.monotonic() - started,
+    )
@@ -53,6 +53,30 @@ class Settings(BaseSettings):
     refresh_token_days: int = 30
     refresh_token_pepper: str = "CHANGE_ME_TOO"
 
+    # Rétention : tokens révoqués conservés N jours (détection de rejeu), expirés purgés après la marge.
+    # Jamais moins que refresh_token_days : un token volé peut être rejoué jusqu'à son expiration
+    refresh_token_revoked_retention_days: int = 30
+    refresh_token_expired_grace_hours: int = 1
+    refresh_token_purge_batch_size: int = 1000
+    # 0 = pas de tâche de fond (purge via scripts/db/purge_refresh_tokens.py)
+    refresh_token_purge_interval_minutes: int = 0
+
+    # ==========================================================
+    # PASSWORD HASHING (argon2) & LOGIN THROTTLING
+    # ==========================================================
+    # Changer ces paramètres déclenche un rehash au prochain login réussi
+    password_hash_time_cost: int = 3
+    password_hash_memory_cost: int = 65536  # KiB
+    password_hash_parallelism: int = 4
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 16
+
+    login_throttle_enabled: bool = True
+    login_max_failures_per_user: int = 5
+    login_max_failures_per_ip: int = 50
+    login_failure_window_seconds: float = 300.0
+    login_lockout_seconds: float = 300.0
+
     # ==========================================================
     # COOKIES
     # ==========================================================
@@ -92,6 +116,53 @@ class Settings(BaseSettings):
             return [item.strip() for item in s.split(",") if item.strip()]
         return []
 
+    # ==========================================================
+    # METRICS
+    # ==========================================================
+    metrics_enabled: bool = True
+
+    # ==========================================================
+    # PLANNING READ CACHE
+    # ==========================================================
+    planning_cache_enabled: bool = True
+    planning_cache_max_entries: int = 512
+    # Filet de sécurité pour les écritures hors services (import CSV, restauration, scripts, autre worker)
+    planning_cache_ttl_seconds: float = 300.0
+
+    # ==========================================================
+    # AUTH USER CACHE
+    # ==========================================================
+    user_cache_enabled: bool = True
+    user_cache_ttl_seconds: float = 30.0
+
+    # ==========================================================
+    # ELIGIBILITY CACHE (qualifications + équipes)
+    # ==========================================================
+    eligibility_cache_enabled: bool = True
+    eligibility_cache_ttl_seconds: float = 300.0
+
+    # ==========================================================
+    # SOLVER BUDGET (wall | deterministic)
+    # ==========================================================
+    solver_budget_mode: Literal["wall", "deterministic"] = "wall"
+    # Unités déterministes CP-SAT par seconde ; à défaut, fichier de calibration de l'hôte
+    solver_deterministic_units_per_second: Optional[float] = None
+    solver_calibration_path: str = "data/solver_calibration.json"
+
+    # ==========================================================
+    # SOLVER MEMORY (profilage par étape + garde-fou RSS)
+    # ==========================================================
+    solver_memory_profiling_enabled: bool = False
+    # Au-delà, la génération échoue proprement (draft FAILED) au lieu d'être tuée par l'OOM killer
+    solver_memory_limit_mb: Optional[int] = None
+
+    # ==========================================================
+    # SOLVER MODEL CACHE (modèles CP-SAT construits, LRU sur disque)
+    # ==========================================================
+    solver_model_cache_enabled: bool = False
+    solver_model_cache_dir: str = "data/solver_model_cache"
+    solver_model_cache_max_mb: int = 512
+
     # ==========================================================
     # AUTO-ADJUSTMENTS
     # ==========================================================
@@ -2,6 +2,7 @@
 from core.application.ports.agent_day_assignment_repo import AgentDayAssignmentRepositoryPort
 from core.application.ports.agent_repo import AgentRepositoryPort
 from core.application.ports.agent_day_repo import AgentDayRepositoryPort
+from core.application.ports.eligibility_repo import EligibilityRepositoryPort
 from core.application.ports.poste_coverage_requirement_repo import PosteCoverageRequirementRepositoryPort
 from core.application.ports.poste_repo import PosteRepositoryPort
 from core.application.ports.qualification_repo import QualificationRepositoryPort
@@ -12,6 +13,7 @@ __all__ = [
     "AgentRepositoryPort",
     "AgentDayRepositoryPort",
     "AgentDayAssignmentRepositoryPort",
+    "EligibilityRepositoryPort",
     "PosteCoverageRequirementRepositoryPort",
     "PosteRepositoryPort",
     "QualificationRepositoryPort",
@@ -1,12 +1,13 @@
 # core/application/ports/agent_day_repository.py
 from __future__ import annotations
 from datetime import date
-from typing import Protocol, List, Optional
+from typing import Dict, Protocol, List, Optional, Tuple
 
 from core.domain.entities.agent_day import AgentDay
 
 
 class AgentDayRepositoryPort(Protocol):
+    def bulk_upsert(self, entities: List[AgentDay]) -> Dict[Tuple[int, date], int]: ...
     def create(self, entity: AgentDay) -> AgentDay: ...
     def delete_by_agent_and_date(self, agent_id: int, day_date: date) -> bool: ...
     def delete_empty_days_by_date(self, day_date: date) -> bool: ...
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import List, Optional, Protocol, runtime_checkable, Any, Sequence, Tuple
+
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.domain.entities.agent import Agent
 
 
@@ -11,6 +13,8 @@ class AgentRepositoryPort(Protocol):
     def exists_for_regime(self, regime_id: int) -> bool: ...
     def get_by_id(self, agent_id: int) -> Optional[Agent]: ...
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Agent]: ...
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Agent]: ...
+    def count_estimate(self) -> Tuple[int, bool]: ...
     def list_all(self) -> List[Agent]: ...
     def list_by_ids(self, ids: List[int]) -> List[Agent]: ...
     def list_by_regime_id(self, regime_id: int) -> List[Agent]: ...
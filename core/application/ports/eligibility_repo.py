@@ -0,0 +1,9 @@
+from __future__ import annotations
+from typing import Protocol, runtime_checkable
+
+from core.application.read_models.eligibility_rm import EligibilityRM
+
+
+@runtime_checkable
+class EligibilityRepositoryPort(Protocol):
+    def load(self) -> EligibilityRM: ...
@@ -1,7 +1,10 @@
 from __future__ import annotations
 from datetime import date
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import List, Optional, Protocol, runtime_checkable, Any, Sequence, Tuple
+
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.application.read_models.poste_coverage_day_rm import TrancheCoverageRM
+from core.application.read_models.poste_coverage_range_rm import PosteCoverageRangeRM
 from core.domain.entities.poste import Poste
 
 
@@ -12,6 +15,9 @@ class PosteRepositoryPort(Protocol):
     def delete(self, object_id: int) -> bool: ...
     def get_by_id(self, poste_id: int) -> Optional[Poste]: ...
     def get_coverage_for_day(self, *, poste_id: int, day_date: date) -> list[TrancheCoverageRM]: ...
+    def get_coverage_for_range(self, *, poste_ids: list[int], start_date: date, end_date: date) -> PosteCoverageRangeRM: ...
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Poste]: ...
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Poste]: ...
+    def count_estimate(self) -> Tuple[int, bool]: ...
     def list_all(self) -> List[Poste]: ...
     def update(self, entity: Poste) -> Optional[Poste]: ...
\ No newline at end of file
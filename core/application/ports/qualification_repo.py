@@ -12,5 +12,6 @@ class QualificationRepositoryPort(Protocol):
     def list_all(self) -> List[Qualification]: ...
     def list_for_agent(self, agent_id: int) -> List[Qualification]: ...
     def list_for_poste(self, poste_id: int) -> List[Qualification]: ...
+    def list_for_postes(self, poste_ids: List[int]) -> List[Qualification]: ...
     def search(self, agent_id: Optional[int] = None, poste_id: Optional[int] = None) -> List[Qualification]: ...
     def update(self, entity: Qualification) -> Optional[Qualification]: ...
\ No newline at end of file
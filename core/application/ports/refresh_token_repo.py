@@ -13,3 +13,7 @@ class RefreshTokenRepositoryPort(Protocol):
     def revoke(self, token: RefreshToken, now: datetime) -> None: ...
     def revoke_by_hash_if_active(self, token_hash: str, now: datetime) -> bool: ...
     def revoke_all_for_user(self, user_id: int, now: datetime) -> int: ...
+    def delete_expired_batch(self, before: datetime, limit: int) -> int: ...
+    def delete_revoked_batch(self, before: datetime, limit: int) -> int: ...
+    def count(self) -> int: ...
+    def table_size_bytes(self) -> Optional[int]: ...
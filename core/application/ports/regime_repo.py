@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import List, Optional, Protocol, runtime_checkable, Any, Sequence, Tuple
+
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.domain.entities.regime import Regime
 
 
@@ -11,5 +13,7 @@ class RegimeRepositoryPort(Protocol):
     def get_by_id(self, regime_id: int) -> Optional[Regime]: ...
     def get_by_name(self, name: str) -> Optional[Regime]: ...
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Regime]: ...
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Regime]: ...
+    def count_estimate(self) -> Tuple[int, bool]: ...
     def list_all(self) -> List[Regime]: ...
     def update(self, entity: Regime) -> Optional[Regime]: ...
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import List, Optional, Protocol, runtime_checkable, Any, Sequence, Tuple
+
+from core.application.read_models.keyset_page_rm import KeysetPage
 
 from core.domain.entities.team import Team
 
@@ -12,6 +14,8 @@ class TeamRepositoryPort(Protocol):
     def get_by_id(self, team_id: int) -> Optional[Team]: ...
     def get_by_name(self, name: str) -> Optional[Team]: ...
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Team]: ...
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Team]: ...
+    def count_estimate(self) -> Tuple[int, bool]: ...
     def list_agent_ids(self, team_id: int) -> List[int]: ...
     def list_all(self) -> List[Team]: ...
     def get_existing_ids(self, team_ids: set[int]) -> set[int]: ...
\ No newline at end of file
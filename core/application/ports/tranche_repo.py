@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import List, Optional, Protocol, runtime_checkable, Any, Sequence, Tuple
+
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.domain.entities.tranche import Tranche
 
 
@@ -11,8 +13,11 @@ class TrancheRepositoryPort(Protocol):
     def exists_for_poste(self, poste_id: int) -> bool: ...
     def get_by_id(self, tranche_id: int) -> Optional[Tranche]: ...
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Tranche]: ...
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Tranche]: ...
+    def count_estimate(self) -> Tuple[int, bool]: ...
     def list_all(self) -> List[Tranche]: ...
     def list_by_ids(self, ids: List[int]) -> List[Tranche]:...
     def list_by_poste_id(self, poste_id: int) -> List[Tranche]: ...
+    def list_by_poste_ids(self, poste_ids: List[int]) -> List[Tranche]: ...
     def list_ids_by_poste(self, poste_id: int) -> List[int]: ...
     def update(self, entity: Tranche) -> Optional[Tranche]: ...
@@ -5,4 +5,5 @@ from db.models import User
 @runtime_checkable
 class UserRepositoryPort(Protocol):
     def get_by_username(self, username: str) -> Optional[User]: ...
-    def get_by_id(self, user_id: int) -> Optional[User]: ...
\ No newline at end of file
+    def get_by_id(self, user_id: int) -> Optional[User]: ...
+    def bump_token_version(self, user_id: int) -> None: ...
\ No newline at end of file
@@ -0,0 +1,91 @@
+# core/application/read_models/eligibility_rm.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.domain.entities.qualification import Qualification
+
+_EMPTY: Tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class EligibilityRM:
+    """
+    Matrice d'éligibilité agent × poste (+ appartenance aux équipes), construite en une passe.
+
+    Une qualification est valide à partir de `date_qualification` (sans date : toujours valide).
+    Les index par poste / agent / équipe sont triés pour des lectures déterministes.
+    """
+
+    qualified_since: Dict[Tuple[int, int], Optional[date]]
+    agents_by_poste: Dict[int, Tuple[int, ...]]
+    postes_by_agent: Dict[int, Tuple[int, ...]]
+    agents_by_team: Dict[int, Tuple[int, ...]]
+    teams_by_agent: Dict[int, Tuple[int, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        qualifications: Iterable[Tuple[int, int, Optional[date]]],
+        memberships: Iterable[Tuple[int, int]],
+    ) -> "EligibilityRM":
+        """`qualifications` : (agent_id, poste_id, date) ; `memberships` : (agent_id, team_id)."""
+        qualified_since: Dict[Tuple[int, int], Optional[date]] = {}
+        by_poste: Dict[int, set[int]] = {}
+        by_agent: Dict[int, set[int]] = {}
+        for agent_id, poste_id, since in qualifications:
+            qualified_since[(agent_id, poste_id)] = since
+            by_poste.setdefault(poste_id, set()).add(agent_id)
+            by_agent.setdefault(agent_id, set()).add(poste_id)
+
+        by_team: Dict[int, set[int]] = {}
+        teams_by_agent: Dict[int, set[int]] = {}
+        for agent_id, team_id in memberships:
+            by_team.setdefault(team_id, set()).add(agent_id)
+            teams_by_agent.setdefault(agent_id, set()).add(team_id)
+
+        return cls(
+            qualified_since=qualified_since,
+            agents_by_poste={k: tuple(sorted(v)) for k, v in by_poste.items()},
+            postes_by_agent={k: tuple(sorted(v)) for k, v in by_agent.items()},
+            agents_by_team={k: tuple(sorted(v)) for k, v in by_team.items()},
+            teams_by_agent={k: tuple(sorted(v)) for k, v in teams_by_agent.items()},
+        )
+
+    # ----------------------------------------------------- qualifications
+    def is_qualified(self, agent_id: int, poste_id: int, on: Optional[date] = None) -> bool:
+        key = (agent_id, poste_id)
+        if key not in self.qualified_since:
+            return False
+        since = self.qualified_since[key]
+        return on is None or since is None or since <= on
+
+    def qualification_date(self, agent_id: int, poste_id: int) -> Optional[date]:
+        return self.qualified_since.get((agent_id, poste_id))
+
+    def qualified_agent_ids(self, poste_id: int, on: Optional[date] = None) -> List[int]:
+        agent_ids = self.agents_by_poste.get(poste_id, _EMPTY)
+        if on is None:
+            return list(agent_ids)
+        return [a for a in agent_ids if self.is_qualified(a, poste_id, on)]
+
+    def qualified_poste_ids(self, agent_id: int, on: Optional[date] = None) -> List[int]:
+        poste_ids = self.postes_by_agent.get(agent_id, _EMPTY)
+        if on is None:
+            return list(poste_ids)
+        return [p for p in poste_ids if self.is_qualified(agent_id, p, on)]
+
+    def qualifications_for_poste(self, poste_id: int) -> List[Qualification]:
+        """Entités Qualification du poste, dans l'ordre de `list_for_poste` (date croissante, sans date en dernier)."""
+        rows = [(a, self.qualified_since[(a, poste_id)]) for a in self.agents_by_poste.get(poste_id, _EMPTY)]
+        rows.sort(key=lambda r: (r[1] is None, r[1] or date.min, r[0]))
+        return [Qualification(agent_id=a, poste_id=poste_id, date_qualification=d) for a, d in rows]
+
+    # ----------------------------------------------------- équipes
+    def team_agent_ids(self, team_id: int) -> List[int]:
+        return list(self.agents_by_team.get(team_id, _EMPTY))
+
+    def agent_team_ids(self, agent_id: int) -> List[int]:
+        return list(self.teams_by_agent.get(agent_id, _EMPTY))
@@ -0,0 +1,17 @@
+# core/application/read_models/keyset_page_rm.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+@dataclass(frozen=True)
+class KeysetPage(Generic[T]):
+    """
+    Page d'une liste paginée par clé (keyset).
+
+    next_key : valeurs des colonnes de tri de la dernière ligne, à repasser en `after`
+    pour la page suivante ; None s'il n'y a plus de lignes.
+    """
+    items: List[T]
+    next_key: Optional[Tuple[Any, ...]]
@@ -0,0 +1,23 @@
+# core/application/read_models/poste_coverage_range_rm.py
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import date, time
+
+@dataclass(frozen=True)
+class TrancheCoverageSeriesRM:
+    tranche_id: int
+    poste_id: int
+    tranche_nom: str
+    heure_debut: time
+    heure_fin: time
+    # Une valeur par jour de PosteCoverageRangeRM.days (même ordre)
+    required_counts: list[int]
+    assigned_counts: list[int]
+
+@dataclass(frozen=True)
+class PosteCoverageRangeRM:
+    poste_ids: list[int]
+    start_date: date
+    end_date: date
+    days: list[date]
+    tranches: list[TrancheCoverageSeriesRM]
@@ -1,18 +1,41 @@
 from __future__ import annotations
 
-from dataclasses import replace
+from dataclasses import dataclass, field, replace
 from datetime import date
-from typing import Optional
+from typing import List, Optional, Set, Tuple
 
 from core.application.ports.agent_day_repo import AgentDayRepositoryPort
 from core.application.ports.agent_day_assignment_repo import (
     AgentDayAssignmentRepositoryPort,
 )
+from core.application.services.planning.planning_cache import PlanningVersions
 from core.domain.enums.day_type import DayType
 from core.domain.entities.agent_day import AgentDay
 from core.domain.entities.agent_day_assignment import AgentDayAssignment
 
 
+@dataclass(frozen=True)
+class AgentDayChange:
+    agent_id: int
+    day_date: date
+    day_type: DayType
+    tranche_id: Optional[int] = None
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class AgentDayChangeFailure:
+    agent_id: int
+    day_date: date
+    message: str
+
+
+@dataclass
+class BulkUpsertResult:
+    applied: List[AgentDayChange] = field(default_factory=list)
+    failed: List[AgentDayChangeFailure] = field(default_factory=list)
+
+
 class AgentDayService:
     """
     Command service for editing an agent day (create/update/delete) + its single assignment (V1).
@@ -22,15 +45,18 @@ class AgentDayService:
     - V1 enforces 0..1 assignment per day (by deleting all then optionally adding one)
     - If day_type != WORKING: no assignment
     - is_off_shift is derived from day_type == OFF_SHIFT
+    - Every write bumps the agent planning version (read cache invalidation)
     """
 
     def __init__(
         self,
         agent_day_repo: AgentDayRepositoryPort,
         assignment_repo: AgentDayAssignmentRepositoryPort,
+        planning_versions: Optional[PlanningVersions] = None,
     ) -> None:
         self.agent_day_repo = agent_day_repo
         self.assignment_repo = assignment_repo
+        self.planning_versions = planning_versions
 
     def upsert_day(
         self,
@@ -88,10 +114,71 @@ class AgentDayService:
                 )
             )
 
+        self._bump_versions(agent_id)
+
         # Re-fetch to return fully hydrated entity (incl. assignments/tranche relationship)
         refreshed = self.agent_day_repo.get_by_agent_and_date(agent_id, day_date)
         return refreshed if refreshed is not None else agent_day
 
+    def bulk_upsert_days(self, changes: List[AgentDayChange]) -> BulkUpsertResult:
+        """
+        Set-based variant of upsert_day for bulk edits.
+        - every change is validated up front; invalid ones are reported, never applied
+        - valid changes are written in one transaction (days upserted, assignments replaced)
+        - nothing is re-fetched: callers build projections in one batch read
+        """
+        result = BulkUpsertResult()
+        seen: Set[Tuple[int, date]] = set()
+        entities: List[AgentDay] = []
+
+        for change in changes:
+            key = (change.agent_id, change.day_date)
+            try:
+                if key in seen:
+                    raise ValueError("duplicate (agent_id, day_date) in changes")
+                self._validate_change(change)
+            except ValueError as e:
+                result.failed.append(
+                    AgentDayChangeFailure(agent_id=change.agent_id, day_date=change.day_date, message=str(e))
+                )
+                continue
+
+            seen.add(key)
+            day_type = DayType(change.day_type)
+            agent_day = AgentDay(
+                id=0,
+                agent_id=change.agent_id,
+                day_date=change.day_date,
+                day_type=day_type.value,
+                description=change.description,
+                is_off_shift=(day_type == DayType.OFF_SHIFT),
+            )
+            # V1: 0..1 assignment, only for WORKING days
+            agent_day.set_tranche_ids(
+                [change.tranche_id] if day_type == DayType.WORKING and change.tranche_id is not None else []
+            )
+            entities.append(agent_day)
+            result.applied.append(change)
+
+        if entities:
+            self.agent_day_repo.bulk_upsert(entities)
+            self._bump_versions(*{e.agent_id for e in entities})
+
+        return result
+
+    @staticmethod
+    def _validate_change(change: AgentDayChange) -> None:
+        try:
+            day_type = DayType(change.day_type)
+        except ValueError:
+            raise ValueError(f"invalid day_type: {change.day_type!r}")
+
+        if change.tranche_id is not None:
+            if day_type != DayType.WORKING:
+                raise ValueError("tranche_id must be null when day_type is not working")
+            if change.tranche_id <= 0:
+                raise ValueError("tranche_id must be a positive id")
+
     def delete_day(self, agent_id: int, day_date: date) -> bool:
         """
         Delete an AgentDay by (agent_id, day_date).
@@ -105,4 +192,10 @@ class AgentDayService:
         # Defensive: clear assignments first (even if DB cascade handles it)
         self.assignment_repo.delete_by_agent_day_id(existing.id)
 
-        return self.agent_day_repo.delete_by_agent_and_date(agent_id, day_date)
+        deleted = self.agent_day_repo.delete_by_agent_and_date(agent_id, day_date)
+        self._bump_versions(agent_id)
+        return deleted
+
+    def _bump_versions(self, *agent_ids: int) -> None:
+        if self.planning_versions is not None:
+            self.planning_versions.bump_agents(agent_ids)
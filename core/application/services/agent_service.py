@@ -1,6 +1,7 @@
 # core/application/service/agent_service.py
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.application.ports import (
     AgentRepositoryPort,
     AgentDayRepositoryPort,
@@ -8,6 +9,8 @@ from core.application.ports import (
     RegimeRepositoryPort,
 )
 
+from core.application.services.eligibility_cache import EligibilityCache
+from core.application.services.planning.planning_cache import PlanningVersions
 from core.domain.entities import Agent
 
 class AgentService:
@@ -24,14 +27,20 @@ class AgentService:
         agent_day_repo: AgentDayRepositoryPort,
         qualification_repo: QualificationRepositoryPort,
         regime_repo: RegimeRepositoryPort,
+        planning_versions: Optional[PlanningVersions] = None,
+        eligibility: Optional[EligibilityCache] = None,
     ):
         self.agent_repo = agent_repo
         self.agent_day_repo = agent_day_repo
         self.regime_repo = regime_repo
         self.qualification_repo = qualification_repo
+        self.planning_versions = planning_versions
+        self.eligibility = eligibility
 
     def activate(self, agent_id: int) -> bool:
-        return self.agent_repo.set_active(agent_id, True)
+        activated = self.agent_repo.set_active(agent_id, True)
+        self._bump_planning(agent_id)
+        return activated
 
     def count(self) -> int:
         return self.agent_repo.count()
@@ -56,7 +65,9 @@ class AgentService:
         return self.agent_repo.create(agent)
     
     def deactivate(self, agent_id: int) -> bool:
-        return self.agent_repo.set_active(agent_id, False)
+        deactivated = self.agent_repo.set_active(agent_id, False)
+        self._bump_planning(agent_id)
+        return deactivated
     
     def delete(self, agent_id: int) -> bool:
         agent = self.agent_repo.get_by_id(agent_id)
@@ -67,13 +78,33 @@ class AgentService:
         if self.agent_day_repo.exists_for_agent(agent_id):
             raise ValueError("Cannot delete agent: agent has agent days")
 
-        return self.agent_repo.delete(agent_id)
+        # Équipes et postes de l'agent lus avant la suppression (agent_teams supprimés en cascade)
+        team_ids: Tuple[int, ...] = ()
+        poste_ids: Tuple[int, ...] = ()
+        if self.eligibility is not None:
+            self.eligibility.invalidate()
+            snapshot = self.eligibility.get()
+            team_ids = snapshot.teams_by_agent.get(agent_id, ())
+            poste_ids = snapshot.postes_by_agent.get(agent_id, ())
+
+        deleted = self.agent_repo.delete(agent_id)
+        if deleted:
+            if self.eligibility is not None:
+                self.eligibility.invalidate()
+            self._bump_deleted_agent(agent_id, team_ids=team_ids, poste_ids=poste_ids)
+        return deleted
     
     def get_by_id(self, agent_id: int) -> Agent | None:
         return self.agent_repo.get_by_id(agent_id)
     
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Agent]:
         return self.agent_repo.list(limit=limit, offset=offset)
+
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Agent]:
+        return self.agent_repo.list_keyset(limit=limit, after=after)
+
+    def count_estimate(self) -> Tuple[int, bool]:
+        return self.agent_repo.count_estimate()
     
     def list_all(self) -> List[Agent]:
         return self.agent_repo.list_all()
@@ -95,7 +126,27 @@ class AgentService:
         if "actif" in changes:
             agent.actif = changes["actif"]
 
-        return self.agent_repo.update(agent)
+        updated = self.agent_repo.update(agent)
+        self._bump_planning(agent_id)
+        return updated
+
+    def _bump_deleted_agent(self, agent_id: int, *, team_ids: Sequence[int], poste_ids: Sequence[int]) -> None:
+        # l'agent supprimé disparaît des plannings d'équipe et de poste mis en cache
+        if self.planning_versions is None:
+            return
+        if self.eligibility is None:
+            self.planning_versions.bump_all()
+            return
+        self.planning_versions.bump_agents([agent_id])
+        for team_id in team_ids:
+            self.planning_versions.bump_team(team_id)
+        for poste_id in poste_ids:
+            self.planning_versions.bump_poste(poste_id)
+
+    def _bump_planning(self, agent_id: int) -> None:
+        # l'agent (nom, régime...) est embarqué dans les plannings mis en cache
+        if self.planning_versions is not None:
+            self.planning_versions.bump_agents([agent_id])
 
     # =========================================================
     # 🔹 Chargement complet
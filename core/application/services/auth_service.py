@@ -2,10 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from functools import partial
+from typing import Optional, Tuple
+
+import anyio
 
 from backend.app.security.jwt import create_access_token, decode_access_token
-from backend.app.security.password import verify_password
+from backend.app.security.login_throttle import LoginThrottle, ThrottleKey
+from backend.app.security.password import (
+    PasswordHasherBusy, averify_and_update_password, verify_and_update_password
+)
 from backend.app.security.refresh import (
     generate_refresh_token, hash_refresh_token, refresh_expires_at
 )
@@ -13,12 +19,23 @@ from db.models.refresh_token import RefreshToken
 from db.models import User
 from core.application.ports.user_repo import UserRepositoryPort
 from core.application.ports.refresh_token_repo import RefreshTokenRepositoryPort
+from core.application.services.user_auth_cache import UserAuthCache
 
 
 class AuthError(Exception):
     pass
 
 
+class LoginThrottledError(AuthError):
+    def __init__(self, retry_after: float):
+        super().__init__("Too many login attempts")
+        self.retry_after = retry_after
+
+
+class LoginBusyError(AuthError):
+    pass
+
+
 @dataclass(frozen=True)
 class LoginResult:
     access_token: str
@@ -32,16 +49,85 @@ class RefreshResult:
 
 
 class AuthService:
-    def __init__(self, users: UserRepositoryPort, refresh_tokens: RefreshTokenRepositoryPort):
+    def __init__(
+        self,
+        users: UserRepositoryPort,
+        refresh_tokens: RefreshTokenRepositoryPort,
+        user_cache: Optional[UserAuthCache] = None,
+        throttle: Optional[LoginThrottle] = None,
+    ):
         self.users = users
         self.refresh_tokens = refresh_tokens
+        self.user_cache = user_cache
+        self.throttle = throttle
 
     def login(self, username: str, password: str, *, user_agent: Optional[str], ip: Optional[str]) -> LoginResult:
+        throttle_keys = LoginThrottle.keys(username, ip)
+        user = self._begin_login(throttle_keys, username)
+        valid, new_hash = False, None
+        if user is not None:
+            try:
+                valid, new_hash = verify_and_update_password(password, user.password_hash)
+            except PasswordHasherBusy as e:
+                raise LoginBusyError("Login temporarily unavailable") from e
+
+        return self._finish_login(throttle_keys, user, valid, new_hash, user_agent=user_agent, ip=ip)
+
+    async def alogin(
+        self, username: str, password: str, *, user_agent: Optional[str], ip: Optional[str]
+    ) -> LoginResult:
+        """
+        Variante async de `login` pour la route HTTP : les accès DB passent par le threadpool,
+        le calcul argon2 est attendu sur le pool dédié sans retenir de thread de requête.
+        """
+        throttle_keys = LoginThrottle.keys(username, ip)
+        user = await anyio.to_thread.run_sync(self._begin_login, throttle_keys, username)
+        valid, new_hash = False, None
+        if user is not None:
+            try:
+                valid, new_hash = await averify_and_update_password(password, user.password_hash)
+            except PasswordHasherBusy as e:
+                raise LoginBusyError("Login temporarily unavailable") from e
+
+        return await anyio.to_thread.run_sync(
+            partial(self._finish_login, throttle_keys, user, valid, new_hash, user_agent=user_agent, ip=ip)
+        )
+
+    def _begin_login(self, throttle_keys: Tuple[ThrottleKey, ...], username: str) -> Optional[User]:
+        """Contrôle du throttle puis chargement de l'utilisateur ; None si inconnu ou inactif."""
+        if self.throttle is not None:
+            retry_after = self.throttle.retry_after(throttle_keys)
+            if retry_after > 0:
+                raise LoginThrottledError(retry_after)
+
         user = self.users.get_by_username(username)
-        if not user or not user.is_active or not verify_password(password, user.password_hash):
+        if user and user.is_active:
+            return user
+        return None
+
+    def _finish_login(
+        self,
+        throttle_keys: Tuple[ThrottleKey, ...],
+        user: Optional[User],
+        valid: bool,
+        new_hash: Optional[str],
+        *,
+        user_agent: Optional[str],
+        ip: Optional[str],
+    ) -> LoginResult:
+        if not valid:
+            if self.throttle is not None:
+                self.throttle.record_failure(throttle_keys)
             raise AuthError("Bad credentials")
 
-        access = create_access_token(user_id=user.id, role=user.role)
+        if self.throttle is not None:
+            self.throttle.record_success(throttle_keys)
+
+        # Paramètres argon2 modifiés : rehash transparent, commité avec le refresh token
+        if new_hash:
+            user.password_hash = new_hash
+
+        access = create_access_token(user_id=user.id, role=user.role, token_version=user.token_version or 0)
         refresh = generate_refresh_token()
 
         rt = RefreshToken(
@@ -69,8 +155,18 @@ class AuthService:
 
     def logout_all(self, user_id: int) -> int:
         now = datetime.now(timezone.utc)
+        return self._revoke_all_sessions(user_id, now)
+
+    def _revoke_all_sessions(self, user_id: int, now: datetime) -> int:
+        """
+        Révoque les refresh tokens ET les access tokens en cours (bump de token_version),
+        puis invalide l'entrée du cache d'authentification.
+        """
         count = self.refresh_tokens.revoke_all_for_user(user_id, now)
+        self.users.bump_token_version(user_id)
         self.refresh_tokens.commit()
+        if self.user_cache is not None:
+            self.user_cache.invalidate(user_id)
         return count
 
     def refresh(self, refresh_token: str, *, user_agent: Optional[str], ip: Optional[str]) -> RefreshResult:
@@ -84,8 +180,7 @@ class AuthService:
 
         # --- REUSE / ABUSE DETECTION ---
         if rt.revoked_at is not None:
-            self.refresh_tokens.revoke_all_for_user(rt.user_id, now)
-            self.refresh_tokens.commit()
+            self._revoke_all_sessions(rt.user_id, now)
             raise AuthError("Refresh token reuse detected")
 
         expires_at = rt.expires_at
@@ -118,7 +213,7 @@ class AuthService:
             )
         )
 
-        access = create_access_token(user_id=user.id, role=user.role)
+        access = create_access_token(user_id=user.id, role=user.role, token_version=user.token_version or 0)
         self.refresh_tokens.commit()
 
         return RefreshResult(access_token=access, refresh_token=new_refresh)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+from core.application.ports.eligibility_repo import EligibilityRepositoryPort
+from core.application.read_models.eligibility_rm import EligibilityRM
+
+
+class EligibilityCache:
+    """
+    Snapshot en mémoire de la matrice d'éligibilité (qualifications + équipes).
+
+    Chargé paresseusement en une requête, partagé par le solver, la validation RH et
+    l'enrichissement des postes. Les écritures sur les qualifications et `agent_teams`
+    de ce processus appellent `invalidate()` ; le TTL borne la fenêtre d'incohérence
+    pour les écritures faites ailleurs (scripts, autre worker).
+    """
+
+    def __init__(
+        self,
+        repo: EligibilityRepositoryPort,
+        ttl_seconds: float = 300.0,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.repo = repo
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._snapshot: Optional[EligibilityRM] = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self.loads = 0
+
+    def get(self) -> EligibilityRM:
+        if not self.enabled:
+            return self.repo.load()
+
+        snapshot = self._fresh()
+        if snapshot is not None:
+            return snapshot
+
+        # Un seul chargement à la fois : les lecteurs concurrents attendent le même snapshot
+        with self._load_lock:
+            snapshot = self._fresh()
+            if snapshot is not None:
+                return snapshot
+
+            with self._lock:
+                generation = self._generation
+            snapshot = self.repo.load()
+            self.loads += 1
+
+            with self._lock:
+                # Invalidé pendant le chargement : on sert le résultat sans le garder
+                if generation == self._generation:
+                    self._snapshot = snapshot
+                    self._expires_at = self._clock() + self.ttl_seconds
+            return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def _fresh(self) -> Optional[EligibilityRM]:
+        with self._lock:
+            if self._snapshot is not None and self._expires_at > self._clock():
+                return self._snapshot
+            return None
@@ -1,9 +1,10 @@
 # core/application/services/planning/agent_planning_factory.py
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from datetime import date
 
+from core.application.services.planning.planning_cache import PlanningReadCache, agent_planning_key
 from core.domain.models.agent_planning import AgentPlanning
 
 if TYPE_CHECKING:
@@ -17,9 +18,11 @@ class AgentPlanningFactory:
         self,
         agent_service: AgentService,
         planning_day_assembler: PlanningDayAssembler,
+        read_cache: Optional[PlanningReadCache] = None,
     ) -> None:
         self.agent_service = agent_service
         self.planning_day_assembler = planning_day_assembler
+        self.read_cache = read_cache
 
     def build(
         self,
@@ -30,6 +33,14 @@ class AgentPlanningFactory:
         if start_date > end_date:
             raise ValueError("start_date must be <= end_date")
 
+        key = agent_planning_key(agent_id, start_date, end_date)
+        token = None
+        if self.read_cache is not None:
+            cached = self.read_cache.get(key)
+            if cached is not None:
+                return cached.value
+            token = self.read_cache.versions.token(agent_ids=[agent_id])
+
         agent = self.agent_service.get_agent_complet(agent_id)
         
         if not agent:
@@ -37,4 +48,7 @@ class AgentPlanningFactory:
         
         days = self.planning_day_assembler.build_for_agent(agent_id, start_date, end_date)
 
-        return AgentPlanning(agent, start_date, end_date, days)
\ No newline at end of file
+        planning = AgentPlanning(agent, start_date, end_date, days)
+        if self.read_cache is not None:
+            self.read_cache.put(key, planning, token=token, agent_ids=[agent_id])
+        return planning
\ No newline at end of file
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Hashable, Iterable, Optional, Tuple, TypeVar
+from uuid import uuid4
+
+T = TypeVar("T")
+
+
+class PlanningVersions:
+    """
+    In-memory version counters for planning data (per agent / team / poste).
+
+    Writers bump the counters they touch; readers compare a snapshot of the
+    counters they depend on. Counters are process-local: the random epoch makes
+    tokens (and ETags) from another process or a previous run never match.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.epoch = uuid4().hex[:12]
+        self._generation = 0
+        self._assignments = 0
+        self._agents: dict[int, int] = {}
+        self._teams: dict[int, int] = {}
+        self._postes: dict[int, int] = {}
+
+    # ----------------------------------------------------- writers
+    def bump_agents(self, agent_ids: Iterable[int]) -> None:
+        with self._lock:
+            for agent_id in set(agent_ids):
+                self._agents[agent_id] = self._agents.get(agent_id, 0) + 1
+            self._assignments += 1
+
+    def bump_team(self, team_id: int) -> None:
+        with self._lock:
+            self._teams[team_id] = self._teams.get(team_id, 0) + 1
+
+    def bump_poste(self, poste_id: int) -> None:
+        with self._lock:
+            self._postes[poste_id] = self._postes.get(poste_id, 0) + 1
+            self._assignments += 1
+
+    def bump_all(self) -> None:
+        """Invalidate every planning snapshot (writes whose impact is not known per entity)."""
+        with self._lock:
+            self._generation += 1
+
+    # ----------------------------------------------------- readers
+    def token(
+        self,
+        *,
+        agent_ids: Iterable[int] = (),
+        team_ids: Iterable[int] = (),
+        poste_ids: Iterable[int] = (),
+        include_assignments: bool = False,
+    ) -> Tuple[Any, ...]:
+        with self._lock:
+            return (
+                self._generation,
+                self._assignments if include_assignments else None,
+                tuple(self._agents.get(agent_id, 0) for agent_id in agent_ids),
+                tuple(self._teams.get(team_id, 0) for team_id in team_ids),
+                tuple(self._postes.get(poste_id, 0) for poste_id in poste_ids),
+            )
+
+
+@dataclass(frozen=True)
+class CachedPlanning(Generic[T]):
+    value: T
+    etag: str
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    etag: str
+    token: Tuple[Any, ...]
+    agent_ids: Tuple[int, ...]
+    team_ids: Tuple[int, ...]
+    poste_ids: Tuple[int, ...]
+    include_assignments: bool
+    expires_at: float
+
+
+class PlanningReadCache:
+    """
+    Bounded LRU cache of planning read models, validated against PlanningVersions.
+
+    An entry is served only while the version counters it depends on are
+    unchanged, so writes invalidate without scanning the cache. Writes that do
+    not go through the services (CSV import, backup restore, scripts, another
+    worker) do not bump the counters: the TTL bounds how long they stay unseen.
+    The ETag includes the build time, so a rebuild after expiry never revalidates
+    an ETag issued for the previous content.
+    """
+
+    def __init__(
+        self,
+        versions: PlanningVersions,
+        max_entries: int = 512,
+        enabled: bool = True,
+        ttl_seconds: Optional[float] = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.versions = versions
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[CachedPlanning[Any]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        current = self.versions.token(
+            agent_ids=entry.agent_ids,
+            team_ids=entry.team_ids,
+            poste_ids=entry.poste_ids,
+            include_assignments=entry.include_assignments,
+        )
+        if current != entry.token or entry.expires_at <= self._clock():
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            self.misses += 1
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        self.hits += 1
+        return CachedPlanning(value=entry.value, etag=entry.etag)
+
+    def put(
+        self,
+        key: Hashable,
+        value: T,
+        *,
+        token: Tuple[Any, ...],
+        agent_ids: Iterable[int] = (),
+        team_ids: Iterable[int] = (),
+        poste_ids: Iterable[int] = (),
+        include_assignments: bool = False,
+    ) -> CachedPlanning[T]:
+        """
+        Store `value` computed under `token` (taken *before* reading the data,
+        so a concurrent write makes the entry immediately stale).
+        """
+        built_at = self._clock()
+        etag = self._etag(key, token, built_at)
+        if not self.enabled:
+            return CachedPlanning(value=value, etag=etag)
+
+        entry = _Entry(
+            value=value,
+            etag=etag,
+            token=token,
+            agent_ids=tuple(agent_ids),
+            team_ids=tuple(team_ids),
+            poste_ids=tuple(poste_ids),
+            include_assignments=include_assignments,
+            expires_at=built_at + self.ttl_seconds if self.ttl_seconds else float("inf"),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return CachedPlanning(value=value, etag=etag)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _etag(self, key: Hashable, token: Tuple[Any, ...], built_at: float) -> str:
+        digest = hashlib.sha1(repr((self.versions.epoch, key, token, built_at)).encode("utf-8")).hexdigest()[:20]
+        return f'W/"{digest}"'
+
+
+def team_planning_key(team_id: int, start_date: Any, end_date: Any) -> Tuple[Any, ...]:
+    return ("team", team_id, start_date, end_date)
+
+
+def agent_planning_key(agent_id: int, start_date: Any, end_date: Any) -> Tuple[Any, ...]:
+    return ("agent", agent_id, start_date, end_date)
+
+
+def poste_planning_key(poste_id: int, start_date: Any, end_date: Any) -> Tuple[Any, ...]:
+    return ("poste", poste_id, start_date, end_date)
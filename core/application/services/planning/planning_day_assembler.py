@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Dict, List
+from typing import Dict, List, Sequence, Tuple
 
 from core.application.ports.agent_day_repo import AgentDayRepositoryPort
 from core.application.ports.tranche_repo import TrancheRepositoryPort
@@ -156,4 +156,23 @@ class PlanningDayAssembler:
     def build_for_agents_day(self, agent_ids: List[int], day_date: date) -> Dict[int, PlanningDay]:
         by_agent = self.build_for_agents(agent_ids, day_date, day_date)
 
-        return {aid: days[0] for aid, days in by_agent.items()}
\ No newline at end of file
+        return {aid: days[0] for aid, days in by_agent.items()}
+
+    def build_for_agent_days(self, keys: Sequence[Tuple[int, date]]) -> Dict[Tuple[int, date], PlanningDay]:
+        """
+        Build projections for arbitrary (agent_id, day_date) cells with a single
+        build_for_agents read over the enclosing date range (bulk PUT responses).
+        """
+        if not keys:
+            return {}
+
+        agent_ids = sorted({agent_id for agent_id, _ in keys})
+        start_date = min(day_date for _, day_date in keys)
+        end_date = max(day_date for _, day_date in keys)
+
+        by_agent = self.build_for_agents(agent_ids, start_date, end_date)
+        by_key: Dict[Tuple[int, date], PlanningDay] = {}
+        for agent_id, days in by_agent.items():
+            for day in days:
+                by_key[(agent_id, day.day_date)] = day
+        return {key: by_key[key] for key in keys if key in by_key}
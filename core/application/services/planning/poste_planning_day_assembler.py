@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from core.application.ports.agent_day_repo import AgentDayRepositoryPort
 from core.application.ports.agent_repo import AgentRepositoryPort
 from core.application.ports.tranche_repo import TrancheRepositoryPort
+from core.application.services.planning.tranche_catalog import TrancheCatalog
 from core.domain.entities import Agent, Tranche
 from core.domain.entities.agent_day import AgentDay
 from core.domain.enums.day_type import DayType
@@ -39,10 +40,16 @@ class PostePlanningDayAssembler:
     agent_repo: AgentRepositoryPort
     agent_day_repo: AgentDayRepositoryPort
 
-    def build_for_poste(self, poste_id: int, start_date: date, end_date: date) -> List[PostePlanningDay]:
-        # 1) Fetch tranches (sorted, stable ordering)
-        tranches = self.tranche_repo.list_by_poste_id(poste_id)
-        tranches = sorted(tranches, key=lambda t: (t.heure_debut, t.heure_fin, t.id))
+    def build_for_poste(
+        self,
+        poste_id: int,
+        start_date: date,
+        end_date: date,
+        *,
+        catalog: Optional[TrancheCatalog] = None,
+    ) -> List[PostePlanningDay]:
+        # 1) Tranches du catalogue de la requête (déjà triées : début, fin, id)
+        tranches = self._tranches(poste_id, catalog)
 
         # 2) Fetch agent_days in range
         agent_days = self.agent_day_repo.list_by_poste_and_range(
@@ -66,10 +73,15 @@ class PostePlanningDayAssembler:
             agent_days=agent_days,
         )
     
-    def build_one_for_poste(self, poste_id: int, day_date: date) -> PostePlanningDay:
-        # 1) Fetch tranches (sorted, stable ordering)
-        tranches = self.tranche_repo.list_by_poste_id(poste_id)
-        tranches = sorted(tranches, key=lambda t: (t.heure_debut, t.heure_fin, t.id))
+    def build_one_for_poste(
+        self,
+        poste_id: int,
+        day_date: date,
+        *,
+        catalog: Optional[TrancheCatalog] = None,
+    ) -> PostePlanningDay:
+        # 1) Tranches du catalogue de la requête (déjà triées : début, fin, id)
+        tranches = self._tranches(poste_id, catalog)
 
         # 2) Fetch agent_days for the single day
         agent_days = self.agent_day_repo.list_by_poste_and_day(poste_id=poste_id, day_date=day_date)
@@ -97,6 +109,9 @@ class PostePlanningDayAssembler:
         return days[0]
 
 
+    def _tranches(self, poste_id: int, catalog: Optional[TrancheCatalog]) -> List[Tranche]:
+        return (catalog or TrancheCatalog.from_repo(self.tranche_repo)).for_poste(poste_id)
+
     def _assemble_days(
         self,
         *,
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Sequence, Dict, Set
+from typing import Dict, Iterable, List, Optional, Sequence, Set
 from collections import defaultdict
 
 from core.application.ports.agent_day_repo import AgentDayRepositoryPort
 from core.application.ports.agent_day_assignment_repo import AgentDayAssignmentRepositoryPort
 from core.application.ports.tranche_repo import TrancheRepositoryPort
+from core.application.services.planning.planning_cache import PlanningVersions
+from core.application.services.planning.tranche_catalog import TrancheCatalog
 from core.domain.entities.agent_day import AgentDay
 from core.domain.entities.agent_day_assignment import AgentDayAssignment
 from core.domain.enums.day_type import DayType
@@ -27,6 +29,8 @@ class PostePlanningDayService:
     - We only manipulate AgentDay + AgentDayAssignment (no poste planning table)
     - We always enforce DayType.WORKING for impacted AgentDays (since we edit "jours travaillés")
     - Rewrite = delete all assignments on tranches of poste for that date, then insert those from payload
+    - Previously assigned agents (and empty-day cleanup) are not known here, so writes
+      invalidate every cached planning snapshot
     """
 
     def __init__(
@@ -34,10 +38,12 @@ class PostePlanningDayService:
         tranche_repo: TrancheRepositoryPort,
         agent_day_repo: AgentDayRepositoryPort,
         agent_day_assignment_repo: AgentDayAssignmentRepositoryPort,
+        planning_versions: Optional[PlanningVersions] = None,
     ) -> None:
         self.tranche_repo = tranche_repo
         self.agent_day_repo = agent_day_repo
         self.agent_day_assignment_repo = agent_day_assignment_repo
+        self.planning_versions = planning_versions
 
     def rewrite_poste_day(
         self,
@@ -45,8 +51,11 @@ class PostePlanningDayService:
         day_date: date,
         tranches_payload: Sequence[PostePlanningTrancheAgents],
         cleanup_empty_agent_days: bool = True,
+        catalog: Optional[TrancheCatalog] = None,
     ) -> None:
-        poste_tranche_ids = self.tranche_repo.list_ids_by_poste(poste_id)
+        poste_tranche_ids = (
+            catalog.ids_for_poste(poste_id) if catalog is not None else self.tranche_repo.list_ids_by_poste(poste_id)
+        )
         poste_tranche_id_set: Set[int] = set(poste_tranche_ids)
 
         payload_tranche_ids = [t.tranche_id for t in tranches_payload]
@@ -91,6 +100,8 @@ class PostePlanningDayService:
         if cleanup_empty_agent_days:
             self.agent_day_repo.delete_empty_days_by_date(day_date)
 
+        self._bump_versions(poste_id, agent_ids=by_agent.keys())
+
     def delete_poste_day(
         self,
         poste_id: int,
@@ -103,6 +114,15 @@ class PostePlanningDayService:
         if cleanup_empty_agent_days:
             self.agent_day_repo.delete_empty_days_by_date(day_date)
 
+        self._bump_versions(poste_id)
+
+    def _bump_versions(self, poste_id: int, agent_ids: Iterable[int] = ()) -> None:
+        if self.planning_versions is None:
+            return
+        self.planning_versions.bump_poste(poste_id)
+        self.planning_versions.bump_agents(agent_ids)
+        self.planning_versions.bump_all()
+
     def _get_or_create_working_day(self, agent_id: int, day_date: date) -> AgentDay:
         existing = self.agent_day_repo.get_by_agent_and_date(agent_id, day_date)
         if existing is None:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from core.application.services.planning.planning_cache import PlanningReadCache, poste_planning_key
 from core.domain.models.poste_planning import PostePlanning
 
 if TYPE_CHECKING:
     from core.application.ports.poste_repo import PosteRepositoryPort
     from core.application.services.planning.poste_planning_day_assembler import PostePlanningDayAssembler
+    from core.application.services.planning.tranche_catalog import TrancheCatalog
 
 
 class PostePlanningFactory:
@@ -15,19 +17,32 @@ class PostePlanningFactory:
         self,
         poste_repo: PosteRepositoryPort,
         planning_day_assembler: PostePlanningDayAssembler,
+        read_cache: Optional[PlanningReadCache] = None,
     ) -> None:
         self.poste_repo = poste_repo
         self.planning_day_assembler = planning_day_assembler
+        self.read_cache = read_cache
 
     def build(
         self,
         poste_id: int,
         start_date: date,
         end_date: date,
+        *,
+        catalog: Optional[TrancheCatalog] = None,
     ) -> PostePlanning:
         if start_date > end_date:
             raise ValueError("start_date must be <= end_date")
 
+        # Poste days aggregate assignments of any agent: depend on the global assignments version.
+        key = poste_planning_key(poste_id, start_date, end_date)
+        token = None
+        if self.read_cache is not None:
+            cached = self.read_cache.get(key)
+            if cached is not None:
+                return cached.value
+            token = self.read_cache.versions.token(poste_ids=[poste_id], include_assignments=True)
+
         poste = self.poste_repo.get_by_id(poste_id)
         if not poste:
             raise ValueError(f"Poste {poste_id} not found.")
@@ -36,11 +51,15 @@ class PostePlanningFactory:
             poste_id=poste_id,
             start_date=start_date,
             end_date=end_date,
+            catalog=catalog,
         )
 
-        return PostePlanning(
+        planning = PostePlanning(
             poste=poste,
             start_date=start_date,
             end_date=end_date,
             days=days,
         )
+        if self.read_cache is not None:
+            self.read_cache.put(key, planning, token=token, poste_ids=[poste_id], include_assignments=True)
+        return planning
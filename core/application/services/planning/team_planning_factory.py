@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
+from core.application.services.planning.planning_cache import PlanningReadCache, team_planning_key
 from core.domain.models.team_planning import TeamPlanning
 from core.domain.models.agent_planning import AgentPlanning
 
@@ -18,18 +19,34 @@ class TeamPlanningFactory:
         team_service: TeamService,
         agent_service: AgentService,
         planning_day_assembler: PlanningDayAssembler,
+        read_cache: Optional[PlanningReadCache] = None,
     ) -> None:
         self.team_service = team_service
         self.agent_service = agent_service
         self.planning_day_assembler = planning_day_assembler
+        self.read_cache = read_cache
 
     def build(self, team_id: int, start_date: date, end_date: date) -> TeamPlanning:
         if start_date > end_date:
             raise ValueError("start_date must be <= end_date")
 
+        key = team_planning_key(team_id, start_date, end_date)
+        if self.read_cache is not None:
+            cached = self.read_cache.get(key)
+            if cached is not None:
+                return cached.value
+            membership_token = self.read_cache.versions.token(team_ids=[team_id])
+
         team = self.team_service.get(team_id)
         agent_ids = sorted(self.team_service.list_agent_ids(team_id))
 
+        token = None
+        if self.read_cache is not None:
+            token = self.read_cache.versions.token(agent_ids=agent_ids, team_ids=[team_id])
+            if self.read_cache.versions.token(team_ids=[team_id]) != membership_token:
+                # Membership changed while listing agents: do not cache this snapshot.
+                token = None
+
         days_by_agent = self.planning_day_assembler.build_for_agents(agent_ids, start_date, end_date)
 
         agent_plannings: List[AgentPlanning] = []
@@ -40,4 +57,7 @@ class TeamPlanningFactory:
             days = days_by_agent.get(agent_id, [])
             agent_plannings.append(AgentPlanning(agent, start_date, end_date, days))
 
-        return TeamPlanning(team=team, start_date=start_date, end_date=end_date, agent_plannings=agent_plannings)
+        planning = TeamPlanning(team=team, start_date=start_date, end_date=end_date, agent_plannings=agent_plannings)
+        if self.read_cache is not None and token is not None:
+            self.read_cache.put(key, planning, token=token, agent_ids=agent_ids, team_ids=[team_id])
+        return planning
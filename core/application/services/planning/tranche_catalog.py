@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence
+
+from core.domain.entities import Tranche
+
+if TYPE_CHECKING:
+    from core.application.ports.tranche_repo import TrancheRepositoryPort
+
+
+def tranche_sort_key(tranche: Tranche):
+    return (tranche.heure_debut, tranche.heure_fin, tranche.id)
+
+
+class TrancheCatalog:
+    """
+    Catalogue des tranches, à durée de vie d'une requête (ou d'un job solver).
+
+    Les postes manquants sont chargés par lots (une requête pour N postes), les tranches
+    sont triées une seule fois (début, fin, id) puis partagées par tous les consommateurs :
+    planning poste, couverture, mapper solver.
+    """
+
+    def __init__(self, load: Callable[[List[int]], Iterable[Tranche]]):
+        self._load = load
+        self._by_poste: Dict[int, List[Tranche]] = {}
+        self._by_id: Dict[int, Tranche] = {}
+        self.loads = 0
+
+    @classmethod
+    def from_repo(cls, tranche_repo: TrancheRepositoryPort) -> "TrancheCatalog":
+        return cls(tranche_repo.list_by_poste_ids)
+
+    def preload(self, poste_ids: Iterable[int]) -> None:
+        missing = sorted({pid for pid in poste_ids if pid not in self._by_poste})
+        if not missing:
+            return
+
+        grouped: Dict[int, List[Tranche]] = {pid: [] for pid in missing}
+        for tranche in self._load(missing):
+            grouped.setdefault(tranche.poste_id, []).append(tranche)
+        self.loads += 1
+
+        for poste_id, tranches in grouped.items():
+            tranches.sort(key=tranche_sort_key)
+            self._by_poste[poste_id] = tranches
+            for tranche in tranches:
+                self._by_id[tranche.id] = tranche
+
+    def for_poste(self, poste_id: int) -> List[Tranche]:
+        self.preload((poste_id,))
+        return list(self._by_poste[poste_id])
+
+    def for_postes(self, poste_ids: Sequence[int]) -> Dict[int, List[Tranche]]:
+        self.preload(poste_ids)
+        return {pid: list(self._by_poste[pid]) for pid in dict.fromkeys(poste_ids)}
+
+    def ids_for_poste(self, poste_id: int) -> List[int]:
+        return [t.id for t in self.for_poste(poste_id)]
+
+    def get(self, tranche_id: int) -> Optional[Tranche]:
+        """Tranche déjà chargée (via un de ses postes) ; None sinon."""
+        return self._by_id.get(tranche_id)
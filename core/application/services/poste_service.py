@@ -1,17 +1,26 @@
 # core/application/services/poste_service.py
 from datetime import date
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from core.application.ports import (
     PosteRepositoryPort,
     QualificationRepositoryPort,
     TrancheRepositoryPort,
 )
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.application.read_models.poste_coverage_day_rm import PosteCoverageDayRM
+from core.application.read_models.poste_coverage_range_rm import PosteCoverageRangeRM
+from core.application.services.eligibility_cache import EligibilityCache
 from core.application.services.exceptions import NotFoundError
+from core.application.services.planning.planning_cache import PlanningVersions
+from core.application.services.planning.tranche_catalog import TrancheCatalog
 from core.domain.entities import Poste
 
 
+# Une ligne (jour, tranche) par cellule : borne la taille de la requête et du payload
+MAX_COVERAGE_RANGE_DAYS = 366
+
+
 class PosteService:
     """
     Service applicatif : coordonne les repositories et le validateur métier.
@@ -22,10 +31,14 @@ class PosteService:
         poste_repo: PosteRepositoryPort,
         qualification_repo: QualificationRepositoryPort,
         tranche_repo: TrancheRepositoryPort,
+        eligibility: Optional[EligibilityCache] = None,
+        planning_versions: Optional[PlanningVersions] = None,
     ):
         self.poste_repo = poste_repo
         self.qualification_repo = qualification_repo
         self.tranche_repo = tranche_repo
+        self.eligibility = eligibility
+        self.planning_versions = planning_versions
 
     def count(self) -> int:
         return self.poste_repo.count()
@@ -51,7 +64,10 @@ class PosteService:
         if self.tranche_repo.exists_for_poste(poste_id):
             raise ValueError("Cannot delete poste: poste is used by tranches")
 
-        return self.poste_repo.delete(poste_id)
+        deleted = self.poste_repo.delete(poste_id)
+        if deleted and self.planning_versions is not None:
+            self.planning_versions.bump_poste(poste_id)
+        return deleted
 
 
     def get_by_id(self, poste_id: int) -> Poste | None:
@@ -72,9 +88,41 @@ class PosteService:
             tranches=tranches,
         )
 
+    def get_poste_coverage_for_range(
+        self,
+        *,
+        poste_ids: List[int],
+        start_date: date,
+        end_date: date,
+    ) -> PosteCoverageRangeRM:
+        if start_date > end_date:
+            raise ValueError("start_date must be <= end_date")
+        if (end_date - start_date).days + 1 > MAX_COVERAGE_RANGE_DAYS:
+            raise ValueError(f"range must not exceed {MAX_COVERAGE_RANGE_DAYS} days")
+
+        unique_ids = list(dict.fromkeys(poste_ids))
+        if not unique_ids:
+            raise ValueError("poste_ids must not be empty")
+
+        missing = [pid for pid in unique_ids if self.poste_repo.get_by_id(pid) is None]
+        if missing:
+            raise NotFoundError(code="poste_not_found", details={"poste_ids": missing})
+
+        return self.poste_repo.get_coverage_for_range(
+            poste_ids=unique_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Poste]:
         return self.poste_repo.list(limit=limit, offset=offset)
 
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Poste]:
+        return self.poste_repo.list_keyset(limit=limit, after=after)
+
+    def count_estimate(self) -> Tuple[int, bool]:
+        return self.poste_repo.count_estimate()
+
     def list_all(self) -> List[Poste]:
         return self.poste_repo.list_all()
     
@@ -86,26 +134,48 @@ class PosteService:
         if "nom" in changes:
             poste.nom = changes["nom"]
 
-        return self.poste_repo.update(poste)
+        updated = self.poste_repo.update(poste)
+        # le nom du poste est repris dans les tranches des plannings agents et équipes
+        if self.planning_versions is not None:
+            self.planning_versions.bump_all()
+        return updated
 
     # =========================================================
     # 🔹 Chargement complet
     # =========================================================
-    def get_poste_complet(self, poste_id: int) -> Poste | None:
+    def get_poste_complet(
+        self, poste_id: int, *, catalog: Optional[TrancheCatalog] = None
+    ) -> Poste | None:
         poste = self.poste_repo.get_by_id(poste_id)
         if not poste:
             return None
 
-        return self._enrich_poste(poste)
+        return self._enrich_postes([poste], catalog=catalog)[0]
 
     def list_postes_complets(
-        self, *, limit: Optional[int] = None, offset: int = 0
+        self, *, limit: Optional[int] = None, offset: int = 0, catalog: Optional[TrancheCatalog] = None
     ) -> List[Poste]:
         postes = self.poste_repo.list(limit=limit, offset=offset)
     
-        return [self._enrich_poste(poste) for poste in postes]
+        return self._enrich_postes(postes, catalog=catalog)
     
-    def _enrich_poste(self, poste: Poste) -> Poste:
-        poste.set_tranches(self.tranche_repo.list_by_poste_id(poste.id))
-        poste.set_qualifications(self.qualification_repo.list_for_poste(poste.id))
-        return poste
\ No newline at end of file
+    def _enrich_postes(self, postes: List[Poste], *, catalog: Optional[TrancheCatalog] = None) -> List[Poste]:
+        """Enrichissement ensembliste : une requête tranches + une requête qualifications pour N postes."""
+        if not postes:
+            return postes
+
+        poste_ids = [poste.id for poste in postes]
+        tranches_by_poste = (catalog or TrancheCatalog.from_repo(self.tranche_repo)).for_postes(poste_ids)
+
+        if self.eligibility is not None:
+            eligibility = self.eligibility.get()
+            qualifications_by_poste = {pid: eligibility.qualifications_for_poste(pid) for pid in poste_ids}
+        else:
+            qualifications_by_poste = {pid: [] for pid in poste_ids}
+            for qualification in self.qualification_repo.list_for_postes(poste_ids):
+                qualifications_by_poste.setdefault(qualification.poste_id, []).append(qualification)
+
+        for poste in postes:
+            poste.set_tranches(tranches_by_poste.get(poste.id, []))
+            poste.set_qualifications(qualifications_by_poste.get(poste.id, []))
+        return postes
\ No newline at end of file
@@ -7,6 +7,8 @@ from core.application.ports import (
     PosteRepositoryPort,
     QualificationRepositoryPort,
 )
+from core.application.services.eligibility_cache import EligibilityCache
+from core.application.services.planning.planning_cache import PlanningVersions
 from core.domain.entities import Qualification
 
 class QualificationService:
@@ -22,10 +24,14 @@ class QualificationService:
         agent_repo: AgentRepositoryPort,
         poste_repo: PosteRepositoryPort,
         qualification_repo: QualificationRepositoryPort,
+        eligibility: Optional[EligibilityCache] = None,
+        planning_versions: Optional[PlanningVersions] = None,
     ):
         self.agent_repo = agent_repo
         self.poste_repo = poste_repo
         self.qualification_repo = qualification_repo
+        self.eligibility = eligibility
+        self.planning_versions = planning_versions
 
     # =========================================================
     # 🔹 Chargement
@@ -55,6 +61,7 @@ class QualificationService:
         )
 
         qualification = self.qualification_repo.create(qualification)
+        self._invalidate_caches(agent_id, poste_id)
 
         return qualification
 
@@ -63,7 +70,10 @@ class QualificationService:
         Hard delete by primary key id.
         Returns False if not found.
         """
-        return self.qualification_repo.delete_for_agent_and_poste(agent_id=agent_id, poste_id=poste_id)
+        deleted = self.qualification_repo.delete_for_agent_and_poste(agent_id=agent_id, poste_id=poste_id)
+        if deleted:
+            self._invalidate_caches(agent_id, poste_id)
+        return deleted
     
     def list_qualifications(self) -> List[Qualification]:
         """Retourne toutes les qualifications (niveau entité)."""
@@ -101,6 +111,7 @@ class QualificationService:
             q.date_qualification = date_qualification
 
         saved = self.qualification_repo.update(q)
+        self._invalidate_caches(agent_id, poste_id)
         return saved
     
     # =========================================================
@@ -136,4 +147,12 @@ class QualificationService:
     # =========================================================
     def is_qualified(self, agent_id: int, poste_id: int) -> bool:
         """Vérifie si un agent est qualifié pour un poste."""
-        return self.qualification_repo.is_qualified(agent_id, poste_id)
\ No newline at end of file
+        return self.qualification_repo.is_qualified(agent_id, poste_id)
+
+    def _invalidate_caches(self, agent_id: int, poste_id: int) -> None:
+        if self.eligibility is not None:
+            self.eligibility.invalidate()
+        # qualifications embarquées dans l'agent (get_agent_complet) et le poste des plannings
+        if self.planning_versions is not None:
+            self.planning_versions.bump_agents([agent_id])
+            self.planning_versions.bump_poste(poste_id)
\ No newline at end of file
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from core.application.ports.refresh_token_repo import RefreshTokenRepositoryPort
+
+
+@dataclass(frozen=True)
+class RefreshTokenPurgeReport:
+    expired_deleted: int
+    revoked_deleted: int
+    batches: int
+    remaining_rows: int
+    table_size_bytes: Optional[int]
+
+    @property
+    def deleted(self) -> int:
+        return self.expired_deleted + self.revoked_deleted
+
+    def format(self) -> str:
+        size = f"{self.table_size_bytes / 1024:.1f} KB" if self.table_size_bytes is not None else "n/a"
+        return (
+            f"refresh_tokens purge: {self.deleted} rows removed "
+            f"(expired={self.expired_deleted}, revoked={self.revoked_deleted}, batches={self.batches}); "
+            f"remaining={self.remaining_rows}, size={size}"
+        )
+
+
+class RefreshTokenRetentionService:
+    """
+    Purge par lots des refresh tokens devenus inutiles.
+
+    - expirés depuis plus de `expired_grace` : plus aucun usage possible
+    - révoqués depuis plus de `revoked_retention` : on les garde un temps pour que la
+      détection de réutilisation (rejeu d'un token révoqué) reste active après une rotation.
+      Avec `refresh_token_lifetime`, la rétention ne descend jamais sous la durée de vie d'un
+      token : un token révoqué reste en base jusqu'à son propre `expires_at` (puis la marge),
+      tant qu'un rejeu est possible
+
+    Chaque lot est commité séparément : verrous courts, pas de longue transaction.
+    """
+
+    def __init__(
+        self,
+        refresh_tokens: RefreshTokenRepositoryPort,
+        *,
+        revoked_retention: timedelta = timedelta(days=7),
+        refresh_token_lifetime: Optional[timedelta] = None,
+        expired_grace: timedelta = timedelta(hours=1),
+        batch_size: int = 1000,
+        max_batches: Optional[int] = None,
+    ):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        self.refresh_tokens = refresh_tokens
+        self.revoked_retention = (
+            max(revoked_retention, refresh_token_lifetime) if refresh_token_lifetime is not None else revoked_retention
+        )
+        self.expired_grace = expired_grace
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+
+    def purge(self, now: Optional[datetime] = None) -> RefreshTokenPurgeReport:
+        now = now or datetime.now(timezone.utc)
+        batches = 0
+
+        expired_deleted, n = self._drain(self.refresh_tokens.delete_expired_batch, now - self.expired_grace)
+        batches += n
+        revoked_deleted, n = self._drain(self.refresh_tokens.delete_revoked_batch, now - self.revoked_retention)
+        batches += n
+
+        return RefreshTokenPurgeReport(
+            expired_deleted=expired_deleted,
+            revoked_deleted=revoked_deleted,
+            batches=batches,
+            remaining_rows=self.refresh_tokens.count(),
+            table_size_bytes=self.refresh_tokens.table_size_bytes(),
+        )
+
+    def _drain(self, delete_batch, before: datetime) -> tuple[int, int]:
+        total = 0
+        batches = 0
+        while self.max_batches is None or batches < self.max_batches:
+            deleted = delete_batch(before, self.batch_size)
+            self.refresh_tokens.commit()
+            batches += 1
+            total += deleted
+            if deleted < self.batch_size:
+                break
+        return total, batches
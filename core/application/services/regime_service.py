@@ -1,10 +1,12 @@
 # core/application/services/regime_service.py
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.application.ports import (
     AgentRepositoryPort,
     RegimeRepositoryPort,
 )
+from core.application.services.planning.planning_cache import PlanningVersions
 from core.domain.entities import Regime
 
 
@@ -19,9 +21,11 @@ class RegimeService:
         self,
         agent_repo: AgentRepositoryPort,
         regime_repo: RegimeRepositoryPort,
+        planning_versions: Optional[PlanningVersions] = None,
     ):
         self.agent_repo = agent_repo
         self.regime_repo = regime_repo
+        self.planning_versions = planning_versions
 
     def count(self) -> int:
         return self.regime_repo.count()
@@ -109,6 +113,12 @@ class RegimeService:
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Regime]:
         return self.regime_repo.list(limit=limit, offset=offset)
 
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Regime]:
+        return self.regime_repo.list_keyset(limit=limit, after=after)
+
+    def count_estimate(self) -> Tuple[int, bool]:
+        return self.regime_repo.count_estimate()
+
     def list_all(self) -> List[Regime]:
         return self.regime_repo.list_all()
     
@@ -140,7 +150,11 @@ class RegimeService:
         if "avg_tolerance_minutes" in changes:
             regime.avg_tolerance_minutes = changes["avg_tolerance_minutes"]
 
-        return self.regime_repo.update(regime)
+        updated = self.regime_repo.update(regime)
+        # le régime est embarqué dans l'agent des plannings mis en cache
+        if self.planning_versions is not None and self.agent_repo is not None:
+            self.planning_versions.bump_agents(agent.id for agent in self.agent_repo.list_by_regime_id(regime_id))
+        return updated
 
     # =========================================================
     # 🔹 Chargement complet
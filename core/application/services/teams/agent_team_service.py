@@ -6,7 +6,9 @@ from typing import List, Optional
 from core.application.ports.agent_team_repo import AgentTeamRepositoryPort
 from core.application.ports.agent_repo import AgentRepositoryPort
 from core.application.ports.team_repo import TeamRepositoryPort
+from core.application.services.eligibility_cache import EligibilityCache
 from core.application.services.exceptions import NotFoundError
+from core.application.services.planning.planning_cache import PlanningVersions
 from core.domain.entities.team import Team
 from core.domain.entities.agent_team import AgentTeam
 
@@ -17,10 +19,14 @@ class AgentTeamService:
         agent_repo: AgentRepositoryPort,
         team_repo: TeamRepositoryPort,
         agent_team_repo: AgentTeamRepositoryPort,
+        planning_versions: Optional[PlanningVersions] = None,
+        eligibility: Optional[EligibilityCache] = None,
     ):
         self.agent_repo = agent_repo
         self.team_repo = team_repo
         self.agent_team_repo = agent_team_repo
+        self.planning_versions = planning_versions
+        self.eligibility = eligibility
 
     def create(self, *, agent_id: int, team_id: int) -> AgentTeam:
         # 1) validations existence (pour erreurs claires)
@@ -38,10 +44,21 @@ class AgentTeamService:
         agent_team = AgentTeam(agent_id=agent_id, team_id=team_id, created_at=datetime.now())
 
         # 3) création
-        return self.agent_team_repo.create(agent_team)
+        created = self.agent_team_repo.create(agent_team)
+        self._bump_team(team_id)
+        return created
     
     def delete(self, *, agent_id: int, team_id: int) -> bool:
-        return self.agent_team_repo.delete_for_agent_and_team(agent_id=agent_id, team_id=team_id)
+        deleted = self.agent_team_repo.delete_for_agent_and_team(agent_id=agent_id, team_id=team_id)
+        self._bump_team(team_id)
+        return deleted
+
+    def _bump_team(self, team_id: int) -> None:
+        # la composition de l'équipe change le planning d'équipe mis en cache
+        if self.planning_versions is not None:
+            self.planning_versions.bump_team(team_id)
+        if self.eligibility is not None:
+            self.eligibility.invalidate()
 
     def search(self, agent_id: Optional[int] = None, team_id: Optional[int] = None) -> List[AgentTeam]:
         """
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.application.ports.team_repo import TeamRepositoryPort
+from core.application.services.eligibility_cache import EligibilityCache
 from core.application.services.exceptions import ConflictError, NotFoundError
+from core.application.services.planning.planning_cache import PlanningVersions
 from core.domain.entities.team import Team
 
 
 class TeamService:
-    def __init__(self, repo: TeamRepositoryPort):
+    def __init__(
+        self,
+        repo: TeamRepositoryPort,
+        eligibility: Optional[EligibilityCache] = None,
+        planning_versions: Optional[PlanningVersions] = None,
+    ):
         self.repo = repo
+        self.eligibility = eligibility
+        self.planning_versions = planning_versions
 
     def count(self) -> int:
         return self.repo.count()
 
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Team]:
         return self.repo.list(limit=limit, offset=offset)
+
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Team]:
+        return self.repo.list_keyset(limit=limit, after=after)
+
+    def count_estimate(self) -> Tuple[int, bool]:
+        return self.repo.count_estimate()
     
     def list_agent_ids(self, team_id: int) -> List[int]:
         self.get(team_id)
@@ -90,8 +106,16 @@ class TeamService:
         if not saved:
             raise NotFoundError(code="team_not_found", details={"team_id": team_id})
 
+        # nom/description de l'équipe embarqués dans le planning d'équipe mis en cache
+        if self.planning_versions is not None:
+            self.planning_versions.bump_team(team_id)
         return saved
 
     def delete(self, team_id: int) -> None:
         # delete(id) retourne bool
         self.repo.delete(team_id)
+        # agent_teams supprimés en cascade
+        if self.eligibility is not None:
+            self.eligibility.invalidate()
+        if self.planning_versions is not None:
+            self.planning_versions.bump_team(team_id)
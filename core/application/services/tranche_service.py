@@ -1,12 +1,14 @@
 # core/application/services/tranche_service.py
 from datetime import time
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.application.ports import (
     PosteRepositoryPort,
     TrancheRepositoryPort,
     AgentDayAssignmentRepositoryPort,
 )
+from core.application.services.planning.planning_cache import PlanningVersions
 from core.domain.entities import Tranche
 
 
@@ -22,10 +24,12 @@ class TrancheService:
         poste_repo: PosteRepositoryPort,
         tranche_repo: TrancheRepositoryPort,
         agent_day_assignment_repo: AgentDayAssignmentRepositoryPort,
+        planning_versions: Optional[PlanningVersions] = None,
     ):
         self.poste_repo = poste_repo
         self.tranche_repo = tranche_repo
         self.agent_day_assignment_repo = agent_day_assignment_repo
+        self.planning_versions = planning_versions
 
     def count(self) -> int:
         return self.tranche_repo.count()
@@ -44,7 +48,9 @@ class TrancheService:
             poste_id=poste_id,
             color=color
         )
-        return self.tranche_repo.create(tranche)
+        created = self.tranche_repo.create(tranche)
+        self._bump_planning()
+        return created
 
     def delete(self, tranche_id: int) -> bool:
         tranche = self.tranche_repo.get_by_id(tranche_id)
@@ -54,7 +60,10 @@ class TrancheService:
         if self.agent_day_assignment_repo.exists_for_tranche(tranche_id):
             raise ValueError("Cannot delete tranche: tranche is used in agent_day_assignments")
 
-        return self.tranche_repo.delete(tranche_id)
+        deleted = self.tranche_repo.delete(tranche_id)
+        if deleted:
+            self._bump_planning()
+        return deleted
 
     def get_by_id(self, tranche_id: int) -> Tranche | None:
         return self.tranche_repo.get_by_id(tranche_id)
@@ -62,6 +71,12 @@ class TrancheService:
     def list(self, *, limit: Optional[int] = None, offset: int = 0) -> List[Tranche]:
         return self.tranche_repo.list(limit=limit, offset=offset)
 
+    def list_keyset(self, *, limit: int, after: Optional[Sequence[Any]] = None) -> KeysetPage[Tranche]:
+        return self.tranche_repo.list_keyset(limit=limit, after=after)
+
+    def count_estimate(self) -> Tuple[int, bool]:
+        return self.tranche_repo.count_estimate()
+
     def list_all(self) -> List[Tranche]:
         return self.tranche_repo.list_all()
     
@@ -90,7 +105,14 @@ class TrancheService:
         if "color" in changes:
             tranche.color = changes["color"]
 
-        return self.tranche_repo.update(tranche)
+        updated = self.tranche_repo.update(tranche)
+        self._bump_planning()
+        return updated
+
+    def _bump_planning(self) -> None:
+        # nom/horaires de tranche embarqués dans tous les plannings (agents concernés inconnus ici)
+        if self.planning_versions is not None:
+            self.planning_versions.bump_all()
 
 
     # =========================================================
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from db.models import User
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    id: int
+    username: str
+    role: str
+    is_active: bool
+    token_version: int
+
+    @classmethod
+    def from_model(cls, user: User) -> "CachedUser":
+        return cls(
+            id=user.id,
+            username=user.username,
+            role=user.role,
+            is_active=bool(user.is_active),
+            token_version=int(user.token_version or 0),
+        )
+
+    def to_model(self) -> User:
+        """User détaché (non lié à une session) : lecture seule pour les dépendances d'auth."""
+        return User(
+            id=self.id,
+            username=self.username,
+            password_hash="",
+            role=self.role,
+            is_active=self.is_active,
+            token_version=self.token_version,
+        )
+
+
+class UserAuthCache:
+    """
+    Cache TTL en mémoire (id -> état d'authentification de l'utilisateur).
+
+    Le chemin chaud de l'authentification (décodage JWT + contrôle actif/rôle/token_version)
+    se fait sans requête SQL tant que l'entrée est fraîche. Les écritures sur l'utilisateur
+    dans ce processus invalident explicitement ; le TTL borne la fenêtre d'incohérence
+    pour les écritures faites par un autre processus.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 4096,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[int, tuple[float, CachedUser]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[CachedUser]:
+        if not self.enabled:
+            return None
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user: CachedUser) -> None:
+        if not self.enabled:
+            return
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            if user.id not in self._entries and len(self._entries) >= self.max_entries:
+                self._evict_expired_or_oldest()
+            self._entries[user.id] = (expires_at, user)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict_expired_or_oldest(self) -> None:
+        now = self._clock()
+        expired = [user_id for user_id, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for user_id in expired:
+            del self._entries[user_id]
+        if len(self._entries) >= self.max_entries:
+            oldest = min(self._entries, key=lambda user_id: self._entries[user_id][0])
+            del self._entries[oldest]
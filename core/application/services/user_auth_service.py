@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from backend.app.security.jwt import decode_access_token
 from core.application.ports.user_repo import UserRepositoryPort
+from core.application.services.user_auth_cache import CachedUser, UserAuthCache
 from db.models import User
 
 
@@ -10,8 +13,9 @@ class UserAuthError(Exception):
 
 
 class UserAuthService:
-    def __init__(self, users: UserRepositoryPort):
+    def __init__(self, users: UserRepositoryPort, cache: Optional[UserAuthCache] = None):
         self.users = users
+        self.cache = cache
 
     def get_current_user(self, access_token: str) -> User:
         try:
@@ -22,9 +26,38 @@ class UserAuthService:
         sub = payload.get("sub")
         if not sub or not str(sub).isdigit():
             raise UserAuthError("Invalid token payload")
+        user_id = int(sub)
+
+        token_version = payload.get("tv", 0)
+        if not isinstance(token_version, int):
+            raise UserAuthError("Invalid token payload")
+
+        if self.cache is None:
+            user = self.users.get_by_id(user_id)
+            if not user or not user.is_active:
+                raise UserAuthError("User not found or inactive")
+            if token_version != (user.token_version or 0):
+                raise UserAuthError("Token revoked")
+            return user
+
+        cached = self.cache.get(user_id)
+        # Jeton plus récent que l'entrée : le cache est en retard (révocation faite ailleurs)
+        if cached is None or token_version > cached.token_version:
+            cached = self._load(user_id)
+
+        if not cached.is_active:
+            raise UserAuthError("User not found or inactive")
+        if token_version != cached.token_version:
+            raise UserAuthError("Token revoked")
+
+        return cached.to_model()
 
-        user = self.users.get_by_id(int(sub))
-        if not user or not user.is_active:
+    def _load(self, user_id: int) -> CachedUser:
+        user = self.users.get_by_id(user_id)
+        if not user:
+            self.cache.invalidate(user_id)
             raise UserAuthError("User not found or inactive")
 
-        return user
+        cached = CachedUser.from_model(user)
+        self.cache.put(cached)
+        return cached
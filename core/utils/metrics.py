@@ -0,0 +1,226 @@
+import hashlib
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, Tuple
+
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Buckets (secondes) adaptés aux requêtes SQL et routes HTTP.
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Buckets (secondes) adaptés aux phases du solveur.
+SOLVER_BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+# Buckets (itérations/seconde) pour le débit LNS.
+RATE_BUCKETS: Tuple[float, ...] = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    Registre minimal de métriques au format texte Prometheus.
+    - Histogrammes à buckets fixes (coût d'une observation : un bisect + un lock)
+    - Compteurs monotones
+    - Aucune dépendance externe, pensé pour rester actif en production
+    """
+
+    def __init__(self, enabled: bool = True, namespace: str = "palaj"):
+        self.enabled = enabled
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._help: Dict[str, str] = {}
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+
+    # --------------------------------------------------
+    def register_histogram(self, name: str, help_text: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Déclare un histogramme (idempotent)."""
+        with self._lock:
+            self._help.setdefault(name, help_text)
+            self._buckets.setdefault(name, tuple(sorted(buckets)))
+            self._histograms.setdefault(name, {})
+
+    def register_counter(self, name: str, help_text: str) -> None:
+        """Déclare un compteur (idempotent)."""
+        with self._lock:
+            self._help.setdefault(name, help_text)
+            self._counters.setdefault(name, {})
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Incrémente le compteur `name`."""
+        if not self.enabled:
+            return
+        key: LabelKey = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._counters.get(name)
+            if series is None:
+                self._help.setdefault(name, name)
+                series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + float(amount)
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Enregistre une observation dans l'histogramme `name`."""
+        if not self.enabled:
+            return
+        key: LabelKey = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._histograms.get(name)
+            if series is None:
+                self._help.setdefault(name, name)
+                self._buckets.setdefault(name, LATENCY_BUCKETS)
+                series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self._buckets[name])
+            histogram.observe(float(value))
+
+    @contextmanager
+    def time(self, name: str, **labels: str) -> Iterator[None]:
+        """Context manager mesurant la durée du bloc."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    # --------------------------------------------------
+    def render(self) -> str:
+        """Retourne l'exposition texte Prometheus (format 0.0.4)."""
+        lines: list[str] = []
+        with self._lock:
+            for name in sorted(self._histograms):
+                full_name = f"{self.namespace}_{name}"
+                lines.append(f"# HELP {full_name} {_escape_help(self._help.get(name, name))}")
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{full_name}_bucket{_format_labels(key, le=_format_float(bound))} {cumulative}")
+                    lines.append(f"{full_name}_bucket{_format_labels(key, le='+Inf')} {histogram.count}")
+                    lines.append(f"{full_name}_sum{_format_labels(key)} {_format_float(histogram.sum)}")
+                    lines.append(f"{full_name}_count{_format_labels(key)} {histogram.count}")
+            for name in sorted(self._counters):
+                full_name = f"{self.namespace}_{name}"
+                lines.append(f"# HELP {full_name} {_escape_help(self._help.get(name, name))}")
+                lines.append(f"# TYPE {full_name} counter")
+                # Un compteur jamais incrémenté est exposé à 0
+                for key, value in sorted(self._counters[name].items()) or [((), 0.0)]:
+                    lines.append(f"{full_name}{_format_labels(key)} {_format_float(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    # --------------------------------------------------
+    def reset(self) -> None:
+        """Réinitialise les observations (les déclarations sont conservées)."""
+        with self._lock:
+            for name in self._histograms:
+                self._histograms[name] = {}
+            for name in self._counters:
+                self._counters[name] = {}
+
+
+_SQL_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_SQL_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SQL_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:\?|%\(\w+\)s|:\w+|__\[POSTCOMPILE_\w+\])\s*,?)+\)", re.IGNORECASE)
+_SQL_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql_statement(statement: str) -> str:
+    """
+    Normalise une requête SQL pour servir de label à faible cardinalité :
+    littéraux remplacés par `?`, listes IN compactées, espaces réduits.
+    """
+    normalized = _SQL_STRING_LITERAL.sub("?", statement)
+    normalized = _SQL_NUMBER_LITERAL.sub("?", normalized)
+    normalized = _SQL_IN_LIST.sub("IN (...)", normalized)
+    return _SQL_WHITESPACE.sub(" ", normalized).strip()
+
+
+@lru_cache(maxsize=2048)
+def sql_statement_labels(statement: str, max_length: int = 160) -> Dict[str, str]:
+    """
+    Labels d'une requête : `statement_id` (hash court du texte normalisé complet) identifie
+    la série ; `statement` (texte tronqué) ne sert que de description lisible.
+    Deux SELECT au même préfixe de 160 caractères restent ainsi deux séries distinctes.
+    """
+    normalized = normalize_sql_statement(statement)
+    return {
+        "statement_id": hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12],
+        "statement": normalized[:max_length],
+    }
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+def _format_labels(key: LabelKey, **extra: str) -> str:
+    pairs = list(key) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label_value(v)}"' for k, v in pairs) + "}"
+
+
+def render_profiler_stats(stats: Dict[str, Dict[str, float]], namespace: str = "palaj") -> str:
+    """Expose les cumuls du `Profiler` (appels et durée totale par fonction)."""
+    if not stats:
+        return ""
+    calls_name = f"{namespace}_profiled_function_calls_total"
+    seconds_name = f"{namespace}_profiled_function_seconds_total"
+    lines = [
+        f"# HELP {calls_name} Calls recorded by core.utils.profiler.",
+        f"# TYPE {calls_name} counter",
+    ]
+    for label, values in sorted(stats.items()):
+        lines.append(f"{calls_name}{_format_labels((('function', label),))} {int(values['calls'])}")
+    lines += [
+        f"# HELP {seconds_name} Cumulated time recorded by core.utils.profiler.",
+        f"# TYPE {seconds_name} counter",
+    ]
+    for label, values in sorted(stats.items()):
+        lines.append(f"{seconds_name}{_format_labels((('function', label),))} {_format_float(values['total_time'])}")
+    return "\n".join(lines) + "\n"
+
+
+# Instance globale réutilisable dans tout le projet
+metrics = MetricsRegistry(enabled=True)
+
+metrics.register_histogram("sql_statement_duration_seconds", "SQL statement latency by normalized statement.")
+metrics.register_histogram("http_request_duration_seconds", "HTTP request latency by route template.")
+metrics.register_histogram("solver_phase_duration_seconds", "Solver stage wall time by phase.", SOLVER_BUCKETS)
+metrics.register_histogram("solver_lns_iterations_per_second", "LNS iterations per second of LNS wall time.", RATE_BUCKETS)
+metrics.register_histogram("planning_draft_persist_duration_seconds", "Time to persist a solver output as draft rows.")
+metrics.register_histogram("planning_draft_accept_duration_seconds", "Time to accept a planning draft.")
+metrics.register_counter(
+    "planning_generate_deduplicated_total", "Generation requests attached to an identical in-flight job."
+)
+
@@ -0,0 +1,510 @@
+# db/backup.py
+"""
+Sauvegarde / restauration à chaud de la base.
+
+- SQLite : API de backup en ligne (`sqlite3.Connection.backup`) par pas de `pages` pages,
+  l'API continue d'écrire pendant la copie.
+- Postgres : export logique `COPY ... TO STDOUT` compressé en gzip, une table par worker,
+  toutes les connexions partageant le même snapshot (cohérence inter-tables, comme pg_dump -j).
+
+Chaque sauvegarde est un dossier `<root>/<YYYYmmdd_HHMMSS>_<dialect>/` contenant les
+fichiers et un `manifest.json` (checksums, nombre de lignes, révision alembic). Le dossier
+est écrit sous un nom `.partial` puis renommé : une sauvegarde interrompue n'est jamais listée.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import shutil
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from db.base import Base
+
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+SQLITE_FILE = "database.db"
+_CHUNK = 1024 * 1024
+_TS_FORMAT = "%Y%m%d_%H%M%S"
+
+
+class BackupError(RuntimeError):
+    pass
+
+
+@dataclass
+class BackupManifest:
+    created_at: datetime
+    dialect: str
+    alembic_revision: Optional[str]
+    rows: Dict[str, int]
+    files: Dict[str, str]  # nom de fichier -> sha256
+    format_version: int = FORMAT_VERSION
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        return json.dumps(data, indent=2, sort_keys=True)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "BackupManifest":
+        data = json.loads(raw)
+        if data.get("format_version") != FORMAT_VERSION:
+            raise BackupError(f"Unsupported backup format: {data.get('format_version')}")
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        return cls(**data)
+
+
+@dataclass
+class BackupReport:
+    path: Path
+    manifest: BackupManifest
+    bytes_written: int
+    duration_seconds: float
+
+    @property
+    def rows(self) -> int:
+        return sum(self.manifest.rows.values())
+
+    def format(self) -> str:
+        return (
+            f"backup {self.path.name}: {len(self.manifest.rows)} tables, {self.rows} rows, "
+            f"{self.bytes_written / 1024:.1f} KB in {self.duration_seconds:.2f}s "
+            f"({_rate(self.bytes_written, self.duration_seconds)}, "
+            f"{self.rows / max(self.duration_seconds, 1e-9):.0f} rows/s)"
+        )
+
+
+@dataclass
+class RestoreReport:
+    path: Path
+    rows: Dict[str, int]
+    bytes_read: int
+    duration_seconds: float
+
+    def format(self) -> str:
+        return (
+            f"restore {self.path.name}: {len(self.rows)} tables, {sum(self.rows.values())} rows verified "
+            f"in {self.duration_seconds:.2f}s ({_rate(self.bytes_read, self.duration_seconds)})"
+        )
+
+
+@dataclass
+class BackupEntry:
+    path: Path
+    manifest: BackupManifest
+    size_bytes: int = 0
+
+
+def _rate(n_bytes: int, seconds: float) -> str:
+    return f"{n_bytes / 1024 / 1024 / max(seconds, 1e-9):.1f} MB/s"
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _HashingWriter:
+    """Calcule sha256 + taille à la volée, sans relire le fichier écrit."""
+
+    def __init__(self, fh):
+        self._fh = fh
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.digest.update(data)
+        self.size += len(data)
+        return self._fh.write(data)
+
+    def flush(self) -> None:
+        self._fh.flush()
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# ---------------------------------------------------------
+# Sauvegarde
+# ---------------------------------------------------------
+
+def create_backup(
+    database,
+    root: str | Path,
+    *,
+    workers: int = 4,
+    pages: int = 256,
+    tables: Optional[Sequence[str]] = None,
+    now: Optional[datetime] = None,
+) -> BackupReport:
+    """
+    Sauvegarde à chaud de `database` dans un nouveau dossier de `root`.
+
+    `pages` : pages SQLite copiées par pas (le verrou en lecture est relâché entre deux pas).
+    `workers` / `tables` : parallélisme et périmètre de l'export Postgres.
+    """
+    now = now or _utcnow()
+    dialect = database.engine.dialect.name
+    root = Path(root)
+    final = root / f"{now.strftime(_TS_FORMAT)}_{dialect}"
+    if final.exists():
+        raise BackupError(f"Backup already exists: {final}")
+    partial = final.with_name(final.name + ".partial")
+    shutil.rmtree(partial, ignore_errors=True)
+    partial.mkdir(parents=True)
+
+    started = time.perf_counter()
+    try:
+        if dialect == "sqlite":
+            rows, files = _sqlite_backup(database, partial, pages=pages)
+        elif dialect == "postgresql":
+            rows, files = _pg_backup(database, partial, workers=workers, tables=tables)
+        else:
+            raise BackupError(f"Unsupported dialect: {dialect}")
+
+        manifest = BackupManifest(
+            created_at=now,
+            dialect=dialect,
+            alembic_revision=_alembic_revision(database),
+            rows=rows,
+            files=files,
+        )
+        (partial / MANIFEST_NAME).write_text(manifest.to_json(), encoding="utf-8")
+        partial.rename(final)
+    except BaseException:
+        shutil.rmtree(partial, ignore_errors=True)
+        raise
+
+    bytes_written = sum((final / name).stat().st_size for name in files)
+    return BackupReport(
+        path=final,
+        manifest=manifest,
+        bytes_written=bytes_written,
+        duration_seconds=time.perf_counter() - started,
+    )
+
+
+def _sqlite_backup(database, directory: Path, *, pages: int) -> Tuple[Dict[str, int], Dict[str, str]]:
+    target = directory / SQLITE_FILE
+    raw = database.engine.raw_connection()
+    try:
+        dst = sqlite3.connect(target)
+        try:
+            raw.driver_connection.backup(dst, pages=pages)
+            _sqlite_integrity_check(dst)
+            rows = _sqlite_row_counts(dst)
+        finally:
+            dst.close()
+    finally:
+        raw.close()
+    return rows, {SQLITE_FILE: _sha256(target)}
+
+
+def _pg_backup(
+    database, directory: Path, *, workers: int, tables: Optional[Sequence[str]]
+) -> Tuple[Dict[str, int], Dict[str, str]]:
+    names = _pg_tables(tables)
+    engine = database.engine
+
+    # Connexion "coordinatrice" : exporte un snapshot et le garde ouvert pendant tout l'export
+    holder = engine.raw_connection()
+    conn = holder.driver_connection
+    conn.autocommit = True
+    try:
+        conn.execute("BEGIN ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        snapshot = conn.execute("SELECT pg_export_snapshot()").fetchone()[0]
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="pg-backup") as pool:
+            results = list(pool.map(lambda t: _pg_dump_table(engine, snapshot, t, directory), names))
+    finally:
+        conn.execute("ROLLBACK")
+        conn.autocommit = False
+        holder.close()
+
+    rows = {name: n for name, n, _ in results}
+    files = {f"{name}.csv.gz": digest for name, _, digest in results}
+    return rows, files
+
+
+def _pg_dump_table(engine, snapshot: str, table: str, directory: Path) -> Tuple[str, int, str]:
+    from psycopg import sql
+
+    raw = engine.raw_connection()
+    conn = raw.driver_connection
+    conn.autocommit = True
+    try:
+        conn.execute("BEGIN ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        conn.execute(sql.SQL("SET TRANSACTION SNAPSHOT {}").format(sql.Literal(snapshot)))
+        copy_sql = sql.SQL("COPY {} TO STDOUT WITH (FORMAT csv, HEADER true)").format(sql.Identifier(table))
+
+        with open(directory / f"{table}.csv.gz", "wb") as fh:
+            writer = _HashingWriter(fh)
+            with gzip.GzipFile(fileobj=writer, mode="wb", compresslevel=6) as gz, conn.cursor() as cur:
+                with cur.copy(copy_sql) as copy:
+                    for chunk in copy:
+                        gz.write(chunk)
+                rowcount = cur.rowcount
+        return table, rowcount, writer.digest.hexdigest()
+    finally:
+        conn.execute("ROLLBACK")
+        conn.autocommit = False
+        raw.close()
+
+
+def _pg_tables(tables: Optional[Sequence[str]]) -> List[str]:
+    # Ordre des dépendances FK : la restauration recharge les parents avant les enfants
+    import db.models  # noqa: F401  (peuple Base.metadata)
+
+    ordered = [t.name for t in Base.metadata.sorted_tables]
+    if tables is None:
+        return ordered
+    unknown = set(tables) - set(ordered)
+    if unknown:
+        raise BackupError(f"Unknown tables: {', '.join(sorted(unknown))}")
+    return [t for t in ordered if t in set(tables)]
+
+
+def _pg_missing_dependents(tables: Sequence[str]) -> Dict[str, List[str]]:
+    """Tables hors de `tables` qui référencent (FK) une table de `tables` : table -> dépendantes manquantes."""
+    import db.models  # noqa: F401  (peuple Base.metadata)
+
+    selected = set(tables)
+    missing: Dict[str, set] = {}
+    for table in Base.metadata.sorted_tables:
+        if table.name in selected:
+            continue
+        for fk in table.foreign_keys:
+            if fk.column.table.name in selected:
+                missing.setdefault(fk.column.table.name, set()).add(table.name)
+    return {name: sorted(dependents) for name, dependents in sorted(missing.items())}
+
+
+def _alembic_revision(database) -> Optional[str]:
+    raw = database.engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        try:
+            cur.execute("SELECT version_num FROM alembic_version")
+            row = cur.fetchone()
+            return row[0] if row else None
+        except Exception:
+            raw.rollback()
+            return None
+        finally:
+            cur.close()
+    finally:
+        raw.close()
+
+
+# ---------------------------------------------------------
+# Vérification / restauration
+# ---------------------------------------------------------
+
+def verify_backup(path: str | Path) -> BackupManifest:
+    """Relit le manifest et contrôle les checksums (et l'intégrité SQLite)."""
+    path = Path(path)
+    manifest_path = path / MANIFEST_NAME
+    if not manifest_path.exists():
+        raise BackupError(f"Missing manifest: {manifest_path}")
+    manifest = BackupManifest.from_json(manifest_path.read_text(encoding="utf-8"))
+
+    for name, expected in manifest.files.items():
+        file = path / name
+        if not file.exists():
+            raise BackupError(f"Missing backup file: {file}")
+        if _sha256(file) != expected:
+            raise BackupError(f"Checksum mismatch: {file}")
+
+    if manifest.dialect == "sqlite":
+        conn = sqlite3.connect(f"file:{path / SQLITE_FILE}?mode=ro", uri=True)
+        try:
+            _sqlite_integrity_check(conn)
+        finally:
+            conn.close()
+    return manifest
+
+
+def restore_backup(database, path: str | Path, *, allow_revision_mismatch: bool = False) -> RestoreReport:
+    """
+    Restaure une sauvegarde vérifiée dans `database`, puis contrôle le nombre de lignes
+    de chaque table contre le manifest.
+
+    Postgres : tout se fait dans une transaction (TRUNCATE + COPY FROM), annulée au moindre écart.
+    """
+    path = Path(path)
+    manifest = verify_backup(path)
+    dialect = database.engine.dialect.name
+    if manifest.dialect != dialect:
+        raise BackupError(f"Backup is {manifest.dialect}, target is {dialect}")
+
+    started = time.perf_counter()
+    if dialect == "sqlite":
+        rows = _sqlite_restore(database, path, manifest)
+    else:
+        current = _alembic_revision(database)
+        if current != manifest.alembic_revision and not allow_revision_mismatch:
+            raise BackupError(
+                f"Schema revision mismatch (backup={manifest.alembic_revision}, target={current}); "
+                "run the matching alembic migration first"
+            )
+        rows = _pg_restore(database, path, manifest)
+
+    return RestoreReport(
+        path=path,
+        rows=rows,
+        bytes_read=sum((path / name).stat().st_size for name in manifest.files),
+        duration_seconds=time.perf_counter() - started,
+    )
+
+
+def _sqlite_restore(database, path: Path, manifest: BackupManifest) -> Dict[str, int]:
+    src = sqlite3.connect(f"file:{path / SQLITE_FILE}?mode=ro", uri=True)
+    raw = database.engine.raw_connection()
+    try:
+        target = raw.driver_connection
+        src.backup(target)
+        _sqlite_integrity_check(target)
+        rows = _sqlite_row_counts(target)
+    finally:
+        raw.close()
+        src.close()
+    # Les autres connexions du pool peuvent avoir un cache de schéma obsolète
+    database.engine.dispose()
+    _check_rows(manifest.rows, rows)
+    return rows
+
+
+def _pg_restore(database, path: Path, manifest: BackupManifest) -> Dict[str, int]:
+    from psycopg import sql
+
+    names = [t for t in _pg_tables(None) if t in manifest.rows]
+    # Sauvegarde partielle (create_backup(tables=...)) : vider une table parente effacerait
+    # aussi des enfants absents de la sauvegarde, que _check_rows ne contrôle pas
+    missing = _pg_missing_dependents(names)
+    if missing:
+        details = "; ".join(f"{name} <- {', '.join(dependents)}" for name, dependents in missing.items())
+        raise BackupError(f"Partial backup cannot be restored: dependent tables not in backup ({details})")
+    raw = database.engine.raw_connection()
+    conn = raw.driver_connection
+    try:
+        with conn.cursor() as cur:
+            # Sans CASCADE : Postgres refuse plutôt que de vider une table absente de la sauvegarde
+            cur.execute(
+                sql.SQL("TRUNCATE {} RESTART IDENTITY").format(
+                    sql.SQL(", ").join(sql.Identifier(n) for n in names)
+                )
+            )
+            rows: Dict[str, int] = {}
+            for name in names:
+                copy_sql = sql.SQL("COPY {} FROM STDIN WITH (FORMAT csv, HEADER true)").format(sql.Identifier(name))
+                with gzip.open(path / f"{name}.csv.gz", "rb") as gz, cur.copy(copy_sql) as copy:
+                    for chunk in iter(lambda: gz.read(_CHUNK), b""):
+                        copy.write(chunk)
+                cur.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(name)))
+                rows[name] = cur.fetchone()[0]
+
+                # Les séquences repartent après le plus grand id restauré
+                cur.execute("SELECT pg_get_serial_sequence(%s, 'id')", (name,))
+                seq = cur.fetchone()
+                if seq and seq[0]:
+                    cur.execute(
+                        sql.SQL("SELECT setval(%s, COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {}").format(
+                            sql.Identifier(name)
+                        ),
+                        (seq[0],),
+                    )
+            _check_rows(manifest.rows, rows)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        raw.close()
+    return rows
+
+
+def _check_rows(expected: Dict[str, int], actual: Dict[str, int]) -> None:
+    diff = {t: (n, actual.get(t)) for t, n in expected.items() if actual.get(t) != n}
+    if diff:
+        details = ", ".join(f"{t}: expected {e}, got {a}" for t, (e, a) in sorted(diff.items()))
+        raise BackupError(f"Restore verification failed ({details})")
+
+
+def _sqlite_integrity_check(conn: sqlite3.Connection) -> None:
+    result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+    if result != "ok":
+        raise BackupError(f"SQLite integrity_check failed: {result}")
+
+
+def _sqlite_row_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    names = [
+        r[0]
+        for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")
+    ]
+    return {name: conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0] for name in names}
+
+
+# ---------------------------------------------------------
+# Inventaire / rétention
+# ---------------------------------------------------------
+
+def list_backups(root: str | Path) -> List[BackupEntry]:
+    """Sauvegardes complètes de `root`, de la plus ancienne à la plus récente."""
+    root = Path(root)
+    if not root.exists():
+        return []
+    entries = []
+    for directory in root.iterdir():
+        manifest_path = directory / MANIFEST_NAME
+        if not directory.is_dir() or directory.name.endswith(".partial") or not manifest_path.exists():
+            continue
+        try:
+            manifest = BackupManifest.from_json(manifest_path.read_text(encoding="utf-8"))
+        except (BackupError, ValueError, TypeError, KeyError):
+            continue
+        size = sum(f.stat().st_size for f in directory.iterdir() if f.is_file())
+        entries.append(BackupEntry(path=directory, manifest=manifest, size_bytes=size))
+    return sorted(entries, key=lambda e: e.manifest.created_at)
+
+
+def find_backup(root: str | Path, at: datetime) -> Optional[BackupEntry]:
+    """Dernière sauvegarde prise au plus tard à `at` (restauration à une date donnée)."""
+    candidates = [e for e in list_backups(root) if e.manifest.created_at <= at]
+    return candidates[-1] if candidates else None
+
+
+def prune_backups(
+    root: str | Path,
+    *,
+    keep_last: int = 7,
+    max_age: Optional[timedelta] = None,
+    now: Optional[datetime] = None,
+    on_remove: Optional[Callable[[BackupEntry], None]] = None,
+) -> List[BackupEntry]:
+    """
+    Supprime les sauvegardes au-delà des `keep_last` plus récentes. Avec `max_age`, celles
+    plus jeunes que `max_age` sont aussi conservées : `keep_last` est un plancher.
+    """
+    if keep_last < 1:
+        raise ValueError("keep_last must be >= 1")
+    now = now or _utcnow()
+    removed = []
+    for entry in list_backups(root)[:-keep_last]:
+        if max_age is not None and entry.manifest.created_at >= now - max_age:
+            continue
+        shutil.rmtree(entry.path)
+        removed.append(entry)
+        if on_remove:
+            on_remove(entry)
+    return removed
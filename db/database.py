@@ -9,6 +9,7 @@ from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 
+from core.utils.metrics import metrics, sql_statement_labels
 from db.base import Base
 
 
@@ -99,5 +100,11 @@ class Database:
             self.stats["queries"] += 1
             self.stats["last_query_time"] = total
             self.stats["time_total"] += total
+            if metrics.enabled:
+                metrics.observe(
+                    "sql_statement_duration_seconds",
+                    total,
+                    **sql_statement_labels(statement),
+                )
             if self.debug:
                 print(f"[SQL] {total*1000:.2f} ms | {statement.strip()[:80]}")
\ No newline at end of file
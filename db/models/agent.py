@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 
 class Agent(Base):
     __tablename__ = "agents"
+    __table_args__ = (
+        # Pagination keyset de la liste des agents : même ordre que AgentRepository._default_order_by
+        Index("ix_agents_nom_prenom_id", "nom", "prenom", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     actif: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
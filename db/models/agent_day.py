@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import List, Optional, TYPE_CHECKING
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, String, Text, UniqueConstraint, func
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -15,6 +15,8 @@ class AgentDay(Base):
     __tablename__ = "agent_days"
     __table_args__ = (
         UniqueConstraint("agent_id", "day_date", name="uq_agent_days_agent_date"),
+        # Lectures par période tous agents confondus (poste, couverture) : la date en tête
+        Index("ix_agent_days_day_date_agent", "day_date", "agent_id", postgresql_include=["id"]),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing  import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -15,6 +15,8 @@ class AgentDayAssignment(Base):
     __tablename__ = "agent_day_assignments"
     __table_args__ = (
         UniqueConstraint("agent_day_id", "tranche_id", name="uq_agent_day_assignments_day_tranche"),
+        # Lectures par tranche -> poste : couvrant pour la jointure vers agent_days
+        Index("ix_agent_day_assignments_tranche_day", "tranche_id", "agent_day_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
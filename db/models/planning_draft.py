@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Any, Optional
 
-from sqlalchemy import JSON, Date, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import JSON, Date, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from core.domain.enums.planning_draft_status import PlanningDraftStatus
@@ -28,6 +28,17 @@ class PlanningDraft(Base):
     solver_options: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # Alternatives d'un même job : drafts frères rattachés au draft principal (rang >= 1)
+    parent_draft_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("planning_drafts.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+    alternative_rank: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # Déduplication des demandes identiques pendant que le job est en file ou en cours
+    request_fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    idempotency_key: Mapped[Optional[str]] = mapped_column(String(128), nullable=True, unique=True)
+    dedup_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
     accepted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     rejected_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
@@ -38,3 +49,15 @@ class PlanningDraft(Base):
     def validate_status(self, key: str, value: str) -> str:
         _ = key
         return PlanningDraftStatus(value).value
+
+
+# Un seul job principal en file/en cours par empreinte : deux demandes simultanées ne
+# peuvent pas toutes deux insérer (la seconde échoue puis se rattache à la première)
+_INFLIGHT_PRIMARY = "parent_draft_id IS NULL AND status IN ('queued', 'running')"
+Index(
+    "uq_planning_drafts_inflight_fingerprint",
+    PlanningDraft.request_fingerprint,
+    unique=True,
+    postgresql_where=text(_INFLIGHT_PRIMARY),
+    sqlite_where=text(_INFLIGHT_PRIMARY),
+)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -10,6 +10,8 @@ class PlanningDraftAssignment(Base):
     __tablename__ = "planning_draft_assignments"
     __table_args__ = (
         UniqueConstraint("draft_agent_day_id", "tranche_id", name="uq_planning_draft_assignment_day_tranche"),
+        # Contrôle RESTRICT à la suppression d'une tranche
+        Index("ix_planning_draft_assignments_tranche_id", "tranche_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
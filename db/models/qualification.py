@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Date, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import Date, ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -15,7 +15,11 @@ if TYPE_CHECKING:
 
 class Qualification(Base):
     __tablename__ = "qualifications"
-    __table_args__ = (UniqueConstraint("agent_id", "poste_id", name="_qualification_uc"),)
+    __table_args__ = (
+        UniqueConstraint("agent_id", "poste_id", name="_qualification_uc"),
+        # Agents qualifiés pour un poste (éligibilité, planning poste)
+        Index("ix_qualifications_poste_agent", "poste_id", "agent_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     agent_id: Mapped[int] = mapped_column(ForeignKey("agents.id"), nullable=False)
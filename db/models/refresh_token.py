@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Index, String
+from sqlalchemy import DateTime, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -32,3 +32,10 @@ class RefreshToken(Base):
 
 Index("ix_refresh_tokens_user_id", RefreshToken.user_id)
 Index("ix_refresh_tokens_expires_at", RefreshToken.expires_at)
+# Index partiel : la purge des tokens révoqués ne parcourt que les lignes révoquées
+Index(
+    "ix_refresh_tokens_revoked_at",
+    RefreshToken.revoked_at,
+    postgresql_where=text("revoked_at IS NOT NULL"),
+    sqlite_where=text("revoked_at IS NOT NULL"),
+)
@@ -15,6 +15,8 @@ class User(Base):
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(50), nullable=False, default="manager")  # admin|manager
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Incrémenté à chaque révocation globale : les access tokens portant une version antérieure sont refusés
+    token_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     def __repr__(self) -> str:
         return f"<User {self.username}>"
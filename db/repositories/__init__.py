@@ -9,6 +9,7 @@ from db.repositories.regime_repo import RegimeRepository
 from db.repositories.qualification_repo import QualificationRepository
 from db.repositories.agent_team_repo import AgentTeamSQLRepository
 from db.repositories.team_repo import TeamSQLRepository
+from db.repositories.eligibility_repo import EligibilityRepository
 
 agent_repo = AgentRepository()
 agent_day_repo = AgentDayRepository()
@@ -20,6 +21,7 @@ regime_repo = RegimeRepository()
 qualification_repo = QualificationRepository()
 agent_team_repo = AgentTeamSQLRepository()
 team_repo = TeamSQLRepository()
+eligibility_repo = EligibilityRepository()
 
 __all__ = [
     "agent_repo",
@@ -32,4 +34,5 @@ __all__ = [
     "qualification_repo",
     "agent_team_repo",
     "team_repo",
+    "eligibility_repo",
 ]
\ No newline at end of file
@@ -1,8 +1,9 @@
 # db/repositories/agent_day_repo.py
 from datetime import date
-from typing import List, Optional
-from sqlalchemy import exists, func, select
-from sqlalchemy.orm import selectinload
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+from sqlalchemy import delete, exists, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload
 
 from db import db
 
@@ -11,6 +12,17 @@ from core.domain.entities.agent_day import AgentDay as AgentDayEntity
 from db.sql_repository import SQLRepository
 from core.adapters.entity_mapper import EntityMapper
 
+T = TypeVar("T")
+
+# Lignes par statement : reste sous la limite historique SQLite de 999 variables.
+BULK_CHUNK_SIZE = 150
+
+
+def _chunks(items: Sequence[T], size: int = BULK_CHUNK_SIZE) -> Iterator[Sequence[T]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
 class AgentDayRepository(SQLRepository[AgentDayModel, AgentDayEntity]):
     """
     Repository SQL pour la gestion des journées agent.
@@ -29,6 +41,89 @@ class AgentDayRepository(SQLRepository[AgentDayModel, AgentDayEntity]):
             assert result is not None
             return result
         
+    def bulk_upsert(self, entities: List[AgentDayEntity]) -> Dict[Tuple[int, date], int]:
+        """
+        Upsert ensembliste des AgentDay + remplacement de leurs assignments, en une transaction.
+        - INSERT ... ON CONFLICT (agent_id, day_date) DO UPDATE pour les journées
+        - un DELETE groupé puis un INSERT groupé pour les assignments (entity.tranche_ids)
+        Retourne l'id persisté de chaque journée, par (agent_id, day_date).
+        """
+        if not entities:
+            return {}
+
+        with self.db.session_scope() as session:
+            day_rows = [
+                {
+                    "agent_id": e.agent_id,
+                    "day_date": e.day_date,
+                    "day_type": e.day_type,
+                    "description": e.description,
+                    "is_off_shift": e.is_off_shift,
+                }
+                for e in entities
+            ]
+            for chunk in _chunks(day_rows):
+                session.execute(self._upsert_days_statement(session, chunk))
+
+            ids_by_key = self._ids_by_agent_and_date(session, [(e.agent_id, e.day_date) for e in entities])
+
+            agent_day_ids = list(ids_by_key.values())
+            for chunk in _chunks(agent_day_ids, size=BULK_CHUNK_SIZE * 5):
+                session.execute(
+                    delete(AgentDayAssignmentModel).where(AgentDayAssignmentModel.agent_day_id.in_(chunk))
+                )
+
+            assignment_rows = [
+                {"agent_day_id": ids_by_key[(e.agent_id, e.day_date)], "tranche_id": tranche_id}
+                for e in entities
+                for tranche_id in dict.fromkeys(e.tranche_ids)
+            ]
+            if assignment_rows:
+                session.execute(insert(AgentDayAssignmentModel), assignment_rows)
+
+            return ids_by_key
+
+    @staticmethod
+    def _upsert_days_statement(session: Session, rows: Sequence[dict]):
+        dialect = session.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql.insert(AgentDayModel).values(list(rows))
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(AgentDayModel).values(list(rows))
+        else:
+            raise NotImplementedError(f"bulk upsert not supported for dialect {dialect!r}")
+
+        return stmt.on_conflict_do_update(
+            index_elements=[AgentDayModel.agent_id, AgentDayModel.day_date],
+            set_={
+                "day_type": stmt.excluded.day_type,
+                "description": stmt.excluded.description,
+                "is_off_shift": stmt.excluded.is_off_shift,
+                "updated_at": func.current_timestamp(),
+            },
+        )
+
+    @staticmethod
+    def _ids_by_agent_and_date(session: Session, keys: List[Tuple[int, date]]) -> Dict[Tuple[int, date], int]:
+        wanted = set(keys)
+        agent_ids = sorted({agent_id for agent_id, _ in wanted})
+        start_date = min(day_date for _, day_date in wanted)
+        end_date = max(day_date for _, day_date in wanted)
+
+        ids_by_key: Dict[Tuple[int, date], int] = {}
+        for chunk in _chunks(agent_ids, size=BULK_CHUNK_SIZE * 5):
+            rows = session.execute(
+                select(AgentDayModel.id, AgentDayModel.agent_id, AgentDayModel.day_date).where(
+                    AgentDayModel.agent_id.in_(chunk),
+                    AgentDayModel.day_date >= start_date,
+                    AgentDayModel.day_date <= end_date,
+                )
+            )
+            for day_id, agent_id, day_date in rows:
+                if (agent_id, day_date) in wanted:
+                    ids_by_key[(agent_id, day_date)] = day_id
+        return ids_by_key
+
     def delete_by_agent_and_date(self, agent_id: int, day_date: date) -> bool:
         """
         Supprime le AgentDay via la clé métier (agent_id, day_date).
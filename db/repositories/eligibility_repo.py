@@ -0,0 +1,40 @@
+# db/repositories/eligibility_repo.py
+from sqlalchemy import Date, literal, null, select, union_all
+from sqlalchemy.orm import Session
+
+from db import db
+from db.models import AgentTeam as AgentTeamModel
+from db.models import Qualification as QualificationModel
+from core.application.read_models.eligibility_rm import EligibilityRM
+
+
+def load_eligibility(session: Session) -> EligibilityRM:
+    """Qualifications + appartenances aux équipes en une seule requête (UNION ALL)."""
+    stmt = union_all(
+        select(
+            literal("q").label("kind"),
+            QualificationModel.agent_id.label("agent_id"),
+            QualificationModel.poste_id.label("target_id"),
+            QualificationModel.date_qualification.label("since"),
+        ),
+        select(
+            literal("t").label("kind"),
+            AgentTeamModel.agent_id.label("agent_id"),
+            AgentTeamModel.team_id.label("target_id"),
+            null().cast(Date).label("since"),
+        ),
+    )
+    rows = session.execute(stmt).all()
+    return EligibilityRM.build(
+        qualifications=((agent_id, target_id, since) for kind, agent_id, target_id, since in rows if kind == "q"),
+        memberships=((agent_id, target_id) for kind, agent_id, target_id, _ in rows if kind == "t"),
+    )
+
+
+class EligibilityRepository:
+    def __init__(self):
+        self.db = db
+
+    def load(self) -> EligibilityRM:
+        with self.db.session_scope() as session:
+            return load_eligibility(session)
@@ -1,6 +1,6 @@
 # db/repositories/poste_repo.py
-from datetime import date
-from sqlalchemy import func, select
+from datetime import date, timedelta
+from sqlalchemy import Date, Integer, and_, func, literal, select, true, union_all
 
 from db import db
 from db.models import (
@@ -13,6 +13,7 @@ from db.models import (
 
 from core.domain.entities import Poste as PosteEntity
 from core.application.read_models.poste_coverage_day_rm import TrancheCoverageRM
+from core.application.read_models.poste_coverage_range_rm import PosteCoverageRangeRM, TrancheCoverageSeriesRM
 from db.sql_repository import SQLRepository
 from core.adapters.entity_mapper import EntityMapper
 
@@ -38,6 +39,101 @@ class PosteRepository(SQLRepository[PosteModel, PosteEntity]):
             )
             return EntityMapper.model_to_entity(model, PosteEntity) if model else None
         
+    def get_coverage_for_range(self, *, poste_ids: list[int], start_date: date, end_date: date) -> PosteCoverageRangeRM:
+        """
+        Couverture (required vs assigned) de chaque (jour, tranche) des postes sur [start_date, end_date],
+        en une seule requête :
+        - jours de la période fournis en CTE (day_date, weekday), croisés avec les tranches des postes
+        - required_count : PosteCoverageRequirement joint par (tranche, weekday)
+        - assigned_count : affectations groupées par (tranche, day_date)
+        """
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        if not poste_ids or not days:
+            return PosteCoverageRangeRM(poste_ids=list(poste_ids), start_date=start_date, end_date=end_date, days=days, tranches=[])
+
+        # UNION ALL de SELECT littéraux plutôt que VALUES : SQLite n'accepte pas d'alias de colonnes sur VALUES
+        days_v = union_all(
+            *[
+                select(literal(d, Date).label("day_date"), literal(d.weekday(), Integer).label("weekday"))
+                for d in days
+            ]
+        ).cte("days")
+
+        assigned_sq = (
+            select(
+                AgentDayAssignmentModel.tranche_id.label("tranche_id"),
+                AgentDayModel.day_date.label("day_date"),
+                func.count(AgentDayAssignmentModel.id).label("assigned_count"),
+            )
+            .select_from(AgentDayAssignmentModel)
+            .join(AgentDayModel, AgentDayModel.id == AgentDayAssignmentModel.agent_day_id)
+            .join(TrancheModel, TrancheModel.id == AgentDayAssignmentModel.tranche_id)
+            .where(TrancheModel.poste_id.in_(poste_ids))
+            .where(AgentDayModel.day_date >= start_date, AgentDayModel.day_date <= end_date)
+            .group_by(AgentDayAssignmentModel.tranche_id, AgentDayModel.day_date)
+            .subquery()
+        )
+
+        stmt = (
+            select(
+                TrancheModel.id.label("tranche_id"),
+                TrancheModel.poste_id,
+                TrancheModel.nom.label("tranche_nom"),
+                TrancheModel.heure_debut,
+                TrancheModel.heure_fin,
+                days_v.c.day_date,
+                func.coalesce(PosteCoverageRequirementModel.required_count, 0).label("required_count"),
+                func.coalesce(assigned_sq.c.assigned_count, 0).label("assigned_count"),
+            )
+            .select_from(TrancheModel)
+            .join(days_v, true())
+            .where(TrancheModel.poste_id.in_(poste_ids))
+            .outerjoin(
+                PosteCoverageRequirementModel,
+                and_(
+                    PosteCoverageRequirementModel.tranche_id == TrancheModel.id,
+                    PosteCoverageRequirementModel.poste_id == TrancheModel.poste_id,
+                    PosteCoverageRequirementModel.weekday == days_v.c.weekday,
+                ),
+            )
+            .outerjoin(
+                assigned_sq,
+                and_(
+                    assigned_sq.c.tranche_id == TrancheModel.id,
+                    assigned_sq.c.day_date == days_v.c.day_date,
+                ),
+            )
+            .order_by(TrancheModel.poste_id.asc(), TrancheModel.heure_debut.asc(), TrancheModel.id.asc(), days_v.c.day_date.asc())
+        )
+
+        day_index = {d: i for i, d in enumerate(days)}
+        series: dict[int, TrancheCoverageSeriesRM] = {}
+
+        with self.db.session_scope() as session:
+            for r in session.execute(stmt):
+                tranche = series.get(r.tranche_id)
+                if tranche is None:
+                    tranche = series[r.tranche_id] = TrancheCoverageSeriesRM(
+                        tranche_id=r.tranche_id,
+                        poste_id=r.poste_id,
+                        tranche_nom=r.tranche_nom,
+                        heure_debut=r.heure_debut,
+                        heure_fin=r.heure_fin,
+                        required_counts=[0] * len(days),
+                        assigned_counts=[0] * len(days),
+                    )
+                i = day_index[r.day_date]
+                tranche.required_counts[i] = int(r.required_count)
+                tranche.assigned_counts[i] = int(r.assigned_count)
+
+        return PosteCoverageRangeRM(
+            poste_ids=list(poste_ids),
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            tranches=list(series.values()),
+        )
+
     def get_coverage_for_day(self, *, poste_id: int, day_date: date) -> list[TrancheCoverageRM]:
         """
         Retourne la couverture détaillée (par tranche) d'un poste pour une date donnée.
@@ -1,5 +1,6 @@
 # db/repositories/qualification_repo.py
 from sqlalchemy import and_
+from sqlalchemy.orm import noload
 from sqlalchemy.sql import exists
 from typing import Optional, List
 
@@ -96,6 +97,27 @@ class QualificationRepository(SQLRepository[QualificationModel, QualificationEnt
                 if (e := EntityMapper.model_to_entity(m, QualificationEntity)) is not None
             ]
 
+    def list_for_postes(self, poste_ids: List[int]) -> list[QualificationEntity]:
+        """Qualifications de plusieurs postes en une requête (même ordre que list_for_poste, par poste)."""
+        if not poste_ids:
+            return []
+        with self.db.session_scope() as session:
+            models = (
+                session.query(QualificationModel)
+                # seules les colonnes sont utiles : pas de chargement agent/poste par ligne
+                .options(noload("*"))
+                .filter(QualificationModel.poste_id.in_(set(poste_ids)))
+                .order_by(
+                    QualificationModel.poste_id.asc(),
+                    QualificationModel.date_qualification.asc().nulls_last(),
+                )
+                .all()
+            )
+            return [
+                e for m in models
+                if (e := EntityMapper.model_to_entity(m, QualificationEntity)) is not None
+            ]
+
     def search(self, agent_id: Optional[int] = None, poste_id: Optional[int] = None) -> List["QualificationEntity"]:
         """
         Search qualifications by optional filters.
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import delete, func, select, text
 from sqlalchemy.orm import Session
 
 from db.models.refresh_token import RefreshToken
@@ -47,5 +48,42 @@ class SqlAlchemyRefreshTokenRepo(RefreshTokenRepositoryPort):
         q.update({"revoked_at": now}, synchronize_session=False)
         return count
 
+    def delete_expired_batch(self, before: datetime, limit: int) -> int:
+        """Supprime au plus `limit` tokens expirés avant `before` (parcours de ix_refresh_tokens_expires_at)."""
+        ids = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < before)
+            .order_by(RefreshToken.expires_at)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        return self._delete_ids(ids)
+
+    def delete_revoked_batch(self, before: datetime, limit: int) -> int:
+        """Supprime au plus `limit` tokens révoqués avant `before` (parcours de ix_refresh_tokens_revoked_at)."""
+        ids = (
+            select(RefreshToken.id)
+            .where(RefreshToken.revoked_at.is_not(None), RefreshToken.revoked_at < before)
+            .order_by(RefreshToken.revoked_at)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        return self._delete_ids(ids)
+
+    def count(self) -> int:
+        return int(self.session.execute(select(func.count(RefreshToken.id))).scalar_one())
+
+    def table_size_bytes(self) -> Optional[int]:
+        """Taille disque (table + index) ; disponible sur Postgres uniquement."""
+        if self.session.get_bind().dialect.name != "postgresql":
+            return None
+        return int(self.session.execute(text("SELECT pg_total_relation_size('refresh_tokens')")).scalar_one())
+
+    def _delete_ids(self, ids) -> int:
+        result = self.session.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        return int(result.rowcount or 0)
+
     def commit(self) -> None:
         self.session.commit()
@@ -17,7 +17,7 @@ class TeamSQLRepository(SQLRepository[TeamModel, TeamEntity]):
 
     def _default_order_by(self):
         # Tri stable par nom
-        return (TeamModel.name,)
+        return (TeamModel.name, TeamModel.id)
 
     def get_by_id(self, team_id: int) -> Optional[TeamEntity]:
         return self.get(team_id)
@@ -1,6 +1,7 @@
 # db/repositories/tranche_repo.py
 from typing import List
 from sqlalchemy import exists, func
+from sqlalchemy.orm import noload
 from db import db
 from db.models import Tranche as TrancheModel
 from core.domain.entities import Tranche as TrancheEntity
@@ -78,6 +79,32 @@ class TrancheRepository(SQLRepository[TrancheModel, TrancheEntity]):
                 if (e := EntityMapper.model_to_entity(m, TrancheEntity)) is not None
             ]
         
+    def list_by_poste_ids(self, poste_ids: List[int]) -> List[TrancheEntity]:
+        """
+        Tranches de plusieurs postes en une requête, triées par (poste, début, fin, id).
+        """
+        if not poste_ids:
+            return []
+        with self.db.session_scope() as session:
+            models = (
+                session.query(TrancheModel)
+                # le mapper parcourt les relations : sans noload, une requête par tranche
+                .options(noload("*"))
+                .filter(TrancheModel.poste_id.in_(set(poste_ids)))
+                .order_by(
+                    TrancheModel.poste_id.asc(),
+                    TrancheModel.heure_debut.asc(),
+                    TrancheModel.heure_fin.asc(),
+                    TrancheModel.id.asc(),
+                )
+                .all()
+            )
+
+            return [
+                e for m in models
+                if (e := EntityMapper.model_to_entity(m, TrancheEntity)) is not None
+            ]
+
     def list_ids_by_poste(self, poste_id: int) -> List[int]:
         """
         Retourne la liste des IDs de tranches associées à un poste.
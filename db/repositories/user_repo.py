@@ -1,4 +1,5 @@
 from __future__ import annotations
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from typing import Optional
 from db.models import User
@@ -13,3 +14,11 @@ class SqlAlchemyUserRepo(UserRepositoryPort):
 
     def get_by_id(self, user_id: int) -> Optional[User]:
         return self.session.query(User).filter(User.id == user_id).first()
+
+    def bump_token_version(self, user_id: int) -> None:
+        self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(token_version=User.token_version + 1)
+            .execution_options(synchronize_session=False)
+        )
@@ -1,10 +1,14 @@
 # db/sql_repository.py
-from typing import Any, Generic, TypeVar, Type, List, Literal, Optional, Sequence
+from typing import Any, Generic, TypeVar, Type, List, Literal, Optional, Sequence, Tuple
 
+from sqlalchemy import func, select, text, tuple_
 from sqlalchemy.orm import DeclarativeBase, selectinload, joinedload
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
 
 from db.database import Database
 from core.adapters.entity_mapper import EntityMapper
+from core.application.read_models.keyset_page_rm import KeysetPage
 
 TModel = TypeVar("TModel", bound=DeclarativeBase)
 TEntity = TypeVar("TEntity")
@@ -92,6 +96,70 @@ class SQLRepository(Generic[TModel, TEntity]):
             return (getattr(self.model_class, "id"),)
         return ()
     
+    def _keyset_columns(self) -> Tuple[Any, ...]:
+        """
+        Colonnes de la clé de pagination, déduites de `_default_order_by` (tri ascendant uniquement),
+        complétées par `id` pour garantir une clé unique.
+        """
+        columns = []
+        for criterion in self._default_order_by():
+            if isinstance(criterion, UnaryExpression):
+                if criterion.modifier is not operators.asc_op:
+                    raise ValueError(f"keyset pagination requires ascending order on {self.model_class.__name__}")
+                criterion = criterion.element
+            columns.append(criterion)
+
+        id_column = getattr(self.model_class, "id")
+        if not any(c is id_column or getattr(c, "key", None) == "id" for c in columns):
+            columns.append(id_column)
+        return tuple(columns)
+
+    @staticmethod
+    def _check_keyset_values(columns: Sequence[Any], after: Sequence[Any]) -> Tuple[Any, ...]:
+        """Vérifie que la clé (issue d'un curseur client) correspond aux types des colonnes du tri."""
+        if len(after) != len(columns):
+            raise ValueError("clé de pagination invalide")
+        for column, value in zip(columns, after):
+            expected = column.type.python_type
+            if not isinstance(value, expected) or isinstance(value, bool) and expected is not bool:
+                raise ValueError("clé de pagination invalide")
+        return tuple(after)
+
+    def list_models_keyset(
+        self,
+        *,
+        limit: int,
+        after: Optional[Sequence[Any]] = None,
+        eager_relations: Optional[Sequence[str]] = None,
+        load_strategy: LoadStrategy = "selectin",
+    ) -> Tuple[List[TModel], Optional[Tuple[Any, ...]]]:
+        """
+        Page de modèles ORM suivant la clé `after` (exclue), dans l'ordre de `_default_order_by`.
+
+        Contrairement à OFFSET, le coût ne dépend pas de la profondeur de la page :
+        la condition (c1, c2, ..., id) > (:v1, :v2, ..., :id) se résout par l'index du tri.
+        """
+        if limit <= 0:
+            raise ValueError("limit doit être > 0")
+
+        columns = self._keyset_columns()
+        if after is not None:
+            after = self._check_keyset_values(columns, after)
+
+        with self.db.session_scope() as session:
+            query = session.query(self.model_class)
+            query = self._apply_eager_loading(query, eager_relations, load_strategy)
+            if after is not None:
+                query = query.filter(tuple_(*columns) > tuple_(*after))
+            models = query.order_by(*columns).limit(limit + 1).all()
+
+        if len(models) <= limit:
+            return models, None
+
+        models = models[:limit]
+        last = models[-1]
+        return models, tuple(getattr(last, c.key) for c in columns)
+
     def get_model(
         self,
         object_id: int,
@@ -255,6 +323,29 @@ class SQLRepository(Generic[TModel, TEntity]):
             if (e := EntityMapper.model_to_entity(m, self.entity_class)) is not None
         ]
 
+    def list_keyset(
+        self,
+        *,
+        limit: int,
+        after: Optional[Sequence[Any]] = None,
+        eager_relations: Optional[Sequence[str]] = None,
+        load_strategy: LoadStrategy = "selectin",
+    ) -> KeysetPage[TEntity]:
+        """
+        Liste paginée par clé des entités métier (voir `list_models_keyset`).
+        """
+        models, next_key = self.list_models_keyset(
+            limit=limit,
+            after=after,
+            eager_relations=eager_relations,
+            load_strategy=load_strategy,
+        )
+        items = [
+            e for m in models
+            if (e := EntityMapper.model_to_entity(m, self.entity_class)) is not None
+        ]
+        return KeysetPage(items=items, next_key=next_key)
+
     def create(self, entity: TEntity) -> TEntity:
         """Crée un enregistrement à partir d'une entité."""
         model = EntityMapper.entity_to_model(entity, self.model_class)
@@ -324,6 +415,24 @@ class SQLRepository(Generic[TModel, TEntity]):
         with self.db.session_scope() as session:
             return session.query(self.model_class).count()
 
+    def count_estimate(self) -> Tuple[int, bool]:
+        """
+        Nombre d'enregistrements, estimé si possible : (total, est_estimé).
+
+        Sur Postgres, lit `pg_class.reltuples` (mis à jour par VACUUM/ANALYZE) au lieu d'un COUNT(*)
+        qui parcourt toute la table ; repli sur le comptage exact si la table n'a jamais été analysée
+        et sur les autres moteurs.
+        """
+        with self.db.session_scope() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                estimate = session.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                    {"table": self.model_class.__tablename__},
+                ).scalar()
+                if estimate is not None and estimate >= 0:
+                    return int(estimate), True
+            return int(session.execute(select(func.count()).select_from(self.model_class)).scalar_one()), False
+
     def exists(self, **filters) -> bool:
         """Vérifie si un enregistrement existe selon un filtre."""
         with self.db.session_scope() as session:
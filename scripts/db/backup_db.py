@@ -1,8 +1,29 @@
 # scripts/db/backup_db.py
-import os
-import shutil
-from datetime import datetime
+"""
+Sauvegarde à chaud, restauration vérifiée et rétention (SQLite ou Postgres).
+
+Usage :
+    python -m scripts.db.backup_db                          # nouvelle sauvegarde
+    python -m scripts.db.backup_db --list
+    python -m scripts.db.backup_db --restore 20251105_224223_sqlite
+    python -m scripts.db.backup_db --restore-at 2025-11-05T23:00:00+00:00
+    python -m scripts.db.backup_db --prune --keep-last 7 --max-age-days 30
+
+La base cible est `APP_DATABASE_URL` (ou `--database-url`, ou `--db` pour un fichier SQLite).
+"""
 import argparse
+from datetime import datetime, timedelta, timezone
+
+from backend.app.settings import settings
+from db.backup import (
+    BackupError,
+    create_backup,
+    find_backup,
+    list_backups,
+    prune_backups,
+    restore_backup,
+)
+from db.database import Database
 
 BACKUP_DIR = "backups"
 
@@ -10,100 +31,115 @@ BACKUP_DIR = "backups"
 # ==========================================================
 # == Sauvegarde
 # ==========================================================
-def backup_sqlite(db_path: str):
-    """Crée une copie horodatée de la base SQLite dans le dossier /backups."""
-    if not os.path.exists(db_path):
-        print(f"❌ Base SQLite introuvable à l'emplacement : {db_path}")
-        return None
-
-    os.makedirs(BACKUP_DIR, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    db_name = os.path.basename(db_path)
-    backup_filename = f"{db_name.replace('.db', '')}_backup_{timestamp}.db"
-    backup_path = os.path.join(BACKUP_DIR, backup_filename)
-
-    shutil.copy2(db_path, backup_path)
-    print(f"✅ Sauvegarde créée : {backup_path}")
-    return backup_path
+def backup(database: Database, root: str, workers: int, pages: int):
+    report = create_backup(database, root, workers=workers, pages=pages)
+    print(f"✅ {report.format()}")
+    print(f"📍 {report.path}")
+    return report.path
 
 
 # ==========================================================
 # == Liste des sauvegardes
 # ==========================================================
-def list_backups():
-    """Liste toutes les sauvegardes existantes."""
-    if not os.path.exists(BACKUP_DIR):
-        print("⚠️  Aucun dossier de sauvegarde trouvé.")
-        return []
-
-    backups = sorted(os.listdir(BACKUP_DIR))
-    if not backups:
+def show_backups(root: str):
+    entries = list_backups(root)
+    if not entries:
         print("ℹ️  Aucune sauvegarde disponible.")
         return []
 
     print("\n📦 Sauvegardes disponibles :")
-    for file in backups:
-        path = os.path.join(BACKUP_DIR, file)
-        size_kb = os.path.getsize(path) / 1024
-        modified = datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y-%m-%d %H:%M:%S")
-        print(f" - {file} ({size_kb:.1f} KB, {modified})")
-    return backups
+    for entry in entries:
+        m = entry.manifest
+        print(
+            f" - {entry.path.name} ({entry.size_bytes / 1024:.1f} KB, {sum(m.rows.values())} lignes, "
+            f"révision {m.alembic_revision or '?'})"
+        )
+    return entries
 
 
 # ==========================================================
 # == Restauration d'une sauvegarde
 # ==========================================================
-def restore_backup(db_path: str, backup_filename: str):
-    """Restaure une sauvegarde spécifique vers la base principale."""
-    backup_path = os.path.join(BACKUP_DIR, backup_filename)
-
-    if not os.path.exists(backup_path):
-        print(f"❌ Sauvegarde introuvable : {backup_path}")
-        return
+def restore(database: Database, root: str, name: str | None, at: datetime | None, yes: bool, force_revision: bool):
+    if at is not None:
+        entry = find_backup(root, at)
+        if entry is None:
+            print(f"❌ Aucune sauvegarde antérieure à {at.isoformat()}")
+            return
+        path = entry.path
+    else:
+        path = f"{root}/{name}"
 
-    if os.path.exists(db_path):
-        confirm = input(f"⚠️  La base {db_path} existe déjà. Écraser ? (o/n) : ").lower()
+    if not yes:
+        confirm = input(f"⚠️  Écraser le contenu de {database.engine.url.render_as_string()} avec {path} ? (o/n) : ").lower()
         if confirm != "o":
             print("❌ Opération annulée.")
             return
 
-    shutil.copy2(backup_path, db_path)
-    print(f"✅ Base restaurée depuis : {backup_path}")
-    print(f"📍 Destination : {db_path}")
+    report = restore_backup(database, path, allow_revision_mismatch=force_revision)
+    print(f"✅ {report.format()}")
+
+
+# ==========================================================
+# == Rétention
+# ==========================================================
+def prune(root: str, keep_last: int, max_age_days: int | None):
+    removed = prune_backups(
+        root,
+        keep_last=keep_last,
+        max_age=timedelta(days=max_age_days) if max_age_days is not None else None,
+        on_remove=lambda e: print(f"🗑️  {e.path.name}"),
+    )
+    print(f"✅ {len(removed)} sauvegarde(s) supprimée(s)")
+
+
+def _parse_at(raw: str) -> datetime:
+    at = datetime.fromisoformat(raw)
+    return at if at.tzinfo else at.replace(tzinfo=timezone.utc)
 
 
 # ==========================================================
 # == CLI principale
 # ==========================================================
 def main():
-    parser = argparse.ArgumentParser(description="Sauvegarde, restauration ou inspection des sauvegardes SQLite.")
-    parser.add_argument(
-        "--db",
-        type=str,
-        default="data/planning.db",
-        help="Chemin de la base SQLite principale (défaut: data/planning.db)"
-    )
-    parser.add_argument(
-        "--list",
-        action="store_true",
-        help="Affiche la liste des sauvegardes existantes."
-    )
-    parser.add_argument(
-        "--restore",
-        type=str,
-        help="Nom d'une sauvegarde à restaurer (ex: planning_backup_20251105_224223.db)"
-    )
+    parser = argparse.ArgumentParser(description="Sauvegarde, restauration et rétention des sauvegardes de la base.")
+    parser.add_argument("--database-url", default=None, help="URL SQLAlchemy (défaut : APP_DATABASE_URL).")
+    parser.add_argument("--db", default=None, help="Raccourci pour un fichier SQLite (ex: data/palaj.db).")
+    parser.add_argument("--dir", default=BACKUP_DIR, help=f"Dossier des sauvegardes (défaut: {BACKUP_DIR}).")
+    parser.add_argument("--workers", type=int, default=4, help="Tables exportées en parallèle (Postgres).")
+    parser.add_argument("--pages", type=int, default=256, help="Pages copiées par pas (SQLite).")
+
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--list", action="store_true", help="Affiche la liste des sauvegardes existantes.")
+    action.add_argument("--restore", type=str, help="Nom d'une sauvegarde à restaurer (ex: 20251105_224223_sqlite).")
+    action.add_argument("--restore-at", type=_parse_at, help="Restaure la dernière sauvegarde antérieure à cette date ISO.")
+    action.add_argument("--prune", action="store_true", help="Applique la politique de rétention.")
+
+    parser.add_argument("--keep-last", type=int, default=7, help="Sauvegardes toujours conservées (défaut: 7).")
+    parser.add_argument("--max-age-days", type=int, default=None, help="Conserve aussi les sauvegardes plus récentes.")
+    parser.add_argument("--yes", action="store_true", help="Restaure sans confirmation.")
+    parser.add_argument("--force-revision", action="store_true", help="Ignore un écart de révision alembic (Postgres).")
 
     args = parser.parse_args()
 
     if args.list:
-        list_backups()
-    elif args.restore:
-        restore_backup(args.db, args.restore)
-    else:
-        backup_sqlite(args.db)
+        show_backups(args.dir)
+        return
+    if args.prune:
+        prune(args.dir, args.keep_last, args.max_age_days)
+        return
+
+    url = f"sqlite:///{args.db}" if args.db else (args.database_url or settings.database_url)
+    database = Database(url)
+    try:
+        if args.restore or args.restore_at:
+            restore(database, args.dir, args.restore, args.restore_at, args.yes, args.force_revision)
+        else:
+            backup(database, args.dir, args.workers, args.pages)
+    except BackupError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
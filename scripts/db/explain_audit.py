@@ -0,0 +1,35 @@
+# scripts/db/explain_audit.py
+"""
+Audit EXPLAIN des requêtes chaudes (planning, couverture, brouillons, refresh tokens).
+
+Usage :
+    python -m scripts.db.explain_audit [--database-url URL]
+
+Sans URL : base SQLite en mémoire, schéma courant + jeu de données synthétique.
+Avec URL : la base doit être vide et migrée (le jeu de données y est inséré).
+Code retour 1 si une requête chaude fait un parcours séquentiel d'une table volumineuse.
+"""
+import argparse
+import sys
+
+from backend.app.services.query_audit import run_audit
+from db.base import Base
+from db.database import Database
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vérifie que les requêtes chaudes passent par des index.")
+    parser.add_argument("--database-url", default="sqlite://", help="Base cible (défaut : SQLite en mémoire).")
+    args = parser.parse_args()
+
+    database = Database(args.database_url)
+    if args.database_url == "sqlite://":
+        Base.metadata.create_all(database.engine)
+
+    report = run_audit(database)
+    print(report.format())
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
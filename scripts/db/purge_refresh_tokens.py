@@ -0,0 +1,27 @@
+# scripts/db/purge_refresh_tokens.py
+"""
+Purge des refresh tokens expirés / révoqués depuis longtemps.
+
+Usage :
+    python -m scripts.db.purge_refresh_tokens [--batch-size 1000]
+
+La politique de rétention vient des settings (APP_REFRESH_TOKEN_REVOKED_RETENTION_DAYS,
+APP_REFRESH_TOKEN_EXPIRED_GRACE_HOURS).
+"""
+import argparse
+
+from backend.app.services.refresh_token_purge import purge_refresh_tokens
+from db import db
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Supprime par lots les refresh tokens expirés ou révoqués.")
+    parser.add_argument("--batch-size", type=int, default=None, help="Lignes supprimées par transaction.")
+    args = parser.parse_args()
+
+    report = purge_refresh_tokens(db, batch_size=args.batch_size)
+    print(f"✅ {report.format()}")
+
+
+if __name__ == "__main__":
+    main()
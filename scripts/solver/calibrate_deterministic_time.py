@@ -0,0 +1,42 @@
+# scripts/solver/calibrate_deterministic_time.py
+"""
+Calibre le budget en temps déterministe CP-SAT pour l'hôte courant.
+
+Usage :
+    python -m scripts.solver.calibrate_deterministic_time                 # écrit APP_SOLVER_CALIBRATION_PATH
+    python -m scripts.solver.calibrate_deterministic_time --runs 5 --seconds 10
+    python -m scripts.solver.calibrate_deterministic_time --show
+
+Le ratio (unités déterministes / seconde) convertit `time_limit_seconds` en
+`max_deterministic_time` quand `budget_mode=deterministic`.
+"""
+import argparse
+
+from backend.app.services.solver.calibration import DeterministicCalibration, calibrate
+from backend.app.settings import settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibration du temps déterministe CP-SAT (unités / seconde).")
+    parser.add_argument("--path", default=settings.solver_calibration_path, help="Fichier de calibration (défaut: APP_SOLVER_CALIBRATION_PATH).")
+    parser.add_argument("--runs", type=int, default=3, help="Nombre d'exécutions (médiane).")
+    parser.add_argument("--seconds", type=int, default=5, help="Budget mur par exécution.")
+    parser.add_argument("--show", action="store_true", help="Affiche la calibration existante sans la recalculer.")
+    args = parser.parse_args()
+
+    if args.show:
+        current = DeterministicCalibration.load(args.path)
+        if current is None:
+            print(f"ℹ️  Aucune calibration dans {args.path}.")
+            return
+        print(f"📏 {current.units_per_second:.4f} unités/s ({current.host}, ortools {current.ortools_version}, {current.measured_at})")
+        return
+
+    calibration = calibrate(runs=args.runs, time_limit_seconds=args.seconds)
+    path = calibration.save(args.path)
+    print(f"✅ {calibration.units_per_second:.4f} unités/s (échantillons: {', '.join(f'{s:.4f}' for s in calibration.samples)})")
+    print(f"📍 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -59,8 +59,8 @@ def test_get_poste_complet_retourne_none_si_absent(service, repos):
     result = service.get_poste_complet(poste_id=123)
 
     assert result is None
-    tranche_repo.list_by_poste_id.assert_not_called()
-    qualification_repo.list_for_poste.assert_not_called()
+    tranche_repo.list_by_poste_ids.assert_not_called()
+    qualification_repo.list_for_postes.assert_not_called()
 
 
 def test_get_poste_complet_enrichit_tranches_et_qualifs(
@@ -83,15 +83,15 @@ def test_get_poste_complet_enrichit_tranches_et_qualifs(
         make_qualification(agent_id=2, poste_id=10),
     ]
 
-    tranche_repo.list_by_poste_id.return_value = tranches
-    qualification_repo.list_for_poste.return_value = qualifications
+    tranche_repo.list_by_poste_ids.return_value = tranches
+    qualification_repo.list_for_postes.return_value = qualifications
 
     result = service.get_poste_complet(poste_id=10)
 
     assert result is p
     poste_repo.get_by_id.assert_called_once_with(10)
-    tranche_repo.list_by_poste_id.assert_called_once_with(10)
-    qualification_repo.list_for_poste.assert_called_once_with(10)
+    tranche_repo.list_by_poste_ids.assert_called_once_with([10])
+    qualification_repo.list_for_postes.assert_called_once_with([10])
 
     assert p.tranches == tranches
     assert p.qualifications == qualifications
@@ -111,11 +111,11 @@ def test_list_postes_complets_enrichit_tous_les_postes(
     p3 = make_poste(id=3, nom="P3")
     poste_repo.list_all.return_value = [p1, p2, p3]
 
-    tranche_repo.list_by_poste_id.side_effect = lambda poste_id: [
-        make_tranche(id=poste_id * 10 + 1, poste_id=poste_id, nom=f"T{poste_id}")
+    tranche_repo.list_by_poste_ids.side_effect = lambda poste_ids: [
+        make_tranche(id=poste_id * 10 + 1, poste_id=poste_id, nom=f"T{poste_id}") for poste_id in poste_ids
     ]
-    qualification_repo.list_for_poste.side_effect = lambda poste_id: [
-        make_qualification(agent_id=999, poste_id=poste_id)
+    qualification_repo.list_for_postes.side_effect = lambda poste_ids: [
+        make_qualification(agent_id=999, poste_id=poste_id) for poste_id in poste_ids
     ]
 
     result = service.list_postes_complets()
@@ -123,8 +123,9 @@ def test_list_postes_complets_enrichit_tous_les_postes(
     assert result == [p1, p2, p3]
     poste_repo.list_all.assert_called_once_with()
 
-    assert tranche_repo.list_by_poste_id.call_count == 3
-    assert qualification_repo.list_for_poste.call_count == 3
+    # enrichissement ensembliste : une requête par relation, quel que soit le nombre de postes
+    tranche_repo.list_by_poste_ids.assert_called_once_with([1, 2, 3])
+    qualification_repo.list_for_postes.assert_called_once_with([1, 2, 3])
 
     assert len(p1.tranches) == 1 and p1.tranches[0].poste_id == 1
     assert len(p2.tranches) == 1 and p2.tranches[0].poste_id == 2
@@ -143,5 +144,5 @@ def test_list_postes_complets_liste_vide(service, repos):
 
     assert result == []
     poste_repo.list_all.assert_called_once_with()
-    tranche_repo.list_by_poste_id.assert_not_called()
-    qualification_repo.list_for_poste.assert_not_called()
\ No newline at end of file
+    tranche_repo.list_by_poste_ids.assert_not_called()
+    qualification_repo.list_for_postes.assert_not_called()
\ No newline at end of file
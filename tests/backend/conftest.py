@@ -10,6 +10,7 @@ from sqlalchemy.orm import sessionmaker, Session
 
 from backend.app.main import create_app
 from backend.app.api.deps import get_db
+from backend.app.bootstrap.container import eligibility_cache, login_throttle, planning_read_cache, user_auth_cache
 from db.base import Base
 
 from backend.app.settings import settings
@@ -97,8 +98,17 @@ def app(engine):
 
     app.dependency_overrides[get_db] = _override_get_db
 
+    # Le cache de lecture planning est global au process : repartir à vide
+    planning_read_cache.clear()
+    user_auth_cache.clear()
+    login_throttle.clear()
+    eligibility_cache.clear()
+
     previous_planning_db = planning_generation_service.db
+    previous_eligibility = planning_generation_service.eligibility
     planning_generation_service.db = _TestDbAdapter(TestingSessionLocal)
+    # le cache d'éligibilité lit la base globale : le job doit lire la base de test
+    planning_generation_service.eligibility = None
 
     # Settings adaptés aux tests
     settings.cookie_secure = False
@@ -122,6 +132,7 @@ def app(engine):
         yield app
     finally:
         planning_generation_service.db = previous_planning_db
+        planning_generation_service.eligibility = previous_eligibility
 
 
 @pytest.fixture()
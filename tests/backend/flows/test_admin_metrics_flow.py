@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from backend.app.api.deps_current_user import current_user
+from backend.app.services.planning.generation import record_solver_metrics
+from core.utils.metrics import MetricsRegistry, metrics, normalize_sql_statement, sql_statement_labels
+from db.database import Database
+from db.models import User
+
+pytestmark = [pytest.mark.flow, pytest.mark.integration]
+
+API = "/api/v1/admin/metrics"
+
+
+def _override_user(app, role: str):
+    def _user():
+        return User(id=999, username=role, password_hash="x", role=role, is_active=True)
+
+    app.dependency_overrides[current_user] = _user
+
+
+def test_metrics_requires_authentication(client):
+    resp = client.get(API)
+    assert resp.status_code == 401, resp.text
+
+
+def test_metrics_forbidden_for_non_admin(app, client):
+    _override_user(app, "manager")
+    resp = client.get(API)
+    assert resp.status_code == 403, resp.text
+
+
+def test_metrics_exposes_prometheus_histograms_for_admin(app, client):
+    _override_user(app, "admin")
+    client.get("/api/v1/health")
+
+    resp = client.get(API)
+
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/plain")
+    body = resp.text
+    assert "# TYPE palaj_http_request_duration_seconds histogram" in body
+    assert 'route="/api/v1/health"' in body
+    assert "# TYPE palaj_sql_statement_duration_seconds histogram" in body
+    assert "# TYPE palaj_solver_phase_duration_seconds histogram" in body
+    assert "# TYPE palaj_planning_draft_accept_duration_seconds histogram" in body
+
+
+def test_sql_listener_records_normalized_statements():
+    database = Database("sqlite://")
+    metrics.reset()
+
+    with database.session_scope() as session:
+        session.execute(text("SELECT 1 WHERE 'a' = 'a'"))
+        session.execute(text("SELECT 2 WHERE 'b' = 'b'"))
+
+    body = metrics.render()
+    statement_id = sql_statement_labels("SELECT ? WHERE ? = ?")["statement_id"]
+    assert (
+        f'palaj_sql_statement_duration_seconds_count{{statement="SELECT ? WHERE ? = ?",statement_id="{statement_id}"}} 2'
+        in body
+    )
+
+
+def test_sql_statement_labels_keep_long_statements_with_same_prefix_apart():
+    columns = ", ".join(f"agents.column_{idx}" for idx in range(30))
+    first = sql_statement_labels(f"SELECT {columns} FROM agents WHERE agents.id = 1")
+    second = sql_statement_labels(f"SELECT {columns} FROM agents WHERE agents.team_id = 1")
+
+    assert first["statement"] == second["statement"]
+    assert len(first["statement"]) == 160
+    assert first["statement_id"] != second["statement_id"]
+
+
+def test_normalize_sql_statement_collapses_literals_and_in_lists():
+    statement = "SELECT *\n  FROM agent_days WHERE agent_id IN (?, ?, ?) AND day_date >= '2026-01-01' LIMIT 50"
+    assert normalize_sql_statement(statement) == "SELECT * FROM agent_days WHERE agent_id IN (...) AND day_date >= ? LIMIT ?"
+
+
+def test_registry_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    registry.register_histogram("demo_seconds", "Demo.", (0.1, 1.0))
+    registry.observe("demo_seconds", 0.05, phase="a")
+    registry.observe("demo_seconds", 0.5, phase="a")
+    registry.observe("demo_seconds", 5.0, phase="a")
+
+    body = registry.render()
+    assert 'palaj_demo_seconds_bucket{phase="a",le="0.1"} 1' in body
+    assert 'palaj_demo_seconds_bucket{phase="a",le="1.0"} 2' in body
+    assert 'palaj_demo_seconds_bucket{phase="a",le="+Inf"} 3' in body
+    assert 'palaj_demo_seconds_count{phase="a"} 3' in body
+
+
+def test_registry_disabled_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    registry.observe("demo_seconds", 1.0)
+    with registry.time("demo_seconds"):
+        pass
+    assert registry.render() == ""
+
+
+def test_record_solver_metrics_reads_grouped_stats():
+    metrics.reset()
+    record_solver_metrics(
+        {
+            "result_stats_schema_version": 3,
+            "stats": {
+                "timing": {"global": {"model_build_wall_time_seconds": 0.2, "solve_wall_time_seconds": 3.0}},
+                "cp_sat": {"phases": {"phase1": {"phase1_wall_time_seconds": 1.0}}},
+                "lns": {"lns_iterations": 10, "lns_total_wall_time_seconds": 2.0},
+            },
+        }
+    )
+
+    body = metrics.render()
+    assert 'palaj_solver_phase_duration_seconds_count{phase="phase1"} 1' in body
+    assert 'palaj_solver_phase_duration_seconds_count{phase="lns"} 1' in body
+    assert "palaj_solver_lns_iterations_per_second_sum 5.0" in body
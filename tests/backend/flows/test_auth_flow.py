@@ -181,3 +181,25 @@ def test_admin_ping_rbac(client):
     r2 = client.get(f"{API}/admin/ping")
     assert r2.status_code == 200, r2.text
     assert r2.json()["status"] == "ok"
+
+
+def test_deactivation_revokes_cached_access_token_immediately(app, db_session):
+    from fastapi.testclient import TestClient
+
+    c_user = TestClient(app)
+    c_admin = TestClient(app)
+    try:
+        assert c_user.post(f"{API}/auth/login", json={"username": "user", "password": "user123"}).status_code == 200
+        assert c_admin.post(f"{API}/auth/login", json={"username": "admin", "password": "admin123"}).status_code == 200
+
+        # chauffe le cache d'authentification
+        assert c_user.get(f"{API}/auth/me").status_code == 200
+
+        user = db_session.query(User).filter(User.username == "user").first()
+        r = c_admin.patch(f"{API}/users/{user.id}", json={"is_active": False})
+        assert r.status_code == 200, r.text
+
+        assert c_user.get(f"{API}/auth/me").status_code == 401
+    finally:
+        c_user.close()
+        c_admin.close()
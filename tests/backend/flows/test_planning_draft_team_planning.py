@@ -114,7 +114,7 @@ def test_get_draft_team_planning_happy_path(client, db_session: Session):
     end_date = start_date + timedelta(days=2)
 
     generation_service = _build_generation_service(db_session)
-    draft = generation_service.create_draft(
+    draft, _ = generation_service.create_draft(
         session=db_session,
         team_id=team.id,
         start_date=start_date,
@@ -160,7 +160,7 @@ def test_get_draft_team_planning_missing_day_row_returns_default_rest(client, db
     end_date = start_date + timedelta(days=2)
 
     generation_service = _build_generation_service(db_session)
-    draft = generation_service.create_draft(
+    draft, _ = generation_service.create_draft(
         session=db_session,
         team_id=team.id,
         start_date=start_date,
@@ -6,13 +6,16 @@ from importlib.util import find_spec
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
 
-from backend.app.services.planning.generation import PlanningGenerationService
+from backend.app.services.planning.generation import IdempotencyKeyConflictError, PlanningGenerationService
 from backend.app.services.solver.models import TimeoutError
 from backend.app.services.solver.ortools_solver import OrtoolsSolver
 from backend.app.settings import settings
+from core.application.services.planning.planning_cache import PlanningVersions
 from core.domain.enums.planning_draft_status import PlanningDraftStatus
+from core.utils.metrics import metrics
 from db.models import (
     Agent,
     AgentTeam,
@@ -222,7 +225,7 @@ def test_runner_execution_with_string_job_id_sets_success_and_creates_agent_days
 
     generation_service = _build_generation_service(db_session)
 
-    draft = generation_service.create_draft(
+    draft, _ = generation_service.create_draft(
         session=db_session,
         team_id=team.id,
         start_date=start_date,
@@ -278,7 +281,7 @@ def test_runner_marks_timeout_when_solver_times_out(db_session: Session, monkeyp
 
     monkeypatch.setattr(OrtoolsSolver, "generate", _raise_timeout)
 
-    draft = generation_service.create_draft(
+    draft, _ = generation_service.create_draft(
         session=db_session,
         team_id=team.id,
         start_date=start_date,
@@ -334,7 +337,7 @@ def test_runner_adds_hard_infeasible_stats_for_unreachable_demand(db_session: Se
 
     generation_service = _build_generation_service(db_session)
 
-    draft = generation_service.create_draft(
+    draft, _ = generation_service.create_draft(
         session=db_session,
         team_id=team.id,
         start_date=start_date,
@@ -410,7 +413,7 @@ def test_runner_adds_ignored_coverage_requirement_stats(db_session: Session):
     db_session.commit()
 
     generation_service = _build_generation_service(db_session)
-    draft = generation_service.create_draft(
+    draft, _ = generation_service.create_draft(
         session=db_session,
         team_id=team.id,
         start_date=start_date,
@@ -466,7 +469,7 @@ def test_run_job_populates_existing_assignments_context_in_solver_input(db_sessi
     monkeypatch.setattr(OrtoolsSolver, "generate", _capture_generate)
 
     generation_service = _build_generation_service(db_session)
-    draft = generation_service.create_draft(
+    draft, _ = generation_service.create_draft(
         session=db_session,
         team_id=team.id,
         start_date=start_date,
@@ -484,3 +487,258 @@ def test_run_job_populates_existing_assignments_context_in_solver_input(db_sessi
     existing_assignment = solver_input.existing_assignment_by_agent_day_ctx[(agent_id, start_date)]
     assert existing_assignment["poste_id"] == poste.id
     assert existing_assignment["tranche_ids"] == (tranche.id,)
+
+
+def test_runner_persists_alternatives_as_sibling_drafts(db_session: Session):
+    team = _seed_team(db_session, agent_count=3)
+    start_date = date(2026, 1, 5)
+    end_date = date(2026, 1, 11)
+
+    poste = Poste(nom=f"Poste alternatives {uuid4()}")
+    db_session.add(poste)
+    db_session.flush()
+    tranche = Tranche(
+        nom=f"Tranche alternatives {uuid4()}",
+        heure_debut=time(8, 0),
+        heure_fin=time(14, 0),
+        poste_id=poste.id,
+        color=None,
+    )
+    db_session.add(tranche)
+    db_session.flush()
+    agent_ids = [agent_id for (agent_id,) in db_session.query(AgentTeam.agent_id).filter(AgentTeam.team_id == team.id).all()]
+    for agent_id in agent_ids:
+        db_session.add(Qualification(agent_id=agent_id, poste_id=poste.id))
+    for weekday in range(7):
+        db_session.add(
+            PosteCoverageRequirement(poste_id=poste.id, weekday=weekday, tranche_id=tranche.id, required_count=1)
+        )
+    db_session.commit()
+
+    generation_service = _build_generation_service(db_session)
+    draft, _ = generation_service.create_draft(
+        session=db_session,
+        team_id=team.id,
+        start_date=start_date,
+        end_date=end_date,
+        seed=5,
+        time_limit_seconds=5,
+        alternatives_count=2,
+        alternatives_min_changed_days=2,
+    )
+    db_session.commit()
+
+    generation_service.run_job(str(draft.job_id))
+
+    db_session.expire_all()
+    primary = db_session.get(PlanningDraft, draft.id)
+    assert primary.status == PlanningDraftStatus.SUCCESS.value
+    siblings = (
+        db_session.query(PlanningDraft)
+        .filter(PlanningDraft.parent_draft_id == primary.id)
+        .order_by(PlanningDraft.alternative_rank)
+        .all()
+    )
+    assert [s.alternative_rank for s in siblings] == [1, 2]
+    assert primary.result_stats["alternative_draft_ids"] == [s.id for s in siblings]
+
+    expected_days_count = len(agent_ids) * ((end_date - start_date).days + 1)
+    for sibling in siblings:
+        assert sibling.status == PlanningDraftStatus.SUCCESS.value
+        assert sibling.job_id != primary.job_id
+        assert (sibling.team_id, sibling.start_date, sibling.end_date) == (team.id, start_date, end_date)
+        assert db_session.query(PlanningDraftAgentDay).filter(PlanningDraftAgentDay.draft_id == sibling.id).count() == expected_days_count
+        alternative = sibling.result_stats["stats"]["objective"]["alternative"]
+        assert alternative["primary_draft_id"] == primary.id
+        assert alternative["changed_days_to_primary"] >= 2
+
+
+def test_runner_fails_cleanly_when_memory_limit_is_exceeded(db_session: Session):
+    team = _seed_team(db_session, agent_count=1)
+
+    generation_service = _build_generation_service(db_session)
+    draft, _ = generation_service.create_draft(
+        session=db_session,
+        team_id=team.id,
+        start_date=date(2026, 1, 5),
+        end_date=date(2026, 1, 11),
+        seed=7,
+        time_limit_seconds=1,
+        enable_memory_profiling=True,
+        memory_limit_mb=1,
+    )
+    db_session.commit()
+
+    generation_service.run_job(str(draft.job_id))
+
+    db_session.expire_all()
+    persisted_draft = db_session.get(PlanningDraft, draft.id)
+    assert persisted_draft.status == PlanningDraftStatus.FAILED.value
+    assert persisted_draft.error.startswith("memory_limit_exceeded")
+    assert persisted_draft.result_stats["normalized_solver_status"] == "MEMORY_LIMIT"
+    memory = persisted_draft.result_stats["stats"]["timing"]["memory"]
+    assert memory["limit_exceeded_stage"] == "combos"
+    assert [sample["stage"] for sample in memory["stages"]] == ["combos"]
+    assert db_session.query(PlanningDraftAgentDay).filter(PlanningDraftAgentDay.draft_id == draft.id).count() == 0
+
+
+def test_create_draft_attaches_identical_inflight_request_to_existing_job(db_session: Session):
+    team = _seed_team(db_session, agent_count=1)
+    versions = PlanningVersions()
+    generation_service = PlanningGenerationService(
+        solver=OrtoolsSolver(), database=_TestDbAdapter(db_session.get_bind()), versions=versions
+    )
+    request = dict(
+        session=db_session,
+        team_id=team.id,
+        start_date=date(2026, 1, 5),
+        end_date=date(2026, 1, 6),
+        seed=7,
+        time_limit_seconds=5,
+    )
+    metrics.reset()
+
+    first, first_deduplicated = generation_service.create_draft(**request)
+    db_session.commit()
+    second, second_deduplicated = generation_service.create_draft(**request)
+    db_session.commit()
+
+    assert first_deduplicated is False
+    assert second_deduplicated is True
+    assert second.job_id == first.job_id
+    assert second.dedup_count == 1
+    assert db_session.query(PlanningDraft).filter(PlanningDraft.team_id == team.id).count() == 1
+    assert "palaj_planning_generate_deduplicated_total 1.0" in metrics.render()
+
+    # Autres options, ou données modifiées entre-temps : nouveau job
+    other_seed, _ = generation_service.create_draft(**{**request, "seed": 8})
+    versions.bump_team(team.id)
+    after_write, _ = generation_service.create_draft(**request)
+    db_session.commit()
+    assert len({first.job_id, other_seed.job_id, after_write.job_id}) == 3
+
+    # Job terminé : plus de rattachement
+    db_session.query(PlanningDraft).filter(PlanningDraft.team_id == team.id).update(
+        {PlanningDraft.status: PlanningDraftStatus.SUCCESS.value}
+    )
+    db_session.commit()
+    _, deduplicated = generation_service.create_draft(**request)
+    assert deduplicated is False
+
+    # Garde-fou en base : pas deux jobs principaux en cours pour la même empreinte
+    db_session.commit()
+    in_flight = (
+        db_session.query(PlanningDraft)
+        .filter(PlanningDraft.team_id == team.id, PlanningDraft.status == PlanningDraftStatus.QUEUED.value)
+        .one()
+    )
+    db_session.add(
+        PlanningDraft(
+            job_id=str(uuid4()),
+            team_id=team.id,
+            start_date=in_flight.start_date,
+            end_date=in_flight.end_date,
+            status=PlanningDraftStatus.RUNNING.value,
+            time_limit_seconds=5,
+            request_fingerprint=in_flight.request_fingerprint,
+        )
+    )
+    with pytest.raises(IntegrityError):
+        db_session.flush()
+    db_session.rollback()
+
+
+def test_create_draft_reuses_draft_for_same_idempotency_key(db_session: Session):
+    team = _seed_team(db_session, agent_count=1)
+    other_team = _seed_team(db_session, agent_count=1)
+    generation_service = _build_generation_service(db_session)
+    request = dict(
+        session=db_session,
+        team_id=team.id,
+        start_date=date(2026, 1, 5),
+        end_date=date(2026, 1, 6),
+        seed=None,
+        time_limit_seconds=5,
+        idempotency_key="click-42",
+    )
+
+    first, _ = generation_service.create_draft(**request)
+    first.status = PlanningDraftStatus.SUCCESS.value
+    db_session.commit()
+
+    retried, deduplicated = generation_service.create_draft(**{**request, "time_limit_seconds": 30})
+    assert deduplicated is True
+    assert retried.job_id == first.job_id
+
+    with pytest.raises(IdempotencyKeyConflictError):
+        generation_service.create_draft(**{**request, "team_id": other_team.id})
+
+
+@pytest.mark.skipif(HTTPX_MISSING, reason="httpx required for TestClient")
+def test_post_generate_twice_schedules_a_single_job(client, db_session: Session, monkeypatch):
+    _login(client, "admin", "admin123")
+    team = _seed_team(db_session, agent_count=1)
+    scheduled: list[str] = []
+    monkeypatch.setattr(PlanningGenerationService, "run_job", lambda self, job_id: scheduled.append(job_id))
+
+    payload = {
+        "team_id": team.id,
+        "start_date": str(date.today()),
+        "end_date": str(date.today() + timedelta(days=1)),
+        "seed": 123,
+        "time_limit_seconds": 5,
+    }
+    first = client.post(f"{API}/planning/generate", json=payload)
+    second = client.post(f"{API}/planning/generate", json=payload, headers={"Idempotency-Key": "double-click"})
+
+    assert first.status_code == 200, first.text
+    assert second.status_code == 200, second.text
+    assert first.json()["deduplicated"] is False
+    assert second.json()["deduplicated"] is True
+    assert second.json()["job_id"] == first.json()["job_id"]
+    assert scheduled == [first.json()["job_id"]]
+
+    status_response = client.get(f"{API}/planning/generate/{first.json()['job_id']}")
+    assert status_response.status_code == 200, status_response.text
+    assert status_response.json()["dedup_count"] == 1
+
+
+@pytest.mark.skipif(HTTPX_MISSING, reason="httpx required for TestClient")
+def test_post_generate_race_on_fingerprint_attaches_to_the_winner(client, db_session: Session, monkeypatch):
+    from backend.app.services.planning.generation import planning_generation_service
+
+    _login(client, "admin", "admin123")
+    team = _seed_team(db_session, agent_count=1)
+    monkeypatch.setattr(PlanningGenerationService, "run_job", lambda self, job_id: None)
+    start_date = date.today()
+
+    # La requête concurrente a déjà inséré son draft
+    winner, _ = planning_generation_service.create_draft(
+        session=db_session, team_id=team.id, start_date=start_date, end_date=start_date, seed=5, time_limit_seconds=5
+    )
+    db_session.commit()
+
+    # ... mais cette requête l'a manqué à la lecture (read-then-insert)
+    real_find_duplicate = PlanningGenerationService._find_duplicate
+    misses = iter([True])
+
+    def _racy_find_duplicate(self, session, **kwargs):
+        if next(misses, False):
+            return None
+        return real_find_duplicate(self, session, **kwargs)
+
+    monkeypatch.setattr(PlanningGenerationService, "_find_duplicate", _racy_find_duplicate)
+
+    payload = {
+        "team_id": team.id,
+        "start_date": str(start_date),
+        "end_date": str(start_date),
+        "seed": 5,
+        "time_limit_seconds": 5,
+    }
+    response = client.post(f"{API}/planning/generate", json=payload)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["deduplicated"] is True
+    assert response.json()["job_id"] == winner.job_id
+    assert db_session.query(PlanningDraft).filter(PlanningDraft.team_id == team.id).count() == 1
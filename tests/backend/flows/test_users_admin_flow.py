@@ -234,3 +234,28 @@ def test_self_demote_and_self_delete_are_forbidden(app, client, db_session):
     assert delete_resp.json()["detail"] == "Forbidden"
 
     app.dependency_overrides.pop(current_user, None)
+
+
+def test_password_hashing_saturation_returns_503(app, client, db_session, monkeypatch):
+    from backend.app.api.v1 import users as users_routes
+    from backend.app.security.password import PasswordHasherBusy
+
+    _override_as_admin(app, db_session)
+
+    async def _busy(_password: str) -> str:
+        raise PasswordHasherBusy("Password hashing capacity exceeded")
+
+    monkeypatch.setattr(users_routes, "ahash_password", _busy)
+    username = f"busy-{uuid.uuid4().hex[:8]}"
+
+    created = _request(
+        client, "POST", API, {"username": username, "password": "password123", "role": "manager", "is_active": True}
+    )
+    assert created.status_code == 503, created.text
+    assert created.headers["Retry-After"] == "1"
+    assert db_session.query(User).filter(User.username == username).first() is None
+
+    admin_user = db_session.query(User).filter(User.username == "admin").first()
+    patched = _request(client, "PATCH", f"{API}/{admin_user.id}", {"password": "newpassword123"})
+    assert patched.status_code == 503, patched.text
+    assert patched.headers["Retry-After"] == "1"
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import io
+from datetime import date, time
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.app.services.planning.csv_import import PlanningCsvCodes, PlanningCsvImporter, parse_header_date
+from db.base import Base
+from db.database import Database
+from db.models import Agent, AgentDay, AgentDayAssignment, Poste, Tranche
+
+pytestmark = [pytest.mark.integration]
+
+CODES = PlanningCsvCodes.build(
+    rest_codes=["RP"],
+    working_codes=["GTI M", "GTI S"],
+    zcot_codes=["FORMATION"],
+    leave_codes=["C"],
+    absence_codes=["MA"],
+    tranche_aliases={"-2": "GTI M"},
+)
+
+CSV = """Agent;1-janv;2-janv;3-janv;4-janv
+Julie MARTIN;GTI M;RP;-2;formation
+Paul DURAND;C;GTI S;;MA
+Inconnu PERSONNE;RP;RP;RP;RP
+"""
+
+
+@pytest.fixture()
+def database() -> Database:
+    database = Database("sqlite://")
+    Base.metadata.create_all(database.engine)
+    with database.session_scope() as session:
+        poste = Poste(nom="GTI")
+        session.add(poste)
+        session.flush()
+        session.add_all(
+            [
+                Tranche(nom="GTI M", heure_debut=time(6, 0), heure_fin=time(14, 0), poste_id=poste.id),
+                Tranche(nom="GTI S", heure_debut=time(14, 0), heure_fin=time(22, 0), poste_id=poste.id),
+                Agent(nom="MARTIN", prenom="Julie", actif=True),
+                Agent(nom="DURAND", prenom="Paul", actif=True),
+            ]
+        )
+    return database
+
+
+def _count(database: Database, model) -> int:
+    with database.session_scope() as session:
+        return session.scalar(select(func.count()).select_from(model))
+
+
+def _import(database: Database, content: str = CSV, **kwargs):
+    importer = PlanningCsvImporter(database, CODES, year=2025, **kwargs)
+    return importer.import_stream(io.StringIO(content))
+
+
+def test_import_bulk_loads_days_and_assignments(database):
+    report = _import(database, chunk_size=3)
+
+    assert report.agent_rows == 3
+    assert report.cells_read == 12
+    assert report.empty_cells == 1
+    assert report.days_written == 7
+    assert report.assignments_written == 3
+    assert report.chunks == 2
+    assert report.unknown_agents == ["Inconnu PERSONNE"]
+    assert _count(database, AgentDay) == 7
+    assert _count(database, AgentDayAssignment) == 3
+
+    with database.session_scope() as session:
+        day = session.scalars(select(AgentDay).where(AgentDay.day_date == date(2025, 1, 4))).first()
+        assert day.day_type == "zcot"
+        assert day.description == "formation"
+
+
+def test_reimport_upserts_in_place(database):
+    _import(database)
+    changed = CSV.replace("Julie MARTIN;GTI M", "Julie MARTIN;RP")
+    _import(database, content=changed)
+
+    assert _count(database, AgentDay) == 7
+    assert _count(database, AgentDayAssignment) == 2
+    with database.session_scope() as session:
+        day = session.scalars(select(AgentDay).where(AgentDay.day_date == date(2025, 1, 1))).first()
+        assert day.day_type == "rest"
+
+
+def test_dry_run_validates_without_writing(database):
+    content = CSV + "Paul DURAND;XYZ;GTI Z;RP;RP\n"
+    report = _import(database, content=content, dry_run=True, create_missing_agents=True)
+
+    assert report.dry_run is True
+    assert report.agents_created == 1
+    assert report.unknown_codes == {"XYZ": 1, "GTI Z": 1}
+    assert not report.is_clean
+    assert _count(database, AgentDay) == 0
+    assert _count(database, Agent) == 2
+    assert "cellules/s" in report.format()
+
+
+def test_header_must_be_continuous(database):
+    with pytest.raises(ValueError, match="Discontinuité"):
+        _import(database, content="Agent;1-janv;3-janv\nJulie MARTIN;RP;RP\n")
+
+
+def test_parse_header_date_formats():
+    assert parse_header_date("30-janv", 2025) == date(2025, 1, 30)
+    assert parse_header_date("1-déc.", 2025) == date(2025, 12, 1)
+    assert parse_header_date("2026-02-01", 2025) == date(2026, 2, 1)
+    assert parse_header_date("01/02/2026", 2025) == date(2026, 2, 1)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+
+from backend.app.services.solver.alternatives import changed_days
+from backend.app.services.solver.models import CoverageDemand, SolverInput, TrancheInfo
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+
+DAYS = [date(2026, 1, 5) + timedelta(days=i) for i in range(7)]
+
+
+def _build_input(**kwargs) -> SolverInput:
+    agent_ids = [1, 2, 3, 4]
+    base = dict(
+        team_id=1,
+        start_date=DAYS[0],
+        end_date=DAYS[-1],
+        seed=11,
+        time_limit_seconds=4,
+        agent_ids=agent_ids,
+        absences=set(),
+        qualified_postes_by_agent={a: (1,) for a in agent_ids},
+        qualification_date_by_agent_poste={(a, 1): None for a in agent_ids},
+        existing_day_type_by_agent_day={},
+        poste_ids=[1],
+        tranches=[TrancheInfo(id=10, poste_id=1, heure_debut=time(8, 0), heure_fin=time(14, 0))],
+        coverage_demands=[CoverageDemand(day_date=d, tranche_id=10, required_count=2, poste_id=1) for d in DAYS],
+        v3_strategy="two_phase",
+    )
+    base.update(kwargs)
+    return SolverInput(**base)
+
+
+def _day_map(agent_days) -> dict[tuple[int, date], str]:
+    return {(d.agent_id, d.day_date): d.day_type for d in agent_days}
+
+
+def test_pool_returns_distinct_alternatives_without_coverage_regression():
+    output = OrtoolsSolver().generate(_build_input(alternatives_count=2, alternatives_min_changed_days=3))
+    stats = output.stats["stats"]
+
+    pool = stats["cp_sat"]["phases"]["alternatives"]
+    assert pool["requested"] == 2
+    assert pool["found"] == len(output.alternatives) == 2
+    assert pool["min_changed_days"] == 3
+
+    primary_days = _day_map(output.agent_days)
+    previous = [primary_days]
+    for alternative in output.alternatives:
+        assert alternative.understaff_total <= stats["coverage"]["understaff_total"]
+        assert alternative.changed_days_to_primary >= 3
+        assert set(alternative.objective_terms) == set(stats["objective"]["objective_terms"])
+        days = _day_map(alternative.agent_days)
+        assert days.keys() == primary_days.keys()
+        for other in previous:
+            assert sum(days[k] != other[k] for k in days) >= 3
+        previous.append(days)
+
+
+def test_no_pool_by_default():
+    output = OrtoolsSolver().generate(_build_input())
+
+    assert output.alternatives == []
+    assert output.stats["stats"]["cp_sat"]["phases"]["alternatives"]["requested"] == 0
+
+
+def test_changed_days_counts_agent_days_with_a_different_combo():
+    left = {(1, 0, 0): 1, (1, 0, 2): 0, (1, 1, 0): 0, (1, 1, 2): 1}
+    right = {(1, 0, 0): 0, (1, 0, 2): 1, (1, 1, 0): 0, (1, 1, 2): 1}
+
+    assert changed_days(left, right) == 1
+    assert changed_days(left, left) == 0
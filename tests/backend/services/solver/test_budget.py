@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from backend.app.services.solver.calibration import (
+    DeterministicCalibration,
+    calibration_input,
+    resolve_units_per_second,
+)
+from backend.app.services.solver.constants import DETERMINISTIC_DEFAULT_UNITS_PER_SECOND
+from backend.app.services.solver.cp_sat import configure_solver, effective_cp_sat_params
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+
+
+def _run(**kwargs):
+    out = OrtoolsSolver().generate(replace(calibration_input(seed=3, time_limit_seconds=2), **kwargs))
+    assignments = sorted((a.agent_id, a.day_date, a.tranche_id) for a in out.assignments)
+    return assignments, out.stats["stats"]
+
+
+def test_deterministic_budget_replays_identically():
+    first_assignments, first = _run(budget_mode="deterministic", deterministic_units_per_second=0.2)
+    second_assignments, second = _run(budget_mode="deterministic", deterministic_units_per_second=0.2)
+
+    assert first_assignments == second_assignments
+    assert first["objective"]["objective_value"] == second["objective"]["objective_value"]
+    assert first["lns"]["lns_iterations"] == second["lns"]["lns_iterations"]
+
+    timing = first["timing"]["global"]
+    assert timing["budget_mode"] == "deterministic"
+    assert timing["deterministic_units_per_second"] == 0.2
+    assert timing["deterministic_time_total"] == second["timing"]["global"]["deterministic_time_total"]
+    assert 0 < timing["deterministic_time_total_seconds"] <= 2.0 * 1.05
+    assert timing["budget_wall_safety_cap_hit"] is False
+    assert first["cp_sat"]["cp_sat_params_effective"]["phase1"]["max_deterministic_time"] > 0
+
+
+def test_wall_budget_keeps_wall_time_limits():
+    solver = configure_solver(budget_seconds=3.0, time_limit_seconds=3.0, seed=1)
+    params = effective_cp_sat_params(solver=solver, budget_seconds=3.0, profile="balanced", seed=1, time_limit_seconds=3.0)
+
+    assert params["max_time_in_seconds"] == 3.0
+    assert "max_deterministic_time" not in params
+
+    solver = configure_solver(budget_seconds=3.0, time_limit_seconds=3.0, seed=1, deterministic_units_per_second=0.5)
+    params = effective_cp_sat_params(solver=solver, budget_seconds=3.0, profile="balanced", seed=1, time_limit_seconds=3.0)
+
+    assert params["max_deterministic_time"] == 1.5
+    # Plafond mural de sécurité uniquement
+    assert params["max_time_in_seconds"] > 3.0
+
+
+def test_calibration_roundtrip_and_resolution(tmp_path):
+    path = tmp_path / "calibration.json"
+    assert resolve_units_per_second(explicit=None, calibration_path=path) == DETERMINISTIC_DEFAULT_UNITS_PER_SECOND
+
+    DeterministicCalibration(units_per_second=0.4, host="ci", ortools_version="9.9", samples=[0.39, 0.41]).save(path)
+    loaded = DeterministicCalibration.load(path)
+
+    assert loaded.units_per_second == 0.4
+    assert loaded.expected_seconds(2.0) == 5.0
+    assert resolve_units_per_second(explicit=None, calibration_path=path) == 0.4
+    assert resolve_units_per_second(explicit=1.5, calibration_path=path) == 1.5
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from datetime import date, time
+
+from backend.app.services.solver.coverage_flow import compute_coverage_flow_bound
+from backend.app.services.solver.models import CoverageDemand, SolverInput, TrancheInfo
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+
+D1 = date(2026, 1, 5)
+D2 = date(2026, 1, 6)
+
+MORNING = TrancheInfo(id=10, poste_id=1, heure_debut=time(6, 0), heure_fin=time(14, 0))
+EVENING = TrancheInfo(id=11, poste_id=1, heure_debut=time(14, 0), heure_fin=time(22, 0))
+OTHER_POSTE = TrancheInfo(id=20, poste_id=2, heure_debut=time(8, 0), heure_fin=time(16, 0))
+
+
+def _bound(**kwargs):
+    base = dict(
+        demands=[],
+        tranches=[MORNING, EVENING, OTHER_POSTE],
+        agent_ids=[1, 2],
+        qualified_postes_by_agent={1: (1,), 2: (1,)},
+        qualification_date_by_agent_poste={},
+        absences=set(),
+    )
+    base.update(kwargs)
+    return compute_coverage_flow_bound(**base)
+
+
+def test_flow_bound_is_zero_when_enough_qualified_agents():
+    bound = _bound(
+        demands=[
+            CoverageDemand(day_date=D1, tranche_id=10, required_count=1),
+            CoverageDemand(day_date=D1, tranche_id=11, required_count=1),
+        ]
+    )
+
+    assert bound.total_required_count == 2
+    assert bound.max_coverable_count == 2
+    assert bound.understaff_lower_bound == 0
+    assert bound.bottleneck_days == []
+
+
+def test_flow_bound_counts_absences_and_reports_bottleneck_day():
+    bound = _bound(
+        demands=[
+            CoverageDemand(day_date=D1, tranche_id=10, required_count=2),
+            CoverageDemand(day_date=D2, tranche_id=10, required_count=2),
+        ],
+        absences={(2, D2)},
+    )
+
+    assert bound.understaff_lower_bound == 1
+    assert [day.day_date for day in bound.bottleneck_days] == [D2]
+
+    stats = bound.to_stats()
+    assert stats["coverage_flow_understaff_lower_bound"] == 1
+    assert stats["coverage_flow_bottleneck_days"] == [
+        {
+            "day_date": D2.isoformat(),
+            "required_count": 2,
+            "max_coverable_count": 1,
+            "understaff_lower_bound": 1,
+            "available_agents_count": 1,
+        }
+    ]
+
+
+def test_flow_bound_respects_qualification_and_qualification_date():
+    bound = _bound(
+        demands=[
+            CoverageDemand(day_date=D1, tranche_id=20, required_count=1),
+            CoverageDemand(day_date=D1, tranche_id=10, required_count=2),
+        ],
+        qualified_postes_by_agent={1: (1,), 2: (1, 2)},
+        qualification_date_by_agent_poste={(2, 2): D2},
+    )
+
+    # Nobody qualified on poste 2 at D1; both agents can still cover the morning.
+    assert bound.max_coverable_count == 2
+    assert bound.understaff_lower_bound == 1
+
+
+def test_flow_bound_is_a_valid_lower_bound_for_the_solver():
+    demands = [
+        CoverageDemand(day_date=D1, tranche_id=10, required_count=2),
+        CoverageDemand(day_date=D1, tranche_id=11, required_count=1),
+        CoverageDemand(day_date=D2, tranche_id=10, required_count=3),
+    ]
+    bound = _bound(demands=demands, tranches=[MORNING, EVENING])
+    assert bound.understaff_lower_bound > 0
+
+    out = OrtoolsSolver().generate(
+        SolverInput(
+            team_id=1,
+            start_date=D1,
+            end_date=D2,
+            seed=123,
+            time_limit_seconds=5,
+            agent_ids=[1, 2],
+            absences=set(),
+            qualified_postes_by_agent={1: (1,), 2: (1,)},
+            qualification_date_by_agent_poste={(1, 1): None, (2, 1): None},
+            existing_day_type_by_agent_day={},
+            poste_ids=[1],
+            tranches=[MORNING, EVENING],
+            coverage_demands=demands,
+            understaff_lower_bound=bound.understaff_lower_bound,
+            coverage_flow_bottleneck_days=bound.to_stats()["coverage_flow_bottleneck_days"],
+        )
+    )
+
+    grouped = out.stats["stats"]
+    phase1 = grouped["cp_sat"]["phases"]["phase1"]
+    assert grouped["coverage"]["understaff_total"] >= bound.understaff_lower_bound
+    assert grouped["coverage"]["coverage_flow_understaff_lower_bound"] == bound.understaff_lower_bound
+    assert len(grouped["coverage"]["coverage_flow_bottleneck_days"]) == len(bound.bottleneck_days)
+    assert phase1["phase1_understaff_lower_bound"] == bound.understaff_lower_bound
+    if phase1["phase1_stopped_at_lower_bound"]:
+        assert phase1["phase1_understaff_total_unweighted"] == bound.understaff_lower_bound
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+
+import pytest
+
+from backend.app.services.solver.decomposition import build_component_input, detect_qualification_components
+from backend.app.services.solver.models import CoverageDemand, InfeasibleError, SolverInput, TrancheInfo
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+
+START = date(2026, 1, 5)
+DAYS = [START + timedelta(days=i) for i in range(7)]
+
+
+def _build_input(**kwargs) -> SolverInput:
+    qualified = kwargs.pop("qualified_postes_by_agent", {1: (1,), 2: (1,), 3: (1,), 4: (2,), 5: (2,), 6: (2,)})
+    poste_ids = kwargs.pop("poste_ids", [1, 2])
+    tranches = [
+        TrancheInfo(id=poste_id * 10, poste_id=poste_id, heure_debut=time(8, 0), heure_fin=time(14, 0))
+        for poste_id in poste_ids
+    ]
+    base = dict(
+        team_id=1,
+        start_date=DAYS[0],
+        end_date=DAYS[-1],
+        seed=3,
+        time_limit_seconds=4,
+        agent_ids=sorted(qualified),
+        absences={(1, DAYS[2])},
+        qualified_postes_by_agent=qualified,
+        qualification_date_by_agent_poste={(a, p): None for a, postes in qualified.items() for p in postes},
+        existing_day_type_by_agent_day={},
+        poste_ids=poste_ids,
+        tranches=tranches,
+        coverage_demands=[
+            CoverageDemand(day_date=d, tranche_id=t.id, required_count=1, poste_id=t.poste_id)
+            for d in DAYS
+            for t in tranches
+        ],
+        v3_strategy="two_phase",
+    )
+    base.update(kwargs)
+    return SolverInput(**base)
+
+
+def test_components_follow_the_qualification_graph():
+    inp = _build_input(
+        qualified_postes_by_agent={1: (1,), 2: (1, 2), 3: (2,), 4: (3,), 5: (3,), 6: ()},
+        poste_ids=[1, 2, 3, 4],
+    )
+
+    components = detect_qualification_components(inp)
+
+    assert [(c.agent_ids, c.poste_ids) for c in components] == [
+        ([1, 2, 3], [1, 2, 4]),
+        ([4, 5], [3]),
+        ([6], []),
+    ]
+
+
+def test_component_input_keeps_only_its_agents_postes_and_demands():
+    inp = _build_input(understaff_lower_bound=0)
+    component = detect_qualification_components(inp)[1]
+
+    sub = build_component_input(inp, component, time_limit_seconds=2)
+
+    assert sub.agent_ids == [4, 5, 6]
+    assert sub.poste_ids == [2]
+    assert {t.poste_id for t in sub.tranches} == {2}
+    assert {d.poste_id for d in sub.coverage_demands} == {2}
+    assert sub.absences == set()
+    assert sub.time_limit_seconds == 2
+    assert sub.understaff_lower_bound == 0
+    assert sub.enable_decomposition is False
+
+
+def test_decomposed_generation_merges_component_outputs():
+    inp = _build_input(enable_decomposition=True)
+
+    output = OrtoolsSolver().generate(inp)
+    stats = output.stats["stats"]
+
+    decomposition = stats["cp_sat"]["decomposition"]
+    assert decomposition["applied"] is True
+    assert decomposition["components_count"] == 2
+    assert [c["agent_ids"] for c in decomposition["components"]] == [[1, 2, 3], [4, 5, 6]]
+
+    assert {a.agent_id for a in output.agent_days} == {1, 2, 3, 4, 5, 6}
+    assert len(output.agent_days) == 6 * len(DAYS)
+    poste_by_tranche = {10: 1, 20: 2}
+    for assignment in output.assignments:
+        assert poste_by_tranche[assignment.tranche_id] == (1 if assignment.agent_id <= 3 else 2)
+
+    coverage = stats["coverage"]
+    assert coverage["total_required_count"] == 2 * len(DAYS)
+    assert coverage["understaff_total"] == sum(c["understaff_total"] for c in decomposition["components"]) == 0
+    assert coverage["coverage_ratio"] == 1.0
+    assert stats["objective"]["objective_value"] == sum(c["objective_value"] for c in decomposition["components"])
+
+
+def test_single_component_falls_back_to_monolithic_model():
+    inp = _build_input(
+        qualified_postes_by_agent={1: (1, 2), 2: (1,), 3: (2,)},
+        enable_decomposition=True,
+    )
+
+    stats = OrtoolsSolver().generate(inp).stats["stats"]
+
+    assert stats["cp_sat"]["decomposition"] == {"applied": False, "components_count": 1}
+
+
+def test_infeasible_component_fails_the_whole_generation():
+    inp = _build_input(
+        tranches=[
+            TrancheInfo(id=10, poste_id=1, heure_debut=time(8, 0), heure_fin=time(14, 0)),
+            TrancheInfo(id=20, poste_id=2, heure_debut=time(8, 0), heure_fin=time(14, 0)),
+            TrancheInfo(id=21, poste_id=2, heure_debut=time(14, 0), heure_fin=time(20, 0)),
+        ],
+        coverage_demands=[CoverageDemand(day_date=DAYS[0], tranche_id=99, required_count=1, poste_id=2)],
+        enable_decomposition=True,
+    )
+
+    with pytest.raises(InfeasibleError) as exc_info:
+        OrtoolsSolver().generate(inp)
+
+    decomposition = exc_info.value.stats["stats"]["cp_sat"]["decomposition"]
+    assert decomposition["failed_component_index"] == 1
@@ -7,6 +7,7 @@ from backend.app.services.solver.mapper import CoverageRequirementPattern, Solve
 from datetime import time
 
 from db.models import Agent, AgentDay, AgentDayAssignment, AgentTeam, Poste, Qualification, Team, Tranche
+from db.repositories.eligibility_repo import load_eligibility
 
 
 def _create_team_with_agents(db_session, count: int = 2) -> tuple[Team, list[Agent]]:
@@ -247,6 +248,30 @@ def test_list_qualification_dates_returns_mapping(db_session):
     }
 
 
+def test_eligibility_snapshot_matches_direct_queries(db_session):
+    team, agents = _create_team_with_agents(db_session, count=3)
+
+    postes = [Poste(nom=f"Poste-E-{uuid4()}") for _ in range(2)]
+    db_session.add_all(postes)
+    db_session.flush()
+    db_session.add_all(
+        [
+            Qualification(agent_id=agents[0].id, poste_id=postes[0].id, date_qualification=date(2026, 1, 2)),
+            Qualification(agent_id=agents[0].id, poste_id=postes[1].id, date_qualification=None),
+            Qualification(agent_id=agents[2].id, poste_id=postes[1].id, date_qualification=date(2025, 6, 1)),
+        ]
+    )
+    db_session.commit()
+
+    direct = SolverInputMapper(session=db_session)
+    cached = SolverInputMapper(session=db_session, eligibility=load_eligibility(db_session))
+
+    agent_ids = direct.list_team_agent_ids(team_id=team.id)
+    assert cached.list_team_agent_ids(team_id=team.id) == agent_ids
+    assert cached.list_qualified_postes_by_agent(agent_ids) == direct.list_qualified_postes_by_agent(agent_ids)
+    assert cached.list_qualification_dates(agent_ids) == direct.list_qualification_dates(agent_ids)
+
+
 def test_list_existing_day_types_returns_existing_rows(db_session):
     team, agents = _create_team_with_agents(db_session)
 
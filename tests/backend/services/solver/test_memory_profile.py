@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+from backend.app.services.solver.memory_profile import MemoryProfiler, tracemalloc_session
+from backend.app.services.solver.models import MemoryLimitExceededError
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+from tests.backend.services.solver.test_decomposition import _build_input
+
+BUILD_STAGES = ["combos", "choice_vars", "coverage", "rest_constraints", "gpt", "fairness", "objective"]
+
+
+def test_profiler_is_a_noop_without_profiling_or_limit():
+    profiler = MemoryProfiler(enabled=False, limit_mb=None).start()
+    profiler.checkpoint("combos")
+    profiler.stop()
+
+    assert profiler.active is False
+    assert profiler.stages == []
+    assert profiler.peak_rss_mb is None
+
+
+def test_nested_profilers_leave_the_shared_tracemalloc_session_running():
+    with tracemalloc_session(True):
+        profiler = MemoryProfiler(enabled=True, limit_mb=None).start()
+        profiler.checkpoint("combos")
+        profiler.stop()
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+    assert profiler.stages[0]["traced_peak_mb"] is not None
+
+
+def test_generate_records_memory_per_stage():
+    output = OrtoolsSolver().generate(_build_input(enable_memory_profiling=True, time_limit_seconds=2))
+    memory = output.stats["stats"]["timing"]["memory"]
+
+    stages = [sample["stage"] for sample in memory["stages"]]
+    assert stages[: len(BUILD_STAGES)] == BUILD_STAGES
+    assert stages[-3:] == ["search", "lns", "extraction"]
+    assert memory["peak_rss_mb"] >= max(sample["rss_mb"] for sample in memory["stages"])
+    assert memory["limit_exceeded_stage"] is None
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_limit_aborts_the_build_with_stats():
+    with pytest.raises(MemoryLimitExceededError) as exc_info:
+        OrtoolsSolver().generate(_build_input(memory_limit_mb=1))
+
+    assert "after stage 'combos'" in str(exc_info.value)
+    memory = exc_info.value.stats["stats"]["timing"]["memory"]
+    assert memory["limit_exceeded_stage"] == "combos"
+    assert memory["limit_mb"] == 1.0
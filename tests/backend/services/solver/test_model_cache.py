@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+
+from backend.app.services.solver.model_cache import CompiledModelCache, solver_input_fingerprint
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+from tests.backend.services.solver.test_decomposition import DAYS, _build_input
+
+BUILD_OPTIONS = {"enable_symmetry_breaking": True}
+
+
+def test_fingerprint_ignores_run_options_but_not_model_inputs():
+    inp = _build_input()
+
+    fingerprint = solver_input_fingerprint(inp, build_options=BUILD_OPTIONS)
+
+    assert fingerprint == solver_input_fingerprint(
+        dataclasses.replace(inp, seed=42, time_limit_seconds=600, lns_iter_seconds=5.0, alternatives_count=2),
+        build_options=BUILD_OPTIONS,
+    )
+    assert fingerprint != solver_input_fingerprint(
+        dataclasses.replace(inp, absences={(2, DAYS[3])}), build_options=BUILD_OPTIONS
+    )
+    assert fingerprint != solver_input_fingerprint(inp, build_options={"enable_symmetry_breaking": False})
+
+
+def test_rerun_with_longer_budget_loads_the_cached_model(tmp_path):
+    solver = OrtoolsSolver(model_cache=CompiledModelCache(tmp_path, max_bytes=50_000_000))
+    inp = _build_input(time_limit_seconds=2)
+
+    first = solver.generate(inp)
+    second = solver.generate(dataclasses.replace(inp, time_limit_seconds=3))
+    uncached = OrtoolsSolver().generate(dataclasses.replace(inp, time_limit_seconds=3))
+
+    first_cache = first.stats["stats"]["model"]["cache"]
+    second_cache = second.stats["stats"]["model"]["cache"]
+    assert first_cache["hit"] is False
+    assert first_cache["build_wall_time_seconds"] > 0
+    assert second_cache["hit"] is True
+    assert second_cache["fingerprint"] == first_cache["fingerprint"]
+    assert second_cache["load_wall_time_seconds"] >= 0
+    assert second.stats["stats"]["timing"]["global"]["time_limit_seconds"] == 3.0
+
+    assert second.stats["stats"]["model"]["num_variables"] == uncached.stats["stats"]["model"]["num_variables"]
+    assert second.stats["stats"]["objective"]["objective_value"] == uncached.stats["stats"]["objective"]["objective_value"]
+    assert second.stats["stats"]["coverage"]["understaff_total"] == uncached.stats["stats"]["coverage"]["understaff_total"]
+    assert len(second.agent_days) == len(uncached.agent_days)
+
+
+def test_corrupted_entry_is_dropped_and_rebuilt(tmp_path):
+    cache = CompiledModelCache(tmp_path, max_bytes=50_000_000)
+    inp = _build_input(time_limit_seconds=2)
+    fingerprint = OrtoolsSolver(model_cache=cache).generate(inp).stats["stats"]["model"]["cache"]["fingerprint"]
+    entry = next(tmp_path.iterdir())
+    entry.write_bytes(b"not a pickle")
+
+    assert cache.load(fingerprint) is None
+    assert not entry.exists()
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    cache = CompiledModelCache(tmp_path, max_bytes=10_000_000)
+    solver = OrtoolsSolver(model_cache=cache)
+    fingerprints = [
+        solver.generate(_build_input(time_limit_seconds=1, absences={(1, day)})).stats["stats"]["model"]["cache"]["fingerprint"]
+        for day in DAYS[:3]
+    ]
+    for age, fingerprint in enumerate(fingerprints):
+        os.utime(tmp_path / f"{fingerprint}.cpmodel.pkl", (1_000 + age, 1_000 + age))
+    total_bytes = sum(path.stat().st_size for path in tmp_path.iterdir())
+    # Relue, l'entrée la plus ancienne devient la plus récente
+    assert cache.load(fingerprints[0]) is not None
+
+    cache.max_bytes = total_bytes - 1
+    evicted = cache.evict()
+
+    assert evicted == [fingerprints[1]]
+    assert cache.load(fingerprints[0]) is not None
+    assert cache.load(fingerprints[2]) is not None
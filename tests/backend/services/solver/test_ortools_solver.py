@@ -688,3 +688,41 @@ def test_existing_penalty_dominance_observability_ratios_present_and_sane():
     assert ratios["ratio_existing_change_medium_vs_one_understaff_weekday_day"] > 0
     assert ratios["ratio_existing_change_strong_vs_one_understaff_weekday_day"] < 1
     assert ratios["ratio_existing_change_medium_vs_one_understaff_weekday_day"] < 1
+
+
+def test_lexicographic_strategy_locks_coverage_then_reports_tier_bounds():
+    demands = [CoverageDemand(day_date=date(2026, 1, d), tranche_id=10, required_count=2, poste_id=1) for d in range(1, 4)]
+    inp = _build_input(end_date=date(2026, 1, 3), time_limit_seconds=3, coverage_demands=demands, v3_strategy="lexicographic")
+
+    grouped = _grouped(OrtoolsSolver().generate(inp))
+    lexico = grouped["cp_sat"]["phases"]["lexicographic"]
+
+    assert lexico["enabled"] is True
+    assert [tier["name"] for tier in lexico["tiers"]] == ["coverage", "fairness", "comfort"]
+    coverage, fairness, comfort = lexico["tiers"]
+    for tier in lexico["tiers"]:
+        assert tier["objective_value"] is not None
+        assert tier["gap"] is not None and tier["gap"] >= 0
+    # la couverture verrouillée n'est pas dégradée par les tiers suivants
+    assert coverage["locked_bound"] == coverage["objective_value"]
+    assert grouped["coverage"]["understaff_total_weighted"] <= coverage["locked_bound"]
+    assert fairness["locked_bound"] == fairness["objective_value"]
+    assert comfort["locked_bound"] is None
+    assert grouped["lns"]["lns_enabled"] is False
+    assert grouped["cp_sat"]["phases"]["phase1"]["phase1_best_objective_value"] == coverage["objective_value"]
+
+
+def test_lexicographic_coverage_matches_two_phase():
+    demands = [CoverageDemand(day_date=date(2026, 1, d), tranche_id=10, required_count=3, poste_id=1) for d in range(1, 3)]
+    base = dict(coverage_demands=demands, time_limit_seconds=3)
+
+    lexico = _grouped(OrtoolsSolver().generate(_build_input(v3_strategy="lexicographic", **base)))
+    two_phase = _grouped(OrtoolsSolver().generate(_build_input(v3_strategy="two_phase", **base)))
+
+    # 2 agents pour 3 places par jour : sous-effectif incompressible identique
+    assert lexico["coverage"]["understaff_total"] == two_phase["coverage"]["understaff_total"] == 2
+
+
+def test_lexicographic_disabled_by_default():
+    lexico = _grouped(OrtoolsSolver().generate(_build_input()))["cp_sat"]["phases"]["lexicographic"]
+    assert lexico == {"enabled": False, "tiers": []}
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+
+from ortools.sat.python import cp_model
+
+from backend.app.services.solver.models import CoverageDemand, SolverInput, TrancheInfo
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+from backend.app.services.solver.solution_extractor import index_getter, solution_values, sum_values
+
+
+def _solved_model():
+    model = cp_model.CpModel()
+    xs = [model.NewBoolVar(f"x{i}") for i in range(6)]
+    n = model.NewIntVar(0, 10, "n")
+    model.Add(n == sum(xs))
+    for i, x in enumerate(xs):
+        model.Add(x == i % 2)
+    solver = cp_model.CpSolver()
+    assert solver.Solve(model) == cp_model.OPTIMAL
+    return solver, xs, n
+
+
+def test_index_getter_matches_solver_value():
+    solver, xs, n = _solved_model()
+    values = solution_values(solver)
+
+    assert index_getter(xs)(values) == tuple(solver.Value(x) for x in xs)
+    assert index_getter([n])(values) == (3,)
+    assert index_getter([])(values) == ()
+    assert sum_values(values, xs) == solver.Value(n) == 3
+
+
+def test_generate_reports_extraction_timing():
+    start = date(2026, 1, 5)
+    days = [start + timedelta(days=i) for i in range(7)]
+    tranche = TrancheInfo(id=10, poste_id=1, heure_debut=time(8, 0), heure_fin=time(14, 0))
+    inp = SolverInput(
+        team_id=1,
+        start_date=days[0],
+        end_date=days[-1],
+        seed=1,
+        time_limit_seconds=3,
+        agent_ids=[1, 2, 3],
+        absences=set(),
+        qualified_postes_by_agent={1: (1,), 2: (1,), 3: (1,)},
+        qualification_date_by_agent_poste={(a, 1): None for a in (1, 2, 3)},
+        existing_day_type_by_agent_day={},
+        poste_ids=[1],
+        tranches=[tranche],
+        coverage_demands=[CoverageDemand(day_date=d, tranche_id=10, required_count=1, poste_id=1) for d in days],
+        v3_strategy="two_phase",
+    )
+
+    output = OrtoolsSolver().generate(inp)
+    timing = output.stats["stats"]["timing"]["global"]
+
+    assert timing["extraction_count"] >= 1
+    assert timing["extraction_wall_time_seconds_total"] >= 0.0
+    assert timing["final_extraction_wall_time_seconds"] >= 0.0
+    assert {(a.agent_id, a.day_date) for a in output.agent_days} == {(a, d) for a in (1, 2, 3) for d in days}
+    assert sorted({a.day_date for a in output.assignments}) == days
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+from datetime import date, time
+
+from backend.app.services.solver.models import CoverageDemand, SolverInput, TrancheInfo
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+from backend.app.services.solver.symmetry import detect_agent_equivalence_classes
+
+
+def _build_input(**kwargs) -> SolverInput:
+    agent_ids = kwargs.pop("agent_ids", [1, 2, 3, 4, 5])
+    base = dict(
+        team_id=1,
+        start_date=date(2026, 1, 5),
+        end_date=date(2026, 1, 8),
+        seed=7,
+        time_limit_seconds=5,
+        agent_ids=agent_ids,
+        absences=set(),
+        qualified_postes_by_agent={a: (1,) for a in agent_ids},
+        qualification_date_by_agent_poste={(a, 1): None for a in agent_ids},
+        existing_day_type_by_agent_day={},
+        poste_ids=[1],
+        tranches=[TrancheInfo(id=10, poste_id=1, heure_debut=time(8, 0), heure_fin=time(14, 0))],
+        coverage_demands=[
+            CoverageDemand(day_date=date(2026, 1, d), tranche_id=10, required_count=2, poste_id=1) for d in range(5, 9)
+        ],
+        v3_strategy="two_phase",
+    )
+    base.update(kwargs)
+    return SolverInput(**base)
+
+
+def test_classes_group_only_strictly_interchangeable_agents():
+    inp = _build_input(
+        absences={(4, date(2026, 1, 6))},
+        qualified_postes_by_agent={1: (1,), 2: (1,), 3: (1,), 4: (1,), 5: (1, 2)},
+        qualification_date_by_agent_poste={(1, 1): None, (2, 1): None, (3, 1): None, (4, 1): None, (5, 1): None, (5, 2): None},
+    )
+
+    classes = detect_agent_equivalence_classes(inp, [1, 2, 3, 4, 5])
+
+    assert classes.classes == [[1, 2, 3]]
+    assert classes.sizes == [3]
+    assert classes.agents_in_classes == 3
+    assert math.isclose(classes.group_size_log10, math.log10(6))
+
+
+def test_existing_context_and_qualification_dates_split_classes():
+    inp = _build_input(
+        existing_daytype_by_agent_day_ctx={(1, date(2026, 1, 4)): "rest", (2, date(2026, 1, 4)): "working"},
+        qualification_date_by_agent_poste={(1, 1): None, (2, 1): None, (3, 1): date(2026, 1, 7), (4, 1): None, (5, 1): None},
+    )
+
+    classes = detect_agent_equivalence_classes(inp, [1, 2, 3, 4, 5])
+
+    assert classes.classes == [[4, 5]]
+
+
+def test_class_ordering_keeps_optimum_and_reports_classes():
+    with_sym = OrtoolsSolver().generate(_build_input(enable_symmetry_breaking=True)).stats["stats"]
+    without_sym = OrtoolsSolver().generate(_build_input(enable_symmetry_breaking=False)).stats["stats"]
+
+    cp_sat = with_sym["cp_sat"]
+    assert cp_sat["symmetry_breaking_enabled"] is True
+    assert cp_sat["symmetry_classes_count"] == 1
+    assert cp_sat["symmetry_class_sizes"] == [5]
+    assert cp_sat["symmetry_constraints_count"] > 0
+    assert cp_sat["symmetry_group_size_log10"] > 2
+
+    assert without_sym["cp_sat"]["symmetry_constraints_count"] == 0
+    assert with_sym["coverage"]["understaff_total"] == without_sym["coverage"]["understaff_total"] == 0
+
+
+def test_heterogeneous_agents_get_no_ordering_constraint():
+    inp = _build_input(
+        agent_ids=[1, 2],
+        qualified_postes_by_agent={1: (1,), 2: (1,)},
+        qualification_date_by_agent_poste={(1, 1): None, (2, 1): None},
+        absences={(2, date(2026, 1, 5))},
+        enable_symmetry_breaking=True,
+    )
+
+    cp_sat = OrtoolsSolver().generate(inp).stats["stats"]["cp_sat"]
+
+    assert cp_sat["symmetry_classes_count"] == 0
+    assert cp_sat["symmetry_constraints_count"] == 0
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from backend.app.services.solver.calibration import calibration_input
+from backend.app.services.solver.ortools_solver import OrtoolsSolver
+from backend.app.services.solver.rh_combos import DayCombo, DayKind
+from backend.app.services.solver.warm_start import GptFrame, WarmStartDemand, build_greedy_warm_start
+
+REST = DayCombo(id=0, poste_id=None, tranche_ids=(), start_min=None, end_min=None, work_minutes=0, amplitude_minutes=0, involves_night=False, day_kind=DayKind.REST)
+DAY = DayCombo(id=2, poste_id=1, tranche_ids=(10,), start_min=480, end_min=960, work_minutes=480, amplitude_minutes=480, involves_night=False, day_kind=DayKind.WORK)
+COMBOS = {0: REST, 2: DAY}
+COMPATIBLE = {(a, b) for a in COMBOS for b in COMBOS}
+
+
+def _greedy(*, agents: list[int], num_days: int, demands: list[WarmStartDemand], gpt: GptFrame | None = None, **kwargs):
+    y_keys = [(a, di, c) for a in agents for di in range(num_days) for c in (0, 2)]
+    return build_greedy_warm_start(
+        ordered_agent_ids=agents,
+        num_days=num_days,
+        y_keys=y_keys,
+        combo_by_id=COMBOS,
+        compatible_pairs=COMPATIBLE,
+        demands=demands,
+        forced_rest=kwargs.pop("forced_rest", set()),
+        gpt=gpt,
+        **kwargs,
+    )
+
+
+def _worked_days(warm, agent_id: int) -> list[int]:
+    return sorted(di for (a, di, c), v in warm.assignment_map.items() if a == agent_id and c == 2 and v)
+
+
+def test_greedy_never_overcovers_and_prefers_least_loaded_agent():
+    demands = [WarmStartDemand(day_index=di, tranche_id=10, required_count=1, weight=1) for di in range(4)]
+
+    warm = _greedy(agents=[1, 2], num_days=4, demands=demands)
+
+    assert warm.understaff_total_unweighted == 0
+    assert len(_worked_days(warm, 1)) + len(_worked_days(warm, 2)) == 4
+    assert len(_worked_days(warm, 1)) == len(_worked_days(warm, 2)) == 2
+
+
+def test_greedy_extends_gpt_runs_to_minimum_and_caps_at_six_days():
+    # 4 jours de contexte repos avant la fenêtre de 8 jours, 3 après
+    num_ctx, offset = 15, 4
+    gpt = GptFrame(num_ctx_days=num_ctx, ctx_index_by_day_index={di: di + offset for di in range(8)}, fixed_ctx_days={})
+    demands = [WarmStartDemand(day_index=di, tranche_id=10, required_count=1, weight=1) for di in range(8)]
+
+    warm = _greedy(agents=[1], num_days=8, demands=demands, gpt=gpt, run_keys=[(1, s, e) for s in range(num_ctx) for e in range(s + 2, min(num_ctx, s + 6))])
+
+    # 6 jours max puis 2 jours off : deux jours restent découverts
+    assert _worked_days(warm, 1) == [0, 1, 2, 3, 4, 5]
+    assert warm.understaff_total_unweighted == 2
+    assert warm.rule_violations == 0
+    assert [key for key, v in warm.run_assignment_map.items() if v] == [(1, offset, offset + 5)]
+
+
+def test_greedy_does_not_start_a_run_that_cannot_reach_three_days():
+    gpt = GptFrame(num_ctx_days=6, ctx_index_by_day_index={di: di for di in range(4)}, fixed_ctx_days={(1, 4): (False, 0), (1, 5): (False, 0)})
+    demands = [WarmStartDemand(day_index=3, tranche_id=10, required_count=1, weight=1)]
+
+    warm = _greedy(agents=[1], num_days=4, demands=demands, gpt=gpt, forced_rest={(1, 1)})
+
+    # Le dernier jour ne peut ouvrir qu'un bloc d'un jour (contexte figé au repos ensuite)
+    assert _worked_days(warm, 1) == []
+    assert warm.understaff_total_unweighted == 1
+
+
+def test_warm_start_is_hinted_into_phase1():
+    inp = replace(calibration_input(seed=1, time_limit_seconds=4), v3_strategy="two_phase")
+
+    stats = OrtoolsSolver().generate(inp).stats["stats"]
+    warm = stats["cp_sat"]["phases"]["warm_start"]
+    phase1 = stats["cp_sat"]["phases"]["phase1"]
+
+    assert warm["enabled"] is True and warm["applied"] is True
+    assert warm["rule_violations"] == 0
+    assert warm["hint_accepted"] is True
+    assert warm["first_feasible_seconds"] is not None
+    assert phase1["phase1_understaff_total_unweighted"] <= warm["understaff_total_unweighted"]
+
+    disabled = OrtoolsSolver().generate(replace(inp, enable_warm_start=False)).stats["stats"]["cp_sat"]["phases"]["warm_start"]
+    assert disabled["enabled"] is False and disabled["applied"] is False
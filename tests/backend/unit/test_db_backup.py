@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from db.backup import (
+    BackupError,
+    _pg_missing_dependents,
+    _pg_tables,
+    create_backup,
+    find_backup,
+    list_backups,
+    prune_backups,
+    restore_backup,
+    verify_backup,
+)
+from db.base import Base
+from db.database import Database
+from db.models import Agent
+
+pytestmark = [pytest.mark.unit]
+
+T0 = datetime(2026, 10, 1, 2, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def database(tmp_path):
+    database = Database(f"sqlite:///{tmp_path / 'palaj.db'}")
+    Base.metadata.create_all(database.engine)
+    with database.session_scope() as session:
+        session.add_all([Agent(nom=f"A{i}", prenom="x") for i in range(25)])
+    return database
+
+
+def _agent_count(database) -> int:
+    with database.session_scope() as session:
+        return session.query(Agent).count()
+
+
+def test_sqlite_backup_then_restore_roundtrip(database, tmp_path):
+    report = create_backup(database, tmp_path / "backups", pages=1, now=T0)
+
+    assert report.path.name == "20261001_020000_sqlite"
+    assert report.manifest.rows["agents"] == 25
+    assert report.bytes_written > 0
+    assert "rows/s" in report.format()
+
+    with database.session_scope() as session:
+        session.query(Agent).filter(Agent.id > 5).delete()
+    assert _agent_count(database) == 5
+
+    restored = restore_backup(database, report.path)
+
+    assert restored.rows["agents"] == 25
+    assert _agent_count(database) == 25
+
+
+def test_verify_rejects_corrupted_backup(database, tmp_path):
+    report = create_backup(database, tmp_path / "backups", now=T0)
+    with open(report.path / "database.db", "r+b") as fh:
+        fh.seek(200)
+        fh.write(b"\x00corrupt\x00")
+
+    with pytest.raises(BackupError, match="Checksum mismatch"):
+        verify_backup(report.path)
+    with pytest.raises(BackupError):
+        restore_backup(database, report.path)
+    assert _agent_count(database) == 25
+
+
+def test_find_and_prune_follow_backup_dates(database, tmp_path):
+    root = tmp_path / "backups"
+    for days in range(5):
+        create_backup(database, root, now=T0 + timedelta(days=days))
+    (root / "20261010_000000_sqlite.partial").mkdir()
+
+    assert len(list_backups(root)) == 5
+    assert find_backup(root, T0 + timedelta(days=2, hours=12)).manifest.created_at == T0 + timedelta(days=2)
+    assert find_backup(root, T0 - timedelta(seconds=1)) is None
+
+    now = T0 + timedelta(days=4)
+    removed = prune_backups(root, keep_last=2, max_age=timedelta(days=3), now=now)
+    assert [e.manifest.created_at for e in removed] == [T0]
+
+    removed = prune_backups(root, keep_last=2, now=now)
+    assert len(removed) == 2
+    assert [e.manifest.created_at for e in list_backups(root)] == [T0 + timedelta(days=3), T0 + timedelta(days=4)]
+
+
+def test_partial_backup_lists_fk_dependent_tables_left_out():
+    missing = _pg_missing_dependents(["agents"])
+
+    assert {"agent_days", "qualifications"} <= set(missing["agents"])
+    assert _pg_missing_dependents(_pg_tables(None)) == {}
@@ -4,7 +4,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from backend.app.main import create_app
-from backend.app.api.deps import get_db, get_poste_coverage_requirement_service, get_tranche_service
+from backend.app.api.deps import get_db, get_poste_coverage_requirement_service, get_tranche_catalog
 from backend.app.api.deps_current_user import current_user
 
 pytestmark = [pytest.mark.unit]
@@ -16,8 +16,8 @@ class _FakeCoverageService:
         raise ValueError("Invalid coverage requirement")
 
 
-class _FakeTrancheService:
-    def list_by_poste_id(self, poste_id: int):
+class _FakeTrancheCatalog:
+    def for_poste(self, poste_id: int):
         return []
 
 
@@ -54,7 +54,7 @@ def test_put_coverage_poste_id_mismatch_is_400(client):
 
 def test_put_coverage_validation_is_422(client, app_auth):
     app_auth.dependency_overrides[get_poste_coverage_requirement_service] = lambda: _FakeCoverageService()
-    app_auth.dependency_overrides[get_tranche_service] = lambda: _FakeTrancheService()
+    app_auth.dependency_overrides[get_tranche_catalog] = lambda: _FakeTrancheCatalog()
 
     payload = {"poste_id": 123, "requirements": []}
     r = client.put(f"{API}/postes/123/coverage", json=payload)
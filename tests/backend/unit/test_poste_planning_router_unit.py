@@ -99,3 +99,30 @@ def test_delete_poste_day_value_error_is_400(client, app_auth):
     r = client.delete(f"{API}/postes/123/planning/days/{d}")
     assert r.status_code == 400, r.text
     assert "invalid" in r.text.lower()
+
+
+class _FakePosteServiceRange:
+    def __init__(self, exc: Exception):
+        self.exc = exc
+
+    def get_poste_coverage_for_range(self, **kwargs):
+        raise self.exc
+
+
+def test_get_postes_coverage_range_unknown_poste_is_404(client, app_auth):
+    exc = NotFoundError(code="poste_not_found", details={"poste_ids": [9]})
+    app_auth.dependency_overrides[get_poste_service] = lambda: _FakePosteServiceRange(exc)
+
+    today = date.today()
+    r = client.get(f"{API}/postes/planning/coverage/range?poste_ids=1&poste_ids=9&start_date={today}&end_date={today}")
+    assert r.status_code == 404, r.text
+    assert r.json()["detail"]["details"]["poste_ids"] == [9]
+
+
+def test_get_postes_coverage_range_invalid_range_is_400(client, app_auth):
+    exc = ValueError("start_date must be <= end_date")
+    app_auth.dependency_overrides[get_poste_service] = lambda: _FakePosteServiceRange(exc)
+
+    today = date.today()
+    r = client.get(f"{API}/postes/planning/coverage/range?poste_ids=1&start_date={today}&end_date={today}")
+    assert r.status_code == 400, r.text
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.app.services.query_audit import HotQuery, QueryPlanAuditor, run_audit, seed_audit_dataset
+from db.base import Base
+from db.database import Database
+
+pytestmark = [pytest.mark.unit]
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    database = Database("sqlite://")
+    Base.metadata.create_all(database.engine)
+    return database, seed_audit_dataset(database, agents=30, days=60, drafts_count=3)
+
+
+def test_hot_queries_do_not_scan_hot_tables(seeded):
+    database, dataset = seeded
+
+    report = run_audit(database, dataset)
+
+    assert report.findings
+    assert report.ok, report.format()
+
+
+def test_audit_flags_seq_scan_when_index_is_missing():
+    database = Database("sqlite://")
+    Base.metadata.create_all(database.engine)
+    dataset = seed_audit_dataset(database, agents=30, days=60, drafts_count=3)
+    with database.engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_qualifications_poste_agent")
+        conn.exec_driver_sql("ANALYZE")
+
+    report = run_audit(database, dataset)
+
+    assert not report.ok
+    assert {f.query for f in report.failures} == {"qualifications.list_for_poste"}
+    assert "SEQ SCAN qualifications" in report.format()
+
+
+def test_sqlite_index_only_scan_is_not_reported_as_seq_scan(seeded):
+    database, _ = seeded
+
+    def _select(sql: str):
+        def _run():
+            with database.engine.connect() as conn:
+                conn.exec_driver_sql(sql).all()
+
+        return _run
+
+    report = QueryPlanAuditor(database).audit(
+        [
+            HotQuery("covering", _select("SELECT agent_id FROM qualifications ORDER BY poste_id, agent_id")),
+            HotQuery("full", _select("SELECT * FROM qualifications")),
+        ]
+    )
+
+    by_name = {f.query: f for f in report.findings}
+    assert any("USING COVERING INDEX" in line for line in by_name["covering"].plan)
+    assert by_name["covering"].seq_scans == []
+    assert by_name["full"].seq_scans == ["qualifications"]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.api.deps import (
+    get_agent_planning_factory,
+    get_agent_planning_validator_service,
+    get_db,
+    get_team_service,
+)
+from backend.app.api.deps_current_user import current_user
+from backend.app.main import create_app
+from backend.app.mappers.rh.rh_day_aggregation import RhDayAggregator, severity_to_str
+from backend.app.mappers.rh.rh_validation_summary import HIGHLIGHT_RULES, to_poste_summary_dto
+from core.rh_rules.models.rh_violation import RhViolation
+from core.rh_rules.models.rule_result import RuleResult
+from core.utils.severity import Severity
+
+pytestmark = [pytest.mark.unit]
+API = "/api/v1"
+
+START = date(2026, 1, 1)
+END = date(2026, 3, 31)
+RULES = sorted(HIGHLIGHT_RULES) + ["OtherRule"]
+
+
+def _violation(rule: str, severity: Severity, start: date | None, end: date | None) -> RhViolation:
+    return RhViolation(
+        code="X",
+        rule_name=rule,
+        severity=severity,
+        message="m",
+        start_date=start,
+        end_date=end,
+    )
+
+
+def _random_results(seed: int, agents: int = 12, per_agent: int = 15):
+    rng = random.Random(seed)
+    out = []
+    for agent_id in range(1, agents + 1):
+        violations = []
+        for _ in range(per_agent):
+            if rng.random() < 0.05:
+                violations.append(_violation(rng.choice(RULES), Severity.ERROR, None, None))
+                continue
+            s = START + timedelta(days=rng.randint(-10, 95))
+            e = s + timedelta(days=rng.randint(0, 6))
+            sev = rng.choice([Severity.INFO, Severity.WARNING, Severity.ERROR])
+            violations.append(_violation(rng.choice(RULES), sev, s, e))
+        out.append((agent_id, RuleResult(violations=violations)))
+    return out
+
+
+def _naive(per_agent_results):
+    """Ancienne implémentation agents × jours × violations (référence)."""
+    expected = {}
+    d = START
+    while d <= END:
+        issues = blockers = 0
+        triggers = Counter()
+        for _, result in per_agent_results:
+            vs = [
+                v
+                for v in result.violations
+                if v.start_date is not None
+                and v.end_date is not None
+                and v.start_date <= d <= v.end_date
+                and v.rule_name in HIGHLIGHT_RULES
+                and v.severity != Severity.INFO
+            ]
+            if vs:
+                issues += 1
+                if any(v.severity == Severity.ERROR for v in vs):
+                    blockers += 1
+            for v in vs:
+                triggers[(v.rule_name, severity_to_str(v.severity))] += 1
+        expected[d] = (issues, blockers, triggers)
+        d += timedelta(days=1)
+    return expected
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_aggregator_matches_naive_per_day_scan(seed):
+    per_agent_results = _random_results(seed)
+    expected = _naive(per_agent_results)
+
+    days = RhDayAggregator(START, END, rule_names=HIGHLIGHT_RULES).add_results(per_agent_results).days()
+
+    assert [agg.day for agg in days] == sorted(expected)
+    for agg in days:
+        issues, blockers, triggers = expected[agg.day]
+        assert agg.agents_with_issues_count == issues
+        assert agg.agents_with_blockers_count == blockers
+        assert agg.triggers == triggers
+
+
+def test_overlapping_violations_count_agent_once_and_are_clipped():
+    result = RuleResult(
+        violations=[
+            _violation("ReposQuotidienRule", Severity.WARNING, START - timedelta(days=3), START + timedelta(days=1)),
+            _violation("AmplitudeMaxRule", Severity.ERROR, START + timedelta(days=1), START + timedelta(days=2)),
+        ]
+    )
+
+    dto = to_poste_summary_dto(
+        poste_id=1,
+        start=START,
+        end=START + timedelta(days=3),
+        profile="full",
+        qualified_agent_ids=[7],
+        per_agent_results=[(7, result)],
+    )
+
+    counts = [(d.agents_with_issues_count, d.agents_with_blockers_count, d.risk.value) for d in dto.days]
+    assert [c[:2] for c in counts] == [(1, 0), (1, 1), (1, 1), (0, 0)]
+    assert [t.key for t in dto.days[1].top_triggers] == ["ReposQuotidienRule", "AmplitudeMaxRule"]
+
+
+# -----------------------------
+# Route /rh/validate/team/summary
+# -----------------------------
+class _FakeTeamService:
+    def list_agent_ids(self, team_id: int):
+        return [2, 1]
+
+
+class _FakePlanningFactory:
+    def build(self, agent_id: int, start_date: date, end_date: date):
+        if agent_id == 2:
+            raise ValueError("boom")
+        return agent_id
+
+
+class _FakeValidator:
+    def validate(self, planning, window_start=None, window_end=None):
+        return RuleResult(violations=[_violation("DureeTravailRule", Severity.ERROR, START, START)])
+
+
+@pytest.fixture()
+def client():
+    app = create_app()
+
+    def _override_get_db():
+        yield None
+
+    app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[current_user] = lambda: {"id": 1, "username": "t", "role": "admin", "is_active": True}
+    app.dependency_overrides[get_team_service] = lambda: _FakeTeamService()
+    app.dependency_overrides[get_agent_planning_factory] = lambda: _FakePlanningFactory()
+    app.dependency_overrides[get_agent_planning_validator_service] = lambda: _FakeValidator()
+    with TestClient(app) as c:
+        yield c
+
+
+def test_team_summary_aggregates_validated_agents_and_reports_skipped(client):
+    payload = {"team_id": 3, "date_debut": str(START), "date_fin": str(START + timedelta(days=1))}
+    r = client.post(f"{API}/rh/validate/team/summary", json=payload)
+    assert r.status_code == 200, r.text
+
+    body = r.json()
+    assert body["team_id"] == 3
+    assert body["agents_count"] == 2
+    assert [s["agent_id"] for s in body["skipped"]] == [2]
+    assert body["days"][0]["agents_with_blockers_count"] == 1
+    assert body["days"][0]["risk"] == "high"
+    assert body["days"][1]["agents_with_issues_count"] == 0
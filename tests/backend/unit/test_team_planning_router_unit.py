@@ -14,6 +14,7 @@ from backend.app.api.deps import (
     get_team_planning_factory
 )
 from backend.app.api.deps_current_user import current_user
+from core.application.services.agent_day_service import AgentDayChangeFailure, BulkUpsertResult
 from core.application.services.exceptions import NotFoundError
 
 pytestmark = [pytest.mark.unit]
@@ -96,6 +97,18 @@ class _FakeAgentDayService:
         if (agent_id, day_date) in self.fail_on:
             raise ValueError("boom validation")
 
+    def bulk_upsert_days(self, changes):
+        result = BulkUpsertResult()
+        for c in changes:
+            self.calls.append((c.agent_id, c.day_date))
+            if (c.agent_id, c.day_date) in self.fail_on:
+                result.failed.append(
+                    AgentDayChangeFailure(agent_id=c.agent_id, day_date=c.day_date, message="boom validation")
+                )
+            else:
+                result.applied.append(c)
+        return result
+
 
 class _FakePlanningDay:
     def __init__(self, day_date: date, day_type: str, description=None, is_off_shift: bool = False, tranches=None):
@@ -121,6 +134,9 @@ class _FakePlanningDayAssembler:
             tranches=[],
         )
 
+    def build_for_agent_days(self, keys):
+        return {(agent_id, day_date): self.build_one_for_agent(agent_id, day_date) for agent_id, day_date in keys}
+
 
 def test_team_planning_requires_auth(client_no_auth):
     today = date.today()
@@ -1,24 +1,40 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 import pytest
 from fastapi.testclient import TestClient
 
 from backend.app.main import create_app
 from backend.app.api.deps import get_db, get_team_service
 from backend.app.api.deps_current_user import current_user
+from core.application.read_models.keyset_page_rm import KeysetPage
 from core.application.services.exceptions import ConflictError, NotFoundError
+from core.domain.entities.team import Team
 
 pytestmark = [pytest.mark.unit]
 API = "/api/v1"
 
 
 class _FakeTeamService:
+    def __init__(self):
+        self.keyset_calls = []
+
     def list(self, limit: int, offset: int):
         return []
 
     def count(self) -> int:
         return 0
 
+    def list_keyset(self, limit: int, after=None):
+        self.keyset_calls.append((limit, after))
+        if after is None:
+            return KeysetPage(items=[Team(id=1, name="A", description=None, created_at=datetime(2026, 1, 1))], next_key=("A", 1))
+        return KeysetPage(items=[Team(id=2, name="B", description=None, created_at=datetime(2026, 1, 1))], next_key=None)
+
+    def count_estimate(self):
+        return 2, True
+
     def create(self, name: str, description: str | None = None):
         raise ConflictError(code="TEAM_ALREADY_EXISTS")
 
@@ -123,3 +139,28 @@ def test_delete_team_is_204(client, app_auth):
 
     r = client.delete(f"{API}/teams/123")
     assert r.status_code == 204, r.text
+
+
+def test_list_teams_keyset_mode_follows_cursor(client, app_auth):
+    service = _FakeTeamService()
+    app_auth.dependency_overrides[get_team_service] = lambda: service
+
+    r1 = client.get(f"{API}/teams?cursor=&page_size=1")
+    assert r1.status_code == 200, r1.text
+    meta = r1.json()["meta"]
+    assert [t["name"] for t in r1.json()["items"]] == ["A"]
+    assert meta["total"] is None and meta["next_cursor"]
+
+    r2 = client.get(f"{API}/teams", params={"cursor": meta["next_cursor"], "page_size": 1, "with_total": True})
+    assert r2.status_code == 200, r2.text
+    assert [t["name"] for t in r2.json()["items"]] == ["B"]
+    assert r2.json()["meta"]["next_cursor"] is None
+    assert r2.json()["meta"]["total"] == 2 and r2.json()["meta"]["total_is_estimate"] is True
+    assert service.keyset_calls == [(1, None), (1, ("A", 1))]
+
+
+def test_list_teams_invalid_cursor_is_400(client, app_auth):
+    app_auth.dependency_overrides[get_team_service] = lambda: _FakeTeamService()
+
+    r = client.get(f"{API}/teams?cursor=%%%")
+    assert r.status_code == 400, r.text
@@ -0,0 +1,120 @@
+# tests/core/application/services/test_agent_day_service_bulk.py
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+
+from core.application.services.agent_day_service import AgentDayChange, AgentDayService
+from core.application.services.planning.planning_cache import PlanningVersions
+from core.domain.enums.day_type import DayType
+from db.base import Base
+from db.database import Database
+from db.models import AgentDay as AgentDayModel, AgentDayAssignment as AgentDayAssignmentModel
+from db.repositories.agent_day_assignment_repo import AgentDayAssignmentRepository
+from db.repositories.agent_day_repo import AgentDayRepository
+
+pytestmark = [pytest.mark.unit]
+
+D1 = date(2026, 3, 2)
+D2 = date(2026, 3, 3)
+
+
+@pytest.fixture()
+def database() -> Database:
+    database = Database("sqlite://")
+    Base.metadata.create_all(database.engine)
+    return database
+
+
+@pytest.fixture()
+def repo(database) -> AgentDayRepository:
+    repo = AgentDayRepository()
+    repo.db = database
+    return repo
+
+
+@pytest.fixture()
+def service(repo, database) -> AgentDayService:
+    assignment_repo = AgentDayAssignmentRepository()
+    assignment_repo.db = database
+    return AgentDayService(repo, assignment_repo, planning_versions=PlanningVersions())
+
+
+def _statements(database: Database, fn) -> int:
+    before = database.stats["queries"]
+    fn()
+    return database.stats["queries"] - before
+
+
+def test_bulk_upsert_creates_then_updates_in_place(service, repo, database):
+    changes = [
+        AgentDayChange(agent_id=agent_id, day_date=d, day_type=DayType.WORKING, tranche_id=4, description="a")
+        for agent_id in (1, 2)
+        for d in (D1, D2)
+    ]
+    result = service.bulk_upsert_days(changes)
+    assert len(result.applied) == 4 and result.failed == []
+
+    first_id = repo.get_by_agent_and_date(1, D1).id
+
+    service.bulk_upsert_days([AgentDayChange(agent_id=1, day_date=D1, day_type=DayType.REST, description="b")])
+
+    day = repo.get_by_agent_and_date(1, D1)
+    assert day.id == first_id
+    assert day.day_type == "rest" and day.description == "b"
+    assert day.tranche_ids == []
+    assert repo.get_by_agent_and_date(2, D2).tranche_ids == [4]
+
+    with database.session_scope() as session:
+        assert session.scalar(select(func.count()).select_from(AgentDayModel)) == 4
+        assert session.scalar(select(func.count()).select_from(AgentDayAssignmentModel)) == 3
+
+
+def test_bulk_upsert_statement_count_does_not_grow_with_days(service, database):
+    def month(agent_ids):
+        return [
+            AgentDayChange(agent_id=a, day_date=date(2026, 3, d), day_type=DayType.WORKING, tranche_id=4)
+            for a in agent_ids
+            for d in range(1, 29)
+        ]
+
+    small = _statements(database, lambda: service.bulk_upsert_days(month([1])))
+    large = _statements(database, lambda: service.bulk_upsert_days(month([2, 3, 4, 5])))
+    # 4x plus de cellules : seuls les chunks d'INSERT ajoutent des statements
+    assert large <= small + 2
+
+
+def test_bulk_upsert_reports_invalid_changes_and_applies_the_rest(service, repo):
+    result = service.bulk_upsert_days(
+        [
+            AgentDayChange(agent_id=1, day_date=D1, day_type=DayType.REST, tranche_id=4),
+            AgentDayChange(agent_id=1, day_date=D2, day_type=DayType.WORKING, tranche_id=4),
+            AgentDayChange(agent_id=1, day_date=D2, day_type=DayType.LEAVE),
+        ]
+    )
+
+    assert [(c.agent_id, c.day_date) for c in result.applied] == [(1, D2)]
+    assert [f.message for f in result.failed] == [
+        "tranche_id must be null when day_type is not working",
+        "duplicate (agent_id, day_date) in changes",
+    ]
+    assert repo.get_by_agent_and_date(1, D1) is None
+    assert repo.get_by_agent_and_date(1, D2).day_type == "working"
+
+
+def test_bulk_upsert_bumps_each_agent_version_once(service):
+    versions = service.planning_versions
+    before = versions.token(agent_ids=[1, 2, 3])
+
+    service.bulk_upsert_days(
+        [
+            AgentDayChange(agent_id=1, day_date=D1, day_type=DayType.REST),
+            AgentDayChange(agent_id=1, day_date=D2, day_type=DayType.REST),
+            AgentDayChange(agent_id=2, day_date=D1, day_type=DayType.REST),
+        ]
+    )
+
+    after = versions.token(agent_ids=[1, 2, 3])
+    assert after[2] == (before[2][0] + 1, before[2][1] + 1, before[2][2])
@@ -10,7 +10,9 @@ import pytest
 from backend.app.settings import settings
 
 # Importe ton service + erreurs
-from core.application.services.auth_service import AuthService, AuthError, LoginResult
+from core.application.services.auth_service import (
+    AuthService, AuthError, LoginBusyError, LoginResult, LoginThrottledError
+)
 
 # Importe le modèle RefreshToken (SQLAlchemy mapped ok, on l'utilise juste en objet Python)
 from db.models.refresh_token import RefreshToken
@@ -27,6 +29,7 @@ class FakeUser:
     password_hash: str
     role: str
     is_active: bool = True
+    token_version: int = 0
 
 
 class FakeUserRepo:
@@ -40,6 +43,9 @@ class FakeUserRepo:
     def get_by_id(self, user_id: int) -> Optional[FakeUser]:
         return self.by_id.get(user_id)
 
+    def bump_token_version(self, user_id: int) -> None:
+        self.by_id[user_id].token_version += 1
+
 
 class FakeRefreshTokenRepo:
     """
@@ -186,6 +192,45 @@ def test_login_success_creates_token_pair_and_persists_refresh(monkeypatch, auth
     assert rt_repo._commits == 1
 
 
+@pytest.mark.unit
+def test_login_throttles_username_after_repeated_failures(monkeypatch, user_repo, rt_repo):
+    import core.application.services.auth_service as auth_service_module
+    from backend.app.security.login_throttle import LoginThrottle
+
+    throttle = LoginThrottle(max_failures_per_user=3, window_seconds=60, lockout_seconds=60)
+    service = AuthService(users=user_repo, refresh_tokens=rt_repo, throttle=throttle)
+
+    for _ in range(3):
+        with pytest.raises(AuthError):
+            service.login("user", "wrong", user_agent=None, ip="10.0.0.1")
+
+    def _must_not_verify(*_args):
+        raise AssertionError("argon2 must not run while throttled")
+
+    monkeypatch.setattr(auth_service_module, "verify_and_update_password", _must_not_verify)
+    with pytest.raises(LoginThrottledError) as exc:
+        service.login("USER", "user123", user_agent=None, ip="10.0.0.2")
+    assert exc.value.retry_after > 0
+
+
+@pytest.mark.unit
+def test_login_rehashes_password_when_argon2_parameters_changed(monkeypatch, auth_service, user_repo):
+    from passlib.context import CryptContext
+
+    _set_deterministic_refresh_tokens(monkeypatch, ["rt_1"])
+    legacy = CryptContext(schemes=["argon2"], argon2__rounds=1, argon2__memory_cost=8192, argon2__parallelism=1)
+    user = user_repo.get_by_id(2)
+    user.password_hash = legacy.hash("user123")
+    old_hash = user.password_hash
+
+    auth_service.login("user", "user123", user_agent=None, ip=None)
+
+    assert user.password_hash != old_hash
+    from backend.app.security.password import password_hasher
+    assert not password_hasher.needs_update(user.password_hash)
+    assert password_hasher.verify("user123", user.password_hash)
+
+
 @pytest.mark.unit
 def test_login_bad_credentials_raises(auth_service):
     with pytest.raises(AuthError):
@@ -201,6 +246,49 @@ def test_login_inactive_user_raises(auth_service):
         auth_service.login("inactive", "inactive123", user_agent=None, ip=None)
 
 
+@pytest.mark.unit
+def test_alogin_issues_the_same_token_pair_as_login(monkeypatch, auth_service, rt_repo):
+    import asyncio
+
+    _set_deterministic_refresh_tokens(monkeypatch, ["rt_1"])
+
+    pair = asyncio.run(auth_service.alogin("user", "user123", user_agent="pytest", ip="127.0.0.1"))
+
+    assert pair.refresh_token == "rt_1"
+    assert rt_repo.tokens[0].user_id == 2
+    assert rt_repo._commits == 1
+
+    with pytest.raises(AuthError):
+        asyncio.run(auth_service.alogin("user", "wrong", user_agent=None, ip=None))
+
+
+@pytest.mark.unit
+def test_alogin_saturated_hasher_fails_fast_without_holding_a_thread(monkeypatch, auth_service):
+    import asyncio
+    import threading
+
+    import core.application.services.auth_service as auth_service_module
+    from backend.app.security.password import PasswordHasher
+
+    hasher = PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1, max_workers=1, max_pending=0)
+    gate = threading.Event()
+    monkeypatch.setattr(hasher.context, "hash", lambda _password: gate.wait(5) and "hash")
+    monkeypatch.setattr(auth_service_module, "averify_and_update_password", hasher.averify_and_update)
+
+    async def _scenario():
+        # Le seul slot du pool argon2 est occupé par un hachage en cours
+        pending = asyncio.create_task(hasher.ahash("secret"))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(LoginBusyError):
+                await auth_service.alogin("user", "user123", user_agent=None, ip=None)
+        finally:
+            gate.set()
+        return await pending
+
+    assert asyncio.run(_scenario()) == "hash"
+
+
 @pytest.mark.unit
 def test_refresh_rotates_refresh_and_revokes_old(monkeypatch, auth_service, rt_repo):
     # 1) login -> refresh token rt_1
@@ -280,7 +368,7 @@ def test_logout_revokes_current_refresh_if_active(monkeypatch, auth_service, rt_
 
 
 @pytest.mark.unit
-def test_logout_all_revokes_all_active_tokens(monkeypatch, auth_service, rt_repo):
+def test_logout_all_revokes_all_active_tokens(monkeypatch, auth_service, rt_repo, user_repo):
     _set_deterministic_refresh_tokens(monkeypatch, ["rt_1", "rt_2"])
     _force_refresh_expires_at(monkeypatch, utcnow() + timedelta(days=30))
 
@@ -292,3 +380,5 @@ def test_logout_all_revokes_all_active_tokens(monkeypatch, auth_service, rt_repo
     count = auth_service.logout_all(user_id=2)
     assert count == 2
     assert all(t.revoked_at is not None for t in rt_repo.tokens)
+    # les access tokens en cours sont révoqués aussi
+    assert user_repo.get_by_id(2).token_version == 1
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from core.application.read_models.eligibility_rm import EligibilityRM
+from core.application.services.eligibility_cache import EligibilityCache
+from db.base import Base
+from db.database import Database
+from db.models import Agent, AgentTeam, Poste, Qualification, Team
+from db.repositories.eligibility_repo import EligibilityRepository
+
+pytestmark = [pytest.mark.unit]
+
+
+def _rm() -> EligibilityRM:
+    return EligibilityRM.build(
+        qualifications=[(1, 10, date(2026, 3, 1)), (2, 10, None), (2, 20, date(2025, 1, 1))],
+        memberships=[(1, 7), (2, 7), (3, 8)],
+    )
+
+
+def test_rm_lookups_respect_qualification_date():
+    rm = _rm()
+
+    assert rm.qualified_agent_ids(10) == [1, 2]
+    assert rm.qualified_agent_ids(10, on=date(2026, 2, 1)) == [2]
+    assert rm.is_qualified(1, 10, on=date(2026, 3, 1))
+    assert not rm.is_qualified(1, 20)
+    assert rm.qualified_poste_ids(2) == [10, 20]
+    assert rm.qualification_date(2, 20) == date(2025, 1, 1)
+    assert rm.team_agent_ids(7) == [1, 2]
+    assert rm.agent_team_ids(3) == [8]
+    assert rm.qualified_agent_ids(999) == []
+    # même ordre que QualificationRepository.list_for_poste : date croissante, sans date en dernier
+    assert [q.agent_id for q in rm.qualifications_for_poste(10)] == [1, 2]
+
+
+class _CountingRepo:
+    def __init__(self):
+        self.loads = 0
+        self.on_load = None
+
+    def load(self) -> EligibilityRM:
+        self.loads += 1
+        if self.on_load:
+            self.on_load()
+        return _rm()
+
+
+def test_cache_loads_once_until_invalidated_or_expired():
+    now = [0.0]
+    repo = _CountingRepo()
+    cache = EligibilityCache(repo, ttl_seconds=60, clock=lambda: now[0])
+
+    assert cache.get() is cache.get()
+    assert repo.loads == 1
+
+    cache.invalidate()
+    cache.get()
+    assert repo.loads == 2
+
+    now[0] = 61.0
+    cache.get()
+    assert repo.loads == 3
+
+
+def test_cache_does_not_keep_snapshot_invalidated_while_loading():
+    repo = _CountingRepo()
+    cache = EligibilityCache(repo)
+    repo.on_load = cache.invalidate  # écriture concurrente pendant le chargement
+
+    cache.get()
+    repo.on_load = None
+    cache.get()
+
+    assert repo.loads == 2
+
+
+def test_repository_loads_matrix_in_one_query():
+    database = Database("sqlite://")
+    Base.metadata.create_all(database.engine)
+    with database.session_scope() as session:
+        team = Team(name="T")
+        agents = [Agent(nom=f"A{i}", prenom="x") for i in range(3)]
+        poste = Poste(nom="P")
+        session.add_all([team, poste, *agents])
+        session.flush()
+        session.add_all([AgentTeam(agent_id=a.id, team_id=team.id) for a in agents[:2]])
+        session.add(Qualification(agent_id=agents[1].id, poste_id=poste.id, date_qualification=date(2026, 1, 1)))
+        ids = (team.id, poste.id, [a.id for a in agents])
+
+    repo = EligibilityRepository()
+    repo.db = database
+    before = database.stats["queries"]
+
+    rm = repo.load()
+
+    assert database.stats["queries"] - before == 1
+    team_id, poste_id, agent_ids = ids
+    assert rm.team_agent_ids(team_id) == agent_ids[:2]
+    assert rm.qualified_agent_ids(poste_id) == [agent_ids[1]]
+    assert rm.qualification_date(agent_ids[1], poste_id) == date(2026, 1, 1)
@@ -0,0 +1,64 @@
+# tests/core/application/services/test_keyset_pagination.py
+from __future__ import annotations
+
+import pytest
+
+from db.base import Base
+from db.database import Database
+from db.models import Agent
+from db.repositories.agent_repo import AgentRepository
+
+pytestmark = [pytest.mark.unit]
+
+
+@pytest.fixture()
+def repo() -> AgentRepository:
+    database = Database("sqlite://")
+    Base.metadata.create_all(database.engine)
+    with database.session_scope() as session:
+        # doublons de (nom, prenom) : l'id départage
+        names = [("Martin", "Paul"), ("Durand", "Léa"), ("Martin", "Paul"), ("Bernard", "Luc"), ("Durand", "Anne")]
+        session.add_all([Agent(nom=nom, prenom=prenom, actif=True) for nom, prenom in names])
+    repo = AgentRepository()
+    repo.db = database
+    return repo
+
+
+def test_keyset_pages_follow_default_order_without_gaps_or_duplicates(repo):
+    expected = [(a.nom, a.prenom, a.id) for a in repo.list()]
+
+    seen = []
+    after = None
+    pages = 0
+    while True:
+        page = repo.list_keyset(limit=2, after=after)
+        seen += [(a.nom, a.prenom, a.id) for a in page.items]
+        pages += 1
+        if page.next_key is None:
+            break
+        after = page.next_key
+
+    assert seen == expected
+    assert pages == 3
+
+
+def test_keyset_page_query_count_does_not_depend_on_depth(repo):
+    before = repo.db.stats["queries"]
+    first = repo.list_keyset(limit=2)
+    first_cost = repo.db.stats["queries"] - before
+
+    before = repo.db.stats["queries"]
+    repo.list_keyset(limit=2, after=first.next_key)
+    # pas de COUNT séparé, même coût que la première page
+    assert repo.db.stats["queries"] - before == first_cost
+
+
+def test_keyset_rejects_malformed_keys(repo):
+    with pytest.raises(ValueError):
+        repo.list_keyset(limit=2, after=("Martin", "Paul"))
+    with pytest.raises(ValueError):
+        repo.list_keyset(limit=2, after=("Martin", "Paul", "not-an-id"))
+
+
+def test_count_estimate_is_exact_on_sqlite(repo):
+    assert repo.count_estimate() == (5, False)
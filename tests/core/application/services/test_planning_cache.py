@@ -0,0 +1,244 @@
+# tests/core/application/services/test_planning_cache.py
+from __future__ import annotations
+
+from datetime import date, time
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from core.application.services.agent_day_service import AgentDayService
+from core.application.services.agent_service import AgentService
+from core.application.services.tranche_service import TrancheService
+from core.application.read_models.eligibility_rm import EligibilityRM
+from core.application.services.planning.agent_planning_factory import AgentPlanningFactory
+from core.application.services.planning.planning_cache import (
+    PlanningReadCache,
+    PlanningVersions,
+    agent_planning_key,
+)
+from core.domain.entities import Tranche
+from core.domain.entities.agent_day import AgentDay
+from core.domain.enums.day_type import DayType
+
+pytestmark = [pytest.mark.unit]
+
+D1 = date(2026, 1, 5)
+D2 = date(2026, 1, 11)
+
+
+# -----------------------------
+# Fakes
+# -----------------------------
+class FakeAgentService:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_agent_complet(self, agent_id: int):
+        self.calls += 1
+        return {"id": agent_id}
+
+
+class FakeAssembler:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def build_for_agent(self, agent_id: int, start_date: date, end_date: date) -> List[str]:
+        self.calls += 1
+        return [f"{agent_id}:{start_date}:{end_date}:{self.calls}"]
+
+
+class FakeAgentDayRepo:
+    def __init__(self) -> None:
+        self.days: Dict[Tuple[int, date], AgentDay] = {}
+
+    def get_by_agent_and_date(self, agent_id: int, day_date: date) -> Optional[AgentDay]:
+        return self.days.get((agent_id, day_date))
+
+    def create(self, agent_day: AgentDay) -> AgentDay:
+        agent_day.id = len(self.days) + 1
+        self.days[(agent_day.agent_id, agent_day.day_date)] = agent_day
+        return agent_day
+
+    def update(self, agent_day: AgentDay) -> AgentDay:
+        self.days[(agent_day.agent_id, agent_day.day_date)] = agent_day
+        return agent_day
+
+    def delete_by_agent_and_date(self, agent_id: int, day_date: date) -> bool:
+        return self.days.pop((agent_id, day_date), None) is not None
+
+
+class FakeAssignmentRepo:
+    def delete_by_agent_day_id(self, agent_day_id: int) -> None:
+        pass
+
+    def create(self, assignment):
+        return assignment
+
+
+class FakeTrancheRepo:
+    def __init__(self) -> None:
+        self.tranches: Dict[int, Tranche] = {}
+
+    def get_by_id(self, tranche_id: int) -> Optional[Tranche]:
+        return self.tranches.get(tranche_id)
+
+    def update(self, tranche: Tranche) -> Tranche:
+        self.tranches[tranche.id] = tranche
+        return tranche
+
+
+@pytest.fixture()
+def versions() -> PlanningVersions:
+    return PlanningVersions()
+
+
+@pytest.fixture()
+def cache(versions) -> PlanningReadCache:
+    return PlanningReadCache(versions, max_entries=2)
+
+
+@pytest.fixture()
+def assembler() -> FakeAssembler:
+    return FakeAssembler()
+
+
+@pytest.fixture()
+def factory(cache, assembler) -> AgentPlanningFactory:
+    return AgentPlanningFactory(
+        agent_service=FakeAgentService(),
+        planning_day_assembler=assembler,
+        read_cache=cache,
+    )
+
+
+def test_second_build_is_served_from_cache(factory, cache, assembler):
+    first = factory.build(agent_id=1, start_date=D1, end_date=D2)
+    second = factory.build(agent_id=1, start_date=D1, end_date=D2)
+
+    assert second is first
+    assert assembler.calls == 1
+    assert cache.get(agent_planning_key(1, D1, D2)).etag.startswith('W/"')
+
+
+def test_agent_day_write_invalidates_only_that_agent(factory, cache, versions, assembler):
+    day_service = AgentDayService(FakeAgentDayRepo(), FakeAssignmentRepo(), planning_versions=versions)
+    factory.build(agent_id=1, start_date=D1, end_date=D2)
+    factory.build(agent_id=2, start_date=D1, end_date=D2)
+    etag_before = cache.get(agent_planning_key(1, D1, D2)).etag
+
+    day_service.upsert_day(agent_id=1, day_date=D1, day_type=DayType.REST)
+
+    assert cache.get(agent_planning_key(1, D1, D2)) is None
+    assert cache.get(agent_planning_key(2, D1, D2)) is not None
+
+    factory.build(agent_id=1, start_date=D1, end_date=D2)
+    assert assembler.calls == 3
+    assert cache.get(agent_planning_key(1, D1, D2)).etag != etag_before
+
+
+def test_bump_all_invalidates_every_entry(factory, cache, versions):
+    factory.build(agent_id=1, start_date=D1, end_date=D2)
+    versions.bump_all()
+    assert cache.get(agent_planning_key(1, D1, D2)) is None
+
+
+def test_stale_token_entry_is_never_served(cache, versions):
+    # Token pris avant la lecture ; une écriture concurrente le rend obsolète.
+    token = versions.token(agent_ids=[1])
+    versions.bump_agents([1])
+    cache.put(("agent", 1), "stale", token=token, agent_ids=[1])
+
+    assert cache.get(("agent", 1)) is None
+
+
+def test_lru_is_bounded(factory, cache, assembler):
+    for agent_id in (1, 2, 3):
+        factory.build(agent_id=agent_id, start_date=D1, end_date=D2)
+
+    assert cache.get(agent_planning_key(1, D1, D2)) is None
+    assert cache.get(agent_planning_key(3, D1, D2)) is not None
+
+
+def test_disabled_cache_always_rebuilds(versions, assembler):
+    factory = AgentPlanningFactory(
+        agent_service=FakeAgentService(),
+        planning_day_assembler=assembler,
+        read_cache=PlanningReadCache(versions, enabled=False),
+    )
+    factory.build(agent_id=1, start_date=D1, end_date=D2)
+    factory.build(agent_id=1, start_date=D1, end_date=D2)
+    assert assembler.calls == 2
+
+
+def test_tranche_rename_changes_agent_planning_etag(factory, cache, versions):
+    tranche_repo = FakeTrancheRepo()
+    tranche_repo.tranches[10] = Tranche(id=10, nom="Matin", heure_debut=time(6, 0), heure_fin=time(14, 0), poste_id=1)
+    tranche_service = TrancheService(
+        poste_repo=None, tranche_repo=tranche_repo, agent_day_assignment_repo=None, planning_versions=versions
+    )
+    factory.build(agent_id=1, start_date=D1, end_date=D2)
+    etag_before = cache.get(agent_planning_key(1, D1, D2)).etag
+
+    tranche_service.update(10, nom="Aube")
+
+    assert cache.get(agent_planning_key(1, D1, D2)) is None
+    factory.build(agent_id=1, start_date=D1, end_date=D2)
+    assert cache.get(agent_planning_key(1, D1, D2)).etag != etag_before
+
+
+def test_entries_expire_after_ttl_with_a_new_etag(versions, assembler):
+    now = [0.0]
+    cache = PlanningReadCache(versions, ttl_seconds=60.0, clock=lambda: now[0])
+    factory = AgentPlanningFactory(
+        agent_service=FakeAgentService(), planning_day_assembler=assembler, read_cache=cache
+    )
+    factory.build(agent_id=1, start_date=D1, end_date=D2)
+    etag_before = cache.get(agent_planning_key(1, D1, D2)).etag
+
+    # Écriture hors services (import, restauration) : aucun compteur ne bouge
+    now[0] = 61.0
+    assert cache.get(agent_planning_key(1, D1, D2)) is None
+
+    factory.build(agent_id=1, start_date=D1, end_date=D2)
+    assert assembler.calls == 2
+    assert cache.get(agent_planning_key(1, D1, D2)).etag != etag_before
+
+
+class FakeAgentRepo:
+    def get_by_id(self, agent_id: int):
+        return {"id": agent_id}
+
+    def delete(self, agent_id: int) -> bool:
+        return True
+
+
+class FakeAgentDayExistence:
+    def exists_for_agent(self, agent_id: int) -> bool:
+        return False
+
+
+class FakeEligibility:
+    def __init__(self, snapshot: EligibilityRM) -> None:
+        self.snapshot = snapshot
+
+    def get(self) -> EligibilityRM:
+        return self.snapshot
+
+    def invalidate(self) -> None:
+        pass
+
+
+def test_agent_delete_invalidates_its_team_and_poste_plannings(versions):
+    eligibility = FakeEligibility(EligibilityRM.build(qualifications=[(1, 7, None)], memberships=[(1, 3)]))
+    agent_service = AgentService(
+        FakeAgentRepo(), FakeAgentDayExistence(), None, None, planning_versions=versions, eligibility=eligibility
+    )
+    team_token = versions.token(team_ids=[3])
+    poste_token = versions.token(poste_ids=[7])
+    other_team_token = versions.token(team_ids=[4])
+
+    assert agent_service.delete(1) is True
+
+    assert versions.token(team_ids=[3]) != team_token
+    assert versions.token(poste_ids=[7]) != poste_token
+    assert versions.token(team_ids=[4]) == other_team_token
@@ -0,0 +1,97 @@
+# tests/core/application/services/test_poste_coverage_range.py
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+
+import pytest
+
+from core.application.services.exceptions import NotFoundError
+from core.application.services.poste_service import PosteService
+from db.base import Base
+from db.database import Database
+from db.models import (
+    Agent,
+    AgentDay,
+    AgentDayAssignment,
+    Poste,
+    PosteCoverageRequirement,
+    Tranche,
+)
+from db.repositories.poste_repo import PosteRepository
+
+pytestmark = [pytest.mark.unit]
+
+MONDAY = date(2026, 3, 2)
+
+
+@pytest.fixture()
+def database() -> Database:
+    database = Database("sqlite://")
+    Base.metadata.create_all(database.engine)
+    with database.session_scope() as session:
+        p1, p2 = Poste(nom="GTI"), Poste(nom="GM")
+        session.add_all([p1, p2])
+        session.flush()
+        morning = Tranche(nom="M", heure_debut=time(6, 0), heure_fin=time(14, 0), poste_id=p1.id)
+        evening = Tranche(nom="S", heure_debut=time(14, 0), heure_fin=time(22, 0), poste_id=p1.id)
+        night = Tranche(nom="N", heure_debut=time(22, 0), heure_fin=time(6, 0), poste_id=p2.id)
+        agents = [Agent(nom=f"A{i}", prenom="x", actif=True) for i in range(3)]
+        session.add_all([morning, evening, night, *agents])
+        session.flush()
+
+        session.add_all(
+            [
+                # lundi : 2 le matin, mardi : 1 le soir
+                PosteCoverageRequirement(poste_id=p1.id, tranche_id=morning.id, weekday=0, required_count=2),
+                PosteCoverageRequirement(poste_id=p1.id, tranche_id=evening.id, weekday=1, required_count=1),
+                PosteCoverageRequirement(poste_id=p2.id, tranche_id=night.id, weekday=0, required_count=1),
+            ]
+        )
+        for agent, (day, tranche) in zip(agents, [(MONDAY, morning), (MONDAY, morning), (MONDAY + timedelta(days=8), evening)]):
+            agent_day = AgentDay(agent_id=agent.id, day_date=day, day_type="working", is_off_shift=False)
+            session.add(agent_day)
+            session.flush()
+            session.add(AgentDayAssignment(agent_day_id=agent_day.id, tranche_id=tranche.id))
+    return database
+
+
+@pytest.fixture()
+def service(database) -> PosteService:
+    repo = PosteRepository()
+    repo.db = database
+    return PosteService(poste_repo=repo, qualification_repo=None, tranche_repo=None)
+
+
+def test_range_coverage_is_columnar_and_uses_one_query(service, database):
+    before = database.stats["queries"]
+    rm = service.get_poste_coverage_for_range(poste_ids=[1], start_date=MONDAY, end_date=MONDAY + timedelta(days=8))
+    # 1 lookup d'existence par poste + 1 requête agrégée
+    assert database.stats["queries"] - before == 2
+
+    assert len(rm.days) == 9
+    assert [t.tranche_nom for t in rm.tranches] == ["M", "S"]
+    morning, evening = rm.tranches
+    assert morning.required_counts == [2, 0, 0, 0, 0, 0, 0, 2, 0]
+    assert morning.assigned_counts == [2, 0, 0, 0, 0, 0, 0, 0, 0]
+    assert evening.required_counts == [0, 1, 0, 0, 0, 0, 0, 0, 1]
+    assert evening.assigned_counts == [0, 0, 0, 0, 0, 0, 0, 0, 1]
+
+
+def test_range_coverage_spans_several_postes(service):
+    rm = service.get_poste_coverage_for_range(poste_ids=[2, 1, 2], start_date=MONDAY, end_date=MONDAY)
+
+    assert rm.poste_ids == [2, 1]
+    assert [(t.poste_id, t.tranche_nom, t.required_counts) for t in rm.tranches] == [
+        (1, "M", [2]),
+        (1, "S", [0]),
+        (2, "N", [1]),
+    ]
+
+
+def test_range_coverage_validates_input(service):
+    with pytest.raises(NotFoundError):
+        service.get_poste_coverage_for_range(poste_ids=[1, 42], start_date=MONDAY, end_date=MONDAY)
+    with pytest.raises(ValueError):
+        service.get_poste_coverage_for_range(poste_ids=[1], start_date=MONDAY, end_date=MONDAY - timedelta(days=1))
+    with pytest.raises(ValueError):
+        service.get_poste_coverage_for_range(poste_ids=[1], start_date=MONDAY, end_date=MONDAY + timedelta(days=400))
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.application.services.refresh_token_retention_service import RefreshTokenRetentionService
+from db.base import Base
+from db.database import Database
+from db.models import User
+from db.models.refresh_token import RefreshToken
+from db.repositories.refresh_token_repo import SqlAlchemyRefreshTokenRepo
+
+pytestmark = [pytest.mark.unit]
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def database():
+    database = Database("sqlite://")
+    Base.metadata.create_all(database.engine)
+    with database.session_scope() as session:
+        session.add(User(id=1, username="u", password_hash="x", role="manager", is_active=True))
+    return database
+
+
+def _token(i: int, *, expires_at: datetime, revoked_at: datetime | None = None) -> RefreshToken:
+    return RefreshToken(user_id=1, token_hash=f"{i:064d}", expires_at=expires_at, revoked_at=revoked_at)
+
+
+def test_purge_removes_expired_and_long_revoked_tokens_in_batches(database):
+    with database.session_scope() as session:
+        # 5 expirés depuis longtemps, 3 révoqués depuis 10 jours, 2 révoqués hier, 4 actifs
+        session.add_all([_token(i, expires_at=NOW - timedelta(days=3)) for i in range(5)])
+        session.add_all(
+            [_token(10 + i, expires_at=NOW + timedelta(days=20), revoked_at=NOW - timedelta(days=10)) for i in range(3)]
+        )
+        session.add_all(
+            [_token(20 + i, expires_at=NOW + timedelta(days=20), revoked_at=NOW - timedelta(days=1)) for i in range(2)]
+        )
+        session.add_all([_token(30 + i, expires_at=NOW + timedelta(days=20)) for i in range(4)])
+
+    with database.session_scope() as session:
+        repo = SqlAlchemyRefreshTokenRepo(session)
+        report = RefreshTokenRetentionService(repo, revoked_retention=timedelta(days=7), batch_size=2).purge(now=NOW)
+
+    assert report.expired_deleted == 5
+    assert report.revoked_deleted == 3
+    assert report.remaining_rows == 6
+    # 5 expirés -> 3 lots, 3 révoqués -> 2 lots
+    assert report.batches == 5
+    assert report.table_size_bytes is None  # SQLite
+
+    with database.session_scope() as session:
+        hashes = {h for (h,) in session.query(RefreshToken.token_hash)}
+    assert hashes == {f"{i:064d}" for i in (20, 21, 30, 31, 32, 33)}
+
+
+def test_purge_within_grace_keeps_recently_expired_tokens(database):
+    with database.session_scope() as session:
+        session.add(_token(1, expires_at=NOW - timedelta(minutes=10)))
+
+    with database.session_scope() as session:
+        report = RefreshTokenRetentionService(
+            SqlAlchemyRefreshTokenRepo(session), expired_grace=timedelta(hours=1)
+        ).purge(now=NOW)
+
+    assert report.deleted == 0
+    assert report.remaining_rows == 1
+
+
+def test_revoked_tokens_are_kept_while_they_could_still_be_replayed(database):
+    with database.session_scope() as session:
+        # révoqué il y a 10 jours, encore valide 20 jours : un rejeu doit rester détecté
+        session.add(_token(1, expires_at=NOW + timedelta(days=20), revoked_at=NOW - timedelta(days=10)))
+
+    with database.session_scope() as session:
+        service = RefreshTokenRetentionService(
+            SqlAlchemyRefreshTokenRepo(session),
+            revoked_retention=timedelta(days=7),
+            refresh_token_lifetime=timedelta(days=30),
+        )
+        report = service.purge(now=NOW)
+
+    assert service.revoked_retention == timedelta(days=30)
+    assert report.deleted == 0
+    assert report.remaining_rows == 1
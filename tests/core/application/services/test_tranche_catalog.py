@@ -0,0 +1,94 @@
+# tests/core/application/services/test_tranche_catalog.py
+from __future__ import annotations
+
+from datetime import time
+
+import pytest
+
+from core.application.services.planning.tranche_catalog import TrancheCatalog
+from core.application.services.poste_service import PosteService
+from db.base import Base
+from db.database import Database
+from db.models import Agent, Poste, Qualification, Tranche
+from db.repositories.poste_repo import PosteRepository
+from db.repositories.qualification_repo import QualificationRepository
+from db.repositories.tranche_repo import TrancheRepository
+
+pytestmark = [pytest.mark.unit]
+
+
+@pytest.fixture()
+def database() -> Database:
+    database = Database("sqlite://")
+    Base.metadata.create_all(database.engine)
+    with database.session_scope() as session:
+        postes = [Poste(nom=f"P{i}") for i in range(4)]
+        agents = [Agent(nom=f"A{i}", prenom="x", actif=True) for i in range(3)]
+        session.add_all([*postes, *agents])
+        session.flush()
+        for p in postes:
+            # insérées dans le désordre : le catalogue trie par heure de début
+            session.add_all(
+                [
+                    Tranche(nom="S", heure_debut=time(14), heure_fin=time(22), poste_id=p.id),
+                    Tranche(nom="M", heure_debut=time(6), heure_fin=time(14), poste_id=p.id),
+                ]
+            )
+        session.add_all([Qualification(agent_id=a.id, poste_id=postes[i % 2].id) for i, a in enumerate(agents)])
+    return database
+
+
+def _repos(database):
+    repos = PosteRepository(), QualificationRepository(), TrancheRepository()
+    for repo in repos:
+        repo.db = database
+    return repos
+
+
+def test_catalog_loads_missing_postes_in_one_batch_and_sorts():
+    calls = []
+
+    def load(poste_ids):
+        calls.append(list(poste_ids))
+        return [
+            Tranche(id=3, nom="S", heure_debut=time(14), heure_fin=time(22), poste_id=1),
+            Tranche(id=1, nom="M", heure_debut=time(6), heure_fin=time(14), poste_id=1),
+        ]
+
+    catalog = TrancheCatalog(load)
+    by_poste = catalog.for_postes([2, 1, 2])
+
+    assert calls == [[1, 2]]
+    assert [t.nom for t in by_poste[1]] == ["M", "S"]
+    assert by_poste[2] == []
+
+    # déjà en cache : ni les postes connus ni les tranches ne sont relus
+    assert catalog.ids_for_poste(1) == [1, 3]
+    assert catalog.get(3).nom == "S"
+    assert catalog.loads == 1
+
+
+def test_list_postes_complets_uses_constant_queries(database):
+    poste_repo, qualification_repo, tranche_repo = _repos(database)
+    service = PosteService(poste_repo=poste_repo, qualification_repo=qualification_repo, tranche_repo=tranche_repo)
+
+    before = database.stats["queries"]
+    postes = service.list_postes_complets()
+    # liste + tranches + qualifications, quel que soit le nombre de postes
+    assert database.stats["queries"] - before == 3
+
+    assert len(postes) == 4
+    assert all([t.nom for t in p.tranches] == ["M", "S"] for p in postes)
+    assert [len(p.qualifications) for p in postes] == [2, 1, 0, 0]
+
+
+def test_shared_catalog_is_reused_across_calls(database):
+    poste_repo, qualification_repo, tranche_repo = _repos(database)
+    service = PosteService(poste_repo=poste_repo, qualification_repo=qualification_repo, tranche_repo=tranche_repo)
+    catalog = TrancheCatalog.from_repo(tranche_repo)
+
+    service.list_postes_complets(catalog=catalog)
+    poste = service.get_poste_complet(1, catalog=catalog)
+
+    assert catalog.loads == 1
+    assert [t.nom for t in poste.tranches] == ["M", "S"]
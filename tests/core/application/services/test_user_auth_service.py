@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.app.security.jwt import create_access_token
+from core.application.services.user_auth_cache import UserAuthCache
+from core.application.services.user_auth_service import UserAuthError, UserAuthService
+from db.models import User
+
+
+class FakeUserRepo:
+    def __init__(self, *users: User):
+        self.users = {u.id: u for u in users}
+        self.get_by_id_calls = 0
+
+    def get_by_username(self, username):
+        return next((u for u in self.users.values() if u.username == username), None)
+
+    def get_by_id(self, user_id):
+        self.get_by_id_calls += 1
+        return self.users.get(user_id)
+
+    def bump_token_version(self, user_id):
+        self.users[user_id].token_version += 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _user(**kwargs) -> User:
+    data = dict(id=1, username="alice", password_hash="x", role="manager", is_active=True, token_version=0)
+    data.update(kwargs)
+    return User(**data)
+
+
+def _service(repo, clock=None):
+    cache = UserAuthCache(ttl_seconds=30, clock=clock or FakeClock())
+    return UserAuthService(users=repo, cache=cache), cache
+
+
+def test_hot_path_hits_cache_without_repository_call():
+    repo = FakeUserRepo(_user())
+    service, cache = _service(repo)
+    token = create_access_token(user_id=1, role="manager")
+
+    for _ in range(5):
+        user = service.get_current_user(token)
+
+    assert user.id == 1 and user.role == "manager"
+    assert repo.get_by_id_calls == 1
+    assert cache.hits == 4
+
+
+def test_entry_expires_after_ttl():
+    clock = FakeClock()
+    repo = FakeUserRepo(_user())
+    service, _ = _service(repo, clock)
+    token = create_access_token(user_id=1, role="manager")
+
+    service.get_current_user(token)
+    clock.now += 31
+    service.get_current_user(token)
+
+    assert repo.get_by_id_calls == 2
+
+
+def test_bumped_token_version_revokes_old_tokens_immediately_after_invalidation():
+    repo = FakeUserRepo(_user())
+    service, cache = _service(repo)
+    old_token = create_access_token(user_id=1, role="manager", token_version=0)
+    service.get_current_user(old_token)
+
+    repo.bump_token_version(1)
+    cache.invalidate(1)
+
+    with pytest.raises(UserAuthError, match="revoked"):
+        service.get_current_user(old_token)
+
+    new_token = create_access_token(user_id=1, role="manager", token_version=1)
+    assert service.get_current_user(new_token).token_version == 1
+
+
+def test_newer_token_than_cache_reloads_user():
+    repo = FakeUserRepo(_user())
+    service, _ = _service(repo)
+    service.get_current_user(create_access_token(user_id=1, role="manager", token_version=0))
+
+    # révocation faite par un autre processus : le cache local est en retard
+    repo.bump_token_version(1)
+    user = service.get_current_user(create_access_token(user_id=1, role="manager", token_version=1))
+
+    assert user.token_version == 1
+    assert repo.get_by_id_calls == 2
+
+
+def test_inactive_user_is_rejected_after_invalidation():
+    repo = FakeUserRepo(_user())
+    service, cache = _service(repo)
+    token = create_access_token(user_id=1, role="manager")
+    service.get_current_user(token)
+
+    repo.users[1].is_active = False
+    cache.invalidate(1)
+
+    with pytest.raises(UserAuthError, match="inactive"):
+        service.get_current_user(token)